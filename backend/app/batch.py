@@ -0,0 +1,348 @@
+"""Batch imports: several reports, or zip/tar archives of them, in one go.
+
+Reports are parsed concurrently in a process pool and ingested in the order
+they were given, through one ``BulkIngestor`` and one commit. Parsed findings
+are handed back through a temp file, one INGEST_CHUNK_SIZE chunk at a time,
+so no process holds a whole report's findings in memory. A report that
+fails to parse is reported and skipped; a database error rolls back the
+whole batch. Also a CLI for CI pipelines::
+
+    python -m app.batch semgrep.sarif trivy.json reports.zip
+"""
+from __future__ import annotations
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from itertools import islice
+from typing import BinaryIO, Iterator, Optional
+import argparse
+import logging
+import multiprocessing
+import os
+import pickle
+import shutil
+import sys
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+
+from sqlalchemy.orm import Session
+
+from .ingest import INGEST_CHUNK_SIZE, BulkIngestor
+from .notifications import NOTIFY_COOLDOWN, NOTIFY_SEVERITIES, enqueue_notifications
+from .parsers import ParsedFinding, resolve_parser
+from .retention import RetentionStats, retain
+from .uploads import UPLOAD_CHUNK_SIZE, UPLOAD_MAX_BYTES, UPLOAD_SPOOL_DIR, UploadTooLarge, open_spooled, strip_gzip_suffix
+
+# Parser processes; 0 parses in the calling process
+BATCH_WORKERS = int(os.environ.get("BATCH_WORKERS", str(min(4, os.cpu_count() or 1))))
+BATCH_MAX_FILES = int(os.environ.get("BATCH_MAX_FILES", "100"))
+
+
+class BatchError(ValueError):
+    pass
+
+
+@dataclass
+class ReportFile:
+    filename: str
+    path: str
+
+
+@dataclass
+class FileResult:
+    filename: str
+    parser: Optional[str] = None
+    status: str = "completed"
+    error: Optional[str] = None
+    parsed: int = 0
+    imported: int = 0
+    new_findings: int = 0
+    deduplicated: int = 0
+    raw_bytes_saved: int = 0
+    parse_seconds: float = 0.0
+    ingest_seconds: float = 0.0
+
+
+@dataclass
+class BatchResult:
+    files: list[FileResult] = field(default_factory=list)
+    imported: int = 0
+    new_findings: int = 0
+    deduplicated: int = 0
+    raw_bytes_saved: int = 0
+    seconds: float = 0.0
+    notifications_queued: int = 0
+
+    @property
+    def source(self) -> str:
+        """How notifications refer to this batch."""
+        if len(self.files) == 1:
+            return self.files[0].filename
+        return f"a batch of {len(self.files)} reports"
+
+    @property
+    def ok(self) -> bool:
+        return all(f.status == "completed" for f in self.files)
+
+    def to_dict(self) -> dict:
+        completed = sum(1 for f in self.files if f.status == "completed")
+        return {
+            "ok": self.ok,
+            "files": [asdict(f) for f in self.files],
+            "imported": self.imported,
+            "new_findings": self.new_findings,
+            "deduplicated": self.deduplicated,
+            "raw_bytes_saved": self.raw_bytes_saved,
+            "seconds": round(self.seconds, 3),
+            "message": (
+                f"Imported {self.imported} findings from {completed} of {len(self.files)} files "
+                f"({self.new_findings} new, {self.deduplicated} deduplicated)"
+            ),
+        }
+
+
+def _archive_members(path: str) -> Optional[Iterator[tuple[str, BinaryIO]]]:
+    """(name, stream) for each regular file in a zip or tar archive, or None if ``path`` isn't one."""
+    if zipfile.is_zipfile(path):
+        def members() -> Iterator[tuple[str, BinaryIO]]:
+            with zipfile.ZipFile(path) as zf:
+                for info in zf.infolist():
+                    if not info.is_dir():
+                        with zf.open(info) as fh:
+                            yield info.filename, fh
+        return members()
+    if tarfile.is_tarfile(path):
+        def members() -> Iterator[tuple[str, BinaryIO]]:
+            with tarfile.open(path, "r:*") as tf:
+                for info in tf:
+                    # Links, devices and directories are skipped, never followed
+                    if info.isfile():
+                        yield info.name, tf.extractfile(info)
+        return members()
+    return None
+
+
+def _is_junk(name: str) -> bool:
+    base = os.path.basename(name)
+    return name.startswith("__MACOSX/") or base.startswith("._") or base == ".DS_Store"
+
+
+def expand_report(path: str, filename: Optional[str], workdir: str) -> list[ReportFile]:
+    """The reports in ``path``: its archive members, extracted to ``workdir``, or the file itself.
+
+    Extraction is capped at UPLOAD_MAX_BYTES per archive; member names are
+    only used for detection and results, never as paths.
+    """
+    filename = filename or os.path.basename(path)
+    members = _archive_members(path)
+    if members is None:
+        return [ReportFile(strip_gzip_suffix(filename), path)]
+
+    reports = []
+    written = 0
+    for name, fh in members:
+        if _is_junk(name):
+            continue
+        if len(reports) >= BATCH_MAX_FILES:
+            raise BatchError(f"{filename} has more than {BATCH_MAX_FILES} files")
+        fd, out_path = tempfile.mkstemp(prefix="secops-batch-", dir=workdir)
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = fh.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                written += len(chunk)
+                if UPLOAD_MAX_BYTES and written > UPLOAD_MAX_BYTES:
+                    raise UploadTooLarge(f"{filename} expands to more than {UPLOAD_MAX_BYTES} bytes")
+                out.write(chunk)
+        reports.append(ReportFile(f"{filename}/{strip_gzip_suffix(name)}", out_path))
+    return reports
+
+
+def _parse_report(path: str, filename: str, parser_name: Optional[str], outdir: str) -> tuple:
+    # Runs in a pool process; errors come back as text so they always unpickle.
+    # Retention is applied here so trimmed raw_data is all that gets written,
+    # and findings are pickled to a file in ``outdir`` chunk by chunk.
+    start = time.perf_counter()
+    name = parser_name
+    retention = RetentionStats()
+    parsed = 0
+    try:
+        fd, out_path = tempfile.mkstemp(prefix="secops-findings-", dir=outdir)
+        with os.fdopen(fd, "wb") as out, open_spooled(path) as fh:
+            parser = resolve_parser(fh, parser_name, os.path.basename(filename))
+            name = parser.name
+            findings = retain(parser.iter_parse(fh, os.path.basename(filename)), name, retention)
+            while chunk := list(islice(findings, INGEST_CHUNK_SIZE)):
+                pickle.dump(chunk, out, pickle.HIGHEST_PROTOCOL)
+                parsed += len(chunk)
+    except Exception as e:
+        return name, None, 0, 0, time.perf_counter() - start, str(e) or type(e).__name__
+    return name, out_path, parsed, retention.saved, time.perf_counter() - start, None
+
+
+def _read_findings(path: str) -> Iterator[ParsedFinding]:
+    """The findings ``_parse_report`` wrote to ``path``, unpickled one chunk at a time."""
+    with open(path, "rb") as fh:
+        while True:
+            try:
+                chunk = pickle.load(fh)
+            except EOFError:
+                return
+            yield from chunk
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> Optional[ProcessPoolExecutor]:
+    """The shared parser pool, started on first use; None when BATCH_WORKERS is 0."""
+    global _pool
+    with _pool_lock:
+        if _pool is None and BATCH_WORKERS > 0:
+            _pool = ProcessPoolExecutor(BATCH_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
+
+
+def import_reports(
+    db: Session,
+    reports: list[ReportFile],
+    parser: Optional[str] = None,
+    default_asset: Optional[str] = None,
+    default_exposure: str = "internal",
+    default_criticality: str = "medium",
+    pool: Optional[ProcessPoolExecutor] = None,
+) -> BatchResult:
+    """Parse ``reports`` concurrently and ingest them in one transaction, then commit.
+
+    Notifications are queued in the notification outbox within that transaction.
+    """
+    if len(reports) > BATCH_MAX_FILES:
+        raise BatchError(f"A batch is limited to {BATCH_MAX_FILES} files")
+    start = time.perf_counter()
+    pool = pool or get_pool()
+    outdir = tempfile.mkdtemp(prefix="secops-batch-", dir=UPLOAD_SPOOL_DIR)
+    futures: list[Future] = []
+    if pool is not None:
+        futures = [pool.submit(_parse_report, r.path, r.filename, parser, outdir) for r in reports]
+
+    ingestor = BulkIngestor(
+        db,
+        default_asset=default_asset,
+        default_exposure=default_exposure,
+        default_criticality=default_criticality,
+        notify_severities=NOTIFY_SEVERITIES,
+        notify_cooldown=NOTIFY_COOLDOWN,
+    )
+    batch = BatchResult()
+    totals = ingestor.result
+    try:
+        for i, report in enumerate(reports):
+            parsed = futures[i].result() if futures else _parse_report(report.path, report.filename, parser, outdir)
+            parser_name, findings_path, count, raw_bytes_saved, parse_seconds, error = parsed
+            file_result = FileResult(filename=report.filename, parser=parser_name, parse_seconds=round(parse_seconds, 3))
+            batch.files.append(file_result)
+            if error is not None:
+                file_result.status = "failed"
+                file_result.error = error
+                continue
+
+            before = (totals.imported, totals.new_findings, totals.deduplicated)
+            ingest_start = time.perf_counter()
+            ingestor.add_all(_read_findings(findings_path))
+            os.unlink(findings_path)
+            file_result.ingest_seconds = round(time.perf_counter() - ingest_start, 3)
+            file_result.parsed = count
+            file_result.raw_bytes_saved = raw_bytes_saved
+            batch.raw_bytes_saved += raw_bytes_saved
+            file_result.imported = totals.imported - before[0]
+            file_result.new_findings = totals.new_findings - before[1]
+            file_result.deduplicated = totals.deduplicated - before[2]
+        batch.notifications_queued = enqueue_notifications(
+            db, totals.notifications, batch.source, totals.notifications_suppressed, ingestor.now
+        )
+        db.commit()
+    except BaseException as e:
+        db.rollback()
+        for future in futures:
+            future.cancel()
+        if isinstance(e, BrokenProcessPool) and pool is _pool:
+            # A parser process died; start a fresh pool for the next batch
+            shutdown_pool()
+        raise
+    finally:
+        shutil.rmtree(outdir, ignore_errors=True)
+
+    batch.imported = totals.imported
+    batch.new_findings = totals.new_findings
+    batch.deduplicated = totals.deduplicated
+    batch.seconds = time.perf_counter() - start
+    return batch
+
+
+def main(argv: list[str]) -> int:
+    from .db import SessionLocal
+
+    cli = argparse.ArgumentParser(prog="python -m app.batch", description="Import scan reports and archives of them")
+    cli.add_argument("paths", nargs="+", help="reports, or zip/tar archives of reports")
+    cli.add_argument("--parser", help="parser for every report (default: detect each one)")
+    cli.add_argument("--asset", help="default asset for findings without one")
+    cli.add_argument("--exposure", default="internal")
+    cli.add_argument("--criticality", default="medium")
+    cli.add_argument("--json", action="store_true", help="print the result as JSON")
+    args = cli.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="secops-batch-", dir=UPLOAD_SPOOL_DIR)
+    db: Session = SessionLocal()
+    try:
+        reports = []
+        for path in args.paths:
+            reports.extend(expand_report(path, path, workdir))
+        result = import_reports(
+            db,
+            reports,
+            parser=args.parser,
+            default_asset=args.asset,
+            default_exposure=args.exposure,
+            default_criticality=args.criticality,
+        )
+    except (BatchError, UploadTooLarge, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        db.close()
+        shutdown_pool()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.json:
+        from . import jsonlib
+
+        sys.stdout.buffer.write(jsonlib.dumps(result.to_dict()) + b"\n")
+    else:
+        for f in result.files:
+            outcome = f"{f.imported} findings ({f.new_findings} new)" if f.status == "completed" else f"FAILED: {f.error}"
+            print(f"{f.filename}  [{f.parser or '-'}]  {outcome}  parse {f.parse_seconds:.2f}s  ingest {f.ingest_seconds:.2f}s")
+        print(result.to_dict()["message"] + f" in {result.seconds:.2f}s")
+        if result.raw_bytes_saved:
+            print(f"raw_data retention saved {result.raw_bytes_saved} bytes")
+        if result.notifications_queued:
+            print(f"{result.notifications_queued} notifications queued in the outbox")
+    return 0 if result.ok else 1
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main(sys.argv[1:]))
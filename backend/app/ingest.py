@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, Optional
+import os
+
+from sqlalchemy import bindparam, func, select, insert, update
+from sqlalchemy.orm import Session
+
+from .models import Asset, Finding, Signal, _uuid
+from .parsers.base import ParsedFinding
+from .payloads import encode_payload_json, store_payloads
+from .rollups import RollupDeltas
+from .scoring import compute_risk_score, make_fingerprint
+from .trends import TrendDeltas
+from .upserts import dialect_insert, greatest, insert_assets_ignoring_conflicts
+
+INGEST_CHUNK_SIZE = int(os.environ.get("INGEST_CHUNK_SIZE", "1000"))
+
+
+@dataclass
+class IngestResult:
+    imported: int = 0
+    new_findings: int = 0
+    deduplicated: int = 0
+    notifications: list[dict] = field(default_factory=list)
+    notifications_suppressed: int = 0
+
+
+@dataclass
+class _AssetState:
+    id: str
+    exposure: str
+    criticality: str
+
+
+@dataclass
+class _FindingState:
+    id: str
+    occurrences: int
+    risk_score: int
+    severity: str = ""
+    status: str = "open"
+    last_notified_at: Optional[datetime] = None
+
+
+class BulkIngestor:
+    """Set-based dedupe of parsed findings into assets, signals and findings.
+
+    Findings are buffered and written per chunk: asset keys and fingerprints are
+    resolved with one ``IN (...)`` query each, and new rows go out as bulk
+    inserts/updates. Updates are relative (``occurrences + n``, the greater
+    risk score) so sightings recorded meanwhile by /ingest/signal or another
+    import aren't overwritten. Every fingerprint seen during the import is kept
+    in an in-batch map so repeats within the same import dedupe against each
+    other.
+    The caller owns the session and the commit; ``on_flush`` runs after each
+    chunk is written and may commit to publish progress.
+
+    A repeat sighting of a finding notified less than ``notify_cooldown`` ago
+    is counted in ``notifications_suppressed`` instead of queued again.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        default_asset: Optional[str] = None,
+        default_exposure: str = "internal",
+        default_criticality: str = "medium",
+        notify_severities: Iterable[str] = (),
+        notify_cooldown: timedelta = timedelta(0),
+        chunk_size: int = INGEST_CHUNK_SIZE,
+        now: Optional[datetime] = None,
+        on_flush: Optional[Callable[[IngestResult], None]] = None,
+    ):
+        self.db = db
+        self.default_asset = default_asset
+        self.default_exposure = default_exposure
+        self.default_criticality = default_criticality
+        self.notify_severities = set(notify_severities)
+        self.notify_cooldown = notify_cooldown
+        self.chunk_size = max(1, chunk_size)
+        self.now = now or datetime.utcnow()
+        self.on_flush = on_flush
+        self.result = IngestResult()
+
+        self._assets: dict[str, _AssetState] = {}
+        self._findings: dict[str, _FindingState] = {}
+        self._payload_hashes: set[str] = set()
+        self._rollup = RollupDeltas()
+        self._trends = TrendDeltas()
+        self._pending: list[ParsedFinding] = []
+
+    def add(self, parsed: ParsedFinding) -> None:
+        self._pending.append(parsed)
+        if len(self._pending) >= self.chunk_size:
+            self.flush()
+
+    def add_all(self, parsed_findings: Iterable[ParsedFinding]) -> IngestResult:
+        for pf in parsed_findings:
+            self.add(pf)
+        self.flush()
+        return self.result
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        chunk, self._pending = self._pending, []
+
+        keyed = []
+        for pf in chunk:
+            asset_key = (pf.asset or self.default_asset or "unknown").strip().lower()
+            keyed.append((pf, asset_key, make_fingerprint(pf.tool, pf.title, asset_key)))
+
+        self._resolve_assets({asset_key for _, asset_key, _ in keyed})
+        self._resolve_findings({fp for _, _, fp in keyed})
+
+        payload_rows = []
+        signal_rows = []
+        new_rows: dict[str, dict] = {}
+        updated_rows: dict[str, dict] = {}
+
+        for pf, asset_key, fp in keyed:
+            asset = self._assets[asset_key]
+            severity = pf.severity.value
+            exposure = asset.exposure or self.default_exposure
+            criticality = asset.criticality or self.default_criticality
+            risk_score = compute_risk_score(severity, exposure, criticality)
+
+            signal_id = _uuid()
+            payload_row = encode_payload_json(pf.signal_payload_json(), self.now)
+            if payload_row["hash"] not in self._payload_hashes:
+                self._payload_hashes.add(payload_row["hash"])
+                payload_rows.append(payload_row)
+            signal_rows.append({
+                "id": signal_id,
+                "tool": pf.tool,
+                "payload_hash": payload_row["hash"],
+                "created_at": self.now,
+            })
+
+            state = self._findings.get(fp)
+            if state is None:
+                state = _FindingState(id=_uuid(), occurrences=1, risk_score=risk_score, severity=severity)
+                self._findings[fp] = state
+                row = new_rows[fp] = {
+                    "id": state.id,
+                    "fingerprint": fp,
+                    "tool": pf.tool,
+                    "title": pf.title,
+                    "severity": severity,
+                    "asset": asset_key,
+                    "asset_id": asset.id,
+                    "exposure": exposure,
+                    "criticality": criticality,
+                    "status": "open",
+                    "risk_score": risk_score,
+                    "occurrences": 1,
+                    "first_seen": self.now,
+                    "last_seen": self.now,
+                    "last_notified_at": None,
+                    "signal_id": signal_id,
+                    "description": pf.description or None,
+                    "recommendation": pf.recommendation or None,
+                    "cwe_id": pf.cwe_id,
+                    "cve_id": pf.cve_id,
+                    "cvss_score": pf.cvss_score,
+                }
+                self.result.new_findings += 1
+                is_new = True
+            else:
+                old_risk = state.risk_score
+                state.occurrences += 1
+                state.risk_score = max(state.risk_score, risk_score)
+                row = new_rows.get(fp)
+                if row is not None:
+                    # Not inserted yet: the row carries the totals
+                    row["occurrences"] = state.occurrences
+                    row["risk_score"] = state.risk_score
+                else:
+                    if state.status == "open":
+                        self._rollup.risk_raised(asset_key, asset.id, old_risk, state.risk_score)
+                        self._trends.risk_raised(self.now, state.severity, pf.tool, asset_key, old_risk, state.risk_score)
+                    # Increments for this chunk, added to the stored row
+                    row = updated_rows.setdefault(
+                        fp, {"id": state.id, "occurrences": 0, "risk_score": 0, "last_notified_at": None}
+                    )
+                    row["occurrences"] += 1
+                    row["risk_score"] = max(row["risk_score"], risk_score)
+                row["signal_id"] = signal_id
+                self.result.deduplicated += 1
+                is_new = False
+
+            if severity in self.notify_severities:
+                if (
+                    not is_new
+                    and state.last_notified_at is not None
+                    and self.now - state.last_notified_at < self.notify_cooldown
+                ):
+                    self.result.notifications_suppressed += 1
+                else:
+                    state.last_notified_at = self.now
+                    row["last_notified_at"] = self.now
+                    self.result.notifications.append({
+                        "title": pf.title,
+                        "severity": severity,
+                        "asset": asset_key,
+                        "risk_score": state.risk_score,
+                        "finding_id": state.id,
+                        "tool": pf.tool,
+                        "is_new": is_new,
+                        "occurrences": state.occurrences,
+                    })
+
+            self.result.imported += 1
+
+        store_payloads(self.db, payload_rows)
+        self.db.execute(insert(Signal), signal_rows)
+        if new_rows:
+            self._insert_findings(new_rows, updated_rows)
+        if updated_rows:
+            table = Finding.__table__
+            self.db.execute(
+                update(table)
+                .where(table.c.id == bindparam("b_id"))
+                .values(
+                    occurrences=table.c.occurrences + bindparam("b_occurrences"),
+                    risk_score=greatest(self.db, table.c.risk_score, bindparam("b_risk_score")),
+                    last_seen=self.now,
+                    signal_id=bindparam("b_signal_id"),
+                    last_notified_at=func.coalesce(bindparam("b_last_notified_at"), table.c.last_notified_at),
+                ),
+                [{f"b_{key}": value for key, value in row.items()} for row in updated_rows.values()],
+            )
+        self._rollup.apply(self.db, self.now)
+        self._trends.apply(self.db, self.now)
+
+        if self.on_flush is not None:
+            self.on_flush(self.result)
+
+    def _insert_findings(self, new_rows: dict[str, dict], updated_rows: dict[str, dict]) -> None:
+        """Insert the chunk's new findings; only rows actually inserted count as opened.
+
+        A fingerprint inserted meanwhile by another import or /ingest/signal
+        conflicts; that row is adopted and this chunk's sightings of it move to
+        ``updated_rows`` as a repeat.
+        """
+        stmt = dialect_insert(self.db, Finding).on_conflict_do_nothing(index_elements=[Finding.fingerprint])
+        inserted = set(self.db.execute(stmt.returning(Finding.fingerprint), list(new_rows.values())).scalars())
+        for fp in inserted:
+            row = new_rows[fp]
+            self._rollup.opened(row["asset"], row["asset_id"], row["severity"], row["risk_score"])
+            self._trends.opened(self.now, row["severity"], row["tool"], row["asset"], row["risk_score"])
+
+        conflicted = new_rows.keys() - inserted
+        if not conflicted:
+            return
+        adopted_ids = {}
+        existing = self.db.execute(
+            select(
+                Finding.id,
+                Finding.fingerprint,
+                Finding.occurrences,
+                Finding.risk_score,
+                Finding.severity,
+                Finding.status,
+                Finding.last_notified_at,
+            )
+            .where(Finding.fingerprint.in_(conflicted))
+            .with_for_update()
+        ).all()
+        for r in existing:
+            row = new_rows[r.fingerprint]
+            state = self._findings[r.fingerprint]
+            adopted_ids[state.id] = r.id
+            old_risk = r.risk_score or 0
+            state.id = r.id
+            state.occurrences = (r.occurrences or 0) + row["occurrences"]
+            state.risk_score = max(old_risk, row["risk_score"])
+            state.severity = r.severity
+            state.status = r.status
+            if row["last_notified_at"] is None:
+                state.last_notified_at = r.last_notified_at
+            if r.status == "open":
+                self._rollup.risk_raised(row["asset"], row["asset_id"], old_risk, state.risk_score)
+                self._trends.risk_raised(self.now, r.severity, row["tool"], row["asset"], old_risk, state.risk_score)
+            updated_rows[r.fingerprint] = {
+                "id": r.id,
+                "occurrences": row["occurrences"],
+                "risk_score": row["risk_score"],
+                "signal_id": row["signal_id"],
+                "last_notified_at": row["last_notified_at"],
+            }
+
+        self.result.new_findings -= len(adopted_ids)
+        self.result.deduplicated += len(adopted_ids)
+        for notification in self.result.notifications:
+            if notification["finding_id"] in adopted_ids:
+                notification["finding_id"] = adopted_ids[notification["finding_id"]]
+                notification["is_new"] = False
+
+    def _resolve_assets(self, keys: set[str]) -> None:
+        missing = keys - self._assets.keys()
+        if not missing:
+            return
+
+        rows = self.db.execute(
+            select(Asset.id, Asset.key, Asset.exposure, Asset.criticality).where(Asset.key.in_(missing))
+        ).all()
+        for r in rows:
+            self._assets[r.key] = _AssetState(id=r.id, exposure=r.exposure, criticality=r.criticality)
+
+        new_keys = sorted(missing - self._assets.keys())
+        if not new_keys:
+            return
+
+        insert_assets_ignoring_conflicts(self.db, [
+            {
+                "id": _uuid(),
+                "key": key,
+                "name": key,
+                "environment": "unknown",
+                "owner": "",
+                "criticality": self.default_criticality,
+                "exposure": self.default_exposure,
+                "created_at": self.now,
+                "updated_at": self.now,
+            }
+            for key in new_keys
+        ])
+        # Re-read so keys created concurrently by another import resolve to their real ids
+        rows = self.db.execute(
+            select(Asset.id, Asset.key, Asset.exposure, Asset.criticality).where(Asset.key.in_(new_keys))
+        ).all()
+        for r in rows:
+            self._assets[r.key] = _AssetState(id=r.id, exposure=r.exposure, criticality=r.criticality)
+
+    def _resolve_findings(self, fingerprints: set[str]) -> None:
+        missing = fingerprints - self._findings.keys()
+        if not missing:
+            return
+
+        rows = self.db.execute(
+            select(
+                Finding.id,
+                Finding.fingerprint,
+                Finding.occurrences,
+                Finding.risk_score,
+                Finding.severity,
+                Finding.status,
+                Finding.last_notified_at,
+            ).where(Finding.fingerprint.in_(missing))
+        ).all()
+        for r in rows:
+            self._findings[r.fingerprint] = _FindingState(
+                id=r.id,
+                occurrences=r.occurrences or 1,
+                risk_score=r.risk_score or 0,
+                severity=r.severity,
+                status=r.status,
+                last_notified_at=r.last_notified_at,
+            )
@@ -0,0 +1,407 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import BinaryIO, Optional
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import tempfile
+import threading
+
+from sqlalchemy import and_, delete, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from .db import SessionLocal, engine
+from .ingest import BulkIngestor, IngestResult
+from .models import ImportJob, ImportJobChunk
+from .notifications import NOTIFY_COOLDOWN, NOTIFY_SEVERITIES, enqueue_notifications, release_notifications
+from .parsers import resolve_parser
+from .retention import RetentionStats, retain
+from .uploads import UPLOAD_SPOOL_DIR, iter_gzipped, open_spooled
+
+logger = logging.getLogger(__name__)
+
+IMPORT_WORKERS = int(os.environ.get("IMPORT_WORKERS", "2"))
+IMPORT_POLL_INTERVAL = float(os.environ.get("IMPORT_POLL_INTERVAL", "1.0"))
+# A running job whose worker hasn't renewed its lease for this long is reclaimed
+IMPORT_LEASE_SECONDS = float(os.environ.get("IMPORT_LEASE_SECONDS", "300"))
+# Leases a job may take before it is failed (its workers keep dying on it)
+IMPORT_MAX_ATTEMPTS = int(os.environ.get("IMPORT_MAX_ATTEMPTS", "3"))
+
+# Set when a job is enqueued so in-process workers pick it up without waiting
+# for the next poll.
+_wakeup = threading.Event()
+
+
+def enqueue_import(
+    db: Session,
+    report: BinaryIO,
+    parser: Optional[str] = None,
+    filename: Optional[str] = None,
+    default_asset: Optional[str] = None,
+    default_exposure: str = "internal",
+    default_criticality: str = "medium",
+) -> ImportJob:
+    """Queue a report (plain or gzipped) for import and commit.
+
+    The report is read and stored gzip-compressed one UPLOAD_CHUNK_SIZE piece
+    at a time.
+    """
+    job = ImportJob(
+        status="queued",
+        parser=parser,
+        filename=filename,
+        default_asset=default_asset,
+        default_exposure=default_exposure,
+        default_criticality=default_criticality,
+        created_at=datetime.utcnow(),
+    )
+    db.add(job)
+    db.flush()
+    for seq, data in enumerate(iter_gzipped(report)):
+        db.execute(insert(ImportJobChunk).values(job_id=job.id, seq=seq, data=data))
+    db.commit()
+    _wakeup.set()
+    return job
+
+
+class LeaseLost(Exception):
+    """Another worker reclaimed the job after this worker's lease expired."""
+
+
+def _claimable(now: datetime):
+    stale = now - timedelta(seconds=IMPORT_LEASE_SECONDS)
+    return or_(
+        ImportJob.status == "queued",
+        and_(
+            ImportJob.status == "running",
+            or_(ImportJob.heartbeat_at.is_(None), ImportJob.heartbeat_at < stale),
+        ),
+    )
+
+
+def lease_next_job(db: Session, worker_id: str) -> Optional[str]:
+    """Claim the oldest queued job, or a running one whose lease expired, for ``worker_id``.
+
+    On Postgres the row is locked with ``FOR UPDATE SKIP LOCKED`` so workers on
+    several nodes never contend for the same job. The conditional update keeps
+    the claim safe on SQLite too. A job whose workers died IMPORT_MAX_ATTEMPTS
+    times is failed instead of being run again.
+    """
+    while True:
+        now = datetime.utcnow()
+        stmt = (
+            select(ImportJob.id, ImportJob.attempts)
+            .where(_claimable(now))
+            .order_by(ImportJob.created_at)
+            .limit(1)
+        )
+        if db.get_bind().dialect.name == "postgresql":
+            stmt = stmt.with_for_update(skip_locked=True)
+
+        row = db.execute(stmt).one_or_none()
+        if row is None:
+            db.rollback()
+            return None
+
+        if row.attempts >= IMPORT_MAX_ATTEMPTS:
+            logger.warning(f"Import job {row.id} lost its worker {row.attempts} times; failing it")
+            _fail_job(db, row.id, f"Import worker lost {row.attempts} times (crashed or killed mid-import)")
+            db.commit()
+            continue
+
+        claimed = db.execute(
+            update(ImportJob)
+            .where(ImportJob.id == row.id, _claimable(now))
+            .values(
+                status="running",
+                worker_id=worker_id,
+                attempts=ImportJob.attempts + 1,
+                started_at=now,
+                heartbeat_at=now,
+            )
+        ).rowcount
+        db.commit()
+        return row.id if claimed else None
+
+
+class _Heartbeat:
+    """Renews a running job's lease from a background thread.
+
+    ``lost`` is set once the job no longer belongs to this worker. Does
+    nothing without a ``worker_id`` (a job run directly, not leased).
+    """
+
+    def __init__(self, job_id: str, worker_id: Optional[str], interval: float = IMPORT_LEASE_SECONDS / 3):
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.interval = interval
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "_Heartbeat":
+        if self.worker_id is not None:
+            self._thread = threading.Thread(target=self._run, name=f"import-heartbeat-{self.job_id}", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def check(self) -> None:
+        if self.lost:
+            raise LeaseLost(f"Import job {self.job_id} was reclaimed by another worker")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            db: Session = SessionLocal()
+            try:
+                renewed = db.execute(
+                    update(ImportJob)
+                    .where(
+                        ImportJob.id == self.job_id,
+                        ImportJob.status == "running",
+                        ImportJob.worker_id == self.worker_id,
+                    )
+                    .values(heartbeat_at=datetime.utcnow())
+                ).rowcount
+                db.commit()
+            except Exception as e:
+                logger.error(f"Import job {self.job_id} heartbeat error: {e}")
+                continue
+            finally:
+                db.close()
+            if not renewed:
+                self.lost = True
+                return
+
+
+def _fail_job(db: Session, job_id: str, error: str) -> None:
+    """Mark a job failed, drop its stored report and release its held digest. Does not commit.
+
+    Chunks committed before the failure are kept; the error says how many
+    findings they held.
+    """
+    job = db.get(ImportJob, job_id)
+    if job is not None and job.imported:
+        error += (
+            f" ({job.imported} findings from earlier chunks were kept, {job.new_findings} of them new;"
+            " re-importing the report deduplicates them)"
+        )
+    db.execute(
+        update(ImportJob)
+        .where(ImportJob.id == job_id)
+        .values(status="failed", error=error, finished_at=datetime.utcnow())
+    )
+    db.execute(delete(ImportJobChunk).where(ImportJobChunk.job_id == job_id))
+    # Chunks committed before the failure still get their digest
+    source = (job.filename or job.parser) if job is not None else None
+    release_notifications(db, job_id, f"{source or job_id} (failed)")
+
+
+def _claim_progress(db: Session, job_id: str, worker_id: Optional[str], **values) -> None:
+    """Update a running job only while ``worker_id`` still holds it; raises LeaseLost otherwise.
+
+    Fences a worker whose lease was taken over before its heartbeat noticed,
+    so its chunk rolls back instead of being imported twice.
+    """
+    stmt = update(ImportJob).where(ImportJob.id == job_id)
+    if worker_id is not None:
+        stmt = stmt.where(ImportJob.status == "running", ImportJob.worker_id == worker_id)
+    if not db.execute(stmt.values(**values)).rowcount:
+        raise LeaseLost(f"Import job {job_id} was reclaimed by another worker")
+
+
+def _run_import_job(db: Session, job_id: str, heartbeat: _Heartbeat) -> None:
+    job = db.get(ImportJob, job_id)
+    if job is None:
+        return
+    # A reclaimed job resumes after the findings an earlier worker committed
+    offset = job.committed or 0
+    base = {
+        "imported": job.imported or 0,
+        "new_findings": job.new_findings or 0,
+        "deduplicated": job.deduplicated or 0,
+        "raw_bytes_saved": job.raw_bytes_saved or 0,
+    }
+
+    fd, path = tempfile.mkstemp(prefix="secops-job-", dir=UPLOAD_SPOOL_DIR)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            chunks = db.execute(
+                select(ImportJobChunk.data)
+                .where(ImportJobChunk.job_id == job_id)
+                .order_by(ImportJobChunk.seq)
+                .execution_options(yield_per=1)
+            ).scalars()
+            for data in chunks:
+                out.write(data)
+
+        retention = RetentionStats()
+
+        def report_progress(result: IngestResult) -> None:
+            heartbeat.check()
+            # A chunk's notifications commit with its findings (and their
+            # last_notified_at); the Slack digest parts are merged at the end
+            enqueue_notifications(
+                db, result.notifications, job.filename or job.parser, now=ingestor.now, group=job.id
+            )
+            result.notifications.clear()
+            _claim_progress(
+                db,
+                job.id,
+                heartbeat.worker_id,
+                committed=offset + result.imported,
+                parsed=offset + result.imported,
+                imported=base["imported"] + result.imported,
+                new_findings=base["new_findings"] + result.new_findings,
+                deduplicated=base["deduplicated"] + result.deduplicated,
+                raw_bytes_saved=base["raw_bytes_saved"] + retention.saved,
+            )
+            db.commit()
+
+        ingestor = BulkIngestor(
+            db,
+            default_asset=job.default_asset,
+            default_exposure=job.default_exposure,
+            default_criticality=job.default_criticality,
+            notify_severities=NOTIFY_SEVERITIES,
+            notify_cooldown=NOTIFY_COOLDOWN,
+            on_flush=report_progress,
+        )
+        # Findings are pulled from the parser one ingest chunk at a time, so
+        # memory follows INGEST_CHUNK_SIZE rather than the report size.
+        with open_spooled(path) as fh:
+            parser = resolve_parser(fh, job.parser, job.filename)
+            job.parser = parser.name
+            findings = islice(parser.iter_parse(fh, job.filename), offset, None)
+            result = ingestor.add_all(retain(findings, parser.name, retention))
+    finally:
+        os.unlink(path)
+
+    heartbeat.check()
+    release_notifications(
+        db, job.id, job.filename or job.parser, result.notifications_suppressed, ingestor.now
+    )
+    db.execute(delete(ImportJobChunk).where(ImportJobChunk.job_id == job_id))
+    _claim_progress(db, job.id, heartbeat.worker_id, status="completed", finished_at=datetime.utcnow())
+    db.commit()
+
+
+def run_import_job(job_id: str, worker_id: Optional[str] = None) -> None:
+    """Run a job leased by ``worker_id``, renewing its lease until done."""
+    db: Session = SessionLocal()
+    heartbeat = _Heartbeat(job_id, worker_id)
+    try:
+        with heartbeat:
+            _run_import_job(db, job_id, heartbeat)
+    except LeaseLost as e:
+        logger.warning(str(e))
+        db.rollback()
+    except Exception as e:
+        logger.exception(f"Import job {job_id} failed")
+        db.rollback()
+        _fail_job(db, job_id, str(e))
+        db.commit()
+    finally:
+        db.close()
+
+
+def worker_loop(worker_id: str, stop_event) -> None:
+    logger.info(f"Import worker {worker_id} started")
+    while not stop_event.is_set():
+        db: Session = SessionLocal()
+        try:
+            job_id = lease_next_job(db, worker_id)
+        except Exception as e:
+            logger.error(f"Import worker {worker_id} lease error: {e}")
+            job_id = None
+        finally:
+            db.close()
+
+        if job_id:
+            run_import_job(job_id, worker_id)
+            continue
+
+        _wakeup.wait(IMPORT_POLL_INTERVAL)
+        _wakeup.clear()
+    logger.info(f"Import worker {worker_id} stopped")
+
+
+def _process_main(worker_id: str, stop_event) -> None:
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    worker_loop(worker_id, stop_event)
+
+
+class ImportWorkerPool:
+    """Pool of import workers: processes on Postgres, one thread on SQLite.
+
+    SQLite allows a single writer, so extra workers would only fight over the
+    database lock; the in-process thread is a stand-in for local setups.
+    """
+
+    def __init__(self, size: int = IMPORT_WORKERS):
+        self.size = size
+        self._workers: list = []
+        self._stop_event = None
+
+    @property
+    def uses_processes(self) -> bool:
+        return engine.dialect.name != "sqlite"
+
+    def start(self) -> None:
+        if self.size <= 0 or self._workers:
+            return
+        prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+        if self.uses_processes:
+            ctx = multiprocessing.get_context("spawn")
+            self._stop_event = ctx.Event()
+            for i in range(self.size):
+                proc = ctx.Process(
+                    target=_process_main,
+                    args=(f"{prefix}:{i}", self._stop_event),
+                    name=f"import-worker-{i}",
+                    daemon=True,
+                )
+                proc.start()
+                self._workers.append(proc)
+        else:
+            self._stop_event = threading.Event()
+            thread = threading.Thread(
+                target=worker_loop,
+                args=(f"{prefix}:0", self._stop_event),
+                name="import-worker-0",
+                daemon=True,
+            )
+            thread.start()
+            self._workers.append(thread)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        if self._stop_event is None:
+            return
+        self._stop_event.set()
+        _wakeup.set()
+        for worker in self._workers:
+            worker.join(timeout)
+        self._workers = []
+        self._stop_event = None
+
+
+if __name__ == "__main__":
+    # Dedicated worker node: python -m app.jobs
+    logging.basicConfig(level=logging.INFO)
+    pool = ImportWorkerPool(max(1, IMPORT_WORKERS))
+    pool.start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.stop()
@@ -0,0 +1,73 @@
+"""The backend's JSON codec: orjson when it is installed, the stdlib otherwise.
+
+``loads`` takes bytes or str, so uploaded reports don't have to be decoded
+to text first; ``dumps`` returns compact UTF-8 bytes. Anything orjson
+rejects (NaN, a BOM) is handed to the stdlib, so both backends accept the
+same documents, though orjson reads integers wider than 64 bits as floats.
+Values orjson cannot encode, such as those integers, are encoded by the
+stdlib. Datetimes and dataclasses go through ``default`` either way, which
+keeps encoded payloads (and their hashes) independent of the active backend.
+"""
+from __future__ import annotations
+
+from typing import IO, Any, Callable, Optional, Union
+import json
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib json module
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+JSONDecodeError = json.JSONDecodeError
+
+Data = Union[str, bytes, bytearray, memoryview]
+
+if orjson is not None:
+    _OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    _SORTED = _OPTIONS | orjson.OPT_SORT_KEYS
+
+
+def loads(data: Data) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def load(fh: IO) -> Any:
+    return loads(fh.read())
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None, sort_keys: bool = False) -> bytes:
+    """Compact UTF-8 JSON."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default, option=_SORTED if sort_keys else _OPTIONS)
+        except orjson.JSONEncodeError:
+            pass
+    return _stdlib_dumps(obj, default, sort_keys)
+
+
+def canonical(obj: Any) -> bytes:
+    """Sorted-key compact JSON; anything not JSON-native is written as str()."""
+    # Called once per stored finding, so it skips the dumps() indirection
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=_SORTED)
+        except orjson.JSONEncodeError:
+            pass
+    return _stdlib_dumps(obj, str, True)
+
+
+def _stdlib_dumps(obj: Any, default: Optional[Callable[[Any], Any]], sort_keys: bool) -> bytes:
+    return json.dumps(
+        obj, default=default, sort_keys=sort_keys, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
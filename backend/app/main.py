@@ -1,28 +1,63 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
-import json
-import hashlib
+import io
 import logging
 import os
+import shutil
+import tempfile
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy import func, select, insert, tuple_, update
 
+from . import jsonlib
 from .auth import api_key_middleware
-from .db import engine, SessionLocal, Base
-from .models import Signal, Finding, Asset, Comment
-from .notifications import send_slack_notification_sync, create_jira_issue_sync
-from .parsers import list_parsers, parse_scan_results, get_parser
+from .batch import BATCH_MAX_FILES, BatchError, expand_report, import_reports, shutdown_pool
+from .db import engine, async_engine, Base, get_async_db, get_db, pool_status
+from .jobs import ImportWorkerPool, enqueue_import
+from .models import Signal, Finding, Asset, AssetRiskRollup, Comment, DailyFindingStat, ImportJob, _uuid
+from .notifications import (
+    NOTIFY_SEVERITIES,
+    JiraReconciler,
+    OutboxDispatcher,
+    client_status,
+    close_clients,
+    enqueue_notifications,
+    in_cooldown,
+    open_clients,
+    outbox_status,
+    reconcile_jira,
+    retry_dead,
+    send_slack_notification,
+)
+from .pagination import decode_cursor, encode_cursor
+from .parsers import list_parsers, get_parser_info as parser_info
 from .parsers.base import ScannerCategory
+from .payloads import store_payload
+from .rollups import SEVERITY_COLUMNS, RollupDeltas
+from .scoring import compute_risk_score, make_fingerprint
+from .trends import TrendDeltas
+from .uploads import UPLOAD_SPOOL_DIR, UploadTooLarge, iter_upload_file, spool_to_file, strip_gzip_suffix
+from .upserts import ensure_asset, upsert_finding
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="SecOps Dashboard API", version="0.8.0")
+
+class FastJSONResponse(JSONResponse):
+    """JSON responses rendered through jsonlib (orjson when installed)."""
+
+    def render(self, content) -> bytes:
+        return jsonlib.dumps(content)
+
+
+app = FastAPI(title="SecOps Dashboard API", version="0.8.0", default_response_class=FastJSONResponse)
 
 app.middleware("http")(api_key_middleware)
 
@@ -34,38 +69,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-NOTIFY_SEVERITIES = {"critical", "high"}
-
-SEVERITY_WEIGHT = {
-    "info": 1,
-    "low": 3,
-    "medium": 6,
-    "high": 10,
-    "critical": 15,
-}
-
-EXPOSURE_WEIGHT = {
-    "internal": 1.0,
-    "internet": 1.5,
-}
-
-CRITICALITY_WEIGHT = {
-    "low": 0.8,
-    "medium": 1.0,
-    "high": 1.3,
-}
-
-
-def compute_risk_score(severity: str, exposure: str, criticality: str) -> int:
-    s = SEVERITY_WEIGHT.get((severity or "").lower(), 1)
-    e = EXPOSURE_WEIGHT.get((exposure or "").lower(), 1.0)
-    c = CRITICALITY_WEIGHT.get((criticality or "").lower(), 1.0)
-    return max(1, min(int(round(s * e * c * 10)), 200))
-
-
-def make_fingerprint(tool: str, title: str, asset_key: str) -> str:
-    raw = f"{(tool or '').strip().lower()}|{(title or '').strip().lower()}|{(asset_key or '').strip().lower()}"
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+JIRA_BASE_URL = os.environ.get("JIRA_BASE_URL", "").rstrip("/")
 
 
 def _serialize_finding(f: Finding) -> dict:
@@ -91,9 +95,18 @@ def _serialize_finding(f: Finding) -> dict:
         "first_seen": f.first_seen.isoformat() + "Z",
         "last_seen": f.last_seen.isoformat() + "Z",
         "signal_id": f.signal_id,
+        "jira_issue_key": f.jira_issue_key,
+        "jira_issue_url": f"{JIRA_BASE_URL}/browse/{f.jira_issue_key}" if JIRA_BASE_URL and f.jira_issue_key else None,
     }
 
 
+def _parse_cursor(cursor: str, sort: str = "", as_datetime: bool = True):
+    try:
+        return tuple_(*decode_cursor(cursor, sort, as_datetime))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 # -----------------------------
 # Schemas
 # -----------------------------
@@ -109,91 +122,78 @@ class SignalIn(BaseModel):
 # -----------------------------
 # Startup
 # -----------------------------
+import_workers = ImportWorkerPool()
+outbox_dispatcher = OutboxDispatcher()
+jira_reconciler = JiraReconciler()
+# Set to 0 on API nodes when dispatchers run separately (python -m app.notifications.outbox)
+OUTBOX_DISPATCHER = os.environ.get("OUTBOX_DISPATCHER", "1") != "0"
+
+
 @app.on_event("startup")
 def startup():
     Base.metadata.create_all(bind=engine)
+    import_workers.start()
+    open_clients()
+    if OUTBOX_DISPATCHER:
+        outbox_dispatcher.start()
+        jira_reconciler.start()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    import_workers.stop()
+    shutdown_pool()
+    await outbox_dispatcher.stop()
+    await jira_reconciler.stop()
+    await close_clients()
+    await async_engine.dispose()
 
 
 # -----------------------------
 # Health
 # -----------------------------
 @app.get("/health")
-def health():
+async def health():
     return {"status": "ok"}
 
 
+@app.get("/internal/db/pool")
+async def db_pool():
+    """Connection pool occupancy and checkout wait times for this process."""
+    return pool_status()
+
+
+@app.get("/internal/integrations/http")
+async def integrations_http():
+    """Slack and Jira client connection reuse, error counts and latency percentiles for this process."""
+    return client_status()
+
+
 # -----------------------------
 # Assets
 # -----------------------------
 @app.get("/assets")
-def list_assets(limit: int = 100, offset: int = 0):
-    db: Session = SessionLocal()
-    try:
-        limit = max(1, min(limit, 200))
-        offset = max(0, offset)
-        rows = db.execute(
-            select(Asset).order_by(Asset.updated_at.desc()).offset(offset).limit(limit)
-        ).scalars().all()
-
-        return {
-            "count": len(rows),
-            "offset": offset,
-            "results": [
-                {
-                    "id": a.id,
-                    "key": a.key,
-                    "name": a.name,
-                    "environment": a.environment,
-                    "owner": a.owner,
-                    "criticality": a.criticality,
-                    "exposure": a.exposure,
-                    "created_at": a.created_at.isoformat() + "Z",
-                    "updated_at": a.updated_at.isoformat() + "Z",
-                }
-                for a in rows
-            ],
-        }
-    finally:
-        db.close()
-
-
-@app.post("/assets/upsert")
-def upsert_asset(payload: dict):
-    key = (payload.get("key") or "").strip().lower()
-    if not key:
-        raise HTTPException(status_code=400, detail="key is required")
+async def list_assets(
+    limit: int = 100,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    limit = max(1, min(limit, 200))
+    offset = max(0, offset)
+    stmt = select(Asset).order_by(Asset.updated_at.desc(), Asset.id.desc()).limit(limit)
+    if cursor:
+        stmt = stmt.where(tuple_(Asset.updated_at, Asset.id) < _parse_cursor(cursor, "-updated_at"))
+    else:
+        stmt = stmt.offset(offset)
+    rows = (await db.execute(stmt)).scalars().all()
 
-    db: Session = SessionLocal()
-    try:
-        now = datetime.utcnow()
-        a = db.execute(select(Asset).where(Asset.key == key)).scalar_one_or_none()
-
-        if a is None:
-            a = Asset(
-                key=key,
-                name=payload.get("name") or key,
-                environment=payload.get("environment") or "unknown",
-                owner=payload.get("owner") or "",
-                criticality=(payload.get("criticality") or "medium"),
-                exposure=(payload.get("exposure") or "internal"),
-                created_at=now,
-                updated_at=now,
-            )
-            db.add(a)
-        else:
-            a.name = payload.get("name") or a.name
-            a.environment = payload.get("environment") or a.environment
-            a.owner = payload.get("owner") or a.owner
-            a.criticality = payload.get("criticality") or a.criticality
-            a.exposure = payload.get("exposure") or a.exposure
-            a.updated_at = now
-
-        db.commit()
-        db.refresh(a)
-
-        return {
-            "ok": True,
-            "asset": {
+    return {
+        "count": len(rows),
+        "offset": offset,
+        "next_cursor": encode_cursor(rows[-1].updated_at, rows[-1].id, "-updated_at") if len(rows) == limit else None,
+        "results": [
+            {
                 "id": a.id,
                 "key": a.key,
                 "name": a.name,
@@ -201,218 +201,302 @@ def upsert_asset(payload: dict):
                 "owner": a.owner,
                 "criticality": a.criticality,
                 "exposure": a.exposure,
+                "created_at": a.created_at.isoformat() + "Z",
                 "updated_at": a.updated_at.isoformat() + "Z",
-            },
-        }
-    finally:
-        db.close()
+            }
+            for a in rows
+        ],
+    }
 
 
-# -----------------------------
-# Background notifications
-# -----------------------------
-def run_notifications_sync(
-    title: str,
-    severity: str,
-    asset: str,
-    risk_score: int,
-    finding_id: str,
-    tool: str,
-    is_new: bool,
-    occurrences: int,
-):
-    try:
-        slack_result = send_slack_notification_sync(
-            title=title,
-            severity=severity,
-            asset=asset,
-            risk_score=risk_score,
-            finding_id=finding_id,
-            tool=tool,
-            is_new=is_new,
-            occurrences=occurrences,
+@app.post("/assets/upsert")
+def upsert_asset(payload: dict, db: Session = Depends(get_db)):
+    key = (payload.get("key") or "").strip().lower()
+    if not key:
+        raise HTTPException(status_code=400, detail="key is required")
+
+    now = datetime.utcnow()
+    a = db.execute(select(Asset).where(Asset.key == key)).scalar_one_or_none()
+
+    if a is None:
+        a = Asset(
+            key=key,
+            name=payload.get("name") or key,
+            environment=payload.get("environment") or "unknown",
+            owner=payload.get("owner") or "",
+            criticality=(payload.get("criticality") or "medium"),
+            exposure=(payload.get("exposure") or "internal"),
+            created_at=now,
+            updated_at=now,
         )
-        if slack_result:
-            logger.info(f"Slack notification: {slack_result}")
-
-        if is_new and severity.lower() in {"critical", "high"}:
-            jira_result = create_jira_issue_sync(
-                title=title,
-                severity=severity,
-                asset=asset,
-                risk_score=risk_score,
-                finding_id=finding_id,
-                tool=tool,
-            )
-            if jira_result:
-                logger.info(f"Jira issue created: {jira_result}")
-    except Exception as e:
-        logger.error(f"Notification error: {e}")
+        db.add(a)
+    else:
+        a.name = payload.get("name") or a.name
+        a.environment = payload.get("environment") or a.environment
+        a.owner = payload.get("owner") or a.owner
+        a.criticality = payload.get("criticality") or a.criticality
+        a.exposure = payload.get("exposure") or a.exposure
+        a.updated_at = now
+
+    db.commit()
+    db.refresh(a)
+
+    return {
+        "ok": True,
+        "asset": {
+            "id": a.id,
+            "key": a.key,
+            "name": a.name,
+            "environment": a.environment,
+            "owner": a.owner,
+            "criticality": a.criticality,
+            "exposure": a.exposure,
+            "updated_at": a.updated_at.isoformat() + "Z",
+        },
+    }
 
 
 # -----------------------------
 # Ingest (signals + findings with dedupe)
 # -----------------------------
-@app.post("/ingest/signal")
-def ingest_signal(payload: SignalIn, background_tasks: BackgroundTasks):
-    db: Session = SessionLocal()
-    try:
-        now = datetime.utcnow()
-        asset_key = (payload.asset or "unknown").strip().lower()
-
-        asset = db.execute(select(Asset).where(Asset.key == asset_key)).scalar_one_or_none()
-        if asset is None:
-            asset = Asset(
-                key=asset_key,
-                name=asset_key,
-                environment="unknown",
-                owner="",
-                criticality=payload.criticality or "medium",
-                exposure=payload.exposure or "internal",
-                created_at=now,
-                updated_at=now,
-            )
-            db.add(asset)
-            db.flush()
-
-        signal = Signal(tool=payload.tool, payload=json.dumps(payload.model_dump()))
-        db.add(signal)
-        db.flush()
-
-        risk_score = compute_risk_score(payload.severity, payload.exposure, payload.criticality)
-        fp = make_fingerprint(payload.tool, payload.title, asset_key)
-
-        existing = db.execute(select(Finding).where(Finding.fingerprint == fp)).scalars().first()
-        if existing:
-            existing.last_seen = now
-            existing.occurrences = (existing.occurrences or 1) + 1
-            existing.risk_score = max(existing.risk_score or 0, risk_score)
-            existing.signal_id = signal.id
-            existing.asset = asset_key
-            existing.asset_id = asset.id
-            db.add(existing)
-            db.commit()
-
-            if payload.severity.lower() in NOTIFY_SEVERITIES:
-                background_tasks.add_task(
-                    run_notifications_sync,
-                    title=payload.title,
-                    severity=payload.severity,
-                    asset=asset_key,
-                    risk_score=existing.risk_score,
-                    finding_id=existing.id,
-                    tool=payload.tool,
-                    is_new=False,
-                    occurrences=existing.occurrences,
-                )
-
-            return {
-                "accepted": True,
-                "deduped": True,
-                "signal_id": signal.id,
-                "finding_id": existing.id,
-                "risk_score": existing.risk_score,
-                "occurrences": existing.occurrences,
-                "fingerprint": existing.fingerprint,
-            }
+def _write_signal(db: Session, payload: SignalIn, asset_key: str, now: datetime):
+    """Store one signal and upsert its finding; returns (signal_id, finding row, is_new, notify).
+
+    ``notify`` is False for critical/high repeats still inside the notification
+    cooldown; otherwise the finding's last_notified_at is moved to ``now`` and
+    the notification is queued in the outbox, in the same transaction.
+
+    Written against the sync Session so it can run inside ``AsyncSession.run_sync``
+    and share the dialect-aware upsert helpers with the bulk importer.
+    """
+    asset = ensure_asset(
+        db,
+        asset_key,
+        criticality=payload.criticality or "medium",
+        exposure=payload.exposure or "internal",
+        now=now,
+    )
 
-        finding = Finding(
-            fingerprint=fp,
+    signal_id = _uuid()
+    db.execute(
+        insert(Signal).values(
+            id=signal_id,
             tool=payload.tool,
-            title=payload.title,
-            severity=payload.severity,
-            asset=asset_key,
-            asset_id=asset.id,
-            exposure=payload.exposure,
-            criticality=payload.criticality,
-            status="open",
-            risk_score=risk_score,
-            occurrences=1,
-            first_seen=now,
-            last_seen=now,
-            signal_id=signal.id,
+            payload_hash=store_payload(db, payload.model_dump(), now),
+            created_at=now,
         )
-        db.add(finding)
-        db.commit()
-        db.refresh(finding)
-
-        if payload.severity.lower() in NOTIFY_SEVERITIES:
-            background_tasks.add_task(
-                run_notifications_sync,
-                title=payload.title,
-                severity=payload.severity,
-                asset=asset_key,
-                risk_score=risk_score,
-                finding_id=finding.id,
-                tool=payload.tool,
-                is_new=True,
-                occurrences=1,
-            )
+    )
 
-        return {
-            "accepted": True,
-            "deduped": False,
-            "signal_id": signal.id,
+    risk_score = compute_risk_score(payload.severity, payload.exposure, payload.criticality)
+    fp = make_fingerprint(payload.tool, payload.title, asset_key)
+
+    previous = db.execute(
+        select(Finding.risk_score, Finding.severity, Finding.status, Finding.last_notified_at)
+        .where(Finding.fingerprint == fp)
+        .with_for_update()
+    ).one_or_none()
+
+    finding = upsert_finding(db, {
+        "id": _uuid(),
+        "fingerprint": fp,
+        "tool": payload.tool,
+        "title": payload.title,
+        "severity": payload.severity,
+        "asset": asset_key,
+        "asset_id": asset.id,
+        "exposure": payload.exposure,
+        "criticality": payload.criticality,
+        "status": "open",
+        "risk_score": risk_score,
+        "occurrences": 1,
+        "first_seen": now,
+        "last_seen": now,
+        "signal_id": signal_id,
+    })
+
+    is_new = finding.occurrences == 1
+    rollup = RollupDeltas()
+    trends = TrendDeltas()
+    if is_new:
+        rollup.opened(asset_key, asset.id, payload.severity, finding.risk_score)
+        trends.opened(now, payload.severity, payload.tool, asset_key, finding.risk_score)
+    elif previous is not None and previous.status == "open":
+        rollup.risk_raised(asset_key, asset.id, previous.risk_score, finding.risk_score)
+        trends.risk_raised(now, previous.severity, payload.tool, asset_key, previous.risk_score, finding.risk_score)
+    rollup.apply(db, now)
+    trends.apply(db, now)
+
+    notify = payload.severity.lower() in NOTIFY_SEVERITIES and (
+        is_new or previous is None or not in_cooldown(previous.last_notified_at, now)
+    )
+    if notify:
+        db.execute(update(Finding).where(Finding.id == finding.id).values(last_notified_at=now))
+        enqueue_notifications(db, [{
+            "title": payload.title,
+            "severity": payload.severity,
+            "asset": asset_key,
+            "risk_score": finding.risk_score,
             "finding_id": finding.id,
-            "risk_score": risk_score,
-            "occurrences": 1,
-            "fingerprint": fp,
-        }
-    finally:
-        db.close()
+            "tool": payload.tool,
+            "is_new": is_new,
+            "occurrences": finding.occurrences,
+        }], payload.tool, now=now)
+    return signal_id, finding, is_new, notify
+
+
+@app.post("/ingest/signal")
+async def ingest_signal(
+    payload: SignalIn,
+    db: AsyncSession = Depends(get_async_db),
+):
+    now = datetime.utcnow()
+    asset_key = (payload.asset or "unknown").strip().lower()
+
+    signal_id, finding, is_new, notify = await db.run_sync(_write_signal, payload, asset_key, now)
+    await db.commit()
+
+    if notify:
+        outbox_dispatcher.wake()
+
+    return {
+        "accepted": True,
+        "deduped": not is_new,
+        "signal_id": signal_id,
+        "finding_id": finding.id,
+        "risk_score": finding.risk_score,
+        "occurrences": finding.occurrences,
+        "fingerprint": finding.fingerprint,
+    }
 
 
 # -----------------------------
 # List findings
 # -----------------------------
+FINDING_SORTS = {
+    "last_seen": Finding.last_seen,
+    "first_seen": Finding.first_seen,
+    "risk_score": Finding.risk_score,
+    "occurrences": Finding.occurrences,
+}
+
+
+def _split(value: Optional[str]) -> list[str]:
+    return [v.strip() for v in (value or "").split(",") if v.strip()]
+
+
 @app.get("/findings")
-def list_findings(limit: int = 100, offset: int = 0):
-    db: Session = SessionLocal()
-    try:
-        limit = max(1, min(limit, 200))
-        offset = max(0, offset)
-        rows = db.execute(
-            select(Finding).order_by(Finding.last_seen.desc()).offset(offset).limit(limit)
-        ).scalars().all()
-
-        return {
-            "count": len(rows),
-            "offset": offset,
-            "results": [_serialize_finding(f) for f in rows],
-        }
-    finally:
-        db.close()
+async def list_findings(
+    limit: int = 100,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    sort: str = "-last_seen",
+    status: Optional[str] = None,
+    severity: Optional[str] = None,
+    tool: Optional[str] = None,
+    asset: Optional[str] = None,
+    asset_id: Optional[str] = None,
+    assignee: Optional[str] = None,
+    cve_id: Optional[str] = None,
+    cwe_id: Optional[int] = None,
+    min_risk: Optional[int] = None,
+    first_seen_after: Optional[datetime] = None,
+    first_seen_before: Optional[datetime] = None,
+    last_seen_after: Optional[datetime] = None,
+    last_seen_before: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """List findings with server-side filters.
+
+    ``status``, ``severity`` and ``tool`` take comma-separated values.
+    ``sort`` is one of last_seen, first_seen, risk_score or occurrences,
+    prefixed with ``-`` for descending order.
+    """
+    descending = sort.startswith("-")
+    sort_col = FINDING_SORTS.get(sort.lstrip("-"))
+    if sort_col is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid sort '{sort}'. Allowed: {', '.join(sorted(FINDING_SORTS))} (prefix '-' for descending)",
+        )
+
+    conditions = []
+    for col, value in ((Finding.status, status), (Finding.severity, severity), (Finding.tool, tool)):
+        values = _split(value)
+        if len(values) == 1:
+            conditions.append(col == values[0])
+        elif values:
+            conditions.append(col.in_(values))
+    if asset:
+        conditions.append(Finding.asset == asset.strip().lower())
+    if asset_id:
+        conditions.append(Finding.asset_id == asset_id)
+    if assignee:
+        conditions.append(Finding.assignee == assignee)
+    if cve_id:
+        conditions.append(Finding.cve_id == cve_id)
+    if cwe_id is not None:
+        conditions.append(Finding.cwe_id == cwe_id)
+    if min_risk is not None:
+        conditions.append(Finding.risk_score >= min_risk)
+    if first_seen_after:
+        conditions.append(Finding.first_seen >= first_seen_after)
+    if first_seen_before:
+        conditions.append(Finding.first_seen < first_seen_before)
+    if last_seen_after:
+        conditions.append(Finding.last_seen >= last_seen_after)
+    if last_seen_before:
+        conditions.append(Finding.last_seen < last_seen_before)
+
+    limit = max(1, min(limit, 200))
+    offset = max(0, offset)
+    order = (sort_col.desc(), Finding.id.desc()) if descending else (sort_col.asc(), Finding.id.asc())
+    stmt = select(Finding).where(*conditions).order_by(*order).limit(limit)
+    if cursor:
+        bound = _parse_cursor(cursor, sort, as_datetime=sort_col.type.python_type is datetime)
+        key = tuple_(sort_col, Finding.id)
+        stmt = stmt.where(key < bound if descending else key > bound)
+    else:
+        stmt = stmt.offset(offset)
+    rows = (await db.execute(stmt)).scalars().all()
+
+    next_cursor = None
+    if len(rows) == limit:
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_col.key), last.id, sort)
+
+    return {
+        "count": len(rows),
+        "offset": offset,
+        "next_cursor": next_cursor,
+        "results": [_serialize_finding(f) for f in rows],
+    }
 
 
 # -----------------------------
 # Get single finding with comments
 # -----------------------------
 @app.get("/findings/{finding_id}")
-def get_finding(finding_id: str):
-    db: Session = SessionLocal()
-    try:
-        finding = db.execute(select(Finding).where(Finding.id == finding_id)).scalar_one_or_none()
-        if not finding:
-            raise HTTPException(status_code=404, detail="Finding not found")
-
-        comments = db.execute(
-            select(Comment).where(Comment.finding_id == finding_id).order_by(Comment.created_at.desc())
-        ).scalars().all()
-
-        result = _serialize_finding(finding)
-        result["comments"] = [
-            {
-                "id": c.id,
-                "author": c.author,
-                "content": c.content,
-                "action_type": c.action_type,
-                "created_at": c.created_at.isoformat() + "Z",
-            }
-            for c in comments
-        ]
-        return result
-    finally:
-        db.close()
+async def get_finding(finding_id: str, db: AsyncSession = Depends(get_async_db)):
+    finding = (await db.execute(select(Finding).where(Finding.id == finding_id))).scalar_one_or_none()
+    if not finding:
+        raise HTTPException(status_code=404, detail="Finding not found")
+
+    comments = (await db.execute(
+        select(Comment).where(Comment.finding_id == finding_id).order_by(Comment.created_at.desc())
+    )).scalars().all()
+
+    result = _serialize_finding(finding)
+    result["comments"] = [
+        {
+            "id": c.id,
+            "author": c.author,
+            "content": c.content,
+            "action_type": c.action_type,
+            "created_at": c.created_at.isoformat() + "Z",
+        }
+        for c in comments
+    ]
+    return result
 
 
 # -----------------------------
@@ -427,57 +511,66 @@ class FindingUpdate(BaseModel):
 
 
 @app.patch("/findings/{finding_id}")
-def update_finding(finding_id: str, payload: FindingUpdate):
-    db: Session = SessionLocal()
-    try:
-        if payload.status is not None and payload.status not in ALLOWED_STATUSES:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid status '{payload.status}'. Allowed: {', '.join(sorted(ALLOWED_STATUSES))}",
-            )
+def update_finding(finding_id: str, payload: FindingUpdate, db: Session = Depends(get_db)):
+    if payload.status is not None and payload.status not in ALLOWED_STATUSES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid status '{payload.status}'. Allowed: {', '.join(sorted(ALLOWED_STATUSES))}",
+        )
 
-        finding = db.execute(select(Finding).where(Finding.id == finding_id)).scalar_one_or_none()
-        if not finding:
-            raise HTTPException(status_code=404, detail="Finding not found")
-
-        now = datetime.utcnow()
-        changes = []
-
-        if payload.status is not None and payload.status != finding.status:
-            old_status = finding.status
-            finding.status = payload.status
-            changes.append(f"Status changed from '{old_status}' to '{payload.status}'")
-
-        if payload.assignee is not None and payload.assignee != finding.assignee:
-            old_assignee = finding.assignee or "unassigned"
-            finding.assignee = payload.assignee if payload.assignee else None
-            new_assignee = payload.assignee or "unassigned"
-            changes.append(f"Assignee changed from '{old_assignee}' to '{new_assignee}'")
-
-        if changes:
-            comment = Comment(
-                finding_id=finding.id,
-                author="system",
-                content="; ".join(changes),
-                action_type="update",
-                created_at=now,
-            )
-            db.add(comment)
-
-        db.commit()
-        db.refresh(finding)
-
-        return {
-            "ok": True,
-            "finding": {
-                "id": finding.id,
-                "status": finding.status,
-                "assignee": finding.assignee,
-            },
-            "changes": changes,
-        }
-    finally:
-        db.close()
+    finding = db.execute(select(Finding).where(Finding.id == finding_id)).scalar_one_or_none()
+    if not finding:
+        raise HTTPException(status_code=404, detail="Finding not found")
+
+    now = datetime.utcnow()
+    changes = []
+
+    if payload.status is not None and payload.status != finding.status:
+        old_status = finding.status
+        finding.status = payload.status
+        changes.append(f"Status changed from '{old_status}' to '{payload.status}'")
+
+        rollup = RollupDeltas()
+        if old_status == "open":
+            rollup.closed(finding.asset, finding.asset_id, finding.severity, finding.risk_score)
+        elif payload.status == "open":
+            rollup.opened(finding.asset, finding.asset_id, finding.severity, finding.risk_score)
+        trends = TrendDeltas()
+        trends.status_changed(
+            now, finding.severity, finding.tool, finding.asset, finding.risk_score, old_status, payload.status
+        )
+        db.flush()
+        rollup.apply(db, now)
+        trends.apply(db, now)
+
+    if payload.assignee is not None and payload.assignee != finding.assignee:
+        old_assignee = finding.assignee or "unassigned"
+        finding.assignee = payload.assignee if payload.assignee else None
+        new_assignee = payload.assignee or "unassigned"
+        changes.append(f"Assignee changed from '{old_assignee}' to '{new_assignee}'")
+
+    if changes:
+        comment = Comment(
+            finding_id=finding.id,
+            author="system",
+            content="; ".join(changes),
+            action_type="update",
+            created_at=now,
+        )
+        db.add(comment)
+
+    db.commit()
+    db.refresh(finding)
+
+    return {
+        "ok": True,
+        "finding": {
+            "id": finding.id,
+            "status": finding.status,
+            "assignee": finding.assignee,
+        },
+        "changes": changes,
+    }
 
 
 # -----------------------------
@@ -489,109 +582,144 @@ class CommentIn(BaseModel):
 
 
 @app.post("/findings/{finding_id}/comments")
-def add_comment(finding_id: str, payload: CommentIn):
-    db: Session = SessionLocal()
-    try:
-        finding = db.execute(select(Finding).where(Finding.id == finding_id)).scalar_one_or_none()
-        if not finding:
-            raise HTTPException(status_code=404, detail="Finding not found")
+def add_comment(finding_id: str, payload: CommentIn, db: Session = Depends(get_db)):
+    finding = db.execute(select(Finding).where(Finding.id == finding_id)).scalar_one_or_none()
+    if not finding:
+        raise HTTPException(status_code=404, detail="Finding not found")
+
+    comment = Comment(
+        finding_id=finding.id,
+        author=payload.author,
+        content=payload.content,
+        action_type="comment",
+        created_at=datetime.utcnow(),
+    )
+    db.add(comment)
+    db.commit()
+    db.refresh(comment)
 
-        comment = Comment(
-            finding_id=finding.id,
-            author=payload.author,
-            content=payload.content,
-            action_type="comment",
-            created_at=datetime.utcnow(),
-        )
-        db.add(comment)
-        db.commit()
-        db.refresh(comment)
-
-        return {
-            "ok": True,
-            "comment": {
-                "id": comment.id,
-                "author": comment.author,
-                "content": comment.content,
-                "action_type": comment.action_type,
-                "created_at": comment.created_at.isoformat() + "Z",
-            },
-        }
-    finally:
-        db.close()
+    return {
+        "ok": True,
+        "comment": {
+            "id": comment.id,
+            "author": comment.author,
+            "content": comment.content,
+            "action_type": comment.action_type,
+            "created_at": comment.created_at.isoformat() + "Z",
+        },
+    }
 
 
 # -----------------------------
 # Risks
 # -----------------------------
+def _serialize_rollup(r: AssetRiskRollup) -> dict:
+    return {
+        "asset": r.asset,
+        "asset_id": r.asset_id,
+        "total_findings": r.open_findings,
+        "max_risk": r.max_risk,
+        "risk_sum": r.risk_sum,
+        "avg_risk": r.risk_sum // r.open_findings if r.open_findings else 0,
+        "by_severity": {sev: getattr(r, col) for sev, col in SEVERITY_COLUMNS.items()},
+    }
+
+
 @app.get("/risks")
-def list_risks():
-    db: Session = SessionLocal()
-    try:
-        rows = db.execute(
-            select(
-                Finding.asset,
-                func.count().label("total"),
-                func.max(Finding.risk_score).label("max_risk"),
-                func.sum(Finding.risk_score).label("risk_sum"),
-                func.avg(Finding.risk_score).label("avg_risk"),
-            )
-            .where(Finding.status == "open")
-            .group_by(Finding.asset)
-            .order_by(func.max(Finding.risk_score).desc())
-        ).all()
-
-        return {
-            "count": len(rows),
-            "results": [
-                {
-                    "asset": r.asset,
-                    "total_findings": int(r.total or 0),
-                    "max_risk": int(r.max_risk or 0),
-                    "risk_sum": int(r.risk_sum or 0),
-                    "avg_risk": int(float(r.avg_risk or 0)),
-                }
-                for r in rows
-            ],
-        }
-    finally:
-        db.close()
+async def list_risks(db: AsyncSession = Depends(get_async_db)):
+    rows = (await db.execute(
+        select(AssetRiskRollup)
+        .where(AssetRiskRollup.open_findings > 0)
+        .order_by(AssetRiskRollup.max_risk.desc())
+    )).scalars().all()
+
+    return {
+        "count": len(rows),
+        "results": [_serialize_rollup(r) for r in rows],
+    }
 
 
 @app.get("/risks/assets")
-def risks_by_asset(limit: int = 100):
-    db: Session = SessionLocal()
-    try:
-        rows = db.execute(
-            select(
-                Asset.key.label("asset"),
-                func.count(Finding.id).label("total_findings"),
-                func.max(Finding.risk_score).label("max_risk"),
-                func.sum(Finding.risk_score).label("risk_sum"),
-                func.avg(Finding.risk_score).label("avg_risk"),
-            )
-            .join(Finding, Finding.asset_id == Asset.id)
-            .where(Finding.status == "open")
-            .group_by(Asset.key)
-            .order_by(func.max(Finding.risk_score).desc())
-            .limit(max(1, min(limit, 200)))
-        ).all()
-
-        return {
-            "count": len(rows),
-            "results": [
-                {
-                    "asset": r.asset,
-                    "total_findings": int(r.total_findings or 0),
-                    "max_risk": int(r.max_risk or 0),
-                    "risk_sum": int(r.risk_sum or 0),
-                    "avg_risk": int(float(r.avg_risk or 0)),
-                }
-                for r in rows
-            ],
-        }
-    finally:
-        db.close()
+async def risks_by_asset(limit: int = 100, db: AsyncSession = Depends(get_async_db)):
+    rows = (await db.execute(
+        select(AssetRiskRollup)
+        .where(AssetRiskRollup.open_findings > 0, AssetRiskRollup.asset_id.is_not(None))
+        .order_by(AssetRiskRollup.max_risk.desc())
+        .limit(max(1, min(limit, 200)))
+    )).scalars().all()
+
+    return {
+        "count": len(rows),
+        "results": [_serialize_rollup(r) for r in rows],
+    }
+
+
+@app.get("/metrics/trends")
+async def finding_trends(
+    days: int = 90,
+    severity: Optional[str] = None,
+    tool: Optional[str] = None,
+    asset: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Findings opened, reopened, closed and resolved per UTC day, with the open backlog and risk.
+
+    Reads only daily_finding_stats. ``severity`` and ``tool`` take comma-separated values.
+    """
+    days = max(1, min(days, 366))
+    start = datetime.utcnow().date() - timedelta(days=days - 1)
+
+    S = DailyFindingStat
+    conditions = []
+    for col, values in (
+        (S.severity, [v.lower() for v in _split(severity)]),
+        (S.tool, _split(tool)),
+        (S.asset, [asset.strip().lower()] if asset else []),
+    ):
+        if len(values) == 1:
+            conditions.append(col == values[0])
+        elif values:
+            conditions.append(col.in_(values))
+
+    # Everything before the window sets the starting backlog
+    before = (await db.execute(
+        select(
+            func.coalesce(func.sum(S.opened + S.reopened - S.closed), 0),
+            func.coalesce(func.sum(S.risk_delta), 0),
+        ).where(S.day < start, *conditions)
+    )).one()
+    rows = (await db.execute(
+        select(
+            S.day,
+            func.sum(S.opened),
+            func.sum(S.reopened),
+            func.sum(S.closed),
+            func.sum(S.resolved),
+            func.sum(S.risk_delta),
+        )
+        .where(S.day >= start, *conditions)
+        .group_by(S.day)
+    )).all()
+    by_day = {r[0]: r[1:] for r in rows}
+
+    open_findings, open_risk = int(before[0]), int(before[1])
+    results = []
+    for i in range(days):
+        day = start + timedelta(days=i)
+        opened, reopened, closed, resolved, risk_delta = by_day.get(day, (0, 0, 0, 0, 0))
+        open_findings += opened + reopened - closed
+        open_risk += risk_delta
+        results.append({
+            "day": day.isoformat(),
+            "opened": opened,
+            "reopened": reopened,
+            "closed": closed,
+            "resolved": resolved,
+            "open_findings": open_findings,
+            "open_risk": open_risk,
+        })
+
+    return {"days": days, "start": start.isoformat(), "results": results}
 
 
 # -----------------------------
@@ -618,12 +746,39 @@ def get_integrations_status():
     }
 
 
+@app.get("/integrations/outbox")
+async def get_notification_outbox(db: AsyncSession = Depends(get_async_db)):
+    """Queued and dead-lettered notifications per destination."""
+    return await outbox_status(db)
+
+
+@app.post("/integrations/outbox/retry")
+async def retry_notification_outbox(destination: Optional[str] = None, db: AsyncSession = Depends(get_async_db)):
+    """Requeue dead-lettered notifications, for one destination or all."""
+    requeued = await retry_dead(db, destination)
+    if requeued:
+        outbox_dispatcher.wake()
+    return {"ok": True, "requeued": requeued}
+
+
+@app.post("/integrations/jira/reconcile")
+async def reconcile_jira_now():
+    """Pull Jira status changes onto linked findings now instead of waiting for the next run."""
+    try:
+        result = await reconcile_jira()
+    except RuntimeError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+    if result is None:
+        raise HTTPException(status_code=400, detail="Jira not configured")
+    return {"ok": True, "issues": result.issues, "findings_updated": result.findings_updated, "cursor": result.cursor}
+
+
 @app.post("/integrations/slack/test")
-def test_slack():
+async def test_slack():
     if not os.environ.get("SLACK_WEBHOOK_URL"):
         raise HTTPException(status_code=400, detail="SLACK_WEBHOOK_URL not configured")
 
-    result = send_slack_notification_sync(
+    result = await send_slack_notification(
         title="Test Notification",
         severity="info",
         asset="test-asset",
@@ -671,11 +826,11 @@ def get_parsers(category: Optional[str] = None):
 
 @app.get("/parsers/{parser_name}")
 def get_parser_info(parser_name: str):
-    parser = get_parser(parser_name)
-    if not parser:
+    info = parser_info(parser_name)
+    if not info:
         raise HTTPException(status_code=404, detail=f"Parser '{parser_name}' not found")
 
-    return parser.get_info()
+    return info
 
 
 # -----------------------------
@@ -690,133 +845,180 @@ class ScanImportRequest(BaseModel):
     default_criticality: str = Field("medium", description="Default criticality level")
 
 
-@app.post("/import/scan")
-def import_scan(payload: ScanImportRequest, background_tasks: BackgroundTasks):
+def _serialize_import_job(job: ImportJob) -> dict:
+    if job.status == "completed":
+        message = f"Successfully imported {job.imported} findings ({job.new_findings} new, {job.deduplicated} deduplicated)"
+    elif job.status == "failed":
+        message = f"Import failed: {job.error}"
+    else:
+        message = f"Import {job.status}"
+
+    return {
+        "ok": job.status != "failed",
+        "job_id": job.id,
+        "status": job.status,
+        "parser": job.parser,
+        "filename": job.filename,
+        "parsed": job.parsed,
+        "imported": job.imported,
+        "new_findings": job.new_findings,
+        "deduplicated": job.deduplicated,
+        "raw_bytes_saved": job.raw_bytes_saved or 0,
+        "error": job.error,
+        "message": message,
+        "created_at": job.created_at.isoformat() + "Z",
+        "started_at": job.started_at.isoformat() + "Z" if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() + "Z" if job.finished_at else None,
+    }
+
+
+def _check_parser(parser: Optional[str]) -> None:
+    if parser and not parser_info(parser):
+        raise HTTPException(status_code=400, detail=f"Unknown parser: {parser}")
+
+
+@app.post("/import/scan", status_code=202)
+def import_scan(payload: ScanImportRequest, db: Session = Depends(get_db)):
+    _check_parser(payload.parser)
+
+    job = enqueue_import(
+        db,
+        io.BytesIO(payload.content.encode("utf-8")),
+        parser=payload.parser,
+        filename=payload.filename,
+        default_asset=payload.default_asset,
+        default_exposure=payload.default_exposure,
+        default_criticality=payload.default_criticality,
+    )
+    return _serialize_import_job(job)
+
+
+@app.post("/import/scan/upload", status_code=202)
+async def import_scan_upload(
+    request: Request,
+    parser: Optional[str] = None,
+    filename: Optional[str] = None,
+    default_asset: Optional[str] = None,
+    default_exposure: str = "internal",
+    default_criticality: str = "medium",
+    db: Session = Depends(get_db),
+):
+    """Import a scan report sent as multipart/form-data or as the raw request body.
+
+    The body is spooled to a temp file chunk by chunk, then stored
+    gzip-compressed as the job's report chunks, so it is never held in memory
+    as a whole. For
+    multipart requests, the report goes in a ``file`` field and the options
+    may be given as form fields; otherwise they are read from the query string.
+    """
+    content_type = request.headers.get("content-type", "")
     try:
-        parsed_findings = parse_scan_results(
-            content=payload.content,
-            parser_name=payload.parser,
-            filename=payload.filename,
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=422, detail=f"Failed to parse scan: {str(e)}")
-
-    if not parsed_findings:
-        return {
-            "ok": True,
-            "imported": 0,
-            "new_findings": 0,
-            "deduplicated": 0,
-            "message": "No findings found in scan output",
-        }
+        if content_type.startswith("multipart/form-data"):
+            form = await request.form()
+            try:
+                upload = form.get("file")
+                if upload is None or isinstance(upload, str):
+                    raise HTTPException(status_code=400, detail="multipart upload requires a 'file' field")
+                parser = form.get("parser") or parser
+                _check_parser(parser)
+                filename = form.get("filename") or upload.filename or filename
+                default_asset = form.get("default_asset") or default_asset
+                default_exposure = form.get("default_exposure") or default_exposure
+                default_criticality = form.get("default_criticality") or default_criticality
+                path = await spool_to_file(iter_upload_file(upload))
+            finally:
+                await form.close()
+        else:
+            _check_parser(parser)
+            path = await spool_to_file(request.stream())
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+    def _enqueue() -> dict:
+        with open(path, "rb") as report:
+            job = enqueue_import(
+                db,
+                report,
+                parser=parser,
+                filename=strip_gzip_suffix(filename),
+                default_asset=default_asset,
+                default_exposure=default_exposure,
+                default_criticality=default_criticality,
+            )
+        return _serialize_import_job(job)
 
-    db: Session = SessionLocal()
     try:
-        now = datetime.utcnow()
-        imported = 0
-        new_findings = 0
-        deduplicated = 0
-
-        for pf in parsed_findings:
-            asset_key = (pf.asset or payload.default_asset or "unknown").strip().lower()
-
-            asset = db.execute(select(Asset).where(Asset.key == asset_key)).scalar_one_or_none()
-            if asset is None:
-                asset = Asset(
-                    key=asset_key,
-                    name=asset_key,
-                    environment="unknown",
-                    owner="",
-                    criticality=payload.default_criticality,
-                    exposure=payload.default_exposure,
-                    created_at=now,
-                    updated_at=now,
-                )
-                db.add(asset)
-                db.flush()
-
-            signal = Signal(tool=pf.tool, payload=json.dumps(pf.to_signal_payload()))
-            db.add(signal)
-            db.flush()
-
-            severity = pf.severity.value
-            exposure = asset.exposure or payload.default_exposure
-            criticality = asset.criticality or payload.default_criticality
-            risk_score = compute_risk_score(severity, exposure, criticality)
-            fp = make_fingerprint(pf.tool, pf.title, asset_key)
-
-            existing = db.execute(select(Finding).where(Finding.fingerprint == fp)).scalars().first()
-            if existing:
-                existing.last_seen = now
-                existing.occurrences = (existing.occurrences or 1) + 1
-                existing.risk_score = max(existing.risk_score or 0, risk_score)
-                existing.signal_id = signal.id
-                db.add(existing)
-                deduplicated += 1
-
-                if severity in NOTIFY_SEVERITIES:
-                    background_tasks.add_task(
-                        run_notifications_sync,
-                        title=pf.title,
-                        severity=severity,
-                        asset=asset_key,
-                        risk_score=existing.risk_score,
-                        finding_id=existing.id,
-                        tool=pf.tool,
-                        is_new=False,
-                        occurrences=existing.occurrences,
-                    )
-            else:
-                finding = Finding(
-                    fingerprint=fp,
-                    tool=pf.tool,
-                    title=pf.title,
-                    severity=severity,
-                    asset=asset_key,
-                    asset_id=asset.id,
-                    exposure=exposure,
-                    criticality=criticality,
-                    status="open",
-                    risk_score=risk_score,
-                    occurrences=1,
-                    first_seen=now,
-                    last_seen=now,
-                    signal_id=signal.id,
-                    description=pf.description or None,
-                    recommendation=pf.recommendation or None,
-                    cwe_id=pf.cwe_id,
-                    cve_id=pf.cve_id,
-                    cvss_score=pf.cvss_score,
-                )
-                db.add(finding)
-                new_findings += 1
-
-                if severity in NOTIFY_SEVERITIES:
-                    db.flush()
-                    background_tasks.add_task(
-                        run_notifications_sync,
-                        title=pf.title,
-                        severity=severity,
-                        asset=asset_key,
-                        risk_score=risk_score,
-                        finding_id=finding.id,
-                        tool=pf.tool,
-                        is_new=True,
-                        occurrences=1,
-                    )
-
-            imported += 1
-
-        db.commit()
-
-        return {
-            "ok": True,
-            "imported": imported,
-            "new_findings": new_findings,
-            "deduplicated": deduplicated,
-            "message": f"Successfully imported {imported} findings ({new_findings} new, {deduplicated} deduplicated)",
-        }
+        return await run_in_threadpool(_enqueue)
+    finally:
+        os.unlink(path)
+
+
+@app.post("/import/batch")
+async def import_batch(
+    request: Request,
+    parser: Optional[str] = None,
+    default_asset: Optional[str] = None,
+    default_exposure: str = "internal",
+    default_criticality: str = "medium",
+    db: Session = Depends(get_db),
+):
+    """Import several reports from one multipart/form-data request.
+
+    Each ``files`` (or ``file``) field holds a report or a zip/tar archive of
+    reports. Every report is detected and parsed on its own, concurrently,
+    and the findings are ingested in a single transaction before responding
+    with per-file results and timings. Options may be form fields or query
+    parameters; ``parser`` skips detection for every report.
+    """
+    if not request.headers.get("content-type", "").startswith("multipart/form-data"):
+        raise HTTPException(status_code=400, detail="batch import requires multipart/form-data")
+
+    workdir = tempfile.mkdtemp(prefix="secops-batch-", dir=UPLOAD_SPOOL_DIR)
+    try:
+        form = await request.form(max_files=BATCH_MAX_FILES)
+        try:
+            uploads = [v for k, v in form.multi_items() if k in ("files", "file") and not isinstance(v, str)]
+            if not uploads:
+                raise HTTPException(status_code=400, detail="batch import requires one or more 'files' fields")
+            parser = form.get("parser") or parser
+            default_asset = form.get("default_asset") or default_asset
+            default_exposure = form.get("default_exposure") or default_exposure
+            default_criticality = form.get("default_criticality") or default_criticality
+            _check_parser(parser)
+
+            reports = []
+            for upload in uploads:
+                spooled = await spool_to_file(iter_upload_file(upload))
+                path = os.path.join(workdir, os.path.basename(spooled))
+                os.replace(spooled, path)
+                reports.extend(await run_in_threadpool(expand_report, path, upload.filename, workdir))
+        finally:
+            await form.close()
+
+        result = await run_in_threadpool(
+            import_reports,
+            db,
+            reports,
+            parser=parser,
+            default_asset=default_asset,
+            default_exposure=default_exposure,
+            default_criticality=default_criticality,
+        )
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except BatchError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     finally:
-        db.close()
+        await run_in_threadpool(shutil.rmtree, workdir, True)
+
+    if result.notifications_queued:
+        outbox_dispatcher.wake()
+    return result.to_dict()
+
+
+@app.get("/import/jobs/{job_id}")
+async def get_import_job(job_id: str, db: AsyncSession = Depends(get_async_db)):
+    job = (await db.execute(select(ImportJob).where(ImportJob.id == job_id))).scalar_one_or_none()
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return _serialize_import_job(job)
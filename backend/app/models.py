@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from uuid import uuid4
 
-from sqlalchemy import String, Integer, Float, DateTime, Text, ForeignKey
+from sqlalchemy import BigInteger, String, Integer, Float, Date, DateTime, Text, ForeignKey, LargeBinary, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .db import Base
@@ -15,6 +15,9 @@ def _uuid() -> str:
 
 class Asset(Base):
     __tablename__ = "assets"
+    __table_args__ = (
+        Index("ix_assets_updated_at_id", "updated_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=_uuid)
     key: Mapped[str] = mapped_column(String, unique=True, index=True)
@@ -30,46 +33,73 @@ class Asset(Base):
     findings: Mapped[list["Finding"]] = relationship(back_populates="asset_rel")
 
 
+class SignalPayload(Base):
+    __tablename__ = "signal_payloads"
+
+    # sha256 of the canonical JSON; identical sightings share one row
+    hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    codec: Mapped[str] = mapped_column(String, default="zlib")
+    size: Mapped[int] = mapped_column(Integer, default=0)
+    data: Mapped[bytes] = mapped_column(LargeBinary)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
 class Signal(Base):
     __tablename__ = "signals"
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=_uuid)
     tool: Mapped[str] = mapped_column(String, index=True)
-    payload: Mapped[str] = mapped_column(Text)
+    payload_hash: Mapped[str] = mapped_column(String(64), ForeignKey("signal_payloads.hash"), index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
 
 class Finding(Base):
     __tablename__ = "findings"
+    # Composite indexes for the /findings filters and sorts; their leading
+    # columns replace the old single-column status/tool/assignee/asset_id indexes.
+    __table_args__ = (
+        Index("ix_findings_last_seen_id", "last_seen", "id"),
+        Index("ix_findings_risk_score_id", "risk_score", "id"),
+        Index("ix_findings_status_last_seen_id", "status", "last_seen", "id"),
+        Index("ix_findings_status_risk_score_id", "status", "risk_score", "id"),
+        Index("ix_findings_severity_status", "severity", "status"),
+        Index("ix_findings_asset_id_status", "asset_id", "status"),
+        Index("ix_findings_tool_status", "tool", "status"),
+        Index("ix_findings_assignee_status", "assignee", "status"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=_uuid)
 
-    fingerprint: Mapped[str] = mapped_column(String(64), index=True)
+    fingerprint: Mapped[str] = mapped_column(String(64), unique=True, index=True)
 
-    tool: Mapped[str] = mapped_column(String, index=True)
+    tool: Mapped[str] = mapped_column(String)
     title: Mapped[str] = mapped_column(String, index=True)
     severity: Mapped[str] = mapped_column(String)
 
     asset: Mapped[str] = mapped_column(String, index=True)
-    asset_id: Mapped[str | None] = mapped_column(String, ForeignKey("assets.id"), nullable=True, index=True)
+    asset_id: Mapped[str | None] = mapped_column(String, ForeignKey("assets.id"), nullable=True)
     asset_rel: Mapped["Asset"] = relationship(back_populates="findings")
 
     exposure: Mapped[str] = mapped_column(String, default="internal")
     criticality: Mapped[str] = mapped_column(String, default="medium")
-    status: Mapped[str] = mapped_column(String, default="open", index=True)
-    assignee: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
+    status: Mapped[str] = mapped_column(String, default="open")
+    assignee: Mapped[str | None] = mapped_column(String, nullable=True)
 
     risk_score: Mapped[int] = mapped_column(Integer, default=1)
     occurrences: Mapped[int] = mapped_column(Integer, default=1)
 
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     recommendation: Mapped[str | None] = mapped_column(Text, nullable=True)
-    cwe_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    cwe_id: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
     cve_id: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
     cvss_score: Mapped[float | None] = mapped_column(Float, nullable=True)
 
     first_seen: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     last_seen: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # When a Slack/Jira notification last went out; repeat sightings inside the cooldown are not re-notified
+    last_notified_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # Jira issue created for this finding, or found by its fingerprint label
+    jira_issue_key: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
 
     signal_id: Mapped[str] = mapped_column(String, index=True)
 
@@ -88,3 +118,127 @@ class Comment(Base):
     action_type: Mapped[str | None] = mapped_column(String, nullable=True)
     
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class AssetRiskRollup(Base):
+    """Open-finding risk totals per asset key, maintained alongside ingest and triage."""
+
+    __tablename__ = "asset_risk_rollups"
+
+    asset: Mapped[str] = mapped_column(String, primary_key=True)
+    asset_id: Mapped[str | None] = mapped_column(String, nullable=True)
+
+    open_findings: Mapped[int] = mapped_column(Integer, default=0)
+    max_risk: Mapped[int] = mapped_column(Integer, default=0, index=True)
+    risk_sum: Mapped[int] = mapped_column(Integer, default=0)
+
+    critical_count: Mapped[int] = mapped_column(Integer, default=0)
+    high_count: Mapped[int] = mapped_column(Integer, default=0)
+    medium_count: Mapped[int] = mapped_column(Integer, default=0)
+    low_count: Mapped[int] = mapped_column(Integer, default=0)
+    info_count: Mapped[int] = mapped_column(Integer, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class ImportJob(Base):
+    __tablename__ = "import_jobs"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=_uuid)
+    status: Mapped[str] = mapped_column(String, default="queued", index=True)
+
+    parser: Mapped[str | None] = mapped_column(String, nullable=True)
+    filename: Mapped[str | None] = mapped_column(String, nullable=True)
+    default_asset: Mapped[str | None] = mapped_column(String, nullable=True)
+    default_exposure: Mapped[str] = mapped_column(String, default="internal")
+    default_criticality: Mapped[str] = mapped_column(String, default="medium")
+
+    parsed: Mapped[int] = mapped_column(Integer, default=0)
+    imported: Mapped[int] = mapped_column(Integer, default=0)
+    new_findings: Mapped[int] = mapped_column(Integer, default=0)
+    deduplicated: Mapped[int] = mapped_column(Integer, default=0)
+    # raw_data bytes not stored because of the parser's retention policy
+    raw_bytes_saved: Mapped[int] = mapped_column(BigInteger, default=0)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    worker_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    # Leases taken, and the running worker's last sign of life; a lease older
+    # than IMPORT_LEASE_SECONDS is reclaimed by another worker
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # Parsed findings, in report order, whose ingest chunks are committed; a
+    # reclaimed job skips them
+    committed: Mapped[int] = mapped_column(Integer, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+class ImportJobChunk(Base):
+    """One piece of a queued job's gzip-compressed report, deleted once the job finishes.
+
+    Reports are stored and read back a chunk at a time so neither the API nor
+    the worker holds a whole report in memory.
+    """
+
+    __tablename__ = "import_job_chunks"
+
+    job_id: Mapped[str] = mapped_column(String, ForeignKey("import_jobs.id"), primary_key=True)
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True)
+    data: Mapped[bytes] = mapped_column(LargeBinary)
+
+
+class NotificationOutbox(Base):
+    """A Slack message or Jira issue waiting for the outbox dispatcher.
+
+    Rows are written in the transaction that produced the notification and
+    deleted once delivered; ``dead`` rows ran out of attempts.
+    """
+    __tablename__ = "notification_outbox"
+    __table_args__ = (
+        Index("ix_notification_outbox_due", "destination", "status", "next_attempt_at"),
+    )
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=_uuid)
+    destination: Mapped[str] = mapped_column(String)  # slack, jira
+    kind: Mapped[str] = mapped_column(String)  # finding, digest, window, issue
+    payload: Mapped[str] = mapped_column(Text)
+    status: Mapped[str] = mapped_column(String, default="pending")  # pending, dead
+    # Import job whose digest this row is part of; parts are merged when the job ends
+    group_key: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class DailyFindingStat(Base):
+    """Findings opened, reopened and closed per UTC day, severity, tool and asset key.
+
+    Maintained alongside ingest and status changes; ``risk_delta`` is the net
+    change in open risk that day, so a running sum gives the open backlog.
+    """
+
+    __tablename__ = "daily_finding_stats"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    severity: Mapped[str] = mapped_column(String, primary_key=True)
+    tool: Mapped[str] = mapped_column(String, primary_key=True)
+    asset: Mapped[str] = mapped_column(String, primary_key=True)
+
+    opened: Mapped[int] = mapped_column(Integer, default=0)
+    reopened: Mapped[int] = mapped_column(Integer, default=0)
+    closed: Mapped[int] = mapped_column(Integer, default=0)
+    resolved: Mapped[int] = mapped_column(Integer, default=0)
+    risk_delta: Mapped[int] = mapped_column(Integer, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class IntegrationCursor(Base):
+    """Where an incremental sync with an external system left off."""
+    __tablename__ = "integration_cursors"
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    value: Mapped[str] = mapped_column(String)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -1,9 +1,26 @@
-from .slack import send_slack_notification, send_slack_notification_sync
-from .jira import create_jira_issue, create_jira_issue_sync
+from .clients import client_status, close_clients, open_clients
+from .slack import send_slack_digest, send_slack_notification
+from .jira import create_jira_issues, search_jira_issues
+from .dispatch import NOTIFY_COOLDOWN, NOTIFY_SEVERITIES, in_cooldown
+from .outbox import OutboxDispatcher, enqueue_notifications, outbox_status, release_notifications, retry_dead
+from .reconcile import JiraReconciler, reconcile_jira
 
 __all__ = [
+    "NOTIFY_COOLDOWN",
+    "NOTIFY_SEVERITIES",
+    "JiraReconciler",
+    "OutboxDispatcher",
+    "client_status",
+    "close_clients",
+    "open_clients",
+    "send_slack_digest",
     "send_slack_notification",
-    "send_slack_notification_sync",
-    "create_jira_issue",
-    "create_jira_issue_sync",
+    "create_jira_issues",
+    "search_jira_issues",
+    "enqueue_notifications",
+    "in_cooldown",
+    "outbox_status",
+    "reconcile_jira",
+    "release_notifications",
+    "retry_dead",
 ]
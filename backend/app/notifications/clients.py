@@ -0,0 +1,182 @@
+"""Long-lived async HTTP clients for the Slack and Jira integrations.
+
+One ``httpx.AsyncClient`` per integration, kept open for the life of the
+process so connections (and their TLS sessions) are reused across
+notifications. HTTP/2 is negotiated through ``h2`` (``httpx[http2]`` in
+requirements.txt); without it the clients use HTTP/1.1. Each client allows at most ``max_connections`` requests in flight;
+further sends wait for a slot rather than failing on a pool timeout.
+Request counts, errors, connection reuse and latency percentiles are
+recorded per client (``client_status``).
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable, Optional
+import asyncio
+import base64
+import os
+import time
+
+import httpx
+
+try:
+    import h2
+except ImportError:  # installed by httpx[http2]; HTTP/1.1 only without it
+    h2 = None
+
+HTTP2 = h2 is not None
+
+SLACK_HTTP_MAX_CONNECTIONS = int(os.environ.get("SLACK_HTTP_MAX_CONNECTIONS", "4"))
+JIRA_HTTP_MAX_CONNECTIONS = int(os.environ.get("JIRA_HTTP_MAX_CONNECTIONS", "4"))
+# Idle connections are closed after this long
+NOTIFY_HTTP_KEEPALIVE_SECONDS = float(os.environ.get("NOTIFY_HTTP_KEEPALIVE_SECONDS", "60"))
+
+_LATENCY_SAMPLES = 1000
+
+
+class _ClientStats:
+    """Requests, errors, new connections and recent latencies for one client."""
+
+    def __init__(self):
+        self.requests = 0
+        self.http_errors = 0
+        self.transport_errors = 0
+        self.connections_opened = 0
+        self.in_flight = 0
+        self.http_versions: dict[str, int] = {}
+        self.latencies: deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+
+    def record(self, elapsed: float, response: Optional[httpx.Response] = None) -> None:
+        self.requests += 1
+        self.latencies.append(elapsed)
+        if response is None:
+            self.transport_errors += 1
+            return
+        if response.status_code >= 400:
+            self.http_errors += 1
+        self.http_versions[response.http_version] = self.http_versions.get(response.http_version, 0) + 1
+
+    def snapshot(self) -> dict:
+        latencies = sorted(self.latencies)
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000, 3)
+
+        return {
+            "requests": self.requests,
+            "http_errors": self.http_errors,
+            "transport_errors": self.transport_errors,
+            "in_flight": self.in_flight,
+            "connections_opened": self.connections_opened,
+            "connections_reused": max(0, self.requests - self.transport_errors - self.connections_opened),
+            "http_versions": dict(self.http_versions),
+            "latency_p50_ms": percentile(0.50),
+            "latency_p95_ms": percentile(0.95),
+            "latency_p99_ms": percentile(0.99),
+            "latency_max_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+        }
+
+
+class IntegrationClient:
+    """A pooled ``httpx.AsyncClient`` with bounded concurrency and request stats.
+
+    ``headers`` is called once, when the underlying client is opened, so
+    per-integration credentials are read and encoded once per process.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        timeout: float,
+        max_connections: int,
+        headers: Optional[Callable[[], dict]] = None,
+    ):
+        self.name = name
+        self.timeout = timeout
+        self.max_connections = max(1, max_connections)
+        self.headers = headers
+        self.stats = _ClientStats()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None
+
+    def open(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                http2=HTTP2,
+                headers=self.headers() if self.headers else None,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=NOTIFY_HTTP_KEEPALIVE_SECONDS,
+                ),
+            )
+            self._slots = asyncio.Semaphore(self.max_connections)
+        return self._client
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        self._slots = None
+        if client is not None:
+            await client.aclose()
+
+    async def _trace(self, event: str, info: dict) -> None:
+        if event == "connection.connect_tcp.complete":
+            self.stats.connections_opened += 1
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        client = self.open()
+        async with self._slots:
+            self.stats.in_flight += 1
+            start = time.perf_counter()
+            response = None
+            try:
+                response = await client.post(url, extensions={"trace": self._trace}, **kwargs)
+                return response
+            finally:
+                self.stats.in_flight -= 1
+                self.stats.record(time.perf_counter() - start, response)
+
+
+def jira_auth_headers() -> dict:
+    auth = f"{os.environ.get('JIRA_EMAIL', '')}:{os.environ.get('JIRA_API_TOKEN', '')}"
+    return {
+        "Authorization": f"Basic {base64.b64encode(auth.encode()).decode()}",
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+    }
+
+
+slack_client = IntegrationClient("slack", timeout=10.0, max_connections=SLACK_HTTP_MAX_CONNECTIONS)
+jira_client = IntegrationClient(
+    "jira", timeout=15.0, max_connections=JIRA_HTTP_MAX_CONNECTIONS, headers=jira_auth_headers
+)
+CLIENTS = (slack_client, jira_client)
+
+
+def open_clients() -> None:
+    """Open every integration client on the running event loop (app startup)."""
+    for client in CLIENTS:
+        client.open()
+
+
+async def close_clients() -> None:
+    for client in CLIENTS:
+        await client.aclose()
+
+
+def client_status() -> dict:
+    return {
+        "http2": HTTP2,
+        "keepalive_s": NOTIFY_HTTP_KEEPALIVE_SECONDS,
+        **{
+            c.name: {"open": c.is_open, "max_connections": c.max_connections, **c.stats.snapshot()}
+            for c in CLIENTS
+        },
+    }
@@ -0,0 +1,21 @@
+from datetime import datetime, timedelta
+from typing import Optional
+import os
+
+NOTIFY_SEVERITIES = {"critical", "high"}
+
+# "import": one Slack digest per import, "window": one per NOTIFY_DIGEST_WINDOW_SECONDS,
+# "off": one Slack message per finding (see outbox.enqueue_notifications)
+NOTIFY_DIGEST = os.environ.get("NOTIFY_DIGEST", "import").strip().lower()
+NOTIFY_DIGEST_WINDOW_SECONDS = float(os.environ.get("NOTIFY_DIGEST_WINDOW_SECONDS", "300"))
+NOTIFY_DIGEST_TOP_N = int(os.environ.get("NOTIFY_DIGEST_TOP_N", "10"))
+# A finding seen again within this long of its last notification is not re-notified; 0 disables
+NOTIFY_COOLDOWN = timedelta(seconds=int(os.environ.get("NOTIFY_COOLDOWN_SECONDS", "86400")))
+
+if NOTIFY_DIGEST not in ("import", "window", "off"):
+    raise ValueError(f"Invalid NOTIFY_DIGEST {NOTIFY_DIGEST!r}; use import, window or off")
+
+
+def in_cooldown(last_notified_at: Optional[datetime], now: datetime) -> bool:
+    """True when a repeat sighting at ``now`` should not be notified again."""
+    return last_notified_at is not None and now - last_notified_at < NOTIFY_COOLDOWN
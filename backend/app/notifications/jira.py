@@ -1,7 +1,15 @@
 import os
 import httpx
-from typing import Optional
-import base64
+from typing import Awaitable, Callable, Optional
+
+from .clients import jira_client
+
+# Issues per /rest/api/3/issue/bulk call (Jira's limit)
+JIRA_BULK_SIZE = 50
+
+# Every issue is labelled with its finding's fingerprint, so an issue can be
+# found again even after the finding row (and its stored key) is gone
+FINGERPRINT_LABEL_PREFIX = "secops-fp-"
 
 SEVERITY_TO_PRIORITY = {
     "critical": "Highest",
@@ -12,7 +20,11 @@ SEVERITY_TO_PRIORITY = {
 }
 
 
-def create_jira_issue_sync(
+def jira_configured() -> bool:
+    return all(os.environ.get(k) for k in ("JIRA_BASE_URL", "JIRA_EMAIL", "JIRA_API_TOKEN", "JIRA_PROJECT_KEY"))
+
+
+def build_jira_issue(
     title: str,
     severity: str,
     asset: str,
@@ -20,15 +32,10 @@ def create_jira_issue_sync(
     finding_id: str,
     tool: str,
     description: str = "",
-) -> Optional[dict]:
-    jira_base = os.environ.get("JIRA_BASE_URL")
-    jira_email = os.environ.get("JIRA_EMAIL")
-    jira_token = os.environ.get("JIRA_API_TOKEN")
+    fingerprint: Optional[str] = None,
+) -> dict:
+    """The create-issue request body for a finding."""
     jira_project = os.environ.get("JIRA_PROJECT_KEY")
-
-    if not all([jira_base, jira_email, jira_token, jira_project]):
-        return None
-
     priority = SEVERITY_TO_PRIORITY.get(severity.lower(), "Medium")
 
     issue_description = f"""
@@ -48,51 +55,144 @@ h3. Description
 _This issue was automatically created by the SecOps Dashboard._
 """
 
-    payload = {
+    return {
         "fields": {
             "project": {"key": jira_project},
             "summary": f"[{severity.upper()}] {title} - {asset}",
             "description": issue_description,
             "issuetype": {"name": "Bug"},
             "priority": {"name": priority},
-            "labels": ["security", "secops-dashboard", severity.lower()],
+            "labels": ["security", "secops-dashboard", severity.lower()]
+            + ([fingerprint_label(fingerprint)] if fingerprint else []),
         }
     }
 
-    auth_str = f"{jira_email}:{jira_token}"
-    auth_bytes = base64.b64encode(auth_str.encode()).decode()
 
-    headers = {
-        "Authorization": f"Basic {auth_bytes}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
+def fingerprint_label(fingerprint: str) -> str:
+    return FINGERPRINT_LABEL_PREFIX + fingerprint
+
+
+def _result(response: httpx.Response, jira_base: str) -> dict:
+    if response.status_code in (200, 201):
+        data = response.json()
+        return {
+            "ok": True,
+            "issue_key": data.get("key"),
+            "issue_id": data.get("id"),
+            "url": f"{jira_base}/browse/{data.get('key')}",
+        }
+    result = {
+        "ok": False,
+        "status": response.status_code,
+        "error": response.text,
     }
+    if "Retry-After" in response.headers:
+        result["retry_after"] = response.headers["Retry-After"]
+    return result
 
+
+def _element_error(error: dict) -> str:
+    element = error.get("elementErrors") or {}
+    messages = list(element.get("errorMessages") or []) + [f"{k}: {v}" for k, v in (element.get("errors") or {}).items()]
+    return "; ".join(messages) or "rejected"
+
+
+async def create_jira_issues(issues: list[dict]) -> Optional[dict]:
+    """Create up to JIRA_BULK_SIZE issues (build_jira_issue bodies) in one bulk call.
+
+    Returns a result with ``results``, one per issue in order (``ok``,
+    ``issue_key``, ``issue_id`` and ``url``, or ``ok`` False with ``error``),
+    when Jira processed the request (even if some issues were rejected); a
+    failed call returns ``ok`` False with ``status``/``error``.
+    """
+    if not jira_configured():
+        return None
+
+    jira_base = os.environ["JIRA_BASE_URL"]
     try:
-        with httpx.Client(timeout=15.0) as client:
-            response = client.post(
-                f"{jira_base}/rest/api/3/issue",
-                headers=headers,
-                json=payload,
-            )
-
-            if response.status_code in (200, 201):
-                data = response.json()
-                return {
-                    "ok": True,
-                    "issue_key": data.get("key"),
-                    "issue_id": data.get("id"),
-                    "url": f"{jira_base}/browse/{data.get('key')}",
-                }
-            else:
-                return {
-                    "ok": False,
-                    "status": response.status_code,
-                    "error": response.text,
-                }
+        response = await jira_client.post(f"{jira_base}/rest/api/3/issue/bulk", json={"issueUpdates": issues})
+        data = response.json() if response.status_code in (200, 201, 400) else None
     except Exception as e:
         return {"ok": False, "error": str(e)}
+    if not isinstance(data, dict) or ("issues" not in data and "errors" not in data):
+        return _result(response, jira_base)
+
+    failed = {e.get("failedElementNumber"): e for e in data.get("errors") or []}
+    created = iter(data.get("issues") or [])
+    results = []
+    for i in range(len(issues)):
+        if i in failed:
+            results.append({"ok": False, "status": failed[i].get("status", 400), "error": _element_error(failed[i])})
+            continue
+        issue = next(created, None)
+        if issue is None:
+            results.append({"ok": False, "error": "missing from bulk response"})
+            continue
+        results.append({
+            "ok": True,
+            "issue_key": issue.get("key"),
+            "issue_id": issue.get("id"),
+            "url": f"{jira_base}/browse/{issue.get('key')}",
+        })
+    return {"ok": not failed, "status": response.status_code, "results": results}
+
+
+async def search_jira_issues(
+    jql: str,
+    fields: list[str],
+    next_page_token: Optional[str] = None,
+    max_results: int = 100,
+) -> dict:
+    """One page of /rest/api/3/search/jql: ``issues``, ``next_page_token`` (None on the last page)."""
+    if not jira_configured():
+        return {"ok": False, "error": "Jira is not configured"}
+
+    jira_base = os.environ["JIRA_BASE_URL"]
+    body: dict = {"jql": jql, "fields": fields, "maxResults": max_results}
+    if next_page_token:
+        body["nextPageToken"] = next_page_token
+    try:
+        response = await jira_client.post(f"{jira_base}/rest/api/3/search/jql", json=body)
+        if response.status_code != 200:
+            return _result(response, jira_base)
+        data = response.json()
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+    return {
+        "ok": True,
+        "issues": data.get("issues") or [],
+        "next_page_token": None if data.get("isLast", True) else data.get("nextPageToken"),
+    }
 
 
-# Alias so existing imports of create_jira_issue still work
-create_jira_issue = create_jira_issue_sync
+def _jql_string(value: str) -> str:
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+async def find_issues_by_fingerprint(
+    fingerprints: list[str],
+    throttle: Optional[Callable[[], Awaitable[None]]] = None,
+) -> dict:
+    """``keys``: fingerprint -> key of an existing issue labelled with it.
+
+    ``throttle`` is awaited before each search request (a rate limiter's acquire).
+    """
+    project = os.environ.get("JIRA_PROJECT_KEY", "")
+    labels = ", ".join(_jql_string(fingerprint_label(fp)) for fp in sorted(set(fingerprints)))
+    jql = f"project = {_jql_string(project)} AND labels in ({labels}) ORDER BY created ASC"
+    keys: dict[str, str] = {}
+    token = None
+    while True:
+        if throttle is not None:
+            await throttle()
+        page = await search_jira_issues(jql, ["labels"], token)
+        if not page["ok"]:
+            return page
+        for issue in page["issues"]:
+            for label in issue.get("fields", {}).get("labels") or []:
+                if label.startswith(FINGERPRINT_LABEL_PREFIX):
+                    # The oldest issue wins if there are already duplicates
+                    keys.setdefault(label[len(FINGERPRINT_LABEL_PREFIX):], issue["key"])
+        token = page["next_page_token"]
+        if not token:
+            return {"ok": True, "keys": keys}
@@ -0,0 +1,559 @@
+"""Durable notification delivery through the ``notification_outbox`` table.
+
+``enqueue_notifications`` writes rows with the caller's session, so they
+commit (or roll back) with the findings that produced them. An
+``OutboxDispatcher`` drains the table from an asyncio task per destination:
+each send waits for a token from that destination's bucket, failures are
+retried with exponential backoff (or the server's Retry-After), and rows
+that run out of attempts, or are rejected outright, are kept as ``dead``.
+Rows are claimed with a lease, so several dispatchers can share the table
+and a dispatcher that dies mid-delivery only delays its rows. Run one
+outside the API with ``python -m app.notifications.outbox``.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
+import asyncio
+import logging
+import os
+import time
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .. import jsonlib
+from ..db import AsyncSessionLocal
+from ..models import Finding, NotificationOutbox, _uuid
+from .dispatch import NOTIFY_DIGEST, NOTIFY_DIGEST_TOP_N, NOTIFY_DIGEST_WINDOW_SECONDS, NOTIFY_SEVERITIES
+from .clients import close_clients, open_clients
+from .jira import JIRA_BULK_SIZE, build_jira_issue, create_jira_issues, find_issues_by_fingerprint, jira_configured
+from .slack import send_slack_digest, send_slack_notification, slack_configured
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_POLL_INTERVAL = float(os.environ.get("OUTBOX_POLL_INTERVAL", "1.0"))
+OUTBOX_BATCH_SIZE = int(os.environ.get("OUTBOX_BATCH_SIZE", "50"))
+# Claimed rows become due again after this long if their dispatcher dies
+OUTBOX_LEASE_SECONDS = float(os.environ.get("OUTBOX_LEASE_SECONDS", "60"))
+OUTBOX_MAX_ATTEMPTS = int(os.environ.get("OUTBOX_MAX_ATTEMPTS", "8"))
+# Delay before the first retry; doubles with every attempt up to the max
+OUTBOX_BACKOFF_SECONDS = float(os.environ.get("OUTBOX_BACKOFF_SECONDS", "5"))
+OUTBOX_BACKOFF_MAX_SECONDS = float(os.environ.get("OUTBOX_BACKOFF_MAX_SECONDS", "3600"))
+# Digest parts of a running import wait this long after its latest chunk; if
+# the import never finishes they then go out on their own
+OUTBOX_HOLD_SECONDS = float(os.environ.get("OUTBOX_HOLD_SECONDS", "3600"))
+
+# Sends per second and burst size per destination, per dispatcher; 0 disables the limit
+RATE_LIMITS = {
+    "slack": (
+        float(os.environ.get("OUTBOX_SLACK_RATE", "1")),
+        float(os.environ.get("OUTBOX_SLACK_BURST", "1")),
+    ),
+    "jira": (
+        float(os.environ.get("OUTBOX_JIRA_RATE", "2")),
+        float(os.environ.get("OUTBOX_JIRA_BURST", "5")),
+    ),
+}
+DESTINATIONS = tuple(RATE_LIMITS)
+
+
+def _row(
+    destination: str,
+    kind: str,
+    payload: Any,
+    now: datetime,
+    due: Optional[datetime] = None,
+    group: Optional[str] = None,
+) -> dict:
+    return {
+        "id": _uuid(),
+        "destination": destination,
+        "kind": kind,
+        "payload": jsonlib.dumps(payload).decode("utf-8"),
+        "status": "pending",
+        "group_key": group,
+        "attempts": 0,
+        "next_attempt_at": due or now,
+        "created_at": now,
+    }
+
+
+def enqueue_notifications(
+    db: Session,
+    notifications: list[dict],
+    source: str,
+    suppressed: int = 0,
+    now: Optional[datetime] = None,
+    group: Optional[str] = None,
+) -> int:
+    """Queue Slack messages and Jira issues for ``notifications`` (BulkIngestor notification dicts).
+
+    Slack gets one message per finding, one digest, or a share of the current
+    digest window depending on NOTIFY_DIGEST; Jira one issue per new finding.
+    With ``group`` (an import job id), the digest is queued as a held part of
+    that import's digest, for release_notifications to merge. Nothing is
+    queued for an integration that isn't configured. Does not commit.
+    """
+    now = now or datetime.utcnow()
+    if group is not None and NOTIFY_DIGEST == "import":
+        _hold(db, group)
+    if not notifications:
+        return 0
+    rows = []
+    if slack_configured():
+        if group is not None and NOTIFY_DIGEST == "import":
+            due = datetime.utcnow() + timedelta(seconds=OUTBOX_HOLD_SECONDS)
+            rows.append(_row(
+                "slack", "digest", {"notifications": notifications, "source": source, "suppressed": suppressed},
+                now, due, group,
+            ))
+        elif NOTIFY_DIGEST == "window":
+            due = now + timedelta(seconds=NOTIFY_DIGEST_WINDOW_SECONDS)
+            rows.append(_row("slack", "window", {"notifications": notifications, "suppressed": suppressed}, now, due))
+        elif NOTIFY_DIGEST == "off" or len(notifications) == 1:
+            rows.extend(_row("slack", "finding", n, now) for n in notifications)
+        else:
+            rows.append(_row(
+                "slack", "digest", {"notifications": notifications, "source": source, "suppressed": suppressed}, now
+            ))
+    if jira_configured():
+        rows.extend(
+            _row("jira", "issue", n, now)
+            for n in notifications
+            if n["is_new"] and n["severity"].lower() in NOTIFY_SEVERITIES
+        )
+    if rows:
+        db.execute(insert(NotificationOutbox), rows)
+    return len(rows)
+
+
+def _held(group: str):
+    O = NotificationOutbox
+    return (
+        O.group_key == group,
+        O.destination == "slack",
+        O.kind == "digest",
+        O.status == "pending",
+        O.attempts == 0,
+    )
+
+
+def _hold(db: Session, group: str) -> None:
+    # Push back the parts queued by earlier chunks while the import is still making progress
+    db.execute(
+        update(NotificationOutbox)
+        .where(*_held(group))
+        .values(next_attempt_at=datetime.utcnow() + timedelta(seconds=OUTBOX_HOLD_SECONDS))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def release_notifications(
+    db: Session,
+    group: str,
+    source: str,
+    suppressed: int = 0,
+    now: Optional[datetime] = None,
+) -> int:
+    """Merge an import's held digest parts into one message, due now. Does not commit.
+
+    Returns the number of notifications in it.
+    """
+    O = NotificationOutbox
+    now = now or datetime.utcnow()
+    parts = db.execute(select(O.id, O.payload).where(*_held(group))).all()
+    if not parts:
+        return 0
+    notifications = [n for p in parts for n in jsonlib.loads(p.payload)["notifications"]]
+    db.execute(delete(O).where(O.id.in_([p.id for p in parts])).execution_options(synchronize_session=False))
+    if len(notifications) == 1:
+        row = _row("slack", "finding", notifications[0], now)
+    else:
+        row = _row("slack", "digest", {"notifications": notifications, "source": source, "suppressed": suppressed}, now)
+    db.execute(insert(O), [row])
+    return len(notifications)
+
+
+class TokenBucket:
+    """``rate`` tokens per second, holding at most ``burst``; rate 0 never waits."""
+
+    def __init__(self, rate: float, burst: float = 1.0):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold the next send back for ``seconds`` (a 429's Retry-After)."""
+        if self.rate > 0:
+            self._refill()
+            self.tokens = min(self.tokens, 1 - seconds * self.rate)
+
+
+def _retry_after(result: dict) -> float:
+    try:
+        return max(0.0, float(result.get("retry_after") or 0))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _outcome(result: Optional[dict]) -> str:
+    """sent, retry or dead for a sender's result; None means the integration isn't configured."""
+    if result is None or result.get("ok"):
+        return "sent"
+    status = result.get("status")
+    if status is None or status in (408, 429) or status >= 500:
+        return "retry"
+    return "dead"
+
+
+def backoff(attempts: int) -> float:
+    return min(OUTBOX_BACKOFF_MAX_SECONDS, OUTBOX_BACKOFF_SECONDS * 2 ** max(0, attempts - 1))
+
+
+class OutboxDispatcher:
+    """Delivers outbox rows: one asyncio task per destination, each with its own token bucket."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        poll_interval: float = OUTBOX_POLL_INTERVAL,
+    ):
+        self.session_factory = session_factory
+        self.poll_interval = poll_interval
+        self.buckets = {d: TokenBucket(rate, burst) for d, (rate, burst) in RATE_LIMITS.items()}
+        self._tasks: list[asyncio.Task] = []
+        self._wakeups: dict[str, asyncio.Event] = {}
+        self._stop: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self) -> None:
+        """Start the delivery tasks on the running event loop."""
+        if self._tasks:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        for destination in DESTINATIONS:
+            self._wakeups[destination] = asyncio.Event()
+            self._tasks.append(asyncio.create_task(self._run(destination), name=f"outbox-{destination}"))
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        if not self._tasks:
+            return
+        self._stop.set()
+        self.wake()
+        _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        self._tasks = []
+
+    def wake(self) -> None:
+        """Check for new rows now instead of at the next poll; safe from any thread."""
+        if self._loop is None or self._loop.is_closed():
+            return
+        for event in self._wakeups.values():
+            self._loop.call_soon_threadsafe(event.set)
+
+    async def _run(self, destination: str) -> None:
+        wakeup = self._wakeups[destination]
+        while not self._stop.is_set():
+            try:
+                delivered = await self.drain(destination)
+            except Exception as e:
+                logger.error(f"Outbox {destination} error: {e}")
+                delivered = 0
+            if delivered:
+                continue
+            try:
+                await asyncio.wait_for(wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+
+    async def drain(self, destination: str) -> int:
+        """Claim and deliver one batch of due rows for ``destination``; returns how many were claimed."""
+        bucket = self.buckets[destination]
+        # Claim no more than the bucket lets out within half a lease
+        limit = OUTBOX_BATCH_SIZE
+        if bucket.rate > 0:
+            limit = max(1, min(limit, int(bucket.burst + bucket.rate * OUTBOX_LEASE_SECONDS / 2)))
+        rows = await self._claim(destination, limit)
+
+        # Every window row claimed together goes out as one digest, and Jira
+        # issues go out in bulk
+        window = [r for r in rows if r.kind == "window"]
+        issues = [r for r in rows if r.kind == "issue"]
+        groups = [[r] for r in rows if r.kind not in ("window", "issue")] + ([window] if window else [])
+        groups += [issues[i:i + JIRA_BULK_SIZE] for i in range(0, len(issues), JIRA_BULK_SIZE)]
+        # The bucket paces when sends start; they then run concurrently, up to
+        # the integration client's connection limit. Issue groups take a token
+        # per Jira call themselves (a lookup, then maybe a bulk create).
+        sends = []
+        for i, group in enumerate(groups):
+            if self._stop is not None and self._stop.is_set():
+                await self._release([r for g in groups[i:] for r in g])
+                break
+            if group[0].kind != "issue":
+                await bucket.acquire()
+            sends.append(asyncio.create_task(self._deliver(destination, group)))
+        for error in await asyncio.gather(*sends, return_exceptions=True):
+            if isinstance(error, Exception):
+                logger.error(f"Outbox {destination} delivery error: {error}")
+        return len(rows)
+
+    async def _claim(self, destination: str, limit: int) -> list:
+        O = NotificationOutbox
+        async with self.session_factory() as db:
+            now = datetime.utcnow()
+            due = (
+                select(O.id)
+                .where(O.destination == destination, O.status == "pending", O.next_attempt_at <= now)
+                .order_by(O.next_attempt_at)
+                .limit(limit)
+            )
+            if db.bind.dialect.name == "postgresql":
+                due = due.with_for_update(skip_locked=True)
+            ids = list((await db.execute(due)).scalars())
+            if not ids:
+                await db.rollback()
+                return []
+
+            claim = (
+                update(O)
+                .values(attempts=O.attempts + 1, next_attempt_at=now + timedelta(seconds=OUTBOX_LEASE_SECONDS))
+                .returning(O.id, O.kind, O.payload, O.attempts)
+                .execution_options(synchronize_session=False)
+            )
+            # The conditional update keeps the claim safe where SKIP LOCKED isn't available
+            rows = (await db.execute(
+                claim.where(O.id.in_(ids), O.status == "pending", O.next_attempt_at <= now)
+            )).all()
+            if any(r.kind == "window" for r in rows):
+                # A closing window also takes the window rows that haven't come due yet
+                rows += (await db.execute(claim.where(
+                    O.destination == destination, O.kind == "window", O.status == "pending", O.attempts == 0
+                ))).all()
+            await db.commit()
+            return rows
+
+    async def _send(self, destination: str, group: list) -> Optional[dict]:
+        kind = group[0].kind
+        payloads = [jsonlib.loads(r.payload) for r in group]
+        try:
+            if kind == "finding":
+                return await send_slack_notification(**payloads[0])
+            source = payloads[0]["source"] if kind == "digest" else f"the last {NOTIFY_DIGEST_WINDOW_SECONDS:g}s"
+            return await send_slack_digest(
+                [n for p in payloads for n in p["notifications"]],
+                source,
+                top_n=NOTIFY_DIGEST_TOP_N,
+                suppressed=sum(p.get("suppressed", 0) for p in payloads),
+            )
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    async def _deliver(self, destination: str, group: list) -> None:
+        if group[0].kind == "issue":
+            await self._deliver_issues(group)
+            return
+        result = await self._send(destination, group)
+        if result and result.get("status") == 429:
+            self.buckets[destination].pause(_retry_after(result))
+        await self._settle(destination, group, _outcome(result), result)
+
+    async def _deliver_issues(self, group: list) -> None:
+        """Create Jira issues for a group of ``issue`` rows with one bulk call.
+
+        Findings that already have an issue key, or whose fingerprint label is
+        already on an issue (say, after the database was rebuilt), adopt that
+        issue instead of getting a new one; rows for purged findings are dropped.
+        """
+        payloads = {r.id: jsonlib.loads(r.payload) for r in group}
+        async with self.session_factory() as db:
+            findings = {
+                f.id: f
+                for f in (await db.execute(
+                    select(Finding.id, Finding.fingerprint, Finding.jira_issue_key)
+                    .where(Finding.id.in_({p["finding_id"] for p in payloads.values()}))
+                )).all()
+            }
+
+        done, pending = [], {}
+        for r in group:
+            finding = findings.get(payloads[r.id]["finding_id"])
+            if finding is None or finding.jira_issue_key:
+                done.append(r)
+            else:
+                pending.setdefault(finding.id, []).append(r)
+        keys: dict[str, str] = {}
+        failed: list[tuple[list, dict]] = []
+
+        if pending:
+            existing = await find_issues_by_fingerprint(
+                [findings[fid].fingerprint for fid in pending], throttle=self.buckets["jira"].acquire
+            )
+            if not existing["ok"]:
+                if existing.get("status") == 429:
+                    self.buckets["jira"].pause(_retry_after(existing))
+                failed.append(([r for rows in pending.values() for r in rows], existing))
+                pending = {}
+            for fid in list(pending):
+                key = existing.get("keys", {}).get(findings[fid].fingerprint)
+                if key:
+                    keys[fid] = key
+                    done.extend(pending.pop(fid))
+
+        if pending:
+            await self.buckets["jira"].acquire()
+            bodies = []
+            for fid, rows in pending.items():
+                n = payloads[rows[0].id]
+                bodies.append(build_jira_issue(
+                    title=n["title"],
+                    severity=n["severity"],
+                    asset=n["asset"],
+                    risk_score=n["risk_score"],
+                    finding_id=n["finding_id"],
+                    tool=n["tool"],
+                    fingerprint=findings[fid].fingerprint,
+                ))
+            created = await create_jira_issues(bodies)
+            if created is None or "results" not in created:
+                if created and created.get("status") == 429:
+                    self.buckets["jira"].pause(_retry_after(created))
+                if created is None:
+                    done.extend(r for rows in pending.values() for r in rows)
+                else:
+                    failed.append(([r for rows in pending.values() for r in rows], created))
+            else:
+                for (fid, rows), result in zip(pending.items(), created["results"]):
+                    if result["ok"]:
+                        keys[fid] = result["issue_key"]
+                        done.extend(rows)
+                    else:
+                        failed.append((rows, result))
+
+        if keys:
+            async with self.session_factory() as db:
+                await db.execute(update(Finding), [{"id": fid, "jira_issue_key": key} for fid, key in keys.items()])
+                await db.commit()
+            logger.info(f"Jira issues for {len(keys)} findings: {', '.join(sorted(set(keys.values())))}")
+        if done:
+            await self._settle("jira", done, "sent", None)
+        for rows, result in failed:
+            await self._settle("jira", rows, _outcome(result), result)
+
+    async def _settle(self, destination: str, group: list, outcome: str, result: Optional[dict]) -> None:
+        O = NotificationOutbox
+        ids = [r.id for r in group]
+        async with self.session_factory() as db:
+            if outcome == "sent":
+                await db.execute(delete(O).where(O.id.in_(ids)).execution_options(synchronize_session=False))
+            else:
+                error = str(result.get("error") or result.get("status"))[:2000]
+                attempts = max(r.attempts for r in group)
+                dead = outcome == "dead" or attempts >= OUTBOX_MAX_ATTEMPTS
+                values: dict = {"last_error": error}
+                if dead:
+                    values["status"] = "dead"
+                    logger.warning(f"Outbox {destination} {group[0].kind} dead after {attempts} attempts: {error}")
+                else:
+                    delay = max(backoff(attempts), _retry_after(result))
+                    values["next_attempt_at"] = datetime.utcnow() + timedelta(seconds=delay)
+                await db.execute(
+                    update(O).where(O.id.in_(ids)).values(**values).execution_options(synchronize_session=False)
+                )
+            await db.commit()
+
+    async def _release(self, group: list) -> None:
+        # Hand unsent claimed rows back without counting the attempt
+        O = NotificationOutbox
+        async with self.session_factory() as db:
+            await db.execute(
+                update(O)
+                .where(O.id.in_([r.id for r in group]))
+                .values(attempts=O.attempts - 1, next_attempt_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+
+async def outbox_status(db: AsyncSession, limit: int = 20) -> dict:
+    """Pending and dead row counts per destination, and the latest dead letters."""
+    O = NotificationOutbox
+    counts = {d: {"pending": 0, "dead": 0} for d in DESTINATIONS}
+    rows = (await db.execute(
+        select(O.destination, O.status, func.count()).group_by(O.destination, O.status)
+    )).all()
+    for destination, status, count in rows:
+        counts.setdefault(destination, {"pending": 0, "dead": 0})[status] = count
+    dead = (await db.execute(
+        select(O).where(O.status == "dead").order_by(O.created_at.desc()).limit(limit)
+    )).scalars().all()
+    return {
+        "destinations": counts,
+        "dead_letters": [
+            {
+                "id": r.id,
+                "destination": r.destination,
+                "kind": r.kind,
+                "attempts": r.attempts,
+                "last_error": r.last_error,
+                "created_at": r.created_at.isoformat() + "Z",
+            }
+            for r in dead
+        ],
+    }
+
+
+async def retry_dead(db: AsyncSession, destination: Optional[str] = None) -> int:
+    """Requeue dead rows (for one destination, or all) with a fresh attempt budget; commits."""
+    O = NotificationOutbox
+    stmt = (
+        update(O)
+        .where(O.status == "dead")
+        .values(status="pending", attempts=0, next_attempt_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    if destination:
+        stmt = stmt.where(O.destination == destination)
+    requeued = (await db.execute(stmt)).rowcount
+    await db.commit()
+    return requeued
+
+
+async def _serve() -> None:
+    open_clients()
+    dispatcher = OutboxDispatcher()
+    dispatcher.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await dispatcher.stop()
+        await close_clients()
+
+
+if __name__ == "__main__":
+    # Dedicated dispatcher: python -m app.notifications.outbox
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_serve())
+    except KeyboardInterrupt:
+        pass
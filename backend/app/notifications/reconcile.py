@@ -0,0 +1,220 @@
+"""Pull Jira status changes back onto findings.
+
+Each run asks Jira for the dashboard's issues updated since the last run
+(``updated >= -Nm``, relative, so it doesn't depend on the Jira user's time
+zone) and moves each linked finding to the status its issue maps to, with a
+comment and the risk rollups adjusted as for a manual status change. The
+cursor is kept in ``integration_cursors``; runs overlap by a minute, and
+applying the same change twice is a no-op. Runs every
+JIRA_RECONCILE_INTERVAL seconds alongside the outbox dispatcher, or once
+with ``python -m app.notifications.reconcile``.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Mapping, Optional
+import asyncio
+import logging
+import math
+import os
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..db import AsyncSessionLocal
+from ..models import Comment, Finding, IntegrationCursor
+from ..rollups import RollupDeltas
+from ..trends import TrendDeltas
+from .jira import _jql_string, jira_configured, search_jira_issues
+
+logger = logging.getLogger(__name__)
+
+CURSOR_NAME = "jira_status"
+
+# Seconds between runs; 0 disables the periodic job
+JIRA_RECONCILE_INTERVAL = float(os.environ.get("JIRA_RECONCILE_INTERVAL", "300"))
+# How far back the first run looks
+JIRA_RECONCILE_LOOKBACK_DAYS = int(os.environ.get("JIRA_RECONCILE_LOOKBACK_DAYS", "30"))
+
+# Jira status category -> finding status
+STATUS_CATEGORY_MAP = {"new": "open", "indeterminate": "investigating", "done": "resolved"}
+
+
+def parse_status_map(spec: str) -> dict[str, str]:
+    """``JIRA_STATUS_MAP``: ``Jira status=finding status`` pairs, comma separated, matched case-insensitively."""
+    mapping = {}
+    for pair in spec.split(","):
+        if not pair.strip():
+            continue
+        name, sep, status = pair.partition("=")
+        status = status.strip().lower()
+        if not sep or status not in ("open", "investigating", "resolved", "closed"):
+            raise ValueError(f"Invalid JIRA_STATUS_MAP entry {pair!r}; use <Jira status>=open|investigating|resolved|closed")
+        mapping[name.strip().lower()] = status
+    return mapping
+
+
+JIRA_STATUS_MAP = parse_status_map(os.environ.get("JIRA_STATUS_MAP", ""))
+
+
+def finding_status(issue: Mapping, status_map: Mapping[str, str] = JIRA_STATUS_MAP) -> Optional[str]:
+    status = (issue.get("fields") or {}).get("status") or {}
+    name = (status.get("name") or "").lower()
+    if name in status_map:
+        return status_map[name]
+    return STATUS_CATEGORY_MAP.get((status.get("statusCategory") or {}).get("key"))
+
+
+def _parse_jira_time(value: str) -> Optional[datetime]:
+    # e.g. 2026-10-18T09:30:00.000+0000
+    try:
+        parsed = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+    except (TypeError, ValueError):
+        return None
+    return parsed.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass
+class ReconcileResult:
+    issues: int = 0
+    findings_updated: int = 0
+    cursor: Optional[str] = None
+
+
+def _apply(db: Session, statuses: dict[str, tuple[str, str]], now: datetime) -> int:
+    """Move findings to their issue's mapped status; ``statuses`` is key -> (status, Jira status name)."""
+    findings = db.execute(select(Finding).where(Finding.jira_issue_key.in_(statuses))).scalars().all()
+    rollup = RollupDeltas()
+    trends = TrendDeltas()
+    changed = 0
+    for finding in findings:
+        status, jira_status = statuses[finding.jira_issue_key]
+        if status == finding.status:
+            continue
+        old_status = finding.status
+        finding.status = status
+        if old_status == "open":
+            rollup.closed(finding.asset, finding.asset_id, finding.severity, finding.risk_score)
+        elif status == "open":
+            rollup.opened(finding.asset, finding.asset_id, finding.severity, finding.risk_score)
+        trends.status_changed(
+            now, finding.severity, finding.tool, finding.asset, finding.risk_score, old_status, status
+        )
+        db.add(Comment(
+            finding_id=finding.id,
+            author="jira",
+            content=f"Status changed from '{old_status}' to '{status}' ({finding.jira_issue_key} is {jira_status})",
+            action_type="update",
+            created_at=now,
+        ))
+        changed += 1
+    db.flush()
+    rollup.apply(db, now)
+    trends.apply(db, now)
+    return changed
+
+
+async def reconcile_jira(
+    session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    status_map: Mapping[str, str] = JIRA_STATUS_MAP,
+) -> Optional[ReconcileResult]:
+    """One incremental pass; None when Jira isn't configured."""
+    if not jira_configured():
+        return None
+
+    now = datetime.utcnow()
+    async with session_factory() as db:
+        cursor_row = await db.get(IntegrationCursor, CURSOR_NAME)
+    since = datetime.fromisoformat(cursor_row.value) if cursor_row else now - timedelta(days=JIRA_RECONCILE_LOOKBACK_DAYS)
+    minutes = math.ceil((now - since).total_seconds() / 60) + 1
+    project = os.environ.get("JIRA_PROJECT_KEY", "")
+    jql = f'project = {_jql_string(project)} AND labels = "secops-dashboard" AND updated >= "-{minutes}m" ORDER BY updated ASC'
+
+    result = ReconcileResult()
+    statuses: dict[str, tuple[str, str]] = {}
+    latest = since
+    token = None
+    while True:
+        page = await search_jira_issues(jql, ["status", "updated"], token)
+        if not page["ok"]:
+            raise RuntimeError(f"Jira search failed: {page.get('error') or page.get('status')}")
+        for issue in page["issues"]:
+            result.issues += 1
+            status = finding_status(issue, status_map)
+            if status is not None:
+                statuses[issue["key"]] = (status, issue["fields"]["status"].get("name", ""))
+            updated = _parse_jira_time(issue.get("fields", {}).get("updated"))
+            if updated is not None and updated > latest:
+                latest = updated
+        token = page["next_page_token"]
+        if not token:
+            break
+
+    # Never move the cursor past the start of this run
+    result.cursor = min(latest, now).isoformat()
+    async with session_factory() as db:
+        if statuses:
+            result.findings_updated = await db.run_sync(_apply, statuses, now)
+        if cursor_row is None:
+            db.add(IntegrationCursor(name=CURSOR_NAME, value=result.cursor, updated_at=now))
+        else:
+            cursor_row.value = result.cursor
+            cursor_row.updated_at = now
+            await db.merge(cursor_row)
+        await db.commit()
+    if result.findings_updated:
+        logger.info(f"Jira reconcile: {result.findings_updated} findings updated from {result.issues} issues")
+    return result
+
+
+class JiraReconciler:
+    """Runs reconcile_jira every ``interval`` seconds on the running event loop."""
+
+    def __init__(self, interval: float = JIRA_RECONCILE_INTERVAL):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None and self.interval > 0 and jira_configured():
+            self._task = asyncio.create_task(self._run(), name="jira-reconcile")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await reconcile_jira()
+            except Exception as e:
+                logger.error(f"Jira reconcile error: {e}")
+            await asyncio.sleep(self.interval)
+
+
+async def _main() -> int:
+    from .clients import close_clients
+
+    try:
+        result = await reconcile_jira()
+    finally:
+        await close_clients()
+    if result is None:
+        print("Jira is not configured")
+        return 1
+    print(f"{result.issues} issues checked, {result.findings_updated} findings updated, cursor {result.cursor}")
+    return 0
+
+
+if __name__ == "__main__":
+    # One pass: python -m app.notifications.reconcile
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(asyncio.run(_main()))
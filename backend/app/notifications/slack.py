@@ -2,6 +2,13 @@ import os
 import httpx
 from typing import Optional
 
+from .clients import slack_client
+
+# Base URL of the dashboard frontend, used for links in Slack messages
+DASHBOARD_URL = os.environ.get("DASHBOARD_URL", "").rstrip("/")
+
+SEVERITY_ORDER = ["critical", "high", "medium", "low", "info"]
+
 SEVERITY_EMOJI = {
     "critical": ":rotating_light:",
     "high": ":warning:",
@@ -19,7 +26,7 @@ SEVERITY_COLOR = {
 }
 
 
-def send_slack_notification_sync(
+def build_slack_notification(
     title: str,
     severity: str,
     asset: str,
@@ -28,11 +35,8 @@ def send_slack_notification_sync(
     tool: str,
     is_new: bool = True,
     occurrences: int = 1,
-) -> Optional[dict]:
-    webhook_url = os.environ.get("SLACK_WEBHOOK_URL")
-    if not webhook_url:
-        return None
-
+) -> dict:
+    """The Slack message for a single finding."""
     emoji = SEVERITY_EMOJI.get(severity.lower(), ":question:")
     color = SEVERITY_COLOR.get(severity.lower(), "#6b7280")
 
@@ -58,22 +62,139 @@ def send_slack_notification_sync(
         },
         {
             "type": "context",
-            "elements": [{"type": "mrkdwn", "text": f"Finding ID: `{finding_id}`"}],
+            "elements": [{
+                "type": "mrkdwn",
+                "text": f"<{DASHBOARD_URL}/findings/{finding_id}|Finding {finding_id}>" if DASHBOARD_URL
+                else f"Finding ID: `{finding_id}`",
+            }],
         },
     ]
 
-    payload = {
+    return {
         "text": f"{emoji} {severity.upper()}: {title} on {asset}",
         "attachments": [{"color": color, "blocks": blocks}],
     }
 
+
+async def send_slack_notification(
+    title: str,
+    severity: str,
+    asset: str,
+    risk_score: int,
+    finding_id: str,
+    tool: str,
+    is_new: bool = True,
+    occurrences: int = 1,
+) -> Optional[dict]:
+    """Post build_slack_notification's message over the pooled Slack client."""
+    webhook_url = os.environ.get("SLACK_WEBHOOK_URL")
+    if not webhook_url:
+        return None
+
+    payload = build_slack_notification(title, severity, asset, risk_score, finding_id, tool, is_new, occurrences)
     try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.post(webhook_url, json=payload)
-            return {"ok": response.status_code == 200, "status": response.status_code}
+        return _result(await slack_client.post(webhook_url, json=payload))
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
 
-# Alias so existing imports of send_slack_notification still work
-send_slack_notification = send_slack_notification_sync
+def slack_configured() -> bool:
+    return bool(os.environ.get("SLACK_WEBHOOK_URL"))
+
+
+def _result(response: httpx.Response) -> dict:
+    result = {"ok": response.status_code == 200, "status": response.status_code}
+    if response.status_code != 200:
+        result["error"] = response.text[:500]
+        if "Retry-After" in response.headers:
+            result["retry_after"] = response.headers["Retry-After"]
+    return result
+
+
+def _escape(text: str) -> str:
+    # Slack mrkdwn control characters
+    return str(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _finding_line(n: dict) -> str:
+    title = _escape(n["title"] if len(n["title"]) <= 120 else n["title"][:119] + "…")
+    if DASHBOARD_URL:
+        title = f"<{DASHBOARD_URL}/findings/{n['finding_id']}|{title}>"
+    seen = "new" if n["is_new"] else f"seen again (#{n['occurrences']})"
+    emoji = SEVERITY_EMOJI.get(n["severity"].lower(), ":question:")
+    return f"{emoji} *{title}* on `{_escape(n['asset'])}` - risk {n['risk_score']}, {seen}"
+
+
+def build_slack_digest(notifications: list[dict], source: str, top_n: int = 10, suppressed: int = 0) -> dict:
+    """One Slack message summarising ``notifications`` (BulkIngestor notification dicts).
+
+    Repeats of a finding collapse into its latest sighting; the top ``top_n``
+    findings by risk score are listed, new ones first on ties.
+    """
+    latest: dict[str, dict] = {}
+    for n in notifications:
+        latest[n["finding_id"]] = n
+    findings = list(latest.values())
+
+    counts: dict[str, int] = {}
+    for n in findings:
+        counts[n["severity"].lower()] = counts.get(n["severity"].lower(), 0) + 1
+    new = sum(1 for n in findings if n["is_new"])
+    worst = next((s for s in SEVERITY_ORDER if counts.get(s)), "info")
+    emoji = SEVERITY_EMOJI.get(worst, ":question:")
+    summary = f"{len(findings)} findings from {source} ({new} new)"
+
+    top = sorted(findings, key=lambda n: (-n["risk_score"], not n["is_new"]))[:top_n]
+    blocks = [
+        {
+            "type": "header",
+            # Header text is capped at 150 characters
+            "text": {"type": "plain_text", "text": f"{emoji} {summary}"[:150], "emoji": True},
+        },
+        {
+            "type": "section",
+            "fields": [
+                {"type": "mrkdwn", "text": f"*{severity.capitalize()}:*\n{counts[severity]}"}
+                for severity in SEVERITY_ORDER + sorted(counts.keys() - set(SEVERITY_ORDER))
+                if counts.get(severity)
+            ] + [
+                {"type": "mrkdwn", "text": f"*New:*\n{new}"},
+                {"type": "mrkdwn", "text": f"*Seen again:*\n{len(findings) - new}"},
+            ],
+        },
+        {
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": "\n".join(_finding_line(n) for n in top)},
+        },
+    ]
+
+    context = []
+    if len(findings) > len(top):
+        context.append(f"+{len(findings) - len(top)} more")
+    if suppressed:
+        context.append(f"{suppressed} repeat sightings inside the notification cooldown not shown")
+    if DASHBOARD_URL:
+        context.append(f"<{DASHBOARD_URL}/findings|View all findings>")
+    if context:
+        blocks.append({
+            "type": "context",
+            "elements": [{"type": "mrkdwn", "text": " | ".join(context)}],
+        })
+
+    return {
+        "text": f"{emoji} {summary}",
+        "attachments": [{"color": SEVERITY_COLOR.get(worst, "#6b7280"), "blocks": blocks}],
+    }
+
+
+async def send_slack_digest(notifications: list[dict], source: str, top_n: int = 10, suppressed: int = 0) -> Optional[dict]:
+    """Post build_slack_digest's message over the pooled Slack client."""
+    webhook_url = os.environ.get("SLACK_WEBHOOK_URL")
+    if not webhook_url or not notifications:
+        return None
+
+    payload = build_slack_digest(notifications, source, top_n=top_n, suppressed=suppressed)
+    try:
+        return _result(await slack_client.post(webhook_url, json=payload))
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
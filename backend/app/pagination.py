@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+import base64
+
+from . import jsonlib
+
+
+def encode_cursor(value: Any, row_id: str, sort: str = "") -> str:
+    """Opaque keyset cursor for a (sort value, id) position under ``sort``."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = jsonlib.dumps([sort, value, row_id])
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str = "", as_datetime: bool = False) -> tuple[Any, str]:
+    """Return the (sort value, id) stored in ``cursor``.
+
+    Raises ValueError if the cursor is malformed or was issued for another sort.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, row_id = jsonlib.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if cursor_sort != sort:
+        raise ValueError(f"Cursor was issued for sort '{cursor_sort}', not '{sort}'")
+    try:
+        if as_datetime:
+            value = datetime.fromisoformat(value)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    return value, str(row_id)
@@ -1,11 +1,17 @@
-from .base import BaseParser, ParsedFinding, ParserRegistry
-from .registry import get_parser, list_parsers, parse_scan_results
+from .base import BaseParser, ParsedFinding, ParserContractError, ParserRegistry, StreamingParser
+from .registry import get_parser, get_parser_info, list_parsers, parse_scan_results, parse_scan_file, iter_scan_file, resolve_parser
 
 __all__ = [
     "BaseParser",
     "ParsedFinding",
+    "ParserContractError",
     "ParserRegistry",
+    "StreamingParser",
     "get_parser",
+    "get_parser_info",
     "list_parsers",
     "parse_scan_results",
+    "parse_scan_file",
+    "iter_scan_file",
+    "resolve_parser",
 ]
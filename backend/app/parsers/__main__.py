@@ -0,0 +1,28 @@
+"""Regenerate the parser manifest: ``python -m app.parsers [--check]``."""
+from typing import List
+import sys
+
+from . import manifest
+
+
+def main(argv: List[str]) -> int:
+    entries = manifest.build()
+    text = manifest.dumps(entries)
+    if "--check" in argv:
+        try:
+            with open(manifest.MANIFEST_PATH, encoding="utf-8") as fh:
+                current = fh.read()
+        except OSError:
+            current = None
+        if current != text:
+            print(f"{manifest.MANIFEST_PATH} is out of date; run python -m app.parsers", file=sys.stderr)
+            return 1
+        return 0
+    with open(manifest.MANIFEST_PATH, "w", encoding="utf-8") as fh:
+        fh.write(text)
+    print(f"Wrote {len(entries)} parsers to {manifest.MANIFEST_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
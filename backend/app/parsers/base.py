@@ -3,8 +3,23 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Type
+from typing import IO, Optional, List, Dict, Any, Sequence, Type, BinaryIO, Iterator, Tuple
 from enum import Enum
+import functools
+import inspect
+import io
+import logging
+import re
+import sys
+
+from .. import jsonlib
+from . import manifest
+from .detection import DetectionIndex, Probe, Signature
+from .manifest import ParserEntry
+
+logger = logging.getLogger(__name__)
+
+_CWE_NUMBER = re.compile(r"\d+")
 
 
 class ScannerCategory(str, Enum):
@@ -31,52 +46,118 @@ class Severity(str, Enum):
 
     @classmethod
     def normalize(cls, value: str) -> "Severity":
-        mapping = {
-            "critical": cls.CRITICAL,
-            "crit": cls.CRITICAL,
-            "5": cls.CRITICAL,
-            "high": cls.HIGH,
-            "4": cls.HIGH,
-            "error": cls.HIGH,
-            "medium": cls.MEDIUM,
-            "med": cls.MEDIUM,
-            "moderate": cls.MEDIUM,
-            "3": cls.MEDIUM,
-            "warning": cls.MEDIUM,
-            "low": cls.LOW,
-            "2": cls.LOW,
-            "info": cls.INFO,
-            "informational": cls.INFO,
-            "note": cls.INFO,
-            "1": cls.INFO,
-            "0": cls.INFO,
-            "none": cls.INFO,
-            "unknown": cls.INFO,
-        }
-        return mapping.get(str(value).lower().strip(), cls.INFO)
+        return _SEVERITY_ALIASES.get(str(value).lower().strip(), cls.INFO)
+
+
+_SEVERITY_ALIASES = {
+    "critical": Severity.CRITICAL,
+    "crit": Severity.CRITICAL,
+    "5": Severity.CRITICAL,
+    "high": Severity.HIGH,
+    "4": Severity.HIGH,
+    "error": Severity.HIGH,
+    "medium": Severity.MEDIUM,
+    "med": Severity.MEDIUM,
+    "moderate": Severity.MEDIUM,
+    "3": Severity.MEDIUM,
+    "warning": Severity.MEDIUM,
+    "low": Severity.LOW,
+    "2": Severity.LOW,
+    "info": Severity.INFO,
+    "informational": Severity.INFO,
+    "note": Severity.INFO,
+    "1": Severity.INFO,
+    "0": Severity.INFO,
+    "none": Severity.INFO,
+    "unknown": Severity.INFO,
+}
 
 
-@dataclass
+_EMPTY_JSON = b"{}"
+_NO_RAW_DATA: Dict[str, Any] = {}  # default for raw_data; never mutated
+
+
+@dataclass(init=False, slots=True)
 class ParsedFinding:
+    """One finding from a report, kept small because imports hold thousands.
+
+    ``raw_data`` is serialized to canonical JSON bytes on construction, so a
+    finding doesn't keep the parser's source dict (and whatever it references)
+    alive; reading ``raw_data`` decodes a fresh copy. ``tool``, ``asset`` and
+    ``file_path`` are interned, and empty ``references``/``tags`` share ().
+    """
+
     title: str
     severity: Severity
     tool: str
-    
-    description: str = ""
-    asset: str = "unknown"
-    file_path: Optional[str] = None
-    line_number: Optional[int] = None
-    cwe_id: Optional[int] = None
-    cve_id: Optional[str] = None
-    cvss_score: Optional[float] = None
-    
-    recommendation: str = ""
-    references: List[str] = field(default_factory=list)
-    tags: List[str] = field(default_factory=list)
-    raw_data: Dict[str, Any] = field(default_factory=dict)
-    
-    detected_at: Optional[datetime] = None
-    
+    description: str
+    asset: str
+    file_path: Optional[str]
+    line_number: Optional[int]
+    cwe_id: Optional[int]
+    cve_id: Optional[str]
+    cvss_score: Optional[float]
+    recommendation: str
+    references: Sequence[str]
+    tags: Sequence[str]
+    raw_json: bytes = field(repr=False)
+    detected_at: Optional[datetime]
+
+    def __init__(
+        self,
+        title: str,
+        severity: Severity,
+        tool: str,
+        description: str = "",
+        asset: str = "unknown",
+        file_path: Optional[str] = None,
+        line_number: Optional[int] = None,
+        cwe_id: Optional[int] = None,
+        cve_id: Optional[str] = None,
+        cvss_score: Optional[float] = None,
+        recommendation: str = "",
+        references: Sequence[str] = (),
+        tags: Sequence[str] = (),
+        raw_data: Any = _NO_RAW_DATA,
+        detected_at: Optional[datetime] = None,
+    ):
+        # Parsers pass scanner values straight through; coerce them to the
+        # field types here. Already-typed values only pay for a type check.
+        if not isinstance(severity, Severity):
+            severity = Severity.normalize(severity)
+        if cwe_id is not None and type(cwe_id) is not int:
+            cwe_id = _to_cwe(cwe_id)
+        if cve_id is not None and type(cve_id) is not str:
+            cve_id = _first_str(cve_id)
+        if cvss_score is not None and type(cvss_score) is not float:
+            cvss_score = _to_number(cvss_score, float)
+        if line_number is not None and type(line_number) is not int:
+            line_number = _to_number(line_number, int)
+
+        self.title = title
+        self.severity = severity
+        self.tool = _intern(tool)
+        self.description = description
+        self.asset = _intern(asset)
+        self.file_path = _intern(file_path)
+        self.line_number = line_number
+        self.cwe_id = cwe_id
+        self.cve_id = cve_id
+        self.cvss_score = cvss_score
+        self.recommendation = recommendation
+        self.references = _shared_empty(references)
+        self.tags = _shared_empty(tags)
+        self.raw_data = raw_data
+        self.detected_at = detected_at
+
+    @property
+    def raw_data(self) -> Any:
+        return jsonlib.loads(self.raw_json)
+
+    @raw_data.setter
+    def raw_data(self, value: Any) -> None:
+        self.raw_json = _EMPTY_JSON if type(value) is dict and not value else jsonlib.canonical(value)
+
     def to_signal_payload(self) -> Dict[str, Any]:
         return {
             "tool": self.tool,
@@ -95,6 +176,74 @@ class ParsedFinding:
             "raw_data": self.raw_data,
         }
 
+    def signal_payload_json(self) -> bytes:
+        """``jsonlib.canonical(self.to_signal_payload())``, without decoding raw_data.
+
+        Canonical JSON sorts keys, so the keys before and after "raw_data" are
+        encoded as two objects and the stored raw bytes are spliced in between.
+        """
+        head = jsonlib.canonical({
+            "asset": self.asset,
+            "cve_id": self.cve_id,
+            "cvss_score": self.cvss_score,
+            "cwe_id": self.cwe_id,
+            "description": self.description,
+            "file_path": self.file_path,
+            "line_number": self.line_number,
+        })
+        tail = jsonlib.canonical({
+            "recommendation": self.recommendation,
+            "references": self.references,
+            "severity": self.severity.value,
+            "tags": self.tags,
+            "title": self.title,
+            "tool": self.tool,
+        })
+        return b"".join((head[:-1], b',"raw_data":', self.raw_json, b",", tail[1:]))
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _shared_empty(value: Any) -> Any:
+    return () if type(value) is list and not value else value
+
+
+def _first_str(value: Any) -> Optional[str]:
+    if isinstance(value, (list, tuple)):
+        value = value[0] if value else None
+    return value if isinstance(value, str) and value else None
+
+
+def _to_cwe(value: Any) -> Optional[int]:
+    """``79``, ``"79"``, ``"CWE-79"`` or a list of those -> ``79``."""
+    if isinstance(value, (list, tuple)):
+        value = value[0] if value else None
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, int):
+        return value
+    match = _CWE_NUMBER.search(str(value))
+    return int(match.group()) if match else None
+
+
+def _to_number(value: Any, kind: type) -> Any:
+    if isinstance(value, bool):
+        return None
+    try:
+        return kind(float(value)) if kind is int else kind(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def read_text(stream: IO) -> str:
+    """The rest of a binary or text stream as text."""
+    data = stream.read()
+    if isinstance(data, bytes):
+        return data.decode("utf-8", errors="replace")
+    return data
+
 
 class BaseParser(ABC):
     name: str = "base"
@@ -102,14 +251,38 @@ class BaseParser(ABC):
     category: ScannerCategory = ScannerCategory.GENERIC
     file_types: List[str] = ["json"]
     description: str = "Base parser class"
+    # Auto-detection rules; a parser without signatures must be selected by name.
+    signatures: Tuple[Signature, ...] = ()
     
     @abstractmethod
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         pass
     
+    def iter_parse(self, stream: BinaryIO, filename: Optional[str] = None) -> Iterator[ParsedFinding]:
+        """Yield findings from a binary stream.
+
+        The default reads the whole report and hands it to parse(); parsers for
+        high-volume formats override this to decode the report incrementally.
+        """
+        yield from self.parse(read_text(stream), filename)
+    
+    def parse_file(self, fh: BinaryIO, filename: Optional[str] = None) -> List[ParsedFinding]:
+        return list(self.iter_parse(fh, filename))
+    
+    @classmethod
+    def matches(cls, probe: Probe) -> bool:
+        """Extra check run after one of ``signatures`` matched; override for deep structure."""
+        return True
+    
     @classmethod
     def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        return False
+        probe = Probe.sniff(content, filename)
+        if not any(sig.match(probe) for sig in cls.signatures):
+            return False
+        try:
+            return bool(cls.matches(probe))
+        except Exception:
+            return False
     
     def get_info(self) -> Dict[str, Any]:
         return {
@@ -121,36 +294,161 @@ class BaseParser(ABC):
         }
 
 
+class StreamingParser(BaseParser):
+    """A parser whose native entry point is iter_parse().
+
+    parse() runs the same code over the text through a StringIO, so
+    iter_parse() must accept text streams as well as binary ones.
+    """
+    
+    def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
+        return list(self.iter_parse(io.StringIO(content), filename))
+    
+    @abstractmethod
+    def iter_parse(self, stream: BinaryIO, filename: Optional[str] = None) -> Iterator[ParsedFinding]:
+        pass
+
+
+class ParserContractError(TypeError):
+    """A parser class does not implement the parser contract."""
+
+
+def _accepts(func: Any, *args: Any) -> bool:
+    try:
+        inspect.signature(func).bind(None, *args)
+    except TypeError:
+        return False
+    return True
+
+
+def _legacy_parse(parse: Any) -> Any:
+    @functools.wraps(parse)
+    def parse_v2(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
+        return parse(self, content)
+    return parse_v2
+
+
+def check_parser_contract(parser_class: Type[BaseParser]) -> Type[BaseParser]:
+    """Validate a parser class against the parser contract (v2).
+
+    A parser is a concrete BaseParser subclass with a name, a ScannerCategory,
+    a tuple of Signatures, ``parse(content, filename=None)``,
+    ``iter_parse(stream, filename=None)`` and the ``matches``/``can_parse``
+    classmethods. A v1 ``parse(content)`` is wrapped to accept and ignore
+    the filename; anything else raises ParserContractError.
+    """
+    label = getattr(parser_class, "__qualname__", repr(parser_class))
+    if not (isinstance(parser_class, type) and issubclass(parser_class, BaseParser)):
+        raise ParserContractError(f"{label} is not a BaseParser subclass")
+    if not isinstance(parser_class.name, str) or not parser_class.name or parser_class.name == BaseParser.name:
+        raise ParserContractError(f"{label} must set a name")
+    if not isinstance(parser_class.category, ScannerCategory):
+        raise ParserContractError(f"{label}.category must be a ScannerCategory")
+    if not isinstance(parser_class.signatures, tuple) or not all(
+        isinstance(sig, Signature) for sig in parser_class.signatures
+    ):
+        raise ParserContractError(f"{label}.signatures must be a tuple of Signature")
+    for hook in ("matches", "can_parse"):
+        if not isinstance(inspect.getattr_static(parser_class, hook), classmethod):
+            raise ParserContractError(f"{label}.{hook} must be a classmethod")
+    
+    if not _accepts(parser_class.parse, "", None):
+        if not _accepts(parser_class.parse, ""):
+            raise ParserContractError(f"{label}.parse must accept (content, filename=None)")
+        logger.warning("Parser %s uses the v1 parse(content) signature; filename is ignored", parser_class.name)
+        parser_class.parse = _legacy_parse(parser_class.parse)
+    if not _accepts(parser_class.iter_parse, None, None):
+        raise ParserContractError(f"{label}.iter_parse must accept (stream, filename=None)")
+    if inspect.isabstract(parser_class):
+        raise ParserContractError(f"{label} does not implement {', '.join(sorted(parser_class.__abstractmethods__))}")
+    return parser_class
+
+
 class ParserRegistry:
+    """Parser classes by name.
+
+    What parsers exist comes from the generated manifest, so listing and
+    detection don't import parser code; a class is imported (and registers
+    itself) the first time get() asks for it. Parsers registered from
+    outside the manifest are added to it.
+    """
+    
     _parsers: Dict[str, Type[BaseParser]] = {}
+    _entries: Optional[Dict[str, ParserEntry]] = None
+    _index: Optional[DetectionIndex] = None
     
     @classmethod
     def register(cls, parser_class: Type[BaseParser]) -> Type[BaseParser]:
+        check_parser_contract(parser_class)
+        existing = cls._parsers.get(parser_class.name)
+        if existing is not None and existing.__qualname__ != parser_class.__qualname__:
+            raise ParserContractError(
+                f"Parser name {parser_class.name!r} is already registered by {existing.__qualname__}"
+            )
         cls._parsers[parser_class.name] = parser_class
+        if cls._entries is not None and parser_class.name not in cls._entries:
+            cls._entries[parser_class.name] = manifest.entry_for(parser_class)
+            cls._index = None
         return parser_class
     
+    @classmethod
+    def entries(cls) -> Dict[str, ParserEntry]:
+        if cls._entries is None:
+            entries = manifest.load()
+            if entries is None:
+                logger.warning("No parser manifest at %s; importing every parser", manifest.MANIFEST_PATH)
+                entries = {entry.name: entry for entry in manifest.build()}
+            for name, parser_class in cls._parsers.items():
+                entries.setdefault(name, manifest.entry_for(parser_class))
+            cls._entries = entries
+        return cls._entries
+    
+    @classmethod
+    def loaded(cls) -> List[Type[BaseParser]]:
+        """Parser classes imported so far, in registration order."""
+        return list(cls._parsers.values())
+    
     @classmethod
     def get(cls, name: str) -> Optional[Type[BaseParser]]:
-        return cls._parsers.get(name)
+        parser_class = cls._parsers.get(name)
+        if parser_class is None:
+            entry = cls.entries().get(name)
+            if entry is not None:
+                # Importing the module registers the class
+                parser_class = entry.load()
+        return parser_class
+    
+    @classmethod
+    def info(cls, name: str) -> Optional[Dict[str, Any]]:
+        entry = cls.entries().get(name)
+        return entry.info() if entry else None
     
     @classmethod
     def list_all(cls) -> List[Dict[str, Any]]:
-        return [p().get_info() for p in cls._parsers.values()]
+        return [entry.info() for entry in cls.entries().values()]
     
     @classmethod
     def list_by_category(cls, category: ScannerCategory) -> List[Dict[str, Any]]:
         return [
-            p().get_info() 
-            for p in cls._parsers.values() 
-            if p.category == category
+            entry.info()
+            for entry in cls.entries().values()
+            if entry.category == category.value
         ]
     
+    @classmethod
+    def detection_index(cls) -> DetectionIndex:
+        if cls._index is None:
+            index = DetectionIndex()
+            for entry in cls.entries().values():
+                index.add(entry, entry.signatures)
+            cls._index = index
+        return cls._index
+    
+    @classmethod
+    def detect(cls, probe: Probe) -> Optional[Type[BaseParser]]:
+        entry = cls.detection_index().detect(probe)
+        return cls.get(entry.name) if entry else None
+    
     @classmethod
     def auto_detect(cls, content: str, filename: Optional[str] = None) -> Optional[Type[BaseParser]]:
-        for parser_class in cls._parsers.values():
-            try:
-                if parser_class.can_parse(content, filename):
-                    return parser_class
-            except Exception:
-                continue
-        return None
+        return cls.detect(Probe.sniff(content, filename))
@@ -1,6 +1,7 @@
-from .bugcrowd import BugcrowdParser
-from .cobaltio import CobaltIOParser
-from .hackerone import HackerOneParser
+# Parser classes are imported on first access; see ..manifest
+from ..manifest import package_getattr
+
+__getattr__ = package_getattr(__name__)
 
 __all__ = [
     "BugcrowdParser",
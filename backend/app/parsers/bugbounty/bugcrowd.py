@@ -1,8 +1,8 @@
-import json
 import csv
 import io
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class BugcrowdParser(BaseParser):
@@ -12,20 +12,18 @@ class BugcrowdParser(BaseParser):
     file_types = ["json", "csv"]
     description = "Bugcrowd crowdsourced security reports"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            if "bugcrowd" in content.lower():
-                return True
-            data = json.loads(content)
-            return "submissions" in data or "vulnerability_references" in str(data)
-        except:
-            return "Title" in content and "Severity" in content and "Target" in content
+    signatures = (
+        Signature(contains=("bugcrowd",)),
+        Signature(format="json", keys=("submissions",)),
+        Signature(format="json", contains=("vulnerability_references",)),
+        Signature(format="csv", columns=("title", "severity", "target")),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
             if content.strip().startswith("{") or content.strip().startswith("["):
-                data = json.loads(content)
+                data = jsonlib.loads(content)
                 submissions = data.get("submissions", data.get("data", [data] if isinstance(data, dict) else data))
                 for sub in submissions:
                     findings.append(ParsedFinding(
@@ -34,7 +32,7 @@ class BugcrowdParser(BaseParser):
                         severity=self._map_severity(sub.get("severity", sub.get("priority", "medium"))),
                         tool=self.name,
                         asset=sub.get("target", sub.get("asset", "unknown")),
-                        cwe=sub.get("cwe"),
+                        cwe_id=sub.get("cwe"),
                         raw_data=sub
                     ))
             else:
@@ -1,8 +1,8 @@
-import json
 import csv
 import io
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class CobaltIOParser(BaseParser):
@@ -12,20 +12,17 @@ class CobaltIOParser(BaseParser):
     file_types = ["json", "csv"]
     description = "Cobalt.io Pentest as a Service findings"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            if "cobalt" in content.lower():
-                return True
-            data = json.loads(content)
-            return "findings" in data or "pentest" in str(data).lower()
-        except:
-            return "Finding Title" in content or "Severity" in content and "Cobalt" in content
+    signatures = (
+        Signature(contains=("cobalt",)),
+        Signature(format="json", contains=("pentest",)),
+        Signature(format="csv", columns=("finding title",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
             if content.strip().startswith("{") or content.strip().startswith("["):
-                data = json.loads(content)
+                data = jsonlib.loads(content)
                 items = data.get("findings", data.get("data", [data] if isinstance(data, dict) else data))
                 for item in items:
                     findings.append(ParsedFinding(
@@ -34,7 +31,7 @@ class CobaltIOParser(BaseParser):
                         severity=self._map_severity(item.get("severity", item.get("criticality", "medium"))),
                         tool=self.name,
                         asset=item.get("affected_asset", item.get("asset", "unknown")),
-                        cwe=item.get("cwe"),
+                        cwe_id=item.get("cwe"),
                         raw_data=item
                     ))
             else:
@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class HackerOneParser(BaseParser):
@@ -10,17 +10,15 @@ class HackerOneParser(BaseParser):
     file_types = ["json"]
     description = "HackerOne bug bounty and VDP reports"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "data" in data and "type" in str(data) and ("hackerone" in str(data).lower() or "report" in str(data))
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("data",), contains=("hackerone",)),
+        Signature(format="json", keys=("data",), contains=("type", "report"), priority=-1),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             reports = data.get("data", [data])
             if not isinstance(reports, list):
                 reports = [reports]
@@ -34,7 +32,7 @@ class HackerOneParser(BaseParser):
                     severity=self._map_severity(attrs.get("severity_rating", attrs.get("severity", "medium"))),
                     tool=self.name,
                     asset=attrs.get("structured_scope", {}).get("asset_identifier", attrs.get("asset", "unknown")),
-                    cwe=weakness.get("external_id"),
+                    cwe_id=weakness.get("external_id"),
                     raw_data=report
                 ))
         except:
@@ -1,20 +1,7 @@
-from .aws_asff import AWSASFFParser
-from .aws_inspector import AWSInspectorParser
-from .aws_security_hub import AWSSecurityHubParser
-from .azure_security_center import AzureSecurityCenterParser
-from .cloudflare import CloudflareParser
-from .cycognito import CycognitoParser
-from .gcp_artifact import GCPArtifactParser
-from .gcp_scc import GCPSecurityCommandCenterParser
-from .ms_defender import MSDefenderParser
-from .scout_suite import ScoutSuiteParser
-from .wiz import WizParser
-from .orca_security import OrcaSecurityParser
-from .risk_recon import RiskReconParser
-from .xygeni import XygeniParser
-from .wizcli_dir import WizCLIDirParser
-from .wizcli_iac import WizCLIIaCParser
-from .wizcli_img import WizCLIImgParser
+# Parser classes are imported on first access; see ..manifest
+from ..manifest import package_getattr
+
+__getattr__ = package_getattr(__name__)
 
 __all__ = [
     "AWSASFFParser",
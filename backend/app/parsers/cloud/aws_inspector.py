@@ -1,6 +1,6 @@
-import json
 from typing import List, Optional
 from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -11,18 +11,10 @@ class AWSInspectorParser(BaseParser):
     file_types = ['json']
     description = "AWS Inspector2 vulnerability findings"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return isinstance(data, (dict, list))
-        except:
-            return False
-
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             items = data if isinstance(data, list) else data.get("results", data.get("vulnerabilities", data.get("findings", [])))
             if not isinstance(items, list):
                 items = [data]
@@ -42,6 +34,6 @@ class AWSInspectorParser(BaseParser):
                     cve_id=item.get("cve", item.get("cve_id")),
                     raw_data=item,
                 ))
-        except json.JSONDecodeError:
+        except jsonlib.JSONDecodeError:
             pass
         return findings
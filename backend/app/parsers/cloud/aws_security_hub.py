@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,24 +12,14 @@ class AWSSecurityHubParser(BaseParser):
     file_types = ["json"]
     description = "AWS Security Hub findings (ASFF format)"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, dict):
-                findings = data.get("Findings", [data])
-            else:
-                findings = data
-            
-            if len(findings) > 0:
-                first = findings[0]
-                return "AwsAccountId" in first or "ProductArn" in first or "SchemaVersion" in first
-            return False
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("Findings",), child="Findings", any_child_keys=("AwsAccountId", "ProductArn", "SchemaVersion")),
+        Signature(format="json", any_item_keys=("AwsAccountId", "ProductArn", "SchemaVersion")),
+        Signature(format="json", any_keys=("AwsAccountId", "ProductArn")),
+    )
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         if isinstance(data, dict):
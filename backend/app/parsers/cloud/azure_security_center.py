@@ -1,9 +1,9 @@
-import json
 import csv
 from io import StringIO
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -14,17 +14,12 @@ class AzureSecurityCenterParser(BaseParser):
     file_types = ["json", "csv"]
     description = "Microsoft Azure security recommendations"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            if content.strip().startswith("{") or content.strip().startswith("["):
-                data = json.loads(content)
-                if isinstance(data, list) and len(data) > 0:
-                    return "resourceGroup" in data[0] or "subscriptionId" in data[0]
-                return "value" in data and "recommendations" in str(data).lower()[:500]
-            return "subscriptionId" in content[:500] or "resourceGroup" in content[:500]
-        except:
-            return False
+    signatures = (
+        Signature(format="json", any_item_keys=("resourceGroup", "subscriptionId")),
+        Signature(format="json", keys=("value",), contains=("recommendations",)),
+        Signature(format="csv", header=("subscriptionid",)),
+        Signature(format="csv", header=("resourcegroup",)),
+    )
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         if content.strip().startswith("{") or content.strip().startswith("["):
@@ -33,7 +28,7 @@ class AzureSecurityCenterParser(BaseParser):
             return self._parse_csv(content)
     
     def _parse_json(self, content: str) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         if isinstance(data, dict):
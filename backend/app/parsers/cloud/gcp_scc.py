@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,18 +12,13 @@ class GCPSecurityCommandCenterParser(BaseParser):
     file_types = ["json"]
     description = "Google Cloud security findings"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, list) and len(data) > 0:
-                return "finding" in data[0] or "resourceName" in data[0]
-            return "listFindingsResults" in data or "finding" in data
-        except:
-            return False
+    signatures = (
+        Signature(format="json", any_item_keys=("finding", "resourceName")),
+        Signature(format="json", any_keys=("listFindingsResults", "finding")),
+    )
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         if isinstance(data, list):
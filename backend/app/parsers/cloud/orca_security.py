@@ -1,8 +1,8 @@
 import csv
 import io
-import json
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 def _orca_score_to_severity(score) -> str:
@@ -30,29 +30,16 @@ class OrcaSecurityParser(BaseParser):
     file_types = ["json", "csv"]
     description = "Orca Security cloud risk platform"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        stripped = content.strip()
-        # JSON array of Orca alerts
-        if stripped.startswith("["):
-            try:
-                data = json.loads(stripped)
-                if isinstance(data, list) and data:
-                    first = data[0]
-                    return isinstance(first, dict) and ("OrcaScore" in first or "Title" in first)
-            except Exception:
-                pass
-        # CSV with Orca-specific headers
-        try:
-            first_line = stripped.splitlines()[0].lower()
-            return "orcascore" in first_line or ("title" in first_line and "category" in first_line and "source" in first_line)
-        except Exception:
-            pass
-        return False
+    signatures = (
+        Signature(format="json", any_item_keys=("OrcaScore",)),
+        Signature(format="json", item_keys=("Title",), priority=-1),
+        Signature(format="csv", header=("orcascore",)),
+        Signature(format="csv", header=("title", "category", "source")),
+    )
 
     def _parse_json(self, content: str) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         for item in data:
             if not isinstance(item, dict):
                 continue
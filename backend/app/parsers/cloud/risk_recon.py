@@ -1,6 +1,6 @@
-import json
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -11,23 +11,15 @@ class RiskReconParser(BaseParser):
     file_types = ["json"]
     description = "RiskRecon external attack surface management"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, list) and data:
-                first = data[0]
-                return isinstance(first, dict) and "finding" in first and "domain_name" in first
-            if isinstance(data, dict):
-                return "findings" in data or "api_key" in data
-            return False
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", item_keys=("finding", "domain_name")),
+        Signature(format="json", keys=("api_key",)),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
 
             # Normalise to a list of finding items
             if isinstance(data, list):
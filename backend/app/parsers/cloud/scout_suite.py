@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,16 +12,12 @@ class ScoutSuiteParser(BaseParser):
     file_types = ["json"]
     description = "Multi-cloud security auditing tool"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return "services" in data and "provider_code" in data
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("services", "provider_code")),
+    )
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         provider = data.get("provider_code", "cloud")
@@ -1,6 +1,6 @@
-import json
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, Probe
+from ... import jsonlib
 
 
 def _parse_libraries(libraries) -> List[dict]:
@@ -66,19 +66,20 @@ class WizCLIDirParser(BaseParser):
     file_types = ["json"]
     description = "Wiz CLI directory scan for libraries and secrets"
 
+    signatures = (
+        Signature(format="json", keys=("result",), child="result", child_keys=("libraries",)),
+        Signature(format="json", keys=("result",), child="result", child_keys=("secrets",)),
+    )
+
     @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            result = data.get("result", {})
-            return "libraries" in result or ("secrets" in result and "ruleMatches" not in result and "osPackages" not in result)
-        except Exception:
-            return False
+    def matches(cls, probe: Probe) -> bool:
+        result = probe.child("result") or {}
+        return "libraries" in result or not ({"ruleMatches", "osPackages"} & result.keys())
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             results = data.get("result", {})
 
             for item in _parse_libraries(results.get("libraries")):
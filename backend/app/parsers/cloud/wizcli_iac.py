@@ -1,6 +1,6 @@
-import json
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 def _parse_rule_matches(rule_matches) -> List[dict]:
@@ -72,19 +72,14 @@ class WizCLIIaCParser(BaseParser):
     file_types = ["json"]
     description = "Wiz CLI Infrastructure-as-Code (IaC) scan"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            result = data.get("result", {})
-            return "ruleMatches" in result
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("result",), child="result", child_keys=("ruleMatches",)),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             results = data.get("result", {})
 
             for item in _parse_rule_matches(results.get("ruleMatches")):
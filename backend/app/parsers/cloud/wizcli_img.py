@@ -1,6 +1,6 @@
-import json
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 def _parse_os_packages(os_packages) -> List[dict]:
@@ -89,19 +89,14 @@ class WizCLIImgParser(BaseParser):
     file_types = ["json"]
     description = "Wiz CLI container image scan for OS packages, libraries and secrets"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            result = data.get("result", {})
-            return "osPackages" in result
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("result",), child="result", child_keys=("osPackages",)),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             results = data.get("result", {})
 
             for item in _parse_os_packages(results.get("osPackages")):
@@ -1,6 +1,6 @@
-import json
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 _SEVERITY_MAP = {
     "critical": "critical",
@@ -23,17 +23,9 @@ class XygeniParser(BaseParser):
     file_types = ["json"]
     description = "Xygeni supply chain security platform"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return (
-                isinstance(data, dict)
-                and isinstance(data.get("metadata"), dict)
-                and "scanType" in data["metadata"]
-            )
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("metadata",), child="metadata", child_keys=("scanType",)),
+    )
 
     def _parse_sast(self, data: dict) -> List[ParsedFinding]:
         findings = []
@@ -115,7 +107,7 @@ class XygeniParser(BaseParser):
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             metadata = data.get("metadata") or {}
             scan_type = str(metadata.get("scanType", "")).lower()
             if scan_type == "sast":
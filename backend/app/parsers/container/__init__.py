@@ -1,24 +1,7 @@
-from .anchore import AnchoreParser
-from .anchore_enterprise import AnchoreEnterpriseParser
-from .anchorectl import AnchoreCTLParser
-from .aqua import AquaParser
-from .clair import ClairParser
-from .deepfence import DeepfenceParser
-from .docker_bench import DockerBenchParser
-from .dockle import DockleParser
-from .dsop import DSOPParser
-from .hadolint import HadolintParser
-from .harbor import HarborParser
-from .neuvector import NeuVectorParser
-from .sysdig import SysdigParser
-from .twistlock import TwistlockParser
-from .mobsf_scorecard import MobSFScorecardParser
-from .neuvector_compliance import NeuVectorComplianceParser
-from .trivy_operator import TrivyOperatorParser
-from .anchore_engine import AnchoreEngineParser
-from .anchore_grype import AnchoreGrypeParser
-from .anchorectl_policies import AnchoreCTLPoliciesParser
-from .anchorectl_vulns import AnchoreCTLVulnsParser
+# Parser classes are imported on first access; see ..manifest
+from ..manifest import package_getattr
+
+__getattr__ = package_getattr(__name__)
 
 __all__ = [
     "AnchoreParser",
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,16 +12,12 @@ class AnchoreParser(BaseParser):
     file_types = ["json"]
     description = "Anchore container security analysis"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return "vulnerabilities" in data and ("imageDigest" in data or "image" in data)
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("vulnerabilities",), any_keys=("imageDigest", "image")),
+    )
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         image = data.get("imageDigest", data.get("image", {}).get("imageDigest", "unknown"))
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,27 +12,13 @@ class AnchoreEngineParser(BaseParser):
     file_types = ["json"]
     description = "Anchore Engine CLI JSON vulnerability report"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, dict):
-                return False
-            # With metadata format: {"metadata": {...}, "securityEvaluation": [...]}
-            if "metadata" in data and "securityEvaluation" in data:
-                return True
-            # Without metadata format: {"vulnerabilities": [...]} with anchore-specific keys
-            if "vulnerabilities" in data and isinstance(data["vulnerabilities"], list):
-                vulns = data["vulnerabilities"]
-                if vulns:
-                    first = vulns[0]
-                    return "package_path" in first or "package_cpe" in first or "feed" in first
-            return False
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("metadata", "securityEvaluation")),
+        Signature(format="json", keys=("vulnerabilities",), child="vulnerabilities", any_child_keys=("package_path", "package_cpe", "feed")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         if data.get("metadata"):
             return self._parse_with_metadata(data)
         return self._parse_without_metadata(data)
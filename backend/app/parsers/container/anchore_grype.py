@@ -1,39 +1,25 @@
-import json
-from typing import List, Optional
+from typing import BinaryIO, Iterator, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import StreamingParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ..jsonstream import iter_sections
 
 
 @ParserRegistry.register
-class AnchoreGrypeParser(BaseParser):
+class AnchoreGrypeParser(StreamingParser):
     name = "anchore_grype"
     display_name = "Anchore Grype"
     category = ScannerCategory.CONTAINER
     file_types = ["json"]
     description = "Anchore Grype container vulnerability scanner"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, dict):
-                return False
-            if "matches" not in data:
-                return False
-            matches = data["matches"]
-            if not isinstance(matches, list) or len(matches) == 0:
-                return True  # empty matches is valid grype output
-            first = matches[0]
-            return "vulnerability" in first and "artifact" in first
-        except Exception:
-            return False
-
-    def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
-        findings = []
+    signatures = (
+        Signature(format="json", keys=("matches",), child="matches", child_keys=("vulnerability", "artifact")),
+    )
+
+    def iter_parse(self, stream: BinaryIO, filename: Optional[str] = None) -> Iterator[ParsedFinding]:
         seen = set()
 
-        for item in data.get("matches", []):
+        for _, item, _ in iter_sections(stream, ("matches",)):
             vulnerability = item.get("vulnerability", {})
             artifact = item.get("artifact", {})
             match_details = item.get("matchDetails", [])
@@ -139,7 +125,7 @@ class AnchoreGrypeParser(BaseParser):
                 continue
             seen.add(dupe_key)
 
-            findings.append(ParsedFinding(
+            yield ParsedFinding(
                 title=title,
                 severity=Severity.normalize(severity),
                 tool="anchore_grype",
@@ -152,9 +138,7 @@ class AnchoreGrypeParser(BaseParser):
                 references=refs,
                 tags=tags,
                 raw_data=item,
-            ))
-
-        return findings
+            )
 
     def _convert_severity(self, val: str) -> str:
         if val in ("Unknown", "Negligible"):
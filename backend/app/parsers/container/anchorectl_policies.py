@@ -1,8 +1,8 @@
-import json
 import re
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -13,23 +13,13 @@ class AnchoreCTLPoliciesParser(BaseParser):
     file_types = ["json"]
     description = "AnchoreCTL policy evaluation report"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            # New format: {"evaluations": [...], "imageDigest": ..., "policyId": ...}
-            if isinstance(data, dict) and "evaluations" in data and "imageDigest" in data:
-                return True
-            # Legacy list format: [{"detail": [...], "digest": ..., "policyId": ...}]
-            if isinstance(data, list) and len(data) > 0:
-                first = data[0]
-                return isinstance(first, dict) and ("detail" in first or "details" in first) and "policyId" in first
-            return False
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("evaluations", "imageDigest")),
+        Signature(format="json", item_keys=("policyId",), any_item_keys=("detail", "details")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
 
         # Normalize new format to list format
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,22 +12,12 @@ class AnchoreCTLVulnsParser(BaseParser):
     file_types = ["json"]
     description = "AnchoreCTL vulnerability scan report"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, list) or len(data) == 0:
-                return False
-            first = data[0]
-            if not isinstance(first, dict):
-                return False
-            # AnchoreCTL vulns format uses camelCase keys
-            return "vuln" in first and "packageType" in first and "feedGroup" in first
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", item_keys=("vuln", "packageType", "feedGroup")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         seen = set()
 
@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class AquaParser(BaseParser):
@@ -10,17 +10,15 @@ class AquaParser(BaseParser):
     file_types = ["json"]
     description = "Aqua Security container and cloud-native security"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "resources" in data or "image_assurance" in data or "aqua" in str(data).lower() and "vulnerabilities" in data
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("image_assurance",)),
+        Signature(format="json", keys=("vulnerabilities",), contains=("aqua",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             resources = data.get("resources", [data])
             for resource in resources:
                 vulns = resource.get("vulnerabilities", resource.get("results", []))
@@ -32,7 +30,7 @@ class AquaParser(BaseParser):
                         severity=self._map_severity(vuln.get("aqua_severity", vuln.get("severity", "medium"))),
                         tool=self.name,
                         asset=image,
-                        cve=vuln.get("name") if str(vuln.get("name", "")).startswith("CVE") else None,
+                        cve_id=vuln.get("name") if str(vuln.get("name", "")).startswith("CVE") else None,
                         cvss_score=vuln.get("aqua_score", vuln.get("nvd_score")),
                         raw_data=vuln
                     ))
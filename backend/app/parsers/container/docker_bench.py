@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,16 +12,12 @@ class DockerBenchParser(BaseParser):
     file_types = ["json"]
     description = "Docker CIS benchmark security scanner"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return "tests" in data and any("docker" in str(t).lower() for t in data.get("tests", [])[:3])
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("tests",), contains=("docker",)),
+    )
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         for test in data.get("tests", []):
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,18 +12,12 @@ class HadolintParser(BaseParser):
     file_types = ["json"]
     description = "Dockerfile linter"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, list) and len(data) > 0:
-                return "code" in data[0] and "message" in data[0]
-            return False
-        except:
-            return False
+    signatures = (
+        Signature(format="json", item_keys=("code", "message")),
+    )
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         for result in data:
@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class HarborParser(BaseParser):
@@ -10,17 +10,15 @@ class HarborParser(BaseParser):
     file_types = ["json"]
     description = "Harbor container registry vulnerability scan results"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "vulnerabilities" in data and ("severity" in str(data) or "package" in str(data)) or "scan_overview" in data
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("scan_overview",)),
+        Signature(format="json", keys=("vulnerabilities",), contains=("severity", "package"), priority=-1),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             vulns = data.get("vulnerabilities", [])
             artifact = data.get("artifact", {}).get("digest", data.get("repository", "unknown"))
             for vuln in vulns:
@@ -30,7 +28,7 @@ class HarborParser(BaseParser):
                     severity=self._map_severity(vuln.get("severity", "medium")),
                     tool=self.name,
                     asset=f"{artifact}:{vuln.get('package', 'unknown')}@{vuln.get('version', '')}",
-                    cve=vuln.get("id") if str(vuln.get("id", "")).startswith("CVE") else None,
+                    cve_id=vuln.get("id") if str(vuln.get("id", "")).startswith("CVE") else None,
                     cvss_score=vuln.get("cvss_score_v3", vuln.get("cvss_score_v2")),
                     raw_data=vuln
                 ))
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -21,22 +21,12 @@ class MobSFScorecardParser(BaseParser):
         "hotspot": "low",
     }
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, dict):
-                return False
-            appsec = data.get("appsec", {})
-            if not isinstance(appsec, dict):
-                return False
-            # MobSF scorecard has high/warning/info/secure/hotspot keys in appsec
-            return any(k in appsec for k in ("high", "warning", "info", "secure", "hotspot"))
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("appsec",), child="appsec", any_child_keys=("high", "warning", "info", "secure", "hotspot")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         seen = set()
 
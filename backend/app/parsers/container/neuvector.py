@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class NeuVectorParser(BaseParser):
@@ -10,17 +10,15 @@ class NeuVectorParser(BaseParser):
     file_types = ["json"]
     description = "NeuVector full lifecycle container security"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "report" in data and "vulnerabilities" in data.get("report", {}) or "neuvector" in str(data).lower()
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("report",), child="report", child_keys=("vulnerabilities",)),
+        Signature(format="json", contains=("neuvector",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             report = data.get("report", data)
             vulns = report.get("vulnerabilities", [])
             image = report.get("image_id", report.get("repository", "unknown"))
@@ -31,7 +29,7 @@ class NeuVectorParser(BaseParser):
                     severity=self._map_severity(vuln.get("severity", "medium")),
                     tool=self.name,
                     asset=f"{image}:{vuln.get('package_name', 'unknown')}@{vuln.get('package_version', '')}",
-                    cve=vuln.get("name") if str(vuln.get("name", "")).startswith("CVE") else None,
+                    cve_id=vuln.get("name") if str(vuln.get("name", "")).startswith("CVE") else None,
                     cvss_score=vuln.get("score"),
                     raw_data=vuln
                 ))
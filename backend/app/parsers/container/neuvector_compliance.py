@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,27 +12,13 @@ class NeuVectorComplianceParser(BaseParser):
     file_types = ["json"]
     description = "NeuVector container compliance scan"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, dict):
-                return False
-            # /v1/scan/workload/{id} format: {"report": {"checks": [...]}}
-            if "report" in data and "checks" in data.get("report", {}):
-                return True
-            # /v1/host/{id}/compliance format: {"items": [...]}
-            if "items" in data:
-                items = data["items"]
-                if isinstance(items, list) and items:
-                    first = items[0]
-                    return "test_number" in first or "category" in first
-            return False
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("report",), child="report", child_keys=("checks",)),
+        Signature(format="json", keys=("items",), child="items", any_child_keys=("test_number", "category")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         seen = set()
 
@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class SysdigParser(BaseParser):
@@ -10,17 +10,15 @@ class SysdigParser(BaseParser):
     file_types = ["json"]
     description = "Sysdig container and Kubernetes security"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "imageDigest" in data or "vulnsBySeverity" in data or "sysdig" in str(data).lower()
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("vulnsBySeverity",)),
+        Signature(format="json", keys=("imageDigest",), contains=("sysdig",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             image = data.get("imageDigest", data.get("imageName", "unknown"))
             vulns = data.get("vulnerabilities", [])
             for vuln in vulns:
@@ -30,7 +28,7 @@ class SysdigParser(BaseParser):
                     severity=self._map_severity(vuln.get("severity", "medium")),
                     tool=self.name,
                     asset=f"{image}:{vuln.get('package', 'unknown')}@{vuln.get('version', '')}",
-                    cve=vuln.get("vuln") if str(vuln.get("vuln", "")).startswith("CVE") else None,
+                    cve_id=vuln.get("vuln") if str(vuln.get("vuln", "")).startswith("CVE") else None,
                     cvss_score=vuln.get("cvss_score", {}).get("value", {}).get("score"),
                     raw_data=vuln
                 ))
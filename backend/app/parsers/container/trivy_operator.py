@@ -1,7 +1,7 @@
-import json
-from typing import List, Optional
+from typing import BinaryIO, Iterator, List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import StreamingParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, Probe
+from ..jsonstream import JsonReader
 
 TRIVY_OPERATOR_SEVERITIES = {
     "CRITICAL": "critical",
@@ -23,32 +23,34 @@ TRIVY_OPERATOR_CRD_KEYS = {
     "vulnerabilityreports.aquasecurity.github.io",
 }
 
+TRIVY_OPERATOR_SBOM_KEYS = {
+    "clustersbomreports.aquasecurity.github.io",
+    "sbomreports.aquasecurity.github.io",
+}
+
 
 @ParserRegistry.register
-class TrivyOperatorParser(BaseParser):
+class TrivyOperatorParser(StreamingParser):
     name = "trivy_operator"
     display_name = "Trivy Operator"
     category = ScannerCategory.CONTAINER
     file_types = ["json"]
     description = "Trivy Operator Kubernetes VulnerabilityReport CRD scanner"
 
+    signatures = (
+        Signature(format="json", any_keys=tuple(sorted(TRIVY_OPERATOR_CRD_KEYS))),
+        Signature(format="json", keys=("metadata",), child="metadata", child_keys=("labels",), contains=("trivy-operator",)),
+        Signature(format="json", item_keys=("metadata",), contains=("trivy-operator",)),
+    )
+
     @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, list):
-                if len(data) == 0:
-                    return False
-                first = data[0]
-                return cls._is_trivy_operator_item(first)
-            if isinstance(data, dict):
-                # Trivy operator export format: top-level keys are CRD names
-                if TRIVY_OPERATOR_CRD_KEYS & set(data.keys()):
-                    return True
-                return cls._is_trivy_operator_item(data)
-            return False
-        except Exception:
-            return False
+    def matches(cls, probe: Probe) -> bool:
+        if TRIVY_OPERATOR_CRD_KEYS & probe.keys:
+            return True
+        data = probe.data
+        if isinstance(data, list):
+            data = data[0] if data else None
+        return cls._is_trivy_operator_item(data)
 
     @classmethod
     def _is_trivy_operator_item(cls, item: dict) -> bool:
@@ -61,23 +63,32 @@ class TrivyOperatorParser(BaseParser):
         # Trivy operator labels contain trivy-operator prefix
         return any("trivy-operator" in str(k) for k in labels.keys())
 
-    def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
-        findings = []
-
-        if isinstance(data, list):
-            for item in data:
-                findings.extend(self._process_item(item))
-        elif isinstance(data, dict):
-            if TRIVY_OPERATOR_CRD_KEYS & set(data.keys()):
-                for key in data.keys():
-                    if key not in {"clustersbomreports.aquasecurity.github.io", "sbomreports.aquasecurity.github.io"}:
-                        for item in data[key]:
-                            findings.extend(self._process_item(item))
-            else:
-                findings.extend(self._process_item(data))
-
-        return findings
+    def iter_parse(self, stream: BinaryIO, filename: Optional[str] = None) -> Iterator[ParsedFinding]:
+        reader = JsonReader(stream)
+        char = reader.peek()
+
+        if char == "[":
+            for item in reader.items():
+                yield from self._process_item(item)
+        elif char == "{":
+            # A single report, unless it turns out to be keyed by CRD name;
+            # members before the first CRD key are decoded, the rest streamed.
+            data = {}
+            keyed = False
+            for key in reader.members():
+                if key in TRIVY_OPERATOR_CRD_KEYS and not keyed:
+                    keyed = True
+                    for earlier, items in data.items():
+                        if earlier not in TRIVY_OPERATOR_SBOM_KEYS:
+                            for item in items:
+                                yield from self._process_item(item)
+                if not keyed:
+                    data[key] = reader.value()
+                elif key not in TRIVY_OPERATOR_SBOM_KEYS:
+                    for item in reader.items():
+                        yield from self._process_item(item)
+            if not keyed:
+                yield from self._process_item(data)
 
     def _process_item(self, data: dict) -> List[ParsedFinding]:
         findings = []
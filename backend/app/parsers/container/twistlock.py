@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class TwistlockParser(BaseParser):
@@ -10,17 +10,16 @@ class TwistlockParser(BaseParser):
     file_types = ["json"]
     description = "Palo Alto Prisma Cloud (formerly Twistlock) container security"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "results" in data and ("vulnerabilities" in str(data) or "complianceIssues" in str(data)) or "twistlock" in str(data).lower() or "prisma" in str(data).lower()
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("results",), child="results", any_child_keys=("vulnerabilities", "complianceIssues")),
+        Signature(format="json", contains=("twistlock",)),
+        Signature(format="json", contains=("prisma",), priority=-1),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             results = data.get("results", [data])
             for result in results:
                 image = result.get("id", result.get("imageName", "unknown"))
@@ -31,7 +30,7 @@ class TwistlockParser(BaseParser):
                         severity=self._map_severity(vuln.get("severity", "medium")),
                         tool=self.name,
                         asset=f"{image}:{vuln.get('packageName', 'unknown')}@{vuln.get('packageVersion', '')}",
-                        cve=vuln.get("cve"),
+                        cve_id=vuln.get("cve"),
                         cvss_score=vuln.get("cvss"),
                         raw_data=vuln
                     ))
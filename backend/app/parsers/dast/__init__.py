@@ -1,37 +1,7 @@
-from .acunetix import AcunetixParser
-from .appcheck import AppCheckParser
-from .appspider import AppSpiderParser
-from .arachni import ArachniParser
-from .burp import BurpParser
-from .burp_api import BurpAPIParser
-from .burp_dastardly import BurpDastardlyParser
-from .burp_enterprise import BurpEnterpriseParser
-from .burp_graphql import BurpGraphQLParser
-from .burp_suite_dast import BurpSuiteDASTParser
-from .crashtest import CrashtestParser
-from .edgescan import EdgescanParser
-from .hcl_appscan import HCLAppScanParser
-from .ibm_appscan import IBMAppScanParser
-from .immuniweb import ImmuniwebParser
-from .invicti import InvictiParser
-from .iriusrisk import IriusRiskParser
-from .mobsf import MobSFParser
-from .netsparker import NetsparkerParser
-from .nikto import NiktoParser
-from .nuclei import NucleiParser
-from .ptart import PTARTParser
-from .rapplex import RapplexParser
-from .stackhawk import StackHawkParser
-from .trustwave import TrustwaveParser
-from .trustwave_fusion_api import TrustwaveFusionAPIParser
-from .veracode import VeracodeParser
-from .veracode_sca import VeracodeScaParser
-from .wapiti import WapitiParser
-from .webinspect import WebinspectParser
-from .wfuzz import WFuzzParser
-from .whitehat_sentinel import WhiteHatSentinelParser
-from .wpscan import WpscanParser
-from .zap import ZAPParser
+# Parser classes are imported on first access; see ..manifest
+from ..manifest import package_getattr
+
+__getattr__ = package_getattr(__name__)
 
 __all__ = [
     "AcunetixParser",
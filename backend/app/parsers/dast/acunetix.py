@@ -1,8 +1,8 @@
-import json
-import xml.etree.ElementTree as ET
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
+from .. import xmlstream
 
 
 @ParserRegistry.register
@@ -13,17 +13,11 @@ class AcunetixParser(BaseParser):
     file_types = ["json", "xml"]
     description = "Acunetix web vulnerability scanner"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            if content.strip().startswith("{"):
-                data = json.loads(content)
-                return "vulnerabilities" in data or "scans" in data
-            elif content.strip().startswith("<"):
-                return "acunetix" in content.lower()[:500] or "ScanGroup" in content[:500]
-            return False
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("scans",)),
+        Signature(format="xml", root=("ScanGroup",)),
+        Signature(format="xml", contains=("acunetix",)),
+    )
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         if content.strip().startswith("{"):
@@ -32,7 +26,7 @@ class AcunetixParser(BaseParser):
             return self._parse_xml(content)
     
     def _parse_json(self, content: str) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         vulns = data.get("vulnerabilities", [])
@@ -56,7 +50,7 @@ class AcunetixParser(BaseParser):
         return findings
     
     def _parse_xml(self, content: str) -> List[ParsedFinding]:
-        root = ET.fromstring(content)
+        root = xmlstream.parse(content)
         findings = []
         
         for report_item in root.findall(".//ReportItem"):
@@ -1,40 +1,32 @@
-import json
-import xml.etree.ElementTree as ET
 import base64
-from typing import List, Optional
+from typing import BinaryIO, Iterator, List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import StreamingParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, read_text
+from ... import jsonlib
+from ..xmlstream import iter_elements, peek_text
 
 
 @ParserRegistry.register
-class BurpParser(BaseParser):
+class BurpParser(StreamingParser):
     name = "burp"
     display_name = "Burp Suite"
     category = ScannerCategory.DAST
     file_types = ["json", "xml", "html"]
     description = "PortSwigger Burp Suite web security scanner"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            if content.strip().startswith("{"):
-                data = json.loads(content)
-                return "issue_events" in data or "issues" in data
-            elif content.strip().startswith("<"):
-                root = ET.fromstring(content)
-                return root.tag == "issues" or "burp" in str(content).lower()[:500]
-            return False
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("issue_events",)),
+        Signature(format="xml", root=("issues",)),
+        Signature(format="xml", contains=("burp",), priority=-1),
+    )
     
-    def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        if content.strip().startswith("{"):
-            return self._parse_json(content)
-        else:
-            return self._parse_xml(content)
+    def iter_parse(self, stream: BinaryIO, filename: Optional[str] = None) -> Iterator[ParsedFinding]:
+        if peek_text(stream).startswith("{"):
+            return iter(self._parse_json(read_text(stream)))
+        return self._iter_xml(stream)
     
     def _parse_json(self, content: str) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         issues = data.get("issue_events", data.get("issues", []))
@@ -66,20 +58,18 @@ class BurpParser(BaseParser):
         
         return findings
     
-    def _parse_xml(self, content: str) -> List[ParsedFinding]:
-        root = ET.fromstring(content)
-        findings = []
+    def _iter_xml(self, stream: BinaryIO) -> Iterator[ParsedFinding]:
+        severity_map = {
+            "high": Severity.HIGH,
+            "medium": Severity.MEDIUM,
+            "low": Severity.LOW,
+            "information": Severity.INFO,
+        }
         
-        for issue in root.findall(".//issue"):
+        for issue, _ in iter_elements(stream, ("issue",)):
             severity_str = issue.findtext("severity", "information").lower()
-            severity_map = {
-                "high": Severity.HIGH,
-                "medium": Severity.MEDIUM,
-                "low": Severity.LOW,
-                "information": Severity.INFO,
-            }
             
-            finding = ParsedFinding(
+            yield ParsedFinding(
                 title=issue.findtext("name", "Unknown Issue"),
                 severity=severity_map.get(severity_str, Severity.INFO),
                 tool="burp",
@@ -89,6 +79,3 @@ class BurpParser(BaseParser):
                 tags=["burp", issue.findtext("type", "")],
                 raw_data={},
             )
-            findings.append(finding)
-        
-        return findings
@@ -1,7 +1,7 @@
-import json
 import base64
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class BurpEnterpriseParser(BaseParser):
@@ -11,17 +11,15 @@ class BurpEnterpriseParser(BaseParser):
     file_types = ["json", "html"]
     description = "PortSwigger Burp Suite Enterprise Edition scan results"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "scan_status" in data or "issue_events" in data or "issues" in data and "scan_metrics" in data
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("scan_status",)),
+        Signature(format="json", keys=("issues", "scan_metrics")),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             issues = data.get("issue_events", data.get("issues", []))
             for issue in issues:
                 issue_data = issue.get("issue", issue)
@@ -31,7 +29,7 @@ class BurpEnterpriseParser(BaseParser):
                     severity=self._map_severity(issue_data.get("severity", "medium")),
                     tool=self.name,
                     asset=issue_data.get("origin", issue_data.get("path", "unknown")),
-                    cwe=issue_data.get("cwe"),
+                    cwe_id=issue_data.get("cwe"),
                     raw_data=issue_data
                 ))
         except:
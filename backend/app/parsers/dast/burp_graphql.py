@@ -1,8 +1,8 @@
-import json
 import re
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -13,13 +13,9 @@ class BurpGraphQLParser(BaseParser):
     file_types = ["json"]
     description = "Burp Suite DAST findings from the GraphQL API"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return isinstance(data, dict) and "Issues" in data
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("Issues",)),
+    )
 
     @staticmethod
     def _strip_html(html_str: str) -> str:
@@ -37,7 +33,7 @@ class BurpGraphQLParser(BaseParser):
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         issues = data.get("Issues", [])
 
         # Group by issue name to deduplicate
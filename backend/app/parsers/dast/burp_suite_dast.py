@@ -2,7 +2,7 @@ import re
 from html.parser import HTMLParser
 from typing import List, Optional, Dict
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
 
 
 class _BurpHTMLParser(HTMLParser):
@@ -118,17 +118,13 @@ class BurpSuiteDASTParser(BaseParser):
     file_types = ["html", "htm"]
     description = "Burp Suite DAST HTML scan report"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        if filename and filename.lower().endswith((".html", ".htm")):
-            return "burpsuite" in content.lower() or "burp suite" in content.lower() or "issue-container" in content.lower()
-        try:
-            stripped = content.strip().lower()
-            return (
-                stripped.startswith("<!doctype html") or stripped.startswith("<html")
-            ) and ("burp" in stripped or "issue-container" in stripped)
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="html", contains=("burp",)),
+        Signature(format="html", contains=("issue-container",)),
+        Signature(extensions=("html", "htm"), contains=("burpsuite",)),
+        Signature(extensions=("html", "htm"), contains=("burp suite",)),
+        Signature(extensions=("html", "htm"), contains=("issue-container",)),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
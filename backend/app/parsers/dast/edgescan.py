@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class EdgescanParser(BaseParser):
@@ -10,17 +10,15 @@ class EdgescanParser(BaseParser):
     file_types = ["json"]
     description = "Edgescan continuous vulnerability management"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "vulnerabilities" in data and ("edgescan" in str(data).lower() or "asset_id" in str(data))
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("vulnerabilities",), contains=("edgescan",)),
+        Signature(format="json", keys=("vulnerabilities",), contains=("asset_id",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             vulns = data.get("vulnerabilities", [])
             for vuln in vulns:
                 findings.append(ParsedFinding(
@@ -29,7 +27,7 @@ class EdgescanParser(BaseParser):
                     severity=self._map_severity(vuln.get("severity", vuln.get("risk", "medium"))),
                     tool=self.name,
                     asset=vuln.get("location", vuln.get("asset_name", vuln.get("host", "unknown"))),
-                    cve=vuln.get("cve"),
+                    cve_id=vuln.get("cve"),
                     cvss_score=vuln.get("cvss_score"),
                     raw_data=vuln
                 ))
@@ -1,7 +1,7 @@
-import json
-import xml.etree.ElementTree as ET
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
+from .. import xmlstream
 
 @ParserRegistry.register
 class HCLAppScanParser(BaseParser):
@@ -11,40 +11,39 @@ class HCLAppScanParser(BaseParser):
     file_types = ["xml", "json"]
     description = "HCL AppScan dynamic application security testing"
 
-    def can_parse(self, content: str) -> bool:
-        return "AppScan" in content or "appscan" in content.lower() or "hcl" in content.lower() and "scan" in content.lower()
+    signatures = (
+        Signature(contains=("appscan",)),
+        Signature(contains=("hcl", "scan"), priority=-1),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
-        try:
-            if content.strip().startswith("<"):
-                root = ET.fromstring(content)
-                for issue in root.findall(".//issue") or root.findall(".//Issue") or root.findall(".//item"):
-                    name = issue.findtext("name") or issue.findtext("issue-type") or "HCL AppScan Finding"
-                    findings.append(ParsedFinding(
-                        title=name,
-                        description=issue.findtext("description", issue.findtext("advisory", "")),
-                        severity=self._map_severity(issue.findtext("severity", "medium")),
-                        tool=self.name,
-                        asset=issue.findtext("url", issue.findtext("affected-url", "unknown")),
-                        cwe=issue.findtext("cwe"),
-                        raw_data={"xml": True}
-                    ))
-            else:
-                data = json.loads(content)
-                issues = data.get("issues", data.get("findings", []))
-                for issue in issues:
-                    findings.append(ParsedFinding(
-                        title=issue.get("name", issue.get("issueType", "HCL AppScan Finding")),
-                        description=issue.get("description", issue.get("advisory", "")),
-                        severity=self._map_severity(issue.get("severity", "medium")),
-                        tool=self.name,
-                        asset=issue.get("url", issue.get("affectedUrl", "unknown")),
-                        cwe=issue.get("cwe"),
-                        raw_data=issue
-                    ))
-        except:
-            pass
+        if content.strip().startswith("<"):
+            root = xmlstream.parse(content)
+            for issue in root.findall(".//issue") or root.findall(".//Issue") or root.findall(".//item"):
+                name = issue.findtext("name") or issue.findtext("issue-type") or "HCL AppScan Finding"
+                findings.append(ParsedFinding(
+                    title=name,
+                    description=issue.findtext("description", issue.findtext("advisory", "")),
+                    severity=self._map_severity(issue.findtext("severity", "medium")),
+                    tool=self.name,
+                    asset=issue.findtext("url", issue.findtext("affected-url", "unknown")),
+                    cwe_id=issue.findtext("cwe"),
+                    raw_data={"xml": True}
+                ))
+        else:
+            data = jsonlib.loads(content)
+            issues = data.get("issues", data.get("findings", []))
+            for issue in issues:
+                findings.append(ParsedFinding(
+                    title=issue.get("name", issue.get("issueType", "HCL AppScan Finding")),
+                    description=issue.get("description", issue.get("advisory", "")),
+                    severity=self._map_severity(issue.get("severity", "medium")),
+                    tool=self.name,
+                    asset=issue.get("url", issue.get("affectedUrl", "unknown")),
+                    cwe_id=issue.get("cwe"),
+                    raw_data=issue
+                ))
         return findings
 
     def _map_severity(self, sev: str) -> str:
@@ -1,7 +1,7 @@
-import json
-import xml.etree.ElementTree as ET
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
+from .. import xmlstream
 
 @ParserRegistry.register
 class ImmuniwebParser(BaseParser):
@@ -11,40 +11,38 @@ class ImmuniwebParser(BaseParser):
     file_types = ["xml", "json"]
     description = "Immuniweb web security scanner"
 
-    def can_parse(self, content: str) -> bool:
-        return "immuniweb" in content.lower() or "ImmuniWeb" in content
+    signatures = (
+        Signature(contains=("immuniweb",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
-        try:
-            if content.strip().startswith("<"):
-                root = ET.fromstring(content)
-                for vuln in root.findall(".//vulnerability") or root.findall(".//finding"):
-                    name = vuln.findtext("name") or vuln.findtext("title") or "Immuniweb Finding"
-                    findings.append(ParsedFinding(
-                        title=name,
-                        description=vuln.findtext("description", ""),
-                        severity=self._map_severity(vuln.findtext("severity", "medium")),
-                        tool=self.name,
-                        asset=vuln.findtext("url", vuln.findtext("target", "unknown")),
-                        cwe=vuln.findtext("cwe"),
-                        raw_data={"xml": True}
-                    ))
-            else:
-                data = json.loads(content)
-                vulns = data.get("vulnerabilities", data.get("findings", []))
-                for vuln in vulns:
-                    findings.append(ParsedFinding(
-                        title=vuln.get("name", vuln.get("title", "Immuniweb Finding")),
-                        description=vuln.get("description", ""),
-                        severity=self._map_severity(vuln.get("severity", "medium")),
-                        tool=self.name,
-                        asset=vuln.get("url", vuln.get("target", "unknown")),
-                        cwe=vuln.get("cwe"),
-                        raw_data=vuln
-                    ))
-        except:
-            pass
+        if content.strip().startswith("<"):
+            root = xmlstream.parse(content)
+            for vuln in root.findall(".//vulnerability") or root.findall(".//finding"):
+                name = vuln.findtext("name") or vuln.findtext("title") or "Immuniweb Finding"
+                findings.append(ParsedFinding(
+                    title=name,
+                    description=vuln.findtext("description", ""),
+                    severity=self._map_severity(vuln.findtext("severity", "medium")),
+                    tool=self.name,
+                    asset=vuln.findtext("url", vuln.findtext("target", "unknown")),
+                    cwe_id=vuln.findtext("cwe"),
+                    raw_data={"xml": True}
+                ))
+        else:
+            data = jsonlib.loads(content)
+            vulns = data.get("vulnerabilities", data.get("findings", []))
+            for vuln in vulns:
+                findings.append(ParsedFinding(
+                    title=vuln.get("name", vuln.get("title", "Immuniweb Finding")),
+                    description=vuln.get("description", ""),
+                    severity=self._map_severity(vuln.get("severity", "medium")),
+                    tool=self.name,
+                    asset=vuln.get("url", vuln.get("target", "unknown")),
+                    cwe_id=vuln.get("cwe"),
+                    raw_data=vuln
+                ))
         return findings
 
     def _map_severity(self, sev: str) -> str:
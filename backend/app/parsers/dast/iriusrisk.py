@@ -3,7 +3,7 @@ import io
 import re
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
 
 SEVERITY_MAP = {
     "very low": "info",
@@ -22,16 +22,9 @@ class IriusRiskParser(BaseParser):
     file_types = ["csv"]
     description = "IriusRisk threat modeling tool CSV export"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            reader = csv.DictReader(io.StringIO(content))
-            fields = set(reader.fieldnames or [])
-            # IriusRisk CSV has these specific columns
-            required = {"Threat", "Component", "Current Risk"}
-            return required.issubset(fields)
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="csv", columns=("threat", "component", "current risk")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class MobSFParser(BaseParser):
@@ -10,17 +10,15 @@ class MobSFParser(BaseParser):
     file_types = ["json"]
     description = "Mobile Security Framework for Android/iOS security analysis"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "appsec" in data or "code_analysis" in data or "binary_analysis" in data or "file_name" in data and "md5" in data
-        except:
-            return False
+    signatures = (
+        Signature(format="json", any_keys=("appsec", "code_analysis", "binary_analysis")),
+        Signature(format="json", keys=("file_name", "md5")),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             app_name = data.get("file_name", data.get("app_name", "Mobile App"))
             for section in ["code_analysis", "binary_analysis", "appsec"]:
                 section_data = data.get(section, {})
@@ -33,7 +31,7 @@ class MobSFParser(BaseParser):
                                 severity=self._map_severity(value.get("severity", value.get("level", "medium"))),
                                 tool=self.name,
                                 asset=app_name,
-                                cwe=value.get("cwe"),
+                                cwe_id=value.get("cwe"),
                                 raw_data=value
                             ))
                         elif isinstance(value, list):
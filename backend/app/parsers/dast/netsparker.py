@@ -1,38 +1,31 @@
-import json
-import xml.etree.ElementTree as ET
-from typing import List, Optional
+from typing import BinaryIO, Iterator, List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import StreamingParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, read_text
+from ... import jsonlib
+from ..xmlstream import iter_elements, peek_text
 
 
 @ParserRegistry.register
-class NetsparkerParser(BaseParser):
+class NetsparkerParser(StreamingParser):
     name = "netsparker"
     display_name = "Netsparker / Invicti"
     category = ScannerCategory.DAST
     file_types = ["json", "xml"]
     description = "Enterprise web application security scanner"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            if content.strip().startswith("{"):
-                data = json.loads(content)
-                return "vulnerabilities" in data and "target" in data
-            elif content.strip().startswith("<"):
-                return "netsparker" in content.lower()[:1000] or "invicti" in content.lower()[:1000]
-            return False
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("vulnerabilities", "target")),
+        Signature(format="xml", contains=("netsparker",)),
+        Signature(format="xml", contains=("invicti",)),
+    )
     
-    def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        if content.strip().startswith("{"):
-            return self._parse_json(content)
-        else:
-            return self._parse_xml(content)
+    def iter_parse(self, stream: BinaryIO, filename: Optional[str] = None) -> Iterator[ParsedFinding]:
+        if peek_text(stream).startswith("{"):
+            return iter(self._parse_json(read_text(stream)))
+        return self._iter_xml(stream)
     
     def _parse_json(self, content: str) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         target = data.get("target", {}).get("url", "unknown")
@@ -70,21 +63,23 @@ class NetsparkerParser(BaseParser):
         
         return findings
     
-    def _parse_xml(self, content: str) -> List[ParsedFinding]:
-        root = ET.fromstring(content)
-        findings = []
-        
-        target = root.findtext(".//target/url", "unknown")
+    def _iter_xml(self, stream: BinaryIO) -> Iterator[ParsedFinding]:
+        severity_map = {
+            "Critical": Severity.CRITICAL,
+            "High": Severity.HIGH,
+            "Medium": Severity.MEDIUM,
+            "Low": Severity.LOW,
+            "Information": Severity.INFO,
+        }
+        # The scan target precedes the vulnerabilities in Netsparker/Invicti exports
+        target = "unknown"
         
-        for vuln in root.findall(".//vulnerability"):
+        for elem, _ in iter_elements(stream, ("target", "vulnerability")):
+            if elem.tag == "target":
+                target = elem.findtext("url", target)
+                continue
+            vuln = elem
             severity_str = vuln.findtext("severity", "Information")
-            severity_map = {
-                "Critical": Severity.CRITICAL,
-                "High": Severity.HIGH,
-                "Medium": Severity.MEDIUM,
-                "Low": Severity.LOW,
-                "Information": Severity.INFO,
-            }
             
             cwe_id = None
             cwe_text = vuln.findtext(".//classification/cwe")
@@ -94,7 +89,7 @@ class NetsparkerParser(BaseParser):
                 except:
                     pass
             
-            finding = ParsedFinding(
+            yield ParsedFinding(
                 title=vuln.findtext("name", vuln.findtext("type", "Unknown")),
                 severity=severity_map.get(severity_str, Severity.INFO),
                 tool="netsparker",
@@ -105,6 +100,3 @@ class NetsparkerParser(BaseParser):
                 tags=["netsparker"],
                 raw_data={},
             )
-            findings.append(finding)
-        
-        return findings
@@ -1,8 +1,8 @@
-import json
-import xml.etree.ElementTree as ET
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
+from .. import xmlstream
 
 
 @ParserRegistry.register
@@ -13,17 +13,11 @@ class NiktoParser(BaseParser):
     file_types = ["json", "xml"]
     description = "Web server vulnerability scanner"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            if content.strip().startswith("{"):
-                data = json.loads(content)
-                return "vulnerabilities" in data or "host" in data
-            elif content.strip().startswith("<"):
-                return "niktoscan" in content.lower()[:500]
-            return False
-        except:
-            return False
+    signatures = (
+        Signature(format="xml", root=("niktoscan",)),
+        Signature(format="xml", contains=("niktoscan",)),
+        Signature(format="json", keys=("host", "vulnerabilities")),
+    )
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         if content.strip().startswith("{"):
@@ -32,7 +26,7 @@ class NiktoParser(BaseParser):
             return self._parse_xml(content)
     
     def _parse_json(self, content: str) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         host = data.get("host", data.get("ip", "unknown"))
@@ -54,7 +48,7 @@ class NiktoParser(BaseParser):
         return findings
     
     def _parse_xml(self, content: str) -> List[ParsedFinding]:
-        root = ET.fromstring(content)
+        root = xmlstream.parse(content)
         findings = []
         
         for scan_details in root.findall(".//scandetails"):
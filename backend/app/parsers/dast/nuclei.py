@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,18 +12,9 @@ class NucleiParser(BaseParser):
     file_types = ["json", "jsonl"]
     description = "ProjectDiscovery fast vulnerability scanner"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            lines = content.strip().split("\n")
-            for line in lines[:5]:
-                if line.strip():
-                    data = json.loads(line)
-                    if "template-id" in data or "templateID" in data or "template" in data:
-                        return True
-            return False
-        except:
-            return False
+    signatures = (
+        Signature(any_keys=("template-id", "templateID", "template")),
+    )
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
@@ -34,7 +25,7 @@ class NucleiParser(BaseParser):
                 continue
             
             try:
-                result = json.loads(line)
+                result = jsonlib.loads(line)
             except:
                 continue
             
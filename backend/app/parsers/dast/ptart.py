@@ -1,8 +1,8 @@
-import json
 import re
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 PTART_SEVERITY_MAP = {
     1: "critical",
@@ -49,15 +49,9 @@ class PTARTParser(BaseParser):
     file_types = ["json"]
     description = "PTART pentest management tool report"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return isinstance(data, dict) and (
-                "assessments" in data or "retest_campaigns" in data
-            )
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", any_keys=("assessments", "retest_campaigns")),
+    )
 
     def _parse_hit(self, hit: dict, component_name: str = "Unknown") -> ParsedFinding:
         title = hit.get("title", "Unknown Finding")
@@ -113,7 +107,7 @@ class PTARTParser(BaseParser):
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         # Parse assessments
         for assessment in data.get("assessments", []):
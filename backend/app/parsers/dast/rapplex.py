@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -20,17 +20,13 @@ class RapplexParser(BaseParser):
         "Critical": "critical",
     }
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return isinstance(data, dict) and "Severities" in data
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("Severities",)),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         for severity_name, severity_data in data.get("Severities", {}).items():
             if not severity_data:
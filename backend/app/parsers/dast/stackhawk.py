@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,21 +12,13 @@ class StackHawkParser(BaseParser):
     file_types = ["json"]
     description = "StackHawk API security testing (HawkScan)"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return (
-                isinstance(data, dict)
-                and data.get("service") == "StackHawk"
-                and "scanCompleted" in data
-            )
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("service", "scanCompleted"), contains=("stackhawk",)),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         completed_scan = data.get("scanCompleted", {})
         scan_meta = completed_scan.get("scan", {})
@@ -2,7 +2,7 @@ import csv
 import io
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
 
 
 @ParserRegistry.register
@@ -21,16 +21,9 @@ class TrustwaveParser(BaseParser):
         "C": "critical",
     }
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            first_line = content.strip().splitlines()[0]
-            reader = csv.DictReader(io.StringIO(content))
-            fields = reader.fieldnames or []
-            required = {"Vulnerability Name", "Severity", "Description"}
-            return required.issubset(set(fields))
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="csv", columns=("vulnerability name", "severity", "description")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,20 +12,9 @@ class TrustwaveFusionAPIParser(BaseParser):
     file_types = ["json"]
     description = "Trustwave Fusion API scan report (JSON)"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return (
-                isinstance(data, dict)
-                and "items" in data
-                and isinstance(data["items"], list)
-                and len(data["items"]) > 0
-                and "location" in data["items"][0]
-                and "kb" in data["items"][0]
-            )
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("items",), child="items", child_keys=("location", "kb")),
+    )
 
     def _extract_asset(self, location: dict) -> str:
         if location.get("url") and location["url"] != "None":
@@ -54,7 +43,7 @@ class TrustwaveFusionAPIParser(BaseParser):
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         seen = {}
         for node in data.get("items", []):
@@ -1,9 +1,9 @@
-import json
-import re
 import xml.etree.ElementTree as ET
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
+from .. import xmlstream
 
 XML_NAMESPACE = "https://www.veracode.com/schema/reports/export/1.0"
 XML_NS = {"x": XML_NAMESPACE}
@@ -28,7 +28,7 @@ JSON_SEVERITY_MAP = {
 
 def _xml_parse(content: str) -> List[ParsedFinding]:
     findings = []
-    root = ET.fromstring(content)
+    root = xmlstream.parse(content, strip_namespaces=False)
 
     # Handle namespace prefix
     def tag(local):
@@ -127,7 +127,7 @@ def _xml_parse(content: str) -> List[ParsedFinding]:
 
 def _json_parse(content: str) -> List[ParsedFinding]:
     findings = []
-    data = json.loads(content)
+    data = jsonlib.loads(content)
     items = data.get("findings", []) or data.get("_embedded", {}).get("findings", [])
 
     for vuln in items:
@@ -202,23 +202,11 @@ class VeracodeParser(BaseParser):
     file_types = ["xml", "json"]
     description = "Veracode SAST/DAST/SCA scan results (XML or JSON)"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        if filename and filename.lower().endswith(".xml"):
-            return "veracode.com" in content or "detailedreport" in content.lower()
-        if filename and filename.lower().endswith(".json"):
-            try:
-                data = json.loads(content)
-                return "findings" in data or ("_embedded" in data and "findings" in data.get("_embedded", {}))
-            except Exception:
-                return False
-        # Try XML first
-        try:
-            if "veracode.com" in content:
-                return True
-        except Exception:
-            pass
-        return False
+    signatures = (
+        Signature(contains=("veracode.com",)),
+        Signature(format="xml", root=("detailedreport",)),
+        Signature(format="json", extensions=("json",), keys=("_embedded",), child="_embedded", child_keys=("findings",)),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         if filename and filename.lower().endswith(".json"):
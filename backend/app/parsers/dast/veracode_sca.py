@@ -1,9 +1,9 @@
 import csv
 import io
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 VC_SEVERITY_MAP = {
     1: "info",
@@ -34,30 +34,14 @@ class VeracodeScaParser(BaseParser):
     file_types = ["json", "csv"]
     description = "Veracode SourceClear SCA scan results (JSON or CSV)"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        if filename and filename.lower().endswith(".json"):
-            try:
-                data = json.loads(content)
-                embedded = data.get("_embedded", {})
-                return "issues" in embedded and any(
-                    i.get("issue_type") == "vulnerability"
-                    for i in embedded.get("issues", [])[:3]
-                )
-            except Exception:
-                return False
-        if filename and filename.lower().endswith(".csv"):
-            try:
-                reader = csv.DictReader(io.StringIO(content))
-                fields = set(reader.fieldnames or [])
-                return {"Issue ID", "Library", "CVE", "Severity"}.issubset(fields)
-            except Exception:
-                return False
-        return False
+    signatures = (
+        Signature(format="json", extensions=("json",), keys=("_embedded",), child="_embedded", child_keys=("issues",), contains=("issue_type",)),
+        Signature(format="csv", extensions=("csv",), columns=("issue id", "library", "cve", "severity")),
+    )
 
     def _parse_json(self, content: str) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         embedded = data.get("_embedded", {})
 
         for issue in embedded.get("issues", []):
@@ -1,8 +1,8 @@
 import re
-import xml.etree.ElementTree as ET
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from .. import xmlstream
 
 
 @ParserRegistry.register
@@ -13,17 +13,13 @@ class WapitiParser(BaseParser):
     file_types = ["xml"]
     description = "Wapiti web application vulnerability scanner"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            root = ET.fromstring(content)
-            return "report" in root.tag.lower()
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="xml", root=("report",), contains=("<vulnerabilities",)),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        root = ET.fromstring(content)
+        root = xmlstream.parse(content)
 
         severity_mapping = {
             "4": "critical",
@@ -1,6 +1,6 @@
-import xml.etree.ElementTree as ET
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from .. import xmlstream
 
 @ParserRegistry.register
 class WebinspectParser(BaseParser):
@@ -10,26 +10,24 @@ class WebinspectParser(BaseParser):
     file_types = ["xml"]
     description = "Micro Focus WebInspect dynamic application security testing"
 
-    def can_parse(self, content: str) -> bool:
-        return "WebInspect" in content or "webinspect" in content.lower() or "Fortify WebInspect" in content
+    signatures = (
+        Signature(contains=("webinspect",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
-        try:
-            root = ET.fromstring(content)
-            for issue in root.findall(".//Issue") or root.findall(".//issue") or root.findall(".//Vulnerability"):
-                name = issue.findtext("Name") or issue.findtext("name") or issue.findtext("CheckType") or "WebInspect Finding"
-                findings.append(ParsedFinding(
-                    title=name,
-                    description=issue.findtext("Description") or issue.findtext("description") or "",
-                    severity=self._map_severity(issue.findtext("Severity") or issue.findtext("severity") or "medium"),
-                    tool=self.name,
-                    asset=issue.findtext("URL") or issue.findtext("url") or issue.findtext("Host") or "unknown",
-                    cwe=issue.findtext("CWE") or issue.findtext("cwe"),
-                    raw_data={"xml": True}
-                ))
-        except:
-            pass
+        root = xmlstream.parse(content)
+        for issue in root.findall(".//Issue") or root.findall(".//issue") or root.findall(".//Vulnerability"):
+            name = issue.findtext("Name") or issue.findtext("name") or issue.findtext("CheckType") or "WebInspect Finding"
+            findings.append(ParsedFinding(
+                title=name,
+                description=issue.findtext("Description") or issue.findtext("description") or "",
+                severity=self._map_severity(issue.findtext("Severity") or issue.findtext("severity") or "medium"),
+                tool=self.name,
+                asset=issue.findtext("URL") or issue.findtext("url") or issue.findtext("Host") or "unknown",
+                cwe_id=issue.findtext("CWE") or issue.findtext("cwe"),
+                raw_data={"xml": True}
+            ))
         return findings
 
     def _map_severity(self, sev: str) -> str:
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,16 +12,9 @@ class WFuzzParser(BaseParser):
     file_types = ["json"]
     description = "WFuzz web application fuzzer"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, list) or not data:
-                return False
-            first = data[0]
-            return isinstance(first, dict) and "url" in first and "code" in first
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", item_keys=("url", "code")),
+    )
 
     def _severity_from_code(self, code: Optional[int]) -> Severity:
         if code is None:
@@ -38,7 +31,7 @@ class WFuzzParser(BaseParser):
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         seen = set()
         for item in data:
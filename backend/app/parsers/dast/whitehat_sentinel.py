@@ -1,8 +1,8 @@
-import json
 import re
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -23,13 +23,9 @@ class WhiteHatSentinelParser(BaseParser):
         6: "critical",
     }
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return isinstance(data, dict) and "collection" in data
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("collection",)),
+    )
 
     def _strip_html(self, html_str: str) -> str:
         text = re.sub(r"<[^>]+>", " ", html_str)
@@ -54,7 +50,7 @@ class WhiteHatSentinelParser(BaseParser):
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         collection = data.get("collection", [])
         if not collection:
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,19 +12,11 @@ class WpscanParser(BaseParser):
     file_types = ["json"]
     description = "WPScan WordPress vulnerability scanner"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return isinstance(data, dict) and (
-                "interesting_findings" in data
-                or "plugins" in data
-                or "version" in data
-                or "target_url" in data
-                or "wordpress" in str(data.get("banner", "")).lower()
-            )
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", any_keys=("interesting_findings", "target_url")),
+        Signature(format="json", keys=("plugins",), contains=("wordpress",)),
+        Signature(format="json", keys=("banner",), contains=("wordpress",)),
+    )
 
     def _generate_references(self, node: dict) -> List[str]:
         refs = []
@@ -77,7 +69,7 @@ class WpscanParser(BaseParser):
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         target_url = data.get("target_url", "unknown")
 
@@ -1,39 +1,31 @@
-import json
-import xml.etree.ElementTree as ET
-from typing import List, Optional
+from typing import BinaryIO, Iterator, List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import StreamingParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, read_text
+from ... import jsonlib
+from ..xmlstream import iter_elements, peek_text
 
 
 @ParserRegistry.register
-class ZAPParser(BaseParser):
+class ZAPParser(StreamingParser):
     name = "zap"
     display_name = "OWASP ZAP"
     category = ScannerCategory.DAST
     file_types = ["json", "xml"]
     description = "OWASP Zed Attack Proxy web application scanner"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            if content.strip().startswith("{"):
-                data = json.loads(content)
-                return "@version" in data or "site" in data or "OWASPZAPReport" in str(data)
-            elif content.strip().startswith("<"):
-                root = ET.fromstring(content)
-                return root.tag == "OWASPZAPReport" or "zap" in root.tag.lower()
-            return False
-        except:
-            return False
+    signatures = (
+        Signature(format="json", any_keys=("@version", "site")),
+        Signature(format="json", contains=("owaspzapreport",)),
+        Signature(format="xml", root=("OWASPZAPReport",)),
+    )
     
-    def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        if content.strip().startswith("{"):
-            return self._parse_json(content)
-        else:
-            return self._parse_xml(content)
+    def iter_parse(self, stream: BinaryIO, filename: Optional[str] = None) -> Iterator[ParsedFinding]:
+        if peek_text(stream).startswith("{"):
+            return iter(self._parse_json(read_text(stream)))
+        return self._iter_xml(stream)
     
     def _parse_json(self, content: str) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         sites = data.get("site", [])
@@ -79,37 +71,33 @@ class ZAPParser(BaseParser):
         
         return findings
     
-    def _parse_xml(self, content: str) -> List[ParsedFinding]:
-        root = ET.fromstring(content)
-        findings = []
+    def _iter_xml(self, stream: BinaryIO) -> Iterator[ParsedFinding]:
+        severity_map = {"3": Severity.HIGH, "2": Severity.MEDIUM, "1": Severity.LOW, "0": Severity.INFO}
         
-        for site in root.findall(".//site"):
+        for alert, ancestors in iter_elements(stream, ("alertitem",)):
+            site = next((a for a in reversed(ancestors) if a.tag == "site"), None)
+            if site is None:
+                continue
             host = site.get("name", "unknown")
+            risk = alert.findtext("riskcode", "0")
             
-            for alert in site.findall(".//alertitem"):
-                risk = alert.findtext("riskcode", "0")
-                severity_map = {"3": Severity.HIGH, "2": Severity.MEDIUM, "1": Severity.LOW, "0": Severity.INFO}
-                
-                cwe_id = None
-                cweid = alert.findtext("cweid")
-                if cweid:
-                    try:
-                        cwe_id = int(cweid)
-                    except:
-                        pass
-                
-                for instance in alert.findall(".//instance"):
-                    finding = ParsedFinding(
-                        title=alert.findtext("name", "Unknown Alert"),
-                        severity=severity_map.get(str(risk), Severity.INFO),
-                        tool="zap",
-                        description=alert.findtext("desc", ""),
-                        asset=instance.findtext("uri", host),
-                        cwe_id=cwe_id,
-                        recommendation=alert.findtext("solution", ""),
-                        tags=["zap", alert.findtext("pluginid", "")],
-                        raw_data={},
-                    )
-                    findings.append(finding)
-        
-        return findings
+            cwe_id = None
+            cweid = alert.findtext("cweid")
+            if cweid:
+                try:
+                    cwe_id = int(cweid)
+                except:
+                    pass
+            
+            for instance in alert.findall(".//instance"):
+                yield ParsedFinding(
+                    title=alert.findtext("name", "Unknown Alert"),
+                    severity=severity_map.get(str(risk), Severity.INFO),
+                    tool="zap",
+                    description=alert.findtext("desc", ""),
+                    asset=instance.findtext("uri", host),
+                    cwe_id=cwe_id,
+                    recommendation=alert.findtext("solution", ""),
+                    tags=["zap", alert.findtext("pluginid", "")],
+                    raw_data={},
+                )
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Dict, FrozenSet, Iterable, List, Optional, Tuple
+import csv
+
+from .. import jsonlib
+from .jsonstream import JsonReader
+from .xmlstream import root_tag, split_tag
+
+# Only this much of the document is kept for substring and header sniffing.
+HEAD_SIZE = 64 * 1024
+
+_CSV_DELIMITERS = (",", ";", "\t", "|")
+
+
+@dataclass
+class Probe:
+    """Everything detection needs to know about a report, computed once.
+
+    JSON is decoded a single time and shared by every candidate parser; XML
+    only has its root element read; CSV only has its header row split.
+    """
+
+    format: str
+    filename: Optional[str] = None
+    extension: str = ""
+    head: str = ""
+    first_line: str = ""
+    data: Any = None
+    keys: FrozenSet[str] = frozenset()
+    item_keys: FrozenSet[str] = frozenset()
+    root: Optional[str] = None
+    namespace: Optional[str] = None
+    columns: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def sniff(cls, content: str, filename: Optional[str] = None) -> "Probe":
+        text = content.lstrip("﻿ \t\r\n")
+        common = _basics(text, filename)
+        head = common["head"]
+
+        if text[:1] in ("{", "["):
+            try:
+                data = jsonlib.loads(text)
+            except ValueError:
+                data = None
+            else:
+                return cls(format="json", data=data, **common, **_json_shape(data))
+
+            try:
+                record = jsonlib.loads(text.split("\n", 1)[0])
+            except ValueError:
+                record = None
+            if isinstance(record, dict):
+                return cls(format="ndjson", data=record, keys=frozenset(record), **common)
+            return cls(format="text", **common)
+
+        if text[:1] == "<":
+            if head.startswith("<!doctype html") or head.startswith("<html"):
+                return cls(format="html", **common)
+            root, namespace = _xml_root(text)
+            return cls(format="xml", root=root, namespace=namespace, **common)
+
+        columns = _csv_header(text)
+        if columns:
+            return cls(format="csv", columns=columns, **common)
+        return cls(format="text", **common)
+
+    @classmethod
+    def sniff_file(cls, fh: BinaryIO, filename: Optional[str] = None) -> "Probe":
+        """Like sniff(), for a seekable binary stream, which is rewound afterwards.
+
+        A JSON document larger than the head is walked rather than loaded: the
+        probe's data is its skeleton, with arrays cut to their first elements.
+        """
+        raw = fh.read(HEAD_SIZE + 1)
+        fh.seek(0)
+        text = raw.decode("utf-8", errors="replace")
+        stripped = text.lstrip("﻿ \t\r\n")
+        if len(raw) <= HEAD_SIZE or stripped[:1] not in ("{", "["):
+            return cls.sniff(text, filename)
+
+        try:
+            reader = JsonReader(fh)
+            data = reader.skeleton()
+            single = reader.at_end()
+        except ValueError:
+            single = False
+        finally:
+            fh.seek(0)
+        if not single:
+            # NDJSON, or not JSON after all
+            return cls.sniff(text, filename)
+
+        return cls(format="json", data=data, **_basics(stripped, filename), **_json_shape(data))
+
+    def child(self, key: str) -> Optional[Dict[str, Any]]:
+        """The object under a top-level key, or the first element if it is a list."""
+        if not isinstance(self.data, dict):
+            return None
+        value = self.data.get(key)
+        if isinstance(value, list):
+            value = value[0] if value else None
+        return value if isinstance(value, dict) else None
+
+
+def _basics(text: str, filename: Optional[str]) -> Dict[str, Any]:
+    head = text[:HEAD_SIZE].lower()
+    return {
+        "filename": filename,
+        "extension": filename.rsplit(".", 1)[-1].lower() if filename and "." in filename else "",
+        "head": head,
+        "first_line": head.split("\n", 1)[0].strip(),
+    }
+
+
+def _json_shape(data: Any) -> Dict[str, FrozenSet[str]]:
+    if isinstance(data, dict):
+        return {"keys": frozenset(data)}
+    if isinstance(data, list) and data and isinstance(data[0], dict):
+        return {"item_keys": frozenset(data[0])}
+    return {}
+
+
+def _xml_root(text: str) -> Tuple[Optional[str], Optional[str]]:
+    tag = root_tag(text)
+    if tag is None:
+        return None, None
+    namespace, local = split_tag(tag)
+    return local, namespace
+
+
+def _csv_header(text: str) -> FrozenSet[str]:
+    line = text.split("\n", 1)[0].strip()
+    delimiter = next((d for d in _CSV_DELIMITERS if d in line), None)
+    if delimiter is None:
+        return frozenset()
+    try:
+        row = next(csv.reader([line], delimiter=delimiter))
+    except (csv.Error, StopIteration):
+        return frozenset()
+    columns = frozenset(c.strip().strip('"').lower() for c in row if c.strip())
+    return columns if len(columns) > 1 else frozenset()
+
+
+@dataclass(frozen=True)
+class Signature:
+    """A declarative match rule a parser publishes for auto-detection.
+
+    Every field that is set must hold. ``keys`` are top-level JSON object keys
+    (or the first record's keys for NDJSON), ``item_keys`` the keys of the
+    first element of a top-level JSON array, ``child`` names a top-level key
+    whose object (or first list element) must carry ``child_keys``.
+    ``columns`` are lowercase CSV header names, ``header`` and ``contains``
+    are lowercase substrings of the first line and of the document head.
+    ``extensions`` only rule out files whose name has another extension.
+    """
+
+    format: Optional[str] = None
+    keys: Tuple[str, ...] = ()
+    any_keys: Tuple[str, ...] = ()
+    item_keys: Tuple[str, ...] = ()
+    any_item_keys: Tuple[str, ...] = ()
+    child: Optional[str] = None
+    child_keys: Tuple[str, ...] = ()
+    any_child_keys: Tuple[str, ...] = ()
+    root: Tuple[str, ...] = ()
+    namespace: Optional[str] = None
+    columns: Tuple[str, ...] = ()
+    header: Tuple[str, ...] = ()
+    contains: Tuple[str, ...] = ()
+    extensions: Tuple[str, ...] = ()
+    priority: int = 0
+
+    @property
+    def specificity(self) -> int:
+        return (
+            bool(self.format)
+            + len(self.keys) + bool(self.any_keys)
+            + len(self.item_keys) + bool(self.any_item_keys)
+            + len(self.child_keys) + bool(self.any_child_keys)
+            + 2 * bool(self.root) + bool(self.namespace)
+            + len(self.columns) + len(self.header) + len(self.contains)
+            + bool(self.extensions)
+        )
+
+    def index_keys(self) -> List[Tuple[str, str, str]]:
+        """Buckets this signature is filed under; every match lands in at least one."""
+        fmt = self.format or "*"
+        if self.keys:
+            return [(fmt, "key", self.keys[0])]
+        if self.any_keys:
+            return [(fmt, "key", k) for k in self.any_keys]
+        if self.item_keys:
+            return [(fmt, "item", self.item_keys[0])]
+        if self.any_item_keys:
+            return [(fmt, "item", k) for k in self.any_item_keys]
+        if self.root:
+            return [(fmt, "root", r.lower()) for r in self.root]
+        if self.columns:
+            return [(fmt, "column", self.columns[0])]
+        return [(fmt, "*", "")]
+
+    def match(self, probe: Probe) -> bool:
+        if self.format and probe.format != self.format:
+            return False
+        if self.extensions and probe.extension and probe.extension not in self.extensions:
+            return False
+        if self.keys and not probe.keys.issuperset(self.keys):
+            return False
+        if self.any_keys and probe.keys.isdisjoint(self.any_keys):
+            return False
+        if self.item_keys and not probe.item_keys.issuperset(self.item_keys):
+            return False
+        if self.any_item_keys and probe.item_keys.isdisjoint(self.any_item_keys):
+            return False
+        if self.child:
+            child = probe.child(self.child)
+            if child is None:
+                return False
+            if any(k not in child for k in self.child_keys):
+                return False
+            if self.any_child_keys and not any(k in child for k in self.any_child_keys):
+                return False
+        if self.root and (probe.root or "").lower() not in {r.lower() for r in self.root}:
+            return False
+        if self.namespace and self.namespace not in (probe.namespace or ""):
+            return False
+        if self.columns and not probe.columns.issuperset(self.columns):
+            return False
+        if self.header and not all(h in probe.first_line for h in self.header):
+            return False
+        if self.contains and not all(c in probe.head for c in self.contains):
+            return False
+        return True
+
+
+def _probe_lookups(probe: Probe) -> Iterable[Tuple[str, str, str]]:
+    for fmt in (probe.format, "*"):
+        for k in probe.keys:
+            yield (fmt, "key", k)
+        for k in probe.item_keys:
+            yield (fmt, "item", k)
+        if probe.root:
+            yield (fmt, "root", probe.root.lower())
+        for c in probe.columns:
+            yield (fmt, "column", c)
+        yield (fmt, "*", "")
+
+
+@dataclass
+class DetectionIndex:
+    """Signatures bucketed by format and anchor key.
+
+    A probe only visits the buckets for its own keys, root tag and columns,
+    so the number of signatures checked depends on the document, not on how
+    many parsers are registered.
+    """
+
+    buckets: Dict[Tuple[str, str, str], List[Tuple[Signature, Any]]] = field(default_factory=dict)
+
+    def add(self, parser_class: Any, signatures: Iterable[Signature]) -> None:
+        for sig in signatures:
+            for key in sig.index_keys():
+                self.buckets.setdefault(key, []).append((sig, parser_class))
+
+    def candidates(self, probe: Probe) -> List[Tuple[Signature, Any]]:
+        seen = set()
+        found = []
+        for key in _probe_lookups(probe):
+            for entry in self.buckets.get(key, ()):
+                if id(entry) not in seen:
+                    seen.add(id(entry))
+                    found.append(entry)
+        return found
+
+    def detect(self, probe: Probe) -> Optional[Any]:
+        """Best matching parser class: highest priority, then most specific signature."""
+        best = None
+        best_rank = None
+        for sig, parser_class in self.candidates(probe):
+            rank = (sig.priority, sig.specificity)
+            if best_rank is not None and rank < best_rank:
+                continue
+            if rank == best_rank and parser_class.name >= best.name:
+                continue
+            if sig.match(probe) and _deep_match(parser_class, probe):
+                best, best_rank = parser_class, rank
+        return best
+
+
+def _deep_match(parser_class: Any, probe: Probe) -> bool:
+    # A parser's matches() hook sees arbitrary documents; treat a crash as "no"
+    try:
+        return bool(parser_class.matches(probe))
+    except Exception:
+        return False
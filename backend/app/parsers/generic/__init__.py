@@ -1,6 +1,7 @@
-from .generic_csv import GenericCSVParser
-from .generic_json import GenericJSONParser
-from .sarif import SARIFParser
+# Parser classes are imported on first access; see ..manifest
+from ..manifest import package_getattr
+
+__getattr__ = package_getattr(__name__)
 
 __all__ = [
     "GenericCSVParser",
@@ -13,10 +13,6 @@ class GenericCSVParser(BaseParser):
     file_types = ["csv"]
     description = "Generic CSV findings import"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        return False
-    
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
         
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional, Dict, Any
 
 from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,12 +12,8 @@ class GenericJSONParser(BaseParser):
     file_types = ["json"]
     description = "Generic JSON findings import"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        return False
-    
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         items = self._extract_findings_array(data)
@@ -1,7 +1,7 @@
 import csv
 import io
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
 
 
 @ParserRegistry.register
@@ -12,13 +12,9 @@ class AlertLogicParser(BaseParser):
     file_types = ["csv"]
     description = "Alert Logic vulnerability scan findings"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            first_line = content.strip().lstrip("﻿").splitlines()[0].lower()
-            return "vulnerability" in first_line and "severity" in first_line and "asset name" in first_line
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="csv", header=("vulnerability", "severity", "asset name")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
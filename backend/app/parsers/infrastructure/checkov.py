@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,18 +12,13 @@ class CheckovParser(BaseParser):
     file_types = ["json"]
     description = "Infrastructure as Code security scanner"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, list):
-                return len(data) > 0 and "check_type" in data[0]
-            return "check_type" in data or "passed_checks" in data or "failed_checks" in data
-        except:
-            return False
+    signatures = (
+        Signature(format="json", item_keys=("check_type",)),
+        Signature(format="json", any_keys=("check_type", "passed_checks", "failed_checks")),
+    )
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         if isinstance(data, list):
@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class CloudsploitParser(BaseParser):
@@ -10,19 +10,15 @@ class CloudsploitParser(BaseParser):
     file_types = ["json"]
     description = "Aqua Cloudsploit cloud security configuration scanner"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, list) and len(data) > 0:
-                return "plugin" in data[0] or "category" in data[0] and "status" in data[0]
-            return False
-        except:
-            return False
+    signatures = (
+        Signature(format="json", any_item_keys=("plugin",)),
+        Signature(format="json", item_keys=("category", "status")),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             for item in data:
                 if item.get("status") in ["FAIL", "WARN", "UNKNOWN"]:
                     findings.append(ParsedFinding(
@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class GitLabSASTParser(BaseParser):
@@ -10,17 +10,14 @@ class GitLabSASTParser(BaseParser):
     file_types = ["json"]
     description = "GitLab Security Scanning (SAST, DAST, Secret Detection)"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "vulnerabilities" in data and ("version" in data or "scan" in data or "remediations" in data)
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("vulnerabilities",), any_keys=("version", "scan", "remediations")),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             scan_type = data.get("scan", {}).get("type", "gitlab")
             for vuln in data.get("vulnerabilities", []):
                 location = vuln.get("location", {})
@@ -38,8 +35,8 @@ class GitLabSASTParser(BaseParser):
                     severity=self._map_severity(vuln.get("severity", "medium")),
                     tool=f"gitlab_{scan_type}",
                     asset=location.get("file", location.get("hostname", "unknown")),
-                    cve=cve,
-                    cwe=cwe,
+                    cve_id=cve,
+                    cwe_id=cwe,
                     raw_data=vuln
                 ))
         except:
@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class KubeBenchParser(BaseParser):
@@ -10,17 +10,15 @@ class KubeBenchParser(BaseParser):
     file_types = ["json"]
     description = "CIS Kubernetes Benchmark checks"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "Controls" in data or "Totals" in data or ("tests" in str(data) and "results" in str(data))
-        except:
-            return False
+    signatures = (
+        Signature(format="json", any_keys=("Controls", "Totals")),
+        Signature(format="json", contains=("tests", "results"), priority=-1),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             controls = data.get("Controls", [])
             for control in controls:
                 for test in control.get("tests", []):
@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class KubeHunterParser(BaseParser):
@@ -10,17 +10,14 @@ class KubeHunterParser(BaseParser):
     file_types = ["json"]
     description = "Kubernetes penetration testing tool"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "vulnerabilities" in data and ("hunter_statistics" in data or "nodes" in data or "services" in data)
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("vulnerabilities",), any_keys=("hunter_statistics", "nodes", "services")),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             for vuln in data.get("vulnerabilities", []):
                 findings.append(ParsedFinding(
                     title=vuln.get("vulnerability", vuln.get("location", "kube-hunter Finding")),
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,18 +12,12 @@ class KubesecParser(BaseParser):
     file_types = ["json"]
     description = "Kubernetes resource security analyzer"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, list) and len(data) > 0:
-                return "scoring" in data[0] or "object" in data[0]
-            return False
-        except:
-            return False
+    signatures = (
+        Signature(format="json", any_item_keys=("scoring", "object")),
+    )
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         for result in data:
@@ -1,54 +1,59 @@
-import json
-import xml.etree.ElementTree as ET
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, BinaryIO, Iterator, Optional
+from ..base import StreamingParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, read_text
+from ... import jsonlib
+from ..xmlstream import iter_elements, peek_text
 
 @ParserRegistry.register
-class NessusParser(BaseParser):
+class NessusParser(StreamingParser):
     name = "nessus"
     display_name = "Nessus"
     category = ScannerCategory.INFRASTRUCTURE
     file_types = ["xml", "json", "nessus"]
     description = "Tenable Nessus vulnerability scanner"
 
-    def can_parse(self, content: str) -> bool:
-        return "NessusClientData" in content or "nessus" in content.lower() or "ReportHost" in content
+    signatures = (
+        Signature(format="xml", root=("NessusClientData_v2", "NessusClientData")),
+        Signature(contains=("reporthost",)),
+        Signature(contains=("nessus",), priority=-1),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def iter_parse(self, stream: BinaryIO, filename: Optional[str] = None) -> Iterator[ParsedFinding]:
+        if not peek_text(stream).startswith("<"):
+            yield from self._parse_json(read_text(stream))
+            return
+        for host, _ in iter_elements(stream, ("ReportHost",)):
+            host_name = host.get("name", "unknown")
+            for item in host.iter("ReportItem"):
+                severity = item.get("severity", "0")
+                if self._severity_level(severity) > 0:
+                    plugin_name = item.get("pluginName", "Nessus Finding")
+                    yield ParsedFinding(
+                        title=plugin_name,
+                        description=item.findtext("description", item.findtext("synopsis", "")),
+                        severity=self._map_severity(severity),
+                        tool=self.name,
+                        asset=f"{host_name}:{item.get('port', '')}",
+                        cve_id=self._extract_cve(item),
+                        cvss_score=self._extract_cvss(item),
+                        raw_data={"plugin_id": item.get("pluginID"), "host": host_name}
+                    )
+
+    def _parse_json(self, content: str) -> list[ParsedFinding]:
         findings = []
         try:
-            if content.strip().startswith("<"):
-                root = ET.fromstring(content)
-                for host in root.findall(".//ReportHost"):
-                    host_name = host.get("name", "unknown")
-                    for item in host.findall(".//ReportItem"):
-                        severity = item.get("severity", "0")
-                        if int(severity) > 0:
-                            plugin_name = item.get("pluginName", "Nessus Finding")
-                            findings.append(ParsedFinding(
-                                title=plugin_name,
-                                description=item.findtext("description", item.findtext("synopsis", "")),
-                                severity=self._map_severity(severity),
-                                tool=self.name,
-                                asset=f"{host_name}:{item.get('port', '')}",
-                                cve=self._extract_cve(item),
-                                cvss_score=self._extract_cvss(item),
-                                raw_data={"plugin_id": item.get("pluginID"), "host": host_name}
-                            ))
-            else:
-                data = json.loads(content)
-                vulns = data.get("vulnerabilities", [])
-                for vuln in vulns:
-                    findings.append(ParsedFinding(
-                        title=vuln.get("plugin_name", "Nessus Finding"),
-                        description=vuln.get("description", ""),
-                        severity=self._map_severity(vuln.get("severity", "0")),
-                        tool=self.name,
-                        asset=vuln.get("host_name", "unknown"),
-                        cve=vuln.get("cve"),
-                        cvss_score=vuln.get("cvss_base_score"),
-                        raw_data=vuln
-                    ))
+            data = jsonlib.loads(content)
+            vulns = data.get("vulnerabilities", [])
+            for vuln in vulns:
+                findings.append(ParsedFinding(
+                    title=vuln.get("plugin_name", "Nessus Finding"),
+                    description=vuln.get("description", ""),
+                    severity=self._map_severity(vuln.get("severity", "0")),
+                    tool=self.name,
+                    asset=vuln.get("host_name", "unknown"),
+                    cve_id=vuln.get("cve"),
+                    cvss_score=vuln.get("cvss_base_score"),
+                    raw_data=vuln
+                ))
         except:
             pass
         return findings
@@ -64,6 +69,12 @@ class NessusParser(BaseParser):
         except:
             return None
 
+    def _severity_level(self, sev: str) -> int:
+        try:
+            return int(sev)
+        except (ValueError, TypeError):
+            return 0
+
     def _map_severity(self, sev: str) -> str:
         try:
             level = int(sev)
@@ -1,54 +1,59 @@
-import json
-import xml.etree.ElementTree as ET
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, BinaryIO, Iterator, Optional
+from ..base import StreamingParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, read_text
+from ... import jsonlib
+from ..xmlstream import iter_elements, peek_text
 
 @ParserRegistry.register
-class OpenVASParser(BaseParser):
+class OpenVASParser(StreamingParser):
     name = "openvas"
     display_name = "OpenVAS"
     category = ScannerCategory.INFRASTRUCTURE
     file_types = ["xml", "json"]
     description = "OpenVAS/Greenbone vulnerability scanner"
 
-    def can_parse(self, content: str) -> bool:
-        return "OpenVAS" in content or "openvas" in content.lower() or "Greenbone" in content or "<report" in content and "<result" in content
+    signatures = (
+        Signature(contains=("openvas",)),
+        Signature(contains=("greenbone",)),
+        Signature(format="xml", root=("report",), contains=("<result",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def iter_parse(self, stream: BinaryIO, filename: Optional[str] = None) -> Iterator[ParsedFinding]:
+        if not peek_text(stream).startswith("<"):
+            yield from self._parse_json(read_text(stream))
+            return
+        for result, _ in iter_elements(stream, ("result",)):
+            nvt = result.find("nvt")
+            threat = result.findtext("threat", "medium")
+            if threat.lower() not in ["log", "false positive"]:
+                nvt_name = nvt.findtext("name", "OpenVAS Finding") if nvt is not None else "OpenVAS Finding"
+                host_el = result.find("host")
+                host = host_el.text if host_el is not None else "unknown"
+                yield ParsedFinding(
+                    title=nvt_name,
+                    description=result.findtext("description", ""),
+                    severity=self._map_severity(threat),
+                    tool=self.name,
+                    asset=f"{host}:{result.findtext('port', '')}",
+                    cve_id=self._extract_cve(nvt),
+                    cvss_score=self._extract_cvss(nvt),
+                    raw_data={"nvt_oid": nvt.get("oid") if nvt is not None else None}
+                )
+
+    def _parse_json(self, content: str) -> list[ParsedFinding]:
         findings = []
         try:
-            if content.strip().startswith("<"):
-                root = ET.fromstring(content)
-                for result in root.findall(".//result"):
-                    nvt = result.find("nvt")
-                    threat = result.findtext("threat", "medium")
-                    if threat.lower() not in ["log", "false positive"]:
-                        nvt_name = nvt.findtext("name", "OpenVAS Finding") if nvt is not None else "OpenVAS Finding"
-                        host_el = result.find("host")
-                        host = host_el.text if host_el is not None else "unknown"
-                        findings.append(ParsedFinding(
-                            title=nvt_name,
-                            description=result.findtext("description", ""),
-                            severity=self._map_severity(threat),
-                            tool=self.name,
-                            asset=f"{host}:{result.findtext('port', '')}",
-                            cve=self._extract_cve(nvt),
-                            cvss_score=self._extract_cvss(nvt),
-                            raw_data={"nvt_oid": nvt.get("oid") if nvt is not None else None}
-                        ))
-            else:
-                data = json.loads(content)
-                for result in data.get("results", []):
-                    findings.append(ParsedFinding(
-                        title=result.get("name", "OpenVAS Finding"),
-                        description=result.get("description", ""),
-                        severity=self._map_severity(result.get("threat", result.get("severity", "medium"))),
-                        tool=self.name,
-                        asset=result.get("host", "unknown"),
-                        cve=result.get("cve"),
-                        cvss_score=result.get("cvss_base"),
-                        raw_data=result
-                    ))
+            data = jsonlib.loads(content)
+            for result in data.get("results", []):
+                findings.append(ParsedFinding(
+                    title=result.get("name", "OpenVAS Finding"),
+                    description=result.get("description", ""),
+                    severity=self._map_severity(result.get("threat", result.get("severity", "medium"))),
+                    tool=self.name,
+                    asset=result.get("host", "unknown"),
+                    cve_id=result.get("cve"),
+                    cvss_score=result.get("cvss_base"),
+                    raw_data=result
+                ))
         except:
             pass
         return findings
@@ -1,7 +1,7 @@
 import csv
 import io
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
 
 
 @ParserRegistry.register
@@ -12,13 +12,9 @@ class PicusParser(BaseParser):
     file_types = ["csv"]
     description = "Picus Breach and Attack Simulation (BAS) platform"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            first_line = content.strip().splitlines()[0].lower()
-            return "threatname" in first_line and "threatpreventionresult" in first_line
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="csv", header=("threatname", "threatpreventionresult")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
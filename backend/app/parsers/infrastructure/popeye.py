@@ -1,7 +1,7 @@
-import json
 import re
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,13 +12,9 @@ class PopeyeParser(BaseParser):
     file_types = ["json"]
     description = "Popeye Kubernetes cluster sanitizer"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return "popeye" in data and "sanitizers" in data["popeye"]
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("popeye",), child="popeye", child_keys=("sanitizers",)),
+    )
 
     def _level_to_severity(self, level: int) -> Severity:
         if level == 1:
@@ -31,7 +27,7 @@ class PopeyeParser(BaseParser):
         findings = []
         seen = set()
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             for sanitizer in data["popeye"]["sanitizers"]:
                 issues = sanitizer.get("issues") or {}
                 sanitizer_name = sanitizer.get("sanitizer", "unknown")
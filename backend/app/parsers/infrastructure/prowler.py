@@ -1,9 +1,9 @@
-import json
 import csv
 from io import StringIO
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -14,16 +14,10 @@ class ProwlerParser(BaseParser):
     file_types = ["json", "csv"]
     description = "AWS/Azure/GCP security assessment tool"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            if content.strip().startswith("{") or content.strip().startswith("["):
-                data = json.loads(content)
-                if isinstance(data, list) and len(data) > 0:
-                    return "CheckID" in data[0] or "check_id" in data[0] or "StatusExtended" in data[0]
-            return "CHECK_ID" in content[:500] or "SEVERITY" in content[:500]
-        except:
-            return False
+    signatures = (
+        Signature(format="json", any_item_keys=("CheckID", "check_id", "StatusExtended")),
+        Signature(format="csv", header=("check_id",)),
+    )
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         if content.strip().startswith("{") or content.strip().startswith("["):
@@ -32,7 +26,7 @@ class ProwlerParser(BaseParser):
             return self._parse_csv(content)
     
     def _parse_json(self, content: str) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         if isinstance(data, dict):
@@ -1,55 +1,60 @@
-import json
-import xml.etree.ElementTree as ET
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, BinaryIO, Iterator, Optional
+from ..base import StreamingParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, read_text
+from ... import jsonlib
+from ..xmlstream import iter_first_of, peek_text
 
 @ParserRegistry.register
-class QualysParser(BaseParser):
+class QualysParser(StreamingParser):
     name = "qualys"
     display_name = "Qualys"
     category = ScannerCategory.INFRASTRUCTURE
     file_types = ["xml", "json", "csv"]
     description = "Qualys vulnerability management scanner"
 
-    def can_parse(self, content: str) -> bool:
-        return "QUALYS" in content.upper() or "qualys" in content.lower() or "QID" in content
+    signatures = (
+        Signature(contains=("qualys",)),
+        Signature(format="xml", contains=("<qid",)),
+        Signature(format="csv", columns=("qid",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def iter_parse(self, stream: BinaryIO, filename: Optional[str] = None) -> Iterator[ParsedFinding]:
+        if not peek_text(stream).startswith("<"):
+            yield from self._parse_json(read_text(stream))
+            return
+        for vuln, _ in iter_first_of(stream, ("VULN", "HOST_VULN", "vuln")):
+            qid = vuln.findtext("QID", "")
+            title = vuln.findtext("TITLE") or vuln.findtext("title") or f"QID {qid}"
+            yield ParsedFinding(
+                title=title,
+                description=vuln.findtext("DIAGNOSIS") or vuln.findtext("diagnosis") or "",
+                severity=self._map_severity(vuln.findtext("SEVERITY") or vuln.findtext("severity") or "3"),
+                tool=self.name,
+                asset=vuln.findtext("IP") or vuln.findtext("HOST") or vuln.findtext("host") or "unknown",
+                cve_id=vuln.findtext("CVE_ID") or vuln.findtext("cve"),
+                raw_data={"qid": qid, "xml": True}
+            )
+
+    def _parse_json(self, content: str) -> list[ParsedFinding]:
         findings = []
         try:
-            if content.strip().startswith("<"):
-                root = ET.fromstring(content)
-                for vuln in root.findall(".//VULN") or root.findall(".//HOST_VULN") or root.findall(".//vuln"):
-                    qid = vuln.findtext("QID", "")
-                    title = vuln.findtext("TITLE") or vuln.findtext("title") or f"QID {qid}"
+            data = jsonlib.loads(content)
+            vulns = data.get("vulnerabilities", data.get("host_list_vm_detection_output", {}).get("response", {}).get("HOST_LIST", {}).get("HOST", []))
+            if not isinstance(vulns, list):
+                vulns = [vulns]
+            for vuln in vulns:
+                detections = vuln.get("DETECTION_LIST", {}).get("DETECTION", [])
+                if not isinstance(detections, list):
+                    detections = [detections]
+                host = vuln.get("IP", vuln.get("DNS", "unknown"))
+                for det in detections:
                     findings.append(ParsedFinding(
-                        title=title,
-                        description=vuln.findtext("DIAGNOSIS") or vuln.findtext("diagnosis") or "",
-                        severity=self._map_severity(vuln.findtext("SEVERITY") or vuln.findtext("severity") or "3"),
+                        title=det.get("TITLE", f"QID {det.get('QID', 'Unknown')}"),
+                        description=det.get("RESULTS", ""),
+                        severity=self._map_severity(det.get("SEVERITY", "3")),
                         tool=self.name,
-                        asset=vuln.findtext("IP") or vuln.findtext("HOST") or vuln.findtext("host") or "unknown",
-                        cve=vuln.findtext("CVE_ID") or vuln.findtext("cve"),
-                        raw_data={"qid": qid, "xml": True}
+                        asset=host,
+                        raw_data=det
                     ))
-            else:
-                data = json.loads(content)
-                vulns = data.get("vulnerabilities", data.get("host_list_vm_detection_output", {}).get("response", {}).get("HOST_LIST", {}).get("HOST", []))
-                if not isinstance(vulns, list):
-                    vulns = [vulns]
-                for vuln in vulns:
-                    detections = vuln.get("DETECTION_LIST", {}).get("DETECTION", [])
-                    if not isinstance(detections, list):
-                        detections = [detections]
-                    host = vuln.get("IP", vuln.get("DNS", "unknown"))
-                    for det in detections:
-                        findings.append(ParsedFinding(
-                            title=det.get("TITLE", f"QID {det.get('QID', 'Unknown')}"),
-                            description=det.get("RESULTS", ""),
-                            severity=self._map_severity(det.get("SEVERITY", "3")),
-                            tool=self.name,
-                            asset=host,
-                            raw_data=det
-                        ))
         except:
             pass
         return findings
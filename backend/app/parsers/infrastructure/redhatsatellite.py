@@ -1,6 +1,6 @@
-import json
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 def _map_severity(sev: str) -> str:
@@ -21,24 +21,14 @@ class RedHatSatelliteParser(BaseParser):
     file_types = ["json"]
     description = "Red Hat Satellite patch and errata management"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return (
-                isinstance(data, dict)
-                and "results" in data
-                and isinstance(data["results"], list)
-                and len(data["results"]) > 0
-                and "errata_id" in data["results"][0]
-            )
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("results",), child="results", child_keys=("errata_id",)),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             for result in data.get("results", []):
                 title = result.get("title") or result.get("name") or "Unknown Errata"
                 sev = _map_severity(result.get("severity", ""))
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,16 +12,13 @@ class TfsecParser(BaseParser):
     file_types = ["json"]
     description = "Terraform static analysis security scanner"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return "results" in data and ("tfsec" in str(data).lower()[:100] or any("rule_id" in str(r) for r in data.get("results", [])[:3]))
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("results",), contains=("tfsec",)),
+        Signature(format="json", keys=("results",), child="results", child_keys=("rule_id",)),
+    )
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         for result in data.get("results", []):
@@ -1,6 +1,6 @@
-import json
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 RISK_TO_CWE = {
     "accidental-secret-leak": 200,
@@ -35,21 +35,14 @@ class ThreagileParser(BaseParser):
     file_types = ["json"]
     description = "Threagile threat modeling risks report (JSON)"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, list) or not data:
-                return False
-            first = data[0]
-            return isinstance(first, dict) and "category" in first and "synthetic_id" in first
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", item_keys=("category", "synthetic_id")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             if not isinstance(data, list):
                 return findings
             for item in data:
@@ -1,6 +1,6 @@
-import json
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 STRIDE_VALUES = {
     "S": "Spoofing",
@@ -20,13 +20,9 @@ class ThreatComposerParser(BaseParser):
     file_types = ["json"]
     description = "AWS Threat Composer threat modeling tool"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return isinstance(data, dict) and "threats" in data
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("threats",)),
+    )
 
     def _parse_metadata(self, metadata):
         severity = "info"
@@ -43,7 +39,7 @@ class ThreatComposerParser(BaseParser):
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             if "threats" not in data:
                 return findings
 
@@ -1,6 +1,6 @@
-import json
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -11,13 +11,9 @@ class WazuhParser(BaseParser):
     file_types = ["json"]
     description = "Wazuh SIEM vulnerability detection report"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return isinstance(data, dict) and ("data" in data or "hits" in data)
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", any_keys=("data", "hits"), priority=-1),
+    )
 
     def _parse_v4_7(self, data: dict) -> List[ParsedFinding]:
         """Parse Wazuh v4.7 format: data.affected_items[]"""
@@ -106,7 +102,7 @@ class WazuhParser(BaseParser):
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             if not data:
                 return []
             if data.get("data"):
@@ -1,7 +1,7 @@
 import csv
 import io
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
 
 
 @ParserRegistry.register
@@ -12,13 +12,9 @@ class ZoraParser(BaseParser):
     file_types = ["csv"]
     description = "Zora Kubernetes vulnerability scanner (CSV export)"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            first_line = content.strip().splitlines()[0].lower()
-            return "title" in first_line and "severity" in first_line and "source" in first_line
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="csv", header=("title", "severity", "source")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from typing import IO, Any, Collection, Dict, Iterator, List, Tuple
+import codecs
+import json
+import re
+
+# Bytes pulled from the stream per read; a value larger than the buffer grows it.
+READ_SIZE = 256 * 1024
+
+# Arrays in a skeleton keep this many leading elements.
+SKELETON_ITEMS = 8
+
+_NON_WS = re.compile(r"[^ \t\r\n]")
+_decoder = json.JSONDecoder()
+
+
+class JsonStreamError(ValueError):
+    pass
+
+
+class JsonReader:
+    """Pull reader that decodes a JSON stream one value at a time.
+
+    ``members()`` and ``elements()`` walk an object or array without decoding
+    it; after each step the caller consumes the member or element with
+    ``value()``, ``items()`` or a nested walk. Anything left unconsumed is
+    skipped. Only the value being decoded is held in memory.
+    """
+
+    def __init__(self, stream: IO, read_size: int = READ_SIZE):
+        self._stream = stream
+        self._read_size = read_size
+        self._utf8 = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._buf = ""
+        self._pos = 0
+        self._dropped = 0  # characters discarded from the front of the buffer
+        self._eof = False
+        self._started = False
+
+    @property
+    def offset(self) -> int:
+        return self._dropped + self._pos
+
+    def _fill(self, at_least: int = 0) -> bool:
+        if self._eof:
+            return False
+        chunk = self._stream.read(max(self._read_size, at_least))
+        if not chunk:
+            self._eof = True
+        text = chunk if isinstance(chunk, str) else self._utf8.decode(chunk or b"", final=self._eof)
+        if not self._started and text:
+            self._started = True
+            text = text.lstrip("﻿")
+        self._dropped += self._pos
+        self._buf = self._buf[self._pos:] + text
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """The next non-whitespace character, or "" at the end of the stream."""
+        while True:
+            m = _NON_WS.search(self._buf, self._pos)
+            if m:
+                self._pos = m.start()
+                return self._buf[self._pos]
+            self._pos = len(self._buf)
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise JsonStreamError(f"Expected {char!r} at offset {self.offset}, found {found or 'end of input'!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the complete value at the cursor."""
+        if not self.peek():
+            raise JsonStreamError("Unexpected end of JSON input")
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                # Most likely the value runs past the buffer; read more (doubling,
+                # so a large value is re-scanned a logarithmic number of times).
+                if self._fill(len(self._buf) - self._pos):
+                    continue
+                raise JsonStreamError(f"{e.msg} at offset {self._dropped + e.pos}") from None
+            # A number that ends the buffer may continue in the next chunk
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def skip(self) -> None:
+        """Consume the value at the cursor; arrays are skipped element by element."""
+        if self.peek() == "[":
+            for _ in self.elements():
+                pass
+        else:
+            self.value()
+
+    def members(self) -> Iterator[str]:
+        """Yield the keys of the object at the cursor, leaving it at each value."""
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise JsonStreamError(f"Expected an object key at offset {self.offset}")
+            self._expect(":")
+            self.peek()
+            mark = self.offset
+            yield key
+            if self.offset == mark:
+                self.skip()
+            if not self._separator("}"):
+                return
+
+    def elements(self) -> Iterator[int]:
+        """Yield the indexes of the array at the cursor, leaving it at each element."""
+        self._expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            self.peek()
+            mark = self.offset
+            yield index
+            if self.offset == mark:
+                self.skip()
+            if not self._separator("]"):
+                return
+            index += 1
+
+    def _separator(self, close: str) -> bool:
+        found = self.peek()
+        self._pos += 1
+        if found == ",":
+            return True
+        if found == close:
+            return False
+        raise JsonStreamError(f"Expected ',' or {close!r} at offset {self.offset - 1}, found {found or 'end of input'!r}")
+
+    def items(self) -> Iterator[Any]:
+        """Decode the elements of the array at the cursor one by one.
+
+        A null or any other non-array value is consumed and yields nothing.
+        """
+        if self.peek() != "[":
+            self.value()
+            return
+        for _ in self.elements():
+            yield self.value()
+
+    def sections(
+        self,
+        arrays: Collection[str],
+        needs: Collection[str] = (),
+    ) -> Iterator[Tuple[str, Any, Dict[str, Any]]]:
+        """Yield ``(name, element, fields)`` for the named arrays of the object at the cursor.
+
+        Every other member is decoded into ``fields``. An array is streamed if
+        all ``needs`` have been read by the time it starts; otherwise it is
+        decoded whole and replayed once the object ends.
+        """
+        fields: Dict[str, Any] = {}
+        deferred: List[Tuple[str, Any]] = []
+        for name in self.members():
+            if name not in arrays:
+                fields[name] = self.value()
+            elif all(need in fields for need in needs):
+                for element in self.items():
+                    yield name, element, fields
+            else:
+                deferred.append((name, self.value()))
+        for name, elements in deferred:
+            for element in elements if isinstance(elements, list) else ():
+                yield name, element, fields
+
+    def skeleton(self) -> Any:
+        """Decode the value at the cursor keeping only the first elements of every array."""
+        char = self.peek()
+        if char == "{":
+            return {key: self.skeleton() for key in self.members()}
+        if char == "[":
+            return [self.skeleton() for index in self.elements() if index < SKELETON_ITEMS]
+        return self.value()
+
+    def at_end(self) -> bool:
+        return self.peek() == ""
+
+    def read_rest(self) -> str:
+        """Everything not consumed yet, as text."""
+        while self._fill():
+            pass
+        rest = self._buf[self._pos:]
+        self._dropped += len(self._buf)
+        self._buf, self._pos = "", 0
+        return rest
+
+
+def iter_sections(
+    stream: IO,
+    arrays: Collection[str],
+    needs: Collection[str] = (),
+) -> Iterator[Tuple[str, Any, Dict[str, Any]]]:
+    """``JsonReader.sections`` over a whole document's top-level object.
+
+    An array that starts before all ``needs`` are known is skipped and
+    streamed on a second pass when the stream is seekable, instead of being
+    decoded whole.
+    """
+    if not stream.seekable():
+        yield from JsonReader(stream).sections(arrays, needs)
+        return
+
+    reader = JsonReader(stream)
+    fields: Dict[str, Any] = {}
+    deferred = set()
+    for name in reader.members():
+        if name not in arrays:
+            fields[name] = reader.value()
+        elif all(need in fields for need in needs):
+            for element in reader.items():
+                yield name, element, fields
+        else:
+            deferred.add(name)
+    if not deferred:
+        return
+
+    stream.seek(0)
+    reader = JsonReader(stream)
+    for name in reader.members():
+        if name in deferred:
+            for element in reader.items():
+                yield name, element, fields
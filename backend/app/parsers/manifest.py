@@ -0,0 +1,162 @@
+"""Generated parser manifest: what the registry knows without importing parsers.
+
+``manifest.json`` lists every in-tree parser with its metadata, detection
+signatures and module path. Listing parsers and auto-detection run from it;
+a parser module is imported the first time its class is needed. Regenerate
+after adding or changing a parser::
+
+    python -m app.parsers          # rewrite manifest.json
+    python -m app.parsers --check  # exit 1 if it is stale
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import importlib
+import json
+import os
+import pkgutil
+
+from .detection import Probe, Signature
+
+MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "manifest.json")
+
+PACKAGES = (
+    "sast", "dast", "sca", "infrastructure", "container", "cloud",
+    "generic", "bugbounty", "network", "mobile", "other", "secrets",
+)
+
+_SIGNATURE_DEFAULTS = {f.name: f.default for f in fields(Signature)}
+
+
+@dataclass(frozen=True)
+class ParserEntry:
+    """A parser as described by the manifest; ``load()`` imports its class."""
+
+    name: str
+    display_name: str
+    category: str
+    file_types: Tuple[str, ...]
+    description: str
+    module: str
+    class_name: str
+    signatures: Tuple[Signature, ...] = ()
+    deep_match: bool = False
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "display_name": self.display_name,
+            "category": self.category,
+            "file_types": list(self.file_types),
+            "description": self.description,
+        }
+
+    def load(self) -> Any:
+        return getattr(importlib.import_module(self.module, __package__), self.class_name)
+
+    def matches(self, probe: Probe) -> bool:
+        # Only parsers that override matches() need their code for detection
+        return self.load().matches(probe) if self.deep_match else True
+
+
+def _signature_to_dict(sig: Signature) -> Dict[str, Any]:
+    out = {}
+    for name, default in _SIGNATURE_DEFAULTS.items():
+        value = getattr(sig, name)
+        if value != default:
+            out[name] = list(value) if isinstance(value, tuple) else value
+    return out
+
+
+def _signature_from_dict(data: Dict[str, Any]) -> Signature:
+    return Signature(**{k: tuple(v) if isinstance(v, list) else v for k, v in data.items()})
+
+
+def _entry_to_dict(entry: ParserEntry) -> Dict[str, Any]:
+    data = entry.info()
+    data.update(
+        module=entry.module,
+        class_name=entry.class_name,
+        signatures=[_signature_to_dict(sig) for sig in entry.signatures],
+        deep_match=entry.deep_match,
+    )
+    return data
+
+
+def _entry_from_dict(data: Dict[str, Any]) -> ParserEntry:
+    return ParserEntry(
+        name=data["name"],
+        display_name=data["display_name"],
+        category=data["category"],
+        file_types=tuple(data["file_types"]),
+        description=data["description"],
+        module=data["module"],
+        class_name=data["class_name"],
+        signatures=tuple(_signature_from_dict(sig) for sig in data.get("signatures", ())),
+        deep_match=data.get("deep_match", False),
+    )
+
+
+def entry_for(parser_class: Any) -> ParserEntry:
+    from .base import BaseParser
+
+    module = parser_class.__module__
+    if module.startswith(__package__ + "."):
+        module = module[len(__package__):]
+    return ParserEntry(
+        name=parser_class.name,
+        display_name=parser_class.display_name,
+        category=parser_class.category.value,
+        file_types=tuple(parser_class.file_types),
+        description=parser_class.description,
+        module=module,
+        class_name=parser_class.__name__,
+        signatures=tuple(parser_class.signatures),
+        deep_match=parser_class.matches.__func__ is not BaseParser.matches.__func__,
+    )
+
+
+def import_all() -> None:
+    """Import every parser module so that each one registers itself."""
+    for package_name in PACKAGES:
+        package = importlib.import_module(f".{package_name}", __package__)
+        for info in pkgutil.iter_modules(package.__path__):
+            importlib.import_module(f"{package.__name__}.{info.name}")
+
+
+def build() -> List[ParserEntry]:
+    from .base import ParserRegistry
+
+    import_all()
+    return [entry_for(parser_class) for parser_class in ParserRegistry.loaded()]
+
+
+def dumps(entries: List[ParserEntry]) -> str:
+    return json.dumps({"parsers": [_entry_to_dict(e) for e in entries]}, indent=1) + "\n"
+
+
+def load(path: str = MANIFEST_PATH) -> Optional[Dict[str, ParserEntry]]:
+    """Manifest entries by parser name, or None when there is no manifest."""
+    try:
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    return {e["name"]: _entry_from_dict(e) for e in data["parsers"]}
+
+
+def package_getattr(package: str) -> Callable[[str], Any]:
+    """A module ``__getattr__`` that imports a parser class on first access.
+
+    Lets a parser package export its classes by name (including through
+    ``__all__``) without importing any of them up front.
+    """
+    def __getattr__(attr: str) -> Any:
+        from .base import ParserRegistry
+
+        for entry in ParserRegistry.entries().values():
+            if entry.class_name == attr and entry.module.rpartition(".")[0] in (package, package[len(__package__):]):
+                return entry.load()
+        raise AttributeError(f"module {package!r} has no attribute {attr!r}")
+    return __getattr__
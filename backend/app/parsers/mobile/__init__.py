@@ -1,5 +1,7 @@
-from .androbugs import AndrobugsParser
-from .qark import QarkParser
+# Parser classes are imported on first access; see ..manifest
+from ..manifest import package_getattr
+
+__getattr__ = package_getattr(__name__)
 
 __all__ = [
     "AndrobugsParser",
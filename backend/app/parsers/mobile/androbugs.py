@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class AndrobugsParser(BaseParser):
@@ -10,18 +10,16 @@ class AndrobugsParser(BaseParser):
     file_types = ["json", "txt"]
     description = "AndroBugs Framework for Android vulnerability scanning"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "androbugs" in str(data).lower() or "analyze_result" in data
-        except:
-            return "AndroBugs" in content or "[Critical]" in content or "[Warning]" in content
+    signatures = (
+        Signature(contains=("androbugs",)),
+        Signature(format="json", keys=("analyze_result",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
             if content.strip().startswith("{"):
-                data = json.loads(content)
+                data = jsonlib.loads(content)
                 for category, issues in data.get("analyze_result", data).items():
                     if isinstance(issues, list):
                         for issue in issues:
@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class QarkParser(BaseParser):
@@ -10,17 +10,15 @@ class QarkParser(BaseParser):
     file_types = ["json"]
     description = "Quick Android Review Kit for Android app security"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "issues" in data or "qark" in str(data).lower() or "apk" in str(data).lower() and "severity" in str(data)
-        except:
-            return False
+    signatures = (
+        Signature(format="json", contains=("qark",)),
+        Signature(format="json", keys=("issues",), contains=("apk", "severity"), priority=-1),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             issues = data.get("issues", data.get("findings", []))
             app = data.get("apk_name", data.get("app", "Android App"))
             for issue in issues:
@@ -30,7 +28,7 @@ class QarkParser(BaseParser):
                     severity=self._map_severity(issue.get("severity", "medium")),
                     tool=self.name,
                     asset=issue.get("file", app),
-                    cwe=issue.get("cwe"),
+                    cwe_id=issue.get("cwe"),
                     raw_data=issue
                 ))
         except:
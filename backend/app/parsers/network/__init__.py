@@ -1,12 +1,7 @@
-from .hydra import HydraParser
-from .masscan import MasscanParser
-from .nmap import NmapParser
-from .openreports import OpenReportsParser
-from .ssh_audit import SSHAuditParser
-from .ssl_labs import SSLLabsParser
-from .sslscan import SSLScanParser
-from .sslyze import SSLyzeParser
-from .testssl import TestSSLParser
+# Parser classes are imported on first access; see ..manifest
+from ..manifest import package_getattr
+
+__getattr__ = package_getattr(__name__)
 
 __all__ = [
     "HydraParser",
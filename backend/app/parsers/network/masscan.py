@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class MasscanParser(BaseParser):
@@ -10,19 +10,14 @@ class MasscanParser(BaseParser):
     file_types = ["json"]
     description = "Masscan high-speed port scanner"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, list) and len(data) > 0:
-                return "ip" in data[0] and "ports" in data[0]
-            return False
-        except:
-            return False
+    signatures = (
+        Signature(format="json", item_keys=("ip", "ports")),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             for host in data:
                 ip = host.get("ip", "unknown")
                 for port in host.get("ports", []):
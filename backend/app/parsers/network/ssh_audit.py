@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 def _cvss_to_severity(raw_value: str) -> str:
@@ -28,18 +28,14 @@ class SSHAuditParser(BaseParser):
     file_types = ["json"]
     description = "SSH Audit SSH server security scanner (JSON)"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return isinstance(data, dict) and "target" in data and "banner" in data
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("target", "banner")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
         except Exception:
             return findings
 
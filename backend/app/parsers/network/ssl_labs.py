@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 def _grade_to_severity(grade: str) -> str:
@@ -22,20 +22,13 @@ class SSLLabsParser(BaseParser):
     file_types = ["json"]
     description = "SSL Labs TLS/SSL scanner (JSON)"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, list) or not data:
-                return False
-            first = data[0]
-            return isinstance(first, dict) and "host" in first and "endpoints" in first
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", item_keys=("host", "endpoints")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         seen = set()
         for host_entry in data:
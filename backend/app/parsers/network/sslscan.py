@@ -1,7 +1,7 @@
-import xml.etree.ElementTree as ET
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from .. import xmlstream
 
 
 @ParserRegistry.register
@@ -12,17 +12,13 @@ class SSLScanParser(BaseParser):
     file_types = ["xml"]
     description = "SSLScan SSL/TLS configuration scanner (XML)"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            root = ET.fromstring(content)
-            return "document" in root.tag.lower()
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="xml", root=("document",)),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        root = ET.fromstring(content)
+        root = xmlstream.parse(content)
 
         seen = set()
         for ssltest in root:
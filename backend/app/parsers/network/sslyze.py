@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class SSLyzeParser(BaseParser):
@@ -10,17 +10,15 @@ class SSLyzeParser(BaseParser):
     file_types = ["json"]
     description = "SSLyze SSL/TLS configuration analyzer"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "server_scan_results" in data or "sslyze_version" in data or "server_info" in str(data)
-        except:
-            return False
+    signatures = (
+        Signature(format="json", any_keys=("server_scan_results", "sslyze_version")),
+        Signature(format="json", contains=("server_info",), priority=-1),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             for result in data.get("server_scan_results", [data]):
                 server = result.get("server_info", {}).get("server_location", {})
                 hostname = server.get("hostname", result.get("server_info", {}).get("hostname", "unknown"))
@@ -42,7 +40,7 @@ class SSLyzeParser(BaseParser):
                         severity="high",
                         tool=self.name,
                         asset=f"{hostname}:{port}",
-                        cve="CVE-2014-3566",
+                        cve_id="CVE-2014-3566",
                         raw_data={"vulnerability": "ssl3_enabled"}
                     ))
                 heartbleed = scan_commands.get("heartbleed", {})
@@ -53,7 +51,7 @@ class SSLyzeParser(BaseParser):
                         severity="critical",
                         tool=self.name,
                         asset=f"{hostname}:{port}",
-                        cve="CVE-2014-0160",
+                        cve_id="CVE-2014-0160",
                         raw_data={"vulnerability": "heartbleed"}
                     ))
                 robot = scan_commands.get("robot", {})
@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class TestSSLParser(BaseParser):
@@ -10,19 +10,16 @@ class TestSSLParser(BaseParser):
     file_types = ["json"]
     description = "testssl.sh SSL/TLS testing tool"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, list) and len(data) > 0:
-                return "id" in data[0] and "severity" in data[0] and "finding" in data[0]
-            return "scanResult" in data or "testssl" in str(data).lower()
-        except:
-            return False
+    signatures = (
+        Signature(format="json", item_keys=("id", "severity", "finding")),
+        Signature(format="json", keys=("scanResult",)),
+        Signature(format="json", contains=("testssl",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             results = data if isinstance(data, list) else data.get("scanResult", [])
             for item in results:
                 if isinstance(item, dict) and item.get("severity") not in ["OK", "INFO", "DEBUG"]:
@@ -32,7 +29,7 @@ class TestSSLParser(BaseParser):
                         severity=self._map_severity(item.get("severity", "medium")),
                         tool=self.name,
                         asset=item.get("ip", item.get("targetHost", "unknown")),
-                        cve=item.get("cve"),
+                        cve_id=item.get("cve"),
                         raw_data=item
                     ))
         except:
@@ -1,20 +1,7 @@
-from .crunch42 import Crunch42Parser
-from .cyberwatch import CyberwatchParser
-from .drheader import DrHeaderParser
-from .github_advanced import GitHubAdvancedSecurityParser
-from .humble import HumbleParser
-from .huskyci import HuskyCIParser
-from .intights import IntSightsParser
-from .mayhem import MayhemParser
-from .mozilla_observatory import MozillaObservatoryParser
-from .ort import ORTParser
-from .outpost24 import Outpost24Parser
-from .api_blackduck import ApiBlackDuckParser
-from .api_bugcrowd import ApiBugcrowdParser
-from .api_cobalt import ApiCobaltParser
-from .api_edgescan import ApiEdgescanParser
-from .api_sonarqube import ApiSonarQubeParser
-from .api_vulners import ApiVulnersParser
+# Parser classes are imported on first access; see ..manifest
+from ..manifest import package_getattr
+
+__getattr__ = package_getattr(__name__)
 
 __all__ = [
     "Crunch42Parser",
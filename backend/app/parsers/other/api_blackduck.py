@@ -1,6 +1,6 @@
-import json
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -11,25 +11,14 @@ class ApiBlackDuckParser(BaseParser):
     file_types = ["json"]
     description = "Synopsys Black Duck Hub API report (SCA)"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, list) and data:
-                first = data[0]
-                return (
-                    isinstance(first, dict)
-                    and "vulnerabilityWithRemediation" in first
-                    and "componentName" in first
-                )
-            return False
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", item_keys=("vulnerabilityWithRemediation", "componentName")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             for entry in data:
                 vuln_info = entry.get("vulnerabilityWithRemediation", {})
                 vuln_id = vuln_info.get("vulnerabilityName", "Unknown")
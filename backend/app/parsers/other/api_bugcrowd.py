@@ -1,7 +1,7 @@
-import json
 import textwrap
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, Probe
+from ... import jsonlib
 
 
 def _convert_severity(bugcrowd_severity: int) -> str:
@@ -17,26 +17,19 @@ class ApiBugcrowdParser(BaseParser):
     file_types = ["json"]
     description = "Bugcrowd API submission export"
 
+    signatures = (
+        Signature(format="json", item_keys=("attributes",), contains=("state", "severity")),
+    )
+
     @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, list) and data:
-                first = data[0]
-                return (
-                    isinstance(first, dict)
-                    and "attributes" in first
-                    and "state" in first.get("attributes", {})
-                    and "severity" in first.get("attributes", {})
-                )
-            return False
-        except Exception:
-            return False
+    def matches(cls, probe: Probe) -> bool:
+        attributes = probe.data[0].get("attributes")
+        return isinstance(attributes, dict) and "state" in attributes and "severity" in attributes
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             for entry in data:
                 attrs = entry.get("attributes", {})
                 title = attrs.get("title", "Bugcrowd Submission")
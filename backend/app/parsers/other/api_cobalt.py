@@ -1,7 +1,7 @@
-import json
 import textwrap
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, Probe
+from ... import jsonlib
 
 
 def _convert_severity(cobalt_severity: str) -> str:
@@ -23,25 +23,19 @@ class ApiCobaltParser(BaseParser):
     file_types = ["json"]
     description = "Cobalt.io pentest platform API export"
 
+    signatures = (
+        Signature(format="json", keys=("data",), child="data", child_keys=("resource",), contains=("state",)),
+    )
+
     @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return (
-                isinstance(data, dict)
-                and "data" in data
-                and isinstance(data["data"], list)
-                and data["data"]
-                and "resource" in data["data"][0]
-                and "state" in data["data"][0].get("resource", {})
-            )
-        except Exception:
-            return False
+    def matches(cls, probe: Probe) -> bool:
+        resource = probe.child("data").get("resource")
+        return isinstance(resource, dict) and "state" in resource
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             for entry in data.get("data", []):
                 resource = entry.get("resource", {})
                 links = entry.get("links", {})
@@ -1,6 +1,6 @@
-import json
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 _ES_SEVERITIES = {1: "info", 2: "low", 3: "medium", 4: "high", 5: "critical"}
 
@@ -13,26 +13,14 @@ class ApiEdgescanParser(BaseParser):
     file_types = ["json"]
     description = "Edgescan continuous vulnerability management API export"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, list) and data:
-                first = data[0]
-                return (
-                    isinstance(first, dict)
-                    and "name" in first
-                    and "severity" in first
-                    and "date_opened" in first
-                )
-            return False
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", item_keys=("name", "severity", "date_opened")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             for vuln in data:
                 title = vuln.get("name", "Edgescan Finding")
                 sev_int = vuln.get("severity", 1)
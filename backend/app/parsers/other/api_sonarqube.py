@@ -1,6 +1,6 @@
-import json
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 # SonarQube severity mapping
 _SQ_SEVERITY = {
@@ -28,23 +28,10 @@ class ApiSonarQubeParser(BaseParser):
     file_types = ["json"]
     description = "SonarQube API JSON export (issues)"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, dict):
-                # Standard SonarQube API response has "issues" key
-                if "issues" in data:
-                    issues = data["issues"]
-                    if isinstance(issues, list) and issues:
-                        first = issues[0]
-                        return isinstance(first, dict) and "rule" in first and "component" in first
-                # Also accept hotspots format
-                if "hotspots" in data:
-                    return True
-            return False
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("issues",), child="issues", child_keys=("rule", "component")),
+        Signature(format="json", keys=("hotspots",), child="hotspots", child_keys=("rule", "component")),
+    )
 
     def _parse_issue(self, issue: dict) -> Optional[ParsedFinding]:
         rule = issue.get("rule", "")
@@ -104,7 +91,7 @@ class ApiSonarQubeParser(BaseParser):
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             for issue in data.get("issues", []):
                 f = self._parse_issue(issue)
                 if f:
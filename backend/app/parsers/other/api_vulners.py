@@ -1,6 +1,6 @@
-import json
 from typing import List, Optional
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 _VULNERS_SEVERITY = {
     0: "info",
@@ -20,23 +20,14 @@ class ApiVulnersParser(BaseParser):
     file_types = ["json"]
     description = "Vulners.com vulnerability scanner API report"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return (
-                isinstance(data, dict)
-                and "data" in data
-                and isinstance(data["data"], dict)
-                and "report" in data["data"]
-            )
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("data",), child="data", child_keys=("report",)),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
         try:
-            outer = json.loads(content)
+            outer = jsonlib.loads(content)
             data = outer.get("data", {})
             report = data.get("report", [])
             vulns = data.get("vulns", {})
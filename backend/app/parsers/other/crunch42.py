@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class Crunch42Parser(BaseParser):
@@ -10,17 +10,15 @@ class Crunch42Parser(BaseParser):
     file_types = ["json"]
     description = "42Crunch API security audit"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "audit" in data or "42crunch" in str(data).lower() or "openapiState" in data
-        except:
-            return False
+    signatures = (
+        Signature(format="json", any_keys=("audit", "openapiState")),
+        Signature(format="json", contains=("42crunch",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             audit = data.get("audit", data)
             for issue in audit.get("issues", audit.get("findings", [])):
                 findings.append(ParsedFinding(
@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class DrHeaderParser(BaseParser):
@@ -10,19 +10,15 @@ class DrHeaderParser(BaseParser):
     file_types = ["json"]
     description = "Security header analyzer"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, list) and len(data) > 0:
-                return "rule" in data[0] or "message" in data[0] and "severity" in data[0]
-            return False
-        except:
-            return False
+    signatures = (
+        Signature(format="json", any_item_keys=("rule",)),
+        Signature(format="json", item_keys=("message", "severity")),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             for item in data:
                 findings.append(ParsedFinding(
                     title=item.get("rule", item.get("header", "DrHeader Finding")),
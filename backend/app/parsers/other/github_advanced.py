@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class GitHubAdvancedSecurityParser(BaseParser):
@@ -10,19 +10,16 @@ class GitHubAdvancedSecurityParser(BaseParser):
     file_types = ["json"]
     description = "GitHub Advanced Security (code scanning, secret scanning, Dependabot)"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, list) and len(data) > 0:
-                return "rule" in data[0] and "tool" in data[0] or "secret_type" in data[0]
-            return "number" in data and "state" in data and "rule" in data
-        except:
-            return False
+    signatures = (
+        Signature(format="json", item_keys=("rule", "tool")),
+        Signature(format="json", any_item_keys=("secret_type",)),
+        Signature(format="json", keys=("number", "state", "rule")),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             alerts = data if isinstance(data, list) else [data]
             for alert in alerts:
                 if "secret_type" in alert:
@@ -42,7 +39,7 @@ class GitHubAdvancedSecurityParser(BaseParser):
                         severity=self._map_severity(rule.get("security_severity_level", rule.get("severity", "medium"))),
                         tool=self.name,
                         asset=alert.get("most_recent_instance", {}).get("location", {}).get("path", "unknown"),
-                        cwe=self._extract_cwe(rule.get("tags", [])),
+                        cwe_id=self._extract_cwe(rule.get("tags", [])),
                         raw_data=alert
                     ))
                 elif "security_advisory" in alert:
@@ -53,7 +50,7 @@ class GitHubAdvancedSecurityParser(BaseParser):
                         severity=self._map_severity(advisory.get("severity", "medium")),
                         tool=self.name,
                         asset=alert.get("dependency", {}).get("package", {}).get("name", "unknown"),
-                        cve=advisory.get("cve_id"),
+                        cve_id=advisory.get("cve_id"),
                         raw_data=alert
                     ))
         except:
@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class HuskyCIParser(BaseParser):
@@ -10,17 +10,14 @@ class HuskyCIParser(BaseParser):
     file_types = ["json"]
     description = "HuskyCI security pipeline orchestrator"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "huskyciresults" in data or "goResults" in data or "npmResults" in data or "pythonResults" in data
-        except:
-            return False
+    signatures = (
+        Signature(format="json", any_keys=("huskyciresults", "goResults", "npmResults", "pythonResults")),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             results = data.get("huskyciresults", data)
             for tool_key in ["goResults", "npmResults", "pythonResults", "javaResults", "rubyResults"]:
                 tool_results = results.get(tool_key, {})
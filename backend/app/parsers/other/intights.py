@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class IntSightsParser(BaseParser):
@@ -10,17 +10,16 @@ class IntSightsParser(BaseParser):
     file_types = ["json"]
     description = "IntSights threat intelligence reports"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "Alerts" in data or "intsights" in str(data).lower() or "ThreatCommand" in str(data)
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("Alerts",)),
+        Signature(format="json", contains=("intsights",)),
+        Signature(format="json", contains=("threatcommand",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             alerts = data.get("Alerts", data.get("alerts", [data] if isinstance(data, dict) else data))
             for alert in alerts:
                 findings.append(ParsedFinding(
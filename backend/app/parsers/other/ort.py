@@ -1,7 +1,6 @@
-import json
-import xml.etree.ElementTree as ET
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class ORTParser(BaseParser):
@@ -11,17 +10,16 @@ class ORTParser(BaseParser):
     file_types = ["json", "xml"]
     description = "OSS Review Toolkit for license compliance and vulnerability scanning"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "analyzer" in data or "advisor" in data or "scanner" in data or "repository" in data and "config" in data
-        except:
-            return "ort-result" in content.lower()
+    signatures = (
+        Signature(format="json", any_keys=("analyzer", "advisor", "scanner")),
+        Signature(format="json", keys=("repository", "config")),
+        Signature(contains=("ort-result",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             advisor = data.get("advisor", {})
             results = advisor.get("results", {})
             for pkg_id, advisories in results.items():
@@ -34,7 +32,7 @@ class ORTParser(BaseParser):
                                 severity=self._map_severity(vuln.get("severity", "medium")),
                                 tool=self.name,
                                 asset=pkg_id,
-                                cve=vuln.get("id") if str(vuln.get("id", "")).startswith("CVE") else None,
+                                cve_id=vuln.get("id") if str(vuln.get("id", "")).startswith("CVE") else None,
                                 raw_data=vuln
                             ))
             evaluator = data.get("evaluator", {})
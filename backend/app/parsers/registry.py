@@ -1,19 +1,7 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, BinaryIO, Iterator
 
 from .base import BaseParser, ParsedFinding, ParserRegistry
-
-from .sast import *
-from .dast import *
-from .sca import *
-from .infrastructure import *
-from .container import *
-from .cloud import *
-from .generic import *
-from .bugbounty import *
-from .network import *
-from .mobile import *
-from .other import *
-from .secrets import *
+from .detection import Probe
 
 
 def get_parser(name: str) -> Optional[BaseParser]:
@@ -27,6 +15,10 @@ def list_parsers() -> List[Dict[str, Any]]:
     return ParserRegistry.list_all()
 
 
+def get_parser_info(name: str) -> Optional[Dict[str, Any]]:
+    return ParserRegistry.info(name)
+
+
 def parse_scan_results(
     content: str,
     parser_name: Optional[str] = None,
@@ -43,3 +35,44 @@ def parse_scan_results(
         parser = parser_class()
     
     return parser.parse(content, filename)
+
+
+def resolve_parser(
+    fh: BinaryIO,
+    parser_name: Optional[str] = None,
+    filename: Optional[str] = None,
+) -> BaseParser:
+    """The named parser, or the one detected for a seekable binary report.
+
+    Raises ValueError for unknown parsers and undetectable content.
+    """
+    if parser_name:
+        parser = get_parser(parser_name)
+        if not parser:
+            raise ValueError(f"Unknown parser: {parser_name}")
+        return parser
+    parser_class = ParserRegistry.detect(Probe.sniff_file(fh, filename))
+    if not parser_class:
+        raise ValueError("Could not auto-detect parser for this content")
+    return parser_class()
+
+
+def iter_scan_file(
+    fh: BinaryIO,
+    parser_name: Optional[str] = None,
+    filename: Optional[str] = None,
+) -> Iterator[ParsedFinding]:
+    """Stream findings from a seekable binary report.
+
+    Unknown parsers and undetectable content raise ValueError right away,
+    before the first finding is requested.
+    """
+    return resolve_parser(fh, parser_name, filename).iter_parse(fh, filename)
+
+
+def parse_scan_file(
+    fh: BinaryIO,
+    parser_name: Optional[str] = None,
+    filename: Optional[str] = None,
+) -> List[ParsedFinding]:
+    return list(iter_scan_file(fh, parser_name, filename))
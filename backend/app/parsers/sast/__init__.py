@@ -1,46 +1,7 @@
-from .bandit import BanditParser
-from .bearer import BearerParser
-from .brakeman import BrakemanParser
-from .checkmarx import CheckmarxParser
-from .checkmarx_cxflow import CheckmarxCxFlowParser
-from .checkmarx_one import CheckmarxOneParser
-from .checkmarx_osa import CheckmarxOsaParser
-from .codechecker import CodecheckerParser
-from .codeql import CodeQLParser
-from .contrast import ContrastParser
-from .coverity import CoverityParser
-from .coverity_api import CoverityApiParser
-from .coverity_scan import CoverityScanParser
-from .credscan import CredScanParser
-from .dawnscanner import DawnScannerParser
-from .detect_secrets import DetectSecretsParser
-from .eslint import ESLintParser
-from .fortify import FortifyParser
-from .gitguardian import GitGuardianParser
-from .github_sast import GithubSASTParser
-from .gitleaks import GitleaksParser
-from .gosec import GosecParser
-from .hcl_asoc import HCLASoCParser
-from .horusec import HorusecParser
-from .kiuwan import KiuwanParser
-from .noseyparker import NoseyParkerParser
-from .php_security_audit_v2 import PhpSecurityAuditV2Parser
-from .php_symfony_security_check import PhpSymfonySecurityCheckParser
-from .phpstan import PHPStanParser
-from .pmd import PmdParser
-from .progpilot import ProgpilotParser
-from .pwn_sast import PwnSastParser
-from .rubocop import RubocopParser
-from .semgrep import SemgrepParser
-from .semgrep_pro import SemgrepProParser
-from .skf import SKFParser
-from .snyk_code import SnykCodeParser
-from .snyk_issue_api import SnykIssueApiParser
-from .solar_appscreener import SolarAppscreenerParser
-from .sonarqube import SonarQubeParser
-from .spotbugs import SpotBugsParser
-from .vcg import VCGParser
-from .xanitizer import XanitizerParser
+# Parser classes are imported on first access; see ..manifest
+from ..manifest import package_getattr
+
+__getattr__ = package_getattr(__name__)
 
 __all__ = [
     "BanditParser",
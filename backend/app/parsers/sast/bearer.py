@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,16 +12,13 @@ class BearerParser(BaseParser):
     file_types = ["json"]
     description = "Code security and privacy analysis"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return "findings" in data or ("high" in data and "critical" in data)
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("high", "critical")),
+        Signature(format="json", keys=("findings",), contains=("bearer",)),
+    )
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         all_findings = []
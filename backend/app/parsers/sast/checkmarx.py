@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class CheckmarxParser(BaseParser):
@@ -10,19 +10,15 @@ class CheckmarxParser(BaseParser):
     file_types = ["json", "xml", "csv"]
     description = "Enterprise SAST solution for secure code review"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, dict):
-                return "scanId" in data or "CxXMLResults" in content or "checkmarx" in str(data).lower()
-            return False
-        except:
-            return "CxXMLResults" in content or "Checkmarx" in content
+    signatures = (
+        Signature(format="json", keys=("scanId",)),
+        Signature(format="json", contains=("checkmarx",), priority=-1),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             results = data.get("results", data.get("vulnerabilities", []))
             if isinstance(data, dict) and not results:
                 results = [data]
@@ -33,10 +29,10 @@ class CheckmarxParser(BaseParser):
                     severity=self._map_severity(item.get("severity", "medium")),
                     tool=self.name,
                     asset=item.get("sourceFile", item.get("file", "unknown")),
-                    cwe=item.get("cweId"),
+                    cwe_id=item.get("cweId"),
                     raw_data=item
                 ))
-        except json.JSONDecodeError:
+        except jsonlib.JSONDecodeError:
             pass
         return findings
 
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, Probe
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,29 +12,27 @@ class CheckmarxOsaParser(BaseParser):
     file_types = ["json"]
     description = "Checkmarx Open Source Analysis (OSA) for dependencies"
 
+    signatures = (
+        Signature(format="json"),
+    )
+
     @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, list) or len(data) != 2:
-                return False
-            # Expect [vulnerabilities_array, libraries_array]
-            # Vulnerabilities have 'libraryId' and 'severity'
-            if not isinstance(data[0], list) or not isinstance(data[1], list):
-                return False
-            if data[0]:
-                first = data[0][0]
-                return "libraryId" in first and "severity" in first
-            if data[1]:
-                first = data[1][0]
-                return "id" in first and "name" in first
-            return True
-        except Exception:
+    def matches(cls, probe: Probe) -> bool:
+        # Expect [vulnerabilities_array, libraries_array]
+        data = probe.data
+        if not isinstance(data, list) or len(data) != 2:
+            return False
+        if not isinstance(data[0], list) or not isinstance(data[1], list):
             return False
+        if data[0]:
+            return isinstance(data[0][0], dict) and "libraryId" in data[0][0] and "severity" in data[0][0]
+        if data[1]:
+            return isinstance(data[1][0], dict) and "id" in data[1][0] and "name" in data[1][0]
+        return True
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         if len(data) != 2:
             return findings
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,20 +12,12 @@ class CodeQLParser(BaseParser):
     file_types = ["json", "sarif"]
     description = "GitHub's semantic code analysis engine"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if "$schema" in data and "sarif" in str(data.get("$schema", "")):
-                return True
-            if "runs" in data and isinstance(data["runs"], list):
-                return True
-            return False
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("runs",), contains=("codeql",)),
+    )
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         for run in data.get("runs", []):
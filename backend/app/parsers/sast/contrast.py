@@ -1,8 +1,8 @@
-import json
 import csv
 import io
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class ContrastParser(BaseParser):
@@ -12,20 +12,17 @@ class ContrastParser(BaseParser):
     file_types = ["json", "csv"]
     description = "Contrast Security IAST/RASP findings"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, dict):
-                return "traces" in data or "vulnerabilities" in data or "contrast" in str(data).lower()
-            return False
-        except:
-            return "Vulnerability Name" in content and "Severity" in content
+    signatures = (
+        Signature(format="json", keys=("traces",)),
+        Signature(format="json", contains=("contrast",), priority=-1),
+        Signature(format="csv", columns=("vulnerability name", "severity"), priority=-1),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
             if content.strip().startswith("{") or content.strip().startswith("["):
-                data = json.loads(content)
+                data = jsonlib.loads(content)
                 traces = data.get("traces", data.get("vulnerabilities", []))
                 if isinstance(data, list):
                     traces = data
@@ -36,7 +33,7 @@ class ContrastParser(BaseParser):
                         severity=self._map_severity(trace.get("severity", "medium")),
                         tool=self.name,
                         asset=trace.get("application", {}).get("name", trace.get("app_name", "unknown")),
-                        cwe=trace.get("cwe"),
+                        cwe_id=trace.get("cwe"),
                         raw_data=trace
                     ))
             else:
@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class CoverityParser(BaseParser):
@@ -10,19 +10,15 @@ class CoverityParser(BaseParser):
     file_types = ["json", "csv"]
     description = "Synopsys Coverity static analysis for finding defects"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, dict):
-                return "issues" in data or "mergedDefects" in data or "coverity" in str(data).lower()
-            return False
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("mergedDefects",)),
+        Signature(format="json", keys=("issues",), contains=("coverity",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             issues = data.get("issues", data.get("mergedDefects", []))
             for issue in issues:
                 findings.append(ParsedFinding(
@@ -31,7 +27,7 @@ class CoverityParser(BaseParser):
                     severity=self._map_severity(issue.get("impact", issue.get("severity", "medium"))),
                     tool=self.name,
                     asset=issue.get("strippedMainEventFilePathname", issue.get("file", "unknown")),
-                    cwe=issue.get("cwe"),
+                    cwe_id=issue.get("cwe"),
                     raw_data=issue
                 ))
         except:
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -19,17 +19,13 @@ class CoverityApiParser(BaseParser):
         "High": "high",
     }
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return "viewContentsV1" in data and "rows" in data.get("viewContentsV1", {})
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("viewContentsV1",), child="viewContentsV1", child_keys=("rows",)),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         rows = data.get("viewContentsV1", {}).get("rows", [])
         for issue in rows:
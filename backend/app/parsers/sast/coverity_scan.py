@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -19,22 +19,13 @@ class CoverityScanParser(BaseParser):
         "High": "high",
     }
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if "issues" not in data or not isinstance(data["issues"], list):
-                return False
-            if not data["issues"]:
-                return False
-            first = data["issues"][0]
-            return "checkerProperties" in first and "checkerName" in first
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("issues",), child="issues", child_keys=("checkerProperties", "checkerName")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         for issue in data.get("issues", []):
             checker_props = issue.get("checkerProperties", {})
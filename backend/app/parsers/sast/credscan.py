@@ -1,8 +1,8 @@
-import json
 import csv
 import io
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class CredScanParser(BaseParser):
@@ -12,20 +12,17 @@ class CredScanParser(BaseParser):
     file_types = ["csv", "json"]
     description = "Microsoft CredScan for detecting credentials in code"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            if "CredentialType" in content or "SearcherName" in content:
-                return True
-            data = json.loads(content)
-            return "credentials" in data or "matches" in data
-        except:
-            return False
+    signatures = (
+        Signature(contains=("credentialtype",)),
+        Signature(contains=("searchername",)),
+        Signature(format="json", keys=("credentials",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
             if content.strip().startswith("{") or content.strip().startswith("["):
-                data = json.loads(content)
+                data = jsonlib.loads(content)
                 creds = data.get("credentials", data.get("matches", []))
                 if isinstance(data, list):
                     creds = data
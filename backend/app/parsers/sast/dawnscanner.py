@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class DawnScannerParser(BaseParser):
@@ -10,17 +10,15 @@ class DawnScannerParser(BaseParser):
     file_types = ["json"]
     description = "Security scanner for Ruby web applications"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "dawn_version" in data or "vulnerabilities" in data and "target" in data
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("dawn_version",)),
+        Signature(format="json", keys=("vulnerabilities", "target"), priority=-1),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             target = data.get("target", "unknown")
             for vuln in data.get("vulnerabilities", []):
                 findings.append(ParsedFinding(
@@ -29,8 +27,8 @@ class DawnScannerParser(BaseParser):
                     severity=self._map_severity(vuln.get("severity", vuln.get("priority", "medium"))),
                     tool=self.name,
                     asset=target,
-                    cve=vuln.get("cve"),
-                    cwe=vuln.get("cwe"),
+                    cve_id=vuln.get("cve"),
+                    cwe_id=vuln.get("cwe"),
                     raw_data=vuln
                 ))
         except:
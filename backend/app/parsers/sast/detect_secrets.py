@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class DetectSecretsParser(BaseParser):
@@ -10,17 +10,15 @@ class DetectSecretsParser(BaseParser):
     file_types = ["json"]
     description = "Yelp's detect-secrets for finding secrets in code"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "results" in data and "generated_at" in data or "version" in data and "results" in data
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("results", "plugins_used")),
+        Signature(format="json", keys=("results", "generated_at", "version")),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             results = data.get("results", {})
             for file_path, secrets in results.items():
                 for secret in secrets:
@@ -1,34 +1,31 @@
-import json
-import xml.etree.ElementTree as ET
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, BinaryIO, Iterator, Optional
+from ..base import StreamingParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, read_text
+from ... import jsonlib
+from ..xmlstream import iter_elements, peek_text
 
 @ParserRegistry.register
-class FortifyParser(BaseParser):
+class FortifyParser(StreamingParser):
     name = "fortify"
     display_name = "Fortify"
     category = ScannerCategory.SAST
     file_types = ["xml", "fpr", "json"]
     description = "HP/Micro Focus Fortify Static Code Analyzer"
 
-    def can_parse(self, content: str) -> bool:
-        return "FVDL" in content or "Fortify" in content or "ReportDefinition" in content
+    signatures = (
+        Signature(format="xml", root=("FVDL",)),
+        Signature(format="xml", root=("ReportDefinition",)),
+        Signature(format="xml", contains=("fortify",), priority=-1),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
-        findings = []
-        try:
-            if content.strip().startswith("{"):
-                data = json.loads(content)
-                for vuln in data.get("vulnerabilities", []):
-                    findings.append(self._create_finding(vuln))
-            else:
-                root = ET.fromstring(content)
-                ns = {"fvdl": "xmlns://www.fortifysoftware.com/schema/fvdl"}
-                for vuln in root.findall(".//fvdl:Vulnerability", ns) or root.findall(".//Vulnerability"):
-                    findings.append(self._parse_xml_vuln(vuln, ns))
-        except:
-            pass
-        return findings
+    def iter_parse(self, stream: BinaryIO, filename: Optional[str] = None) -> Iterator[ParsedFinding]:
+        if peek_text(stream).startswith("{"):
+            data = jsonlib.loads(read_text(stream))
+            for vuln in data.get("vulnerabilities", []):
+                yield self._create_finding(vuln)
+        else:
+            ns = {"fvdl": "xmlns://www.fortifysoftware.com/schema/fvdl"}
+            for vuln, _ in iter_elements(stream, ("Vulnerability",)):
+                yield self._parse_xml_vuln(vuln, ns)
 
     def _create_finding(self, vuln: dict) -> ParsedFinding:
         return ParsedFinding(
@@ -37,7 +34,7 @@ class FortifyParser(BaseParser):
             severity=self._map_severity(vuln.get("frilesriority", vuln.get("severity", "medium"))),
             tool=self.name,
             asset=vuln.get("primaryLocation", {}).get("file", "unknown"),
-            cwe=vuln.get("cwe"),
+            cwe_id=vuln.get("cwe"),
             raw_data=vuln
         )
 
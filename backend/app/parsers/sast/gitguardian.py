@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class GitGuardianParser(BaseParser):
@@ -10,19 +10,14 @@ class GitGuardianParser(BaseParser):
     file_types = ["json"]
     description = "GitGuardian ggshield secrets detection"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, dict):
-                return "policy_breaks" in data or "secrets_engine_version" in data or "entities_with_incidents" in data
-            return False
-        except:
-            return False
+    signatures = (
+        Signature(format="json", any_keys=("policy_breaks", "secrets_engine_version", "entities_with_incidents")),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             incidents = data.get("policy_breaks", data.get("entities_with_incidents", []))
             if isinstance(data, dict) and "scans" in data:
                 for scan in data["scans"]:
@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class HorusecParser(BaseParser):
@@ -10,17 +10,14 @@ class HorusecParser(BaseParser):
     file_types = ["json"]
     description = "Horusec open-source security analysis tool"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "analysisVulnerabilities" in data or "version" in data and "id" in data and "status" in data
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("analysisVulnerabilities",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             vulns = data.get("analysisVulnerabilities", [])
             for vuln_wrapper in vulns:
                 vuln = vuln_wrapper.get("vulnerabilities", vuln_wrapper)
@@ -30,7 +27,7 @@ class HorusecParser(BaseParser):
                     severity=self._map_severity(vuln.get("severity", "medium")),
                     tool=self.name,
                     asset=vuln.get("file", "unknown"),
-                    cwe=vuln.get("cwe"),
+                    cwe_id=vuln.get("cwe"),
                     raw_data=vuln
                 ))
         except:
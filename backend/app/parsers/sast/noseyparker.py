@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class NoseyParkerParser(BaseParser):
@@ -10,14 +10,12 @@ class NoseyParkerParser(BaseParser):
     file_types = ["json", "jsonl"]
     description = "Praetorian Nosey Parker secrets scanner"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content.split("\n")[0] if "\n" in content else content)
-            return "rule_name" in data or "matches" in data and "provenance" in str(data)
-        except:
-            return False
+    signatures = (
+        Signature(keys=("rule_name",)),
+        Signature(keys=("matches",), contains=("provenance",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
             lines = content.strip().split("\n")
@@ -25,7 +23,7 @@ class NoseyParkerParser(BaseParser):
                 if not line.strip():
                     continue
                 try:
-                    data = json.loads(line)
+                    data = jsonlib.loads(line)
                     matches = data.get("matches", [data])
                     for match in matches:
                         findings.append(ParsedFinding(
@@ -1,8 +1,8 @@
-import json
 import math
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, Probe
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -13,21 +13,16 @@ class PhpSecurityAuditV2Parser(BaseParser):
     file_types = ["json"]
     description = "PHP Security Audit v2 static analysis tool"
 
+    signatures = (
+        Signature(format="json", keys=("files",), contains=("messages",)),
+    )
+
     @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return (
-                "files" in data
-                and isinstance(data["files"], dict)
-                and any(
-                    "messages" in v
-                    for v in data["files"].values()
-                    if isinstance(v, dict)
-                )
-            )
-        except Exception:
-            return False
+    def matches(cls, probe: Probe) -> bool:
+        files = probe.data.get("files")
+        return isinstance(files, dict) and any(
+            "messages" in v for v in files.values() if isinstance(v, dict)
+        )
 
     @staticmethod
     def _get_severity(severity_int: int) -> str:
@@ -42,7 +37,7 @@ class PhpSecurityAuditV2Parser(BaseParser):
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         for filepath, report in data.get("files", {}).items():
             errors = report.get("errors") or 0
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, Probe
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,23 +12,23 @@ class PhpSymfonySecurityCheckParser(BaseParser):
     file_types = ["json"]
     description = "PHP Symfony Security Checker for known vulnerable dependencies"
 
+    signatures = (
+        Signature(format="json", contains=("advisories",)),
+    )
+
     @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, dict):
-                return False
-            # Each key is a package name; each value has 'version' and 'advisories'
-            for _pkg_name, pkg_data in data.items():
-                if isinstance(pkg_data, dict) and "advisories" in pkg_data and "version" in pkg_data:
-                    return True
-            return False
-        except Exception:
+    def matches(cls, probe: Probe) -> bool:
+        # Each key is a package name; each value has 'version' and 'advisories'
+        if not isinstance(probe.data, dict):
             return False
+        return any(
+            isinstance(pkg_data, dict) and "advisories" in pkg_data and "version" in pkg_data
+            for pkg_data in probe.data.values()
+        )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         for dependency_name, dependency_data in data.items():
             if not isinstance(dependency_data, dict):
@@ -2,7 +2,7 @@ import csv
 import io
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
 
 
 @ParserRegistry.register
@@ -21,18 +21,9 @@ class PmdParser(BaseParser):
         "5": "critical",
     }
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            if filename and not filename.lower().endswith(".csv"):
-                return False
-            lines = content.strip().splitlines()
-            if not lines:
-                return False
-            header = lines[0].lower()
-            return "rule" in header and "priority" in header and "file" in header
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="csv", extensions=("csv",), header=("rule", "priority", "file")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,20 +12,13 @@ class ProgpilotParser(BaseParser):
     file_types = ["json"]
     description = "ProgPilot PHP static analysis security tool"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, list) or not data:
-                return False
-            first = data[0]
-            return "vuln_name" in first and "vuln_type" in first
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", item_keys=("vuln_name", "vuln_type")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         for result in data:
             vuln_name = result.get("vuln_name") or "Unknown"
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,17 +12,13 @@ class PwnSastParser(BaseParser):
     file_types = ["json"]
     description = "PWN SAST source code scanner"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return "report_name" in data and "data" in data and isinstance(data.get("data"), list)
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("report_name", "data")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         data_arr = data.get("data", [])
 
         for data_hash in data_arr:
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -21,17 +21,13 @@ class RubocopParser(BaseParser):
         "fatal": "critical",
     }
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return "files" in data and "summary" in data and isinstance(data.get("files"), list)
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("files", "summary")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         for vuln_file in data.get("files", []):
             path = vuln_file.get("path", "unknown")
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,16 +12,13 @@ class SemgrepParser(BaseParser):
     file_types = ["json"]
     description = "Lightweight static analysis for many languages"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return "results" in data and isinstance(data.get("results"), list)
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("results",), child="results", child_keys=("check_id",)),
+        Signature(format="json", keys=("results", "errors", "paths")),
+    )
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         for result in data.get("results", []):
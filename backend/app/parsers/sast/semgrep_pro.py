@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
 from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,15 +12,10 @@ class SemgrepProParser(BaseParser):
     file_types = ["json"]
     description = "Semgrep Pro — cross-file and cross-function analysis variant"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        # Semgrep Pro uses the same JSON format as Semgrep; differentiated by filename convention only
-        # We intentionally return False so auto-detect does not pick this over the base semgrep parser;
-        # users must explicitly select this parser.
-        return False
+    # No signatures: Semgrep Pro output is identical to semgrep's, so it must be selected by name.
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
 
         for result in data.get("results", []):
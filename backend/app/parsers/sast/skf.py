@@ -2,7 +2,7 @@ import csv
 import io
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
 
 
 @ParserRegistry.register
@@ -13,18 +13,9 @@ class SKFParser(BaseParser):
     file_types = ["csv"]
     description = "Security Knowledge Framework (SKF) sprint summary export"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            if filename and not filename.lower().endswith(".csv"):
-                return False
-            lines = content.strip().splitlines()
-            if not lines:
-                return False
-            header = lines[0].lower()
-            return "title" in header and "description" in header and "mitigation" in header
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="csv", extensions=("csv",), header=("title", "description", "mitigation")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, Probe
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,23 +12,21 @@ class SnykCodeParser(BaseParser):
     file_types = ["json", "sarif"]
     description = "Snyk Code SAST scanner (SARIF output format)"
 
+    signatures = (
+        Signature(format="json", keys=("runs",), contains=("snyk",)),
+    )
+
     @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if "runs" not in data:
-                return False
-            for run in data.get("runs", []):
-                tool_name = run.get("tool", {}).get("driver", {}).get("name", "").lower()
-                if "snyk" in tool_name or "snykcode" in tool_name or "snyk code" in tool_name:
-                    return True
-            return False
-        except Exception:
-            return False
+    def matches(cls, probe: Probe) -> bool:
+        for run in probe.data.get("runs", []):
+            tool_name = run.get("tool", {}).get("driver", {}).get("name", "").lower()
+            if "snyk" in tool_name:
+                return True
+        return False
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         for run in data.get("runs", []):
             tool_info = run.get("tool", {}).get("driver", {})
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, Probe
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,23 +12,18 @@ class SnykIssueApiParser(BaseParser):
     file_types = ["json"]
     description = "Snyk Issue API output (REST API /issues endpoint)"
 
+    signatures = (
+        Signature(format="json", keys=("data",), child="data", child_keys=("type", "attributes")),
+    )
+
     @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if "data" not in data or not isinstance(data["data"], list):
-                return False
-            items = data["data"]
-            if not items:
-                return False
-            first = items[0]
-            return (
-                first.get("type") == "issue"
-                and "attributes" in first
-                and first["attributes"].get("type") in {"code", "package_vulnerability"}
-            )
-        except Exception:
-            return False
+    def matches(cls, probe: Probe) -> bool:
+        first = probe.child("data")
+        return (
+            first.get("type") == "issue"
+            and isinstance(first["attributes"], dict)
+            and first["attributes"].get("type") in {"code", "package_vulnerability"}
+        )
 
     def _extract_cwe(self, attributes: dict) -> Optional[int]:
         for cls_info in attributes.get("classes", []):
@@ -62,7 +57,7 @@ class SnykIssueApiParser(BaseParser):
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         severity_map = {
             "critical": "critical",
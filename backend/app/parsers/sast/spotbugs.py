@@ -1,11 +1,11 @@
-import xml.etree.ElementTree as ET
-from typing import List, Optional
+from typing import BinaryIO, Iterator, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import StreamingParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ..xmlstream import iter_elements
 
 
 @ParserRegistry.register
-class SpotBugsParser(BaseParser):
+class SpotBugsParser(StreamingParser):
     name = "spotbugs"
     display_name = "SpotBugs"
     category = ScannerCategory.SAST
@@ -18,24 +18,15 @@ class SpotBugsParser(BaseParser):
         "3": "low",
     }
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            if filename and not filename.lower().endswith(".xml"):
-                return False
-            root = ET.fromstring(content)
-            return root.tag in ("BugCollection", "bugCollection")
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="xml", extensions=("xml",), root=("BugCollection",)),
+    )
 
-    def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        findings = []
-        try:
-            root = ET.fromstring(content)
-        except ET.ParseError:
-            return findings
+    def iter_parse(self, stream: BinaryIO, filename: Optional[str] = None) -> Iterator[ParsedFinding]:
+        for bug, ancestors in iter_elements(stream, ("BugInstance",)):
+            if len(ancestors) != 1:
+                continue
 
-        for bug in root.findall("BugInstance"):
             priority = bug.get("priority", "3")
             severity_str = self.SEVERITY_MAP.get(priority, "low")
 
@@ -70,7 +61,7 @@ class SpotBugsParser(BaseParser):
                 if start and start.isdigit():
                     line_number = int(start)
 
-            findings.append(ParsedFinding(
+            yield ParsedFinding(
                 title=title,
                 severity=Severity.normalize(severity_str),
                 tool="spotbugs",
@@ -83,5 +74,4 @@ class SpotBugsParser(BaseParser):
                 cvss_score=None,
                 recommendation="",
                 raw_data={"type": bug.get("type"), "priority": priority, "cweid": cwe_str},
-            ))
-        return findings
+            )
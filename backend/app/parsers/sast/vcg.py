@@ -1,13 +1,13 @@
 import csv
 import io
-import xml.etree.ElementTree as ET
-from typing import List, Optional
+from typing import BinaryIO, Iterator, List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import StreamingParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, read_text
+from ..xmlstream import iter_elements
 
 
 @ParserRegistry.register
-class VCGParser(BaseParser):
+class VCGParser(StreamingParser):
     name = "vcg"
     display_name = "VisualCodeGrepper"
     category = ScannerCategory.SAST
@@ -24,37 +24,24 @@ class VCGParser(BaseParser):
         7: "info",
     }
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            if filename:
-                fname = filename.lower()
-                if fname.endswith(".xml"):
-                    root = ET.fromstring(content)
-                    return "vcg" in root.tag.lower() or root.find("CodeIssue") is not None
-                if fname.endswith(".csv"):
-                    lines = content.strip().splitlines()
-                    return len(lines) > 0
-            return False
-        except Exception:
-            return False
-
-    def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
+    signatures = (
+        Signature(format="xml", extensions=("xml",), root=("CodeIssueCollection",)),
+        Signature(format="xml", extensions=("xml",), contains=("<codeissue",)),
+    )
+
+    def iter_parse(self, stream: BinaryIO, filename: Optional[str] = None) -> Iterator[ParsedFinding]:
         if filename and filename.lower().endswith(".xml"):
-            return self._parse_xml(content)
-        return self._parse_csv(content)
+            return self._iter_xml(stream)
+        return iter(self._parse_csv(read_text(stream)))
 
     def _priority_to_severity(self, priority: int) -> str:
         return self.PRIORITY_MAP.get(priority, "info")
 
-    def _parse_xml(self, content: str) -> List[ParsedFinding]:
-        findings = []
-        try:
-            root = ET.fromstring(content)
-        except ET.ParseError:
-            return findings
+    def _iter_xml(self, stream: BinaryIO) -> Iterator[ParsedFinding]:
+        for issue, ancestors in iter_elements(stream, ("CodeIssue",)):
+            if len(ancestors) != 1:
+                continue
 
-        for issue in root.findall("CodeIssue"):
             def _text(tag):
                 elem = issue.find(tag)
                 return elem.text if elem is not None and elem.text else None
@@ -92,7 +79,7 @@ class VCGParser(BaseParser):
                 except ValueError:
                     pass
 
-            findings.append(ParsedFinding(
+            yield ParsedFinding(
                 title=title,
                 severity=Severity.normalize(severity_str),
                 tool="vcg",
@@ -105,8 +92,7 @@ class VCGParser(BaseParser):
                 cvss_score=None,
                 recommendation="",
                 raw_data={"title": title, "priority": priority},
-            ))
-        return findings
+            )
 
     def _parse_csv(self, content: str) -> List[ParsedFinding]:
         findings = []
@@ -1,25 +1,22 @@
 import re
 import xml.etree.ElementTree as ET
-from typing import List, Optional
+from typing import BinaryIO, Iterator, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import StreamingParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ..xmlstream import iter_elements
 
 
 @ParserRegistry.register
-class XanitizerParser(BaseParser):
+class XanitizerParser(StreamingParser):
     name = "xanitizer"
     display_name = "Xanitizer"
     category = ScannerCategory.SAST
     file_types = ["xml"]
     description = "Xanitizer SAST tool for Java web applications"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            root = ET.fromstring(content)
-            return "XanitizerFindingsList" in root.tag
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="xml", root=("XanitizerFindingsList",)),
+    )
 
     def _resolve_severity(self, finding: ET.Element) -> str:
         rating_elem = finding.find("rating")
@@ -74,14 +71,11 @@ class XanitizerParser(BaseParser):
             return file_elem.text
         return None
 
-    def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        findings = []
-        try:
-            root = ET.fromstring(content)
-        except ET.ParseError:
-            return findings
+    def iter_parse(self, stream: BinaryIO, filename: Optional[str] = None) -> Iterator[ParsedFinding]:
+        for finding, ancestors in iter_elements(stream, ("finding",)):
+            if len(ancestors) != 1:
+                continue
 
-        for finding in root.findall("finding"):
             problem_type_elem = finding.find("problemType")
             title = self._get_text(problem_type_elem) or "Unknown"
 
@@ -115,7 +109,7 @@ class XanitizerParser(BaseParser):
             elif node is not None:
                 line_no = node.get("lineNo")
                 location = node.get("classFQN") or node.get("relativePath", "")
-                if line_no and int(line_no) > 0:
+                if line_no and line_no.isdigit() and int(line_no) > 0:
                     description_parts.append(f"\n**Finding at:** {location} - **Line** {line_no}")
                 else:
                     description_parts.append(f"\n**Finding at:** {location}")
@@ -147,7 +141,7 @@ class XanitizerParser(BaseParser):
 
             file_path = self._generate_file_path(finding)
 
-            findings.append(ParsedFinding(
+            yield ParsedFinding(
                 title=full_title,
                 severity=Severity.normalize(self._resolve_severity(finding)),
                 tool="xanitizer",
@@ -160,5 +154,4 @@ class XanitizerParser(BaseParser):
                 cvss_score=None,
                 recommendation="",
                 raw_data={"problemType": title},
-            ))
-        return findings
+            )
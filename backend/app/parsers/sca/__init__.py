@@ -1,37 +1,7 @@
-from .auditjs import AuditJSParser
-from .blackduck import BlackDuckParser
-from .blackduck_binary import BlackDuckBinaryParser
-from .blackduck_component import BlackDuckComponentParser
-from .bundler_audit import BundlerAuditParser
-from .cargo_audit import CargoAuditParser
-from .cyclonedx import CycloneDXParser
-from .dependency_check import DependencyCheckParser
-from .dependency_track import DependencyTrackParser
-from .github_vulnerability import GithubVulnerabilityParser
-from .govulncheck import GovulncheckParser
-from .grype import GrypeParser
-from .jfrog_binary import JFrogBinaryParser
-from .jfrog_unified import JFrogUnifiedParser
-from .jfrog_xray import JFrogXrayParser
-from .kiuwan_sca import KiuwanSCAParser
-from .mend import MendParser
-from .meterian import MeterianParser
-from .nancy import NancyParser
-from .npm_audit import NpmAuditParser
-from .nsp import NSPParser
-from .osv import OSVParser
-from .pip_audit import PipAuditParser
-from .retirejs import RetireJSParser
-from .safety import SafetyParser
-from .snyk import SnykParser
-from .trivy import TrivyParser
-from .yarn_audit import YarnAuditParser
-from .sonatype import SonatypeParser
-from .ossindex_devaudit import OssIndexDevauditParser
-from .npm_audit_7_plus import NpmAudit7PlusParser
-from .xeol import XeolParser
-from .scantist import ScantistParser
-from .reversinglabs_spectraassure import ReversinglabsSpectraassureParser
+# Parser classes are imported on first access; see ..manifest
+from ..manifest import package_getattr
+
+__getattr__ = package_getattr(__name__)
 
 __all__ = [
     "AuditJSParser",
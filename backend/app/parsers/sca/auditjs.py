@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class AuditJSParser(BaseParser):
@@ -10,19 +10,14 @@ class AuditJSParser(BaseParser):
     file_types = ["json"]
     description = "AuditJS for auditing JavaScript packages via npm registry"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, list) and len(data) > 0:
-                return "coordinates" in data[0] or "vulnerabilities" in data[0]
-            return False
-        except:
-            return False
+    signatures = (
+        Signature(format="json", any_item_keys=("coordinates", "vulnerabilities")),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             for item in data:
                 coords = item.get("coordinates", "unknown")
                 for vuln in item.get("vulnerabilities", []):
@@ -32,7 +27,7 @@ class AuditJSParser(BaseParser):
                         severity=self._map_severity(vuln.get("severity", vuln.get("cvssScore", "medium"))),
                         tool=self.name,
                         asset=coords,
-                        cve=vuln.get("cve"),
+                        cve_id=vuln.get("cve"),
                         cvss_score=vuln.get("cvssScore"),
                         raw_data={"coordinates": coords, **vuln}
                     ))
@@ -1,9 +1,9 @@
-import json
 import csv
 import io
 import zipfile
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class BlackDuckParser(BaseParser):
@@ -13,18 +13,19 @@ class BlackDuckParser(BaseParser):
     file_types = ["json", "csv", "zip"]
     description = "Synopsys Black Duck software composition analysis"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "items" in data and "totalCount" in data or "blackduck" in str(data).lower() or "componentVersion" in str(data)
-        except:
-            return "Component Name" in content or "Vulnerability ID" in content
+    signatures = (
+        Signature(format="json", keys=("items", "totalCount")),
+        Signature(format="json", contains=("blackduck",)),
+        Signature(format="json", contains=("componentversion",), priority=-1),
+        Signature(format="csv", columns=("component name",)),
+        Signature(format="csv", columns=("vulnerability id",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
             if content.strip().startswith("{") or content.strip().startswith("["):
-                data = json.loads(content)
+                data = jsonlib.loads(content)
                 items = data.get("items", data if isinstance(data, list) else [])
                 for item in items:
                     vuln = item.get("vulnerabilityWithRemediation", item)
@@ -35,7 +36,7 @@ class BlackDuckParser(BaseParser):
                         severity=self._map_severity(vuln.get("severity", vuln.get("overallScore", "medium"))),
                         tool=self.name,
                         asset=f"{comp.get('componentName', item.get('componentName', 'unknown'))}@{comp.get('componentVersionName', item.get('versionName', ''))}",
-                        cve=vuln.get("vulnerabilityName") if str(vuln.get("vulnerabilityName", "")).startswith("CVE") else None,
+                        cve_id=vuln.get("vulnerabilityName") if str(vuln.get("vulnerabilityName", "")).startswith("CVE") else None,
                         cvss_score=vuln.get("overallScore"),
                         raw_data=item
                     ))
@@ -48,7 +49,7 @@ class BlackDuckParser(BaseParser):
                         severity=self._map_severity(row.get("Severity", row.get("Security Risk", "medium"))),
                         tool=self.name,
                         asset=f"{row.get('Component Name', 'unknown')}@{row.get('Component Version', '')}",
-                        cve=row.get("Vulnerability ID") if row.get("Vulnerability ID", "").startswith("CVE") else None,
+                        cve_id=row.get("Vulnerability ID") if row.get("Vulnerability ID", "").startswith("CVE") else None,
                         cvss_score=self._parse_cvss(row.get("CVSS Score", row.get("Base Score"))),
                         raw_data=dict(row)
                     ))
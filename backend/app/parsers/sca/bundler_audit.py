@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class BundlerAuditParser(BaseParser):
@@ -10,20 +10,16 @@ class BundlerAuditParser(BaseParser):
     file_types = ["txt", "json"]
     description = "Ruby Bundler dependency vulnerability scanner"
 
-    def can_parse(self, content: str) -> bool:
-        if "Insecure Source URI" in content or "Name:" in content and "Version:" in content and "CVE" in content:
-            return True
-        try:
-            data = json.loads(content)
-            return "results" in data or "vulnerabilities" in data
-        except:
-            return False
+    signatures = (
+        Signature(format="text", contains=("insecure source uri",)),
+        Signature(format="text", contains=("name:", "version:", "cve")),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
             if content.strip().startswith("{"):
-                data = json.loads(content)
+                data = jsonlib.loads(content)
                 for vuln in data.get("results", data.get("vulnerabilities", [])):
                     findings.append(ParsedFinding(
                         title=vuln.get("title", vuln.get("advisory", {}).get("title", "Bundler-Audit Finding")),
@@ -31,7 +27,7 @@ class BundlerAuditParser(BaseParser):
                         severity=self._map_severity(vuln.get("criticality", "medium")),
                         tool=self.name,
                         asset=f"{vuln.get('gem', {}).get('name', 'unknown')}@{vuln.get('gem', {}).get('version', '')}",
-                        cve=vuln.get("cve", vuln.get("advisory", {}).get("cve")),
+                        cve_id=vuln.get("cve", vuln.get("advisory", {}).get("cve")),
                         raw_data=vuln
                     ))
             else:
@@ -57,7 +53,7 @@ class BundlerAuditParser(BaseParser):
                             severity=self._map_severity(current.get("severity", "medium")),
                             tool=self.name,
                             asset=f"{current.get('name', 'unknown')}@{current.get('version', '')}",
-                            cve=current.get("cve"),
+                            cve_id=current.get("cve"),
                             raw_data=current
                         ))
                         current = {}
@@ -68,7 +64,7 @@ class BundlerAuditParser(BaseParser):
                         severity=self._map_severity(current.get("severity", "medium")),
                         tool=self.name,
                         asset=f"{current.get('name', 'unknown')}@{current.get('version', '')}",
-                        cve=current.get("cve"),
+                        cve_id=current.get("cve"),
                         raw_data=current
                     ))
         except:
@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class CargoAuditParser(BaseParser):
@@ -10,17 +10,14 @@ class CargoAuditParser(BaseParser):
     file_types = ["json"]
     description = "Rust cargo-audit for auditing Cargo.lock dependencies"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "vulnerabilities" in data and ("database" in data or "lockfile" in data) or "warnings" in data
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("vulnerabilities",), any_keys=("database", "lockfile")),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             vulns = data.get("vulnerabilities", {})
             vuln_list = vulns.get("list", []) if isinstance(vulns, dict) else vulns
             for vuln in vuln_list:
@@ -32,7 +29,7 @@ class CargoAuditParser(BaseParser):
                     severity=self._map_severity(advisory.get("severity", vuln.get("severity", "medium"))),
                     tool=self.name,
                     asset=f"{package.get('name', 'unknown')}@{package.get('version', '')}",
-                    cve=advisory.get("id") if advisory.get("id", "").startswith("CVE") else None,
+                    cve_id=advisory.get("id") if advisory.get("id", "").startswith("CVE") else None,
                     raw_data=vuln
                 ))
             for warning in data.get("warnings", {}).get("unmaintained", []):
@@ -1,105 +1,89 @@
-import json
-import xml.etree.ElementTree as ET
-from typing import List, Optional
+from typing import BinaryIO, Iterator, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import StreamingParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ..jsonstream import JsonReader
+from ..xmlstream import iter_elements, peek_text
 
 
 @ParserRegistry.register
-class DependencyCheckParser(BaseParser):
+class DependencyCheckParser(StreamingParser):
     name = "dependency-check"
     display_name = "OWASP Dependency-Check"
     category = ScannerCategory.SCA
     file_types = ["json", "xml"]
     description = "OWASP software composition analysis tool"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            if content.strip().startswith("{"):
-                data = json.loads(content)
-                return "dependencies" in data and "scanInfo" in data
-            elif content.strip().startswith("<"):
-                return "dependency-check" in content.lower()[:500]
-            return False
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("dependencies", "scanInfo")),
+        Signature(format="xml", root=("analysis",), namespace="dependency-check"),
+        Signature(format="xml", contains=("dependency-check",)),
+    )
     
-    def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        if content.strip().startswith("{"):
-            return self._parse_json(content)
-        else:
-            return self._parse_xml(content)
+    def iter_parse(self, stream: BinaryIO, filename: Optional[str] = None) -> Iterator[ParsedFinding]:
+        if peek_text(stream).startswith("<"):
+            yield from self._iter_xml(stream)
+            return
+        
+        reader = JsonReader(stream)
+        for key in reader.members():
+            if key == "dependencies":
+                for dep in reader.items():
+                    yield from self._dependency_findings(dep)
     
-    def _parse_json(self, content: str) -> List[ParsedFinding]:
-        data = json.loads(content)
-        findings = []
+    def _dependency_findings(self, dep: dict) -> Iterator[ParsedFinding]:
+        file_path = dep.get("filePath", dep.get("fileName", "unknown"))
         
-        for dep in data.get("dependencies", []):
-            file_path = dep.get("filePath", dep.get("fileName", "unknown"))
+        for vuln in dep.get("vulnerabilities", []):
+            cve_id = vuln.get("name")
             
-            for vuln in dep.get("vulnerabilities", []):
-                cve_id = vuln.get("name")
-                
-                cvss_score = None
-                if vuln.get("cvssv3"):
-                    cvss_score = vuln["cvssv3"].get("baseScore")
-                elif vuln.get("cvssv2"):
-                    cvss_score = vuln["cvssv2"].get("score")
-                
-                severity_str = vuln.get("severity", "MEDIUM")
-                
-                cwe_ids = vuln.get("cwes", [])
-                cwe_id = None
-                if cwe_ids:
-                    try:
-                        cwe_id = int(str(cwe_ids[0]).replace("CWE-", ""))
-                    except:
-                        pass
-                
-                finding = ParsedFinding(
-                    title=f"{cve_id}: {dep.get('fileName', 'Unknown Package')}",
-                    severity=Severity.normalize(severity_str),
-                    tool="dependency-check",
-                    description=vuln.get("description", ""),
-                    asset=file_path,
-                    file_path=file_path,
-                    cve_id=cve_id,
-                    cwe_id=cwe_id,
-                    cvss_score=cvss_score,
-                    references=vuln.get("references", []),
-                    tags=["dependency", dep.get("fileName", "")],
-                    raw_data=vuln,
-                )
-                findings.append(finding)
-        
-        return findings
+            cvss_score = None
+            if vuln.get("cvssv3"):
+                cvss_score = vuln["cvssv3"].get("baseScore")
+            elif vuln.get("cvssv2"):
+                cvss_score = vuln["cvssv2"].get("score")
+            
+            severity_str = vuln.get("severity", "MEDIUM")
+            
+            cwe_ids = vuln.get("cwes", [])
+            cwe_id = None
+            if cwe_ids:
+                try:
+                    cwe_id = int(str(cwe_ids[0]).replace("CWE-", ""))
+                except:
+                    pass
+            
+            yield ParsedFinding(
+                title=f"{cve_id}: {dep.get('fileName', 'Unknown Package')}",
+                severity=Severity.normalize(severity_str),
+                tool="dependency-check",
+                description=vuln.get("description", ""),
+                asset=file_path,
+                file_path=file_path,
+                cve_id=cve_id,
+                cwe_id=cwe_id,
+                cvss_score=cvss_score,
+                references=vuln.get("references", []),
+                tags=["dependency", dep.get("fileName", "")],
+                raw_data=vuln,
+            )
     
-    def _parse_xml(self, content: str) -> List[ParsedFinding]:
-        root = ET.fromstring(content)
-        ns = {"dc": "https://jeremylong.github.io/DependencyCheck/dependency-check.2.5.xsd"}
-        findings = []
-        
-        for dep in root.findall(".//dc:dependency", ns) or root.findall(".//dependency"):
-            file_path = dep.findtext("dc:filePath", dep.findtext("filePath", "unknown"), ns)
-            file_name = dep.findtext("dc:fileName", dep.findtext("fileName", "unknown"), ns)
+    def _iter_xml(self, stream: BinaryIO) -> Iterator[ParsedFinding]:
+        for dep, _ in iter_elements(stream, ("dependency",)):
+            file_path = dep.findtext("filePath", "unknown")
+            file_name = dep.findtext("fileName", "unknown")
             
-            vulns = dep.findall(".//dc:vulnerability", ns) or dep.findall(".//vulnerability")
-            for vuln in vulns:
-                cve_id = vuln.findtext("dc:name", vuln.findtext("name", ""), ns)
-                severity_str = vuln.findtext("dc:severity", vuln.findtext("severity", "MEDIUM"), ns)
+            for vuln in dep.iter("vulnerability"):
+                cve_id = vuln.findtext("name", "")
+                severity_str = vuln.findtext("severity", "MEDIUM")
                 
-                finding = ParsedFinding(
+                yield ParsedFinding(
                     title=f"{cve_id}: {file_name}",
                     severity=Severity.normalize(severity_str),
                     tool="dependency-check",
-                    description=vuln.findtext("dc:description", vuln.findtext("description", ""), ns),
+                    description=vuln.findtext("description", ""),
                     asset=file_path,
                     file_path=file_path,
                     cve_id=cve_id,
                     tags=["dependency", file_name],
                     raw_data={},
                 )
-                findings.append(finding)
-        
-        return findings
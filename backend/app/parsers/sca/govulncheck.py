@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class GovulncheckParser(BaseParser):
@@ -10,17 +10,15 @@ class GovulncheckParser(BaseParser):
     file_types = ["json"]
     description = "Go vulnerability checker for Go modules"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "vulns" in data or "Vulns" in data or "entries" in data and "go.mod" in str(data)
-        except:
-            return False
+    signatures = (
+        Signature(format="json", any_keys=("vulns", "Vulns")),
+        Signature(format="json", keys=("entries",), contains=("go.mod",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             vulns = data.get("vulns", data.get("Vulns", data.get("entries", [])))
             for vuln in vulns:
                 osv = vuln.get("osv", vuln)
@@ -33,7 +31,7 @@ class GovulncheckParser(BaseParser):
                         severity=self._map_severity(osv.get("database_specific", {}).get("severity", "medium")),
                         tool=self.name,
                         asset=pkg_path,
-                        cve=self._extract_cve(osv.get("aliases", [])),
+                        cve_id=self._extract_cve(osv.get("aliases", [])),
                         raw_data={**osv, "module": mod}
                     ))
                 if not modules:
@@ -43,7 +41,7 @@ class GovulncheckParser(BaseParser):
                         severity=self._map_severity(osv.get("database_specific", {}).get("severity", "medium")),
                         tool=self.name,
                         asset=osv.get("id", "unknown"),
-                        cve=self._extract_cve(osv.get("aliases", [])),
+                        cve_id=self._extract_cve(osv.get("aliases", [])),
                         raw_data=osv
                     ))
         except:
@@ -1,37 +1,33 @@
-import json
-from typing import List, Optional
+from typing import BinaryIO, Iterator, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import StreamingParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ..jsonstream import iter_sections
 
 
 @ParserRegistry.register
-class GrypeParser(BaseParser):
+class GrypeParser(StreamingParser):
     name = "grype"
     display_name = "Grype"
     category = ScannerCategory.SCA
     file_types = ["json"]
     description = "Anchore container and filesystem vulnerability scanner"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return "matches" in data and "source" in data
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("matches", "source")),
+    )
     
-    def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
-        findings = []
+    def iter_parse(self, stream: BinaryIO, filename: Optional[str] = None) -> Iterator[ParsedFinding]:
+        asset_name = None
         
-        source = data.get("source", {})
-        source_target = source.get("target", {})
-        if isinstance(source_target, dict):
-            asset_name = source_target.get("userInput", source_target.get("imageID", "unknown"))
-        else:
-            asset_name = str(source_target)
-        
-        for match in data.get("matches", []):
+        # grype writes "source" after "matches"; iter_sections reads it first
+        for _, match, data in iter_sections(stream, ("matches",), needs=("source",)):
+            if asset_name is None:
+                source_target = data.get("source", {}).get("target", {})
+                if isinstance(source_target, dict):
+                    asset_name = source_target.get("userInput", source_target.get("imageID", "unknown"))
+                else:
+                    asset_name = str(source_target)
+            
             vuln = match.get("vulnerability", {})
             artifact = match.get("artifact", {})
             
@@ -54,7 +50,7 @@ class GrypeParser(BaseParser):
             if fixed_versions:
                 recommendation = f"Upgrade {pkg_name} to: {', '.join(fixed_versions)}"
             
-            finding = ParsedFinding(
+            yield ParsedFinding(
                 title=f"{cve_id}: {pkg_name} {version}",
                 severity=Severity.normalize(vuln.get("severity", "Unknown")),
                 tool="grype",
@@ -67,6 +63,3 @@ class GrypeParser(BaseParser):
                 tags=[artifact.get("type", ""), pkg_name],
                 raw_data=match,
             )
-            findings.append(finding)
-        
-        return findings
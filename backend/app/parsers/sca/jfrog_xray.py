@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class JFrogXrayParser(BaseParser):
@@ -10,17 +10,15 @@ class JFrogXrayParser(BaseParser):
     file_types = ["json"]
     description = "JFrog Xray universal software composition analysis"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            return "security_violations" in data or "vulnerabilities" in data and "xray" in str(data).lower() or "violations" in data
-        except:
-            return False
+    signatures = (
+        Signature(format="json", any_keys=("security_violations", "violations")),
+        Signature(format="json", keys=("vulnerabilities",), contains=("xray",)),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             violations = data.get("security_violations", data.get("violations", data.get("vulnerabilities", [])))
             for violation in violations:
                 components = violation.get("components", [{}])
@@ -31,7 +29,7 @@ class JFrogXrayParser(BaseParser):
                         severity=self._map_severity(violation.get("severity", "medium")),
                         tool=self.name,
                         asset=comp.get("component_id", comp.get("id", violation.get("impacted_artifact", "unknown"))),
-                        cve=violation.get("cve"),
+                        cve_id=violation.get("cve"),
                         cvss_score=violation.get("cvss_v3_score", violation.get("cvss_v2_score")),
                         raw_data={**violation, "component": comp}
                     ))
@@ -42,7 +40,7 @@ class JFrogXrayParser(BaseParser):
                         severity=self._map_severity(violation.get("severity", "medium")),
                         tool=self.name,
                         asset=violation.get("impacted_artifact", "unknown"),
-                        cve=violation.get("cve"),
+                        cve_id=violation.get("cve"),
                         cvss_score=violation.get("cvss_v3_score"),
                         raw_data=violation
                     ))
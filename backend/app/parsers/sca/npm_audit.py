@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,16 +12,15 @@ class NpmAuditParser(BaseParser):
     file_types = ["json"]
     description = "Node.js npm package vulnerability scanner"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return ("advisories" in data or "vulnerabilities" in data) and ("metadata" in data or "auditReportVersion" in data)
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("advisories", "metadata")),
+        Signature(format="json", keys=("vulnerabilities", "metadata")),
+        Signature(format="json", keys=("advisories", "auditReportVersion")),
+        Signature(format="json", keys=("vulnerabilities", "auditReportVersion")),
+    )
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         if "vulnerabilities" in data:
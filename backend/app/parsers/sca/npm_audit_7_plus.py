@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,24 +12,13 @@ class NpmAudit7PlusParser(BaseParser):
     file_types = ["json"]
     description = "Node.js npm audit v7+ vulnerability scanner"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, dict):
-                return False
-            # npm audit --json (v7+): top-level auditReportVersion >= 2
-            if data.get("auditReportVersion") and "vulnerabilities" in data:
-                return True
-            # npm audit fix --dry-run --json: nested audit.auditReportVersion
-            if "audit" in data and data["audit"].get("auditReportVersion"):
-                return True
-            return False
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("auditReportVersion", "vulnerabilities"), priority=1),
+        Signature(format="json", keys=("audit",), child="audit", child_keys=("auditReportVersion",)),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
 
         # Unwrap nested audit format
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,22 +12,12 @@ class OssIndexDevauditParser(BaseParser):
     file_types = ["json"]
     description = "Sonatype OSSIndex DevAudit SCA scan"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, dict):
-                return False
-            packages = data.get("Packages")
-            if not isinstance(packages, list) or len(packages) == 0:
-                return False
-            first = packages[0]
-            return "Package" in first and "Vulnerabilities" in first
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("Packages",), child="Packages", child_keys=("Package", "Vulnerabilities")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         seen = set()
 
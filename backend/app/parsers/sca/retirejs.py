@@ -1,6 +1,6 @@
-import json
-from typing import Any
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from typing import Any, Optional
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 @ParserRegistry.register
 class RetireJSParser(BaseParser):
@@ -10,20 +10,16 @@ class RetireJSParser(BaseParser):
     file_types = ["json"]
     description = "Retire.js for detecting vulnerable JavaScript libraries"
 
-    def can_parse(self, content: str) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, list) and len(data) > 0:
-                first = data[0]
-                return "file" in first or "results" in first or "component" in first and "vulnerabilities" in first
-            return "data" in data and isinstance(data["data"], list)
-        except:
-            return False
+    signatures = (
+        Signature(format="json", any_item_keys=("file", "results")),
+        Signature(format="json", item_keys=("component", "vulnerabilities")),
+        Signature(format="json", keys=("data",), child="data", any_child_keys=("file", "results")),
+    )
 
-    def parse(self, content: str) -> list[ParsedFinding]:
+    def parse(self, content: str, filename: Optional[str] = None) -> list[ParsedFinding]:
         findings = []
         try:
-            data = json.loads(content)
+            data = jsonlib.loads(content)
             items = data.get("data", data) if isinstance(data, dict) else data
             for item in items:
                 file_path = item.get("file", "unknown")
@@ -44,7 +40,7 @@ class RetireJSParser(BaseParser):
                             severity=self._map_severity(severity),
                             tool=self.name,
                             asset=f"{component}@{version}" if version else component,
-                            cve=cve,
+                            cve_id=cve,
                             raw_data={"file": file_path, "component": component, "version": version, **vuln}
                         ))
         except:
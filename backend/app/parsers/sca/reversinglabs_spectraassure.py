@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, Probe
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,22 +12,17 @@ class ReversinglabsSpectraassureParser(BaseParser):
     file_types = ["json"]
     description = "ReversingLabs SpectraAssure software supply chain security scanner"
 
+    signatures = (
+        Signature(format="json", keys=("report",), child="report", child_keys=("metadata",)),
+    )
+
     @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, dict):
-                return False
-            report = data.get("report", {})
-            if not isinstance(report, dict):
-                return False
-            metadata = report.get("metadata", {})
-            return "vulnerabilities" in metadata or "components" in metadata
-        except Exception:
-            return False
+    def matches(cls, probe: Probe) -> bool:
+        metadata = probe.child("report").get("metadata")
+        return isinstance(metadata, dict) and ("vulnerabilities" in metadata or "components" in metadata)
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         seen = set()
 
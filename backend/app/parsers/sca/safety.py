@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature, Probe
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,21 +12,22 @@ class SafetyParser(BaseParser):
     file_types = ["json"]
     description = "Python dependency security checker"
     
+    signatures = (
+        Signature(format="json", keys=("report_meta",)),
+        Signature(format="json", keys=("report",), child="report", child_keys=("vulnerabilities",)),
+        Signature(format="json"),
+    )
+
     @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if isinstance(data, list) and len(data) > 0:
-                first = data[0]
-                return len(first) >= 4 and isinstance(first[0], str)
-            if isinstance(data, dict):
-                return "report" in data or "vulnerabilities" in data
-            return False
-        except:
-            return False
+    def matches(cls, probe: Probe) -> bool:
+        data = probe.data
+        if isinstance(data, list):
+            # Safety 1.x: [[package, affected, installed, description, id], ...]
+            return bool(data) and isinstance(data[0], list) and len(data[0]) >= 4 and isinstance(data[0][0], str)
+        return "report_meta" in probe.keys or probe.child("report") is not None
     
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         
         if isinstance(data, list):
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,19 +12,12 @@ class ScantistParser(BaseParser):
     file_types = ["json"]
     description = "Scantist SCA vulnerability scanner"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, list) or len(data) == 0:
-                return False
-            first = data[0]
-            return isinstance(first, dict) and "Public ID" in first and "Library" in first
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", item_keys=("Public ID", "Library")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
         seen = set()
 
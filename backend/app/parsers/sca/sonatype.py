@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,24 +12,12 @@ class SonatypeParser(BaseParser):
     file_types = ["json"]
     description = "Sonatype Nexus IQ application security scan"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, dict):
-                return False
-            if "components" not in data:
-                return False
-            components = data["components"]
-            if not isinstance(components, list) or len(components) == 0:
-                return False
-            first = components[0]
-            return "securityData" in first or "componentIdentifier" in first or "packageUrl" in first
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("components",), child="components", any_child_keys=("securityData", "componentIdentifier", "packageUrl")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
 
         for component in data.get("components", []):
@@ -1,102 +1,155 @@
-import json
-from typing import List, Optional
+from typing import BinaryIO, Iterator, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import StreamingParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ..jsonstream import JsonReader
+
+_SECTIONS = ("Vulnerabilities", "Misconfigurations", "Secrets")
 
 
 @ParserRegistry.register
-class TrivyParser(BaseParser):
+class TrivyParser(StreamingParser):
     name = "trivy"
     display_name = "Trivy"
     category = ScannerCategory.SCA
     file_types = ["json"]
     description = "Aqua Security comprehensive vulnerability scanner"
     
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            return "Results" in data or ("SchemaVersion" in data and "ArtifactName" in data)
-        except:
-            return False
+    signatures = (
+        Signature(format="json", keys=("Results",)),
+        Signature(format="json", keys=("SchemaVersion", "ArtifactName")),
+    )
+    
+    def iter_parse(self, stream: BinaryIO, filename: Optional[str] = None) -> Iterator[ParsedFinding]:
+        reader = JsonReader(stream)
+        # Trivy writes ArtifactName ahead of Results. Results that come first
+        # are streamed on a second pass when the stream is seekable, and
+        # decoded whole otherwise.
+        artifact_name = None
+        deferred = None
+        
+        for key in reader.members():
+            if key == "ArtifactName":
+                artifact_name = reader.value()
+            elif key != "Results":
+                continue
+            elif artifact_name is not None:
+                yield from self._stream_results(reader, artifact_name)
+            elif stream.seekable():
+                deferred = True
+            else:
+                deferred = reader.value()
+        
+        artifact_name = artifact_name or "unknown"
+        if deferred is True:
+            stream.seek(0)
+            reader = JsonReader(stream)
+            for key in reader.members():
+                if key == "Results":
+                    yield from self._stream_results(reader, artifact_name)
+        elif isinstance(deferred, list):
+            for result in deferred:
+                if isinstance(result, dict):
+                    for section in _SECTIONS:
+                        for item in result.get(section) or ():
+                            yield self._finding(section, item, result, artifact_name)
+    
+    def _stream_results(self, reader: JsonReader, artifact_name: str) -> Iterator[ParsedFinding]:
+        for _ in reader.elements():
+            if reader.peek() != "{":
+                continue
+            # A section is streamed once Target (and Type, for vulnerabilities)
+            # and every section listed before it in _SECTIONS have been read;
+            # otherwise it is decoded whole and replayed in order at the end.
+            fields = {}
+            streamed = set()
+            deferred = {}
+            for name in reader.members():
+                if name not in _SECTIONS:
+                    fields[name] = reader.value()
+                    continue
+                ahead = _SECTIONS[:_SECTIONS.index(name)]
+                needs = ("Target", "Type") if name == "Vulnerabilities" else ("Target",)
+                if all(n in fields for n in needs) and all(s in streamed for s in ahead):
+                    for item in reader.items():
+                        yield self._finding(name, item, fields, artifact_name)
+                    streamed.add(name)
+                else:
+                    deferred[name] = reader.value()
+            for name in _SECTIONS:
+                elements = deferred.get(name)
+                for item in elements if isinstance(elements, list) else ():
+                    yield self._finding(name, item, fields, artifact_name)
     
-    def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
-        findings = []
+    def _finding(self, section: str, item: dict, result: dict, artifact_name: str) -> ParsedFinding:
+        target = result.get("Target", artifact_name)
+        if section == "Vulnerabilities":
+            return self._vulnerability(item, target, result.get("Type", ""))
+        if section == "Misconfigurations":
+            return self._misconfiguration(item, target)
+        return self._secret(item, target)
+    
+    def _vulnerability(self, vuln: dict, target: str, result_type: str) -> ParsedFinding:
+        cve_id = vuln.get("VulnerabilityID")
+        
+        cvss_score = None
+        cvss_data = vuln.get("CVSS", {})
+        for source in ["nvd", "redhat", "ghsa"]:
+            if source in cvss_data:
+                cvss_score = cvss_data[source].get("V3Score") or cvss_data[source].get("V2Score")
+                if cvss_score:
+                    break
+        
+        cwe_ids = vuln.get("CweIDs", [])
+        cwe_id = None
+        if cwe_ids:
+            try:
+                cwe_id = int(cwe_ids[0].replace("CWE-", ""))
+            except:
+                pass
         
-        artifact_name = data.get("ArtifactName", "unknown")
+        pkg_name = vuln.get("PkgName", "")
+        installed = vuln.get("InstalledVersion", "")
+        fixed = vuln.get("FixedVersion", "")
         
-        for result in data.get("Results", []):
-            target = result.get("Target", artifact_name)
-            result_type = result.get("Type", "")
-            
-            for vuln in result.get("Vulnerabilities", []):
-                cve_id = vuln.get("VulnerabilityID")
-                
-                cvss_score = None
-                cvss_data = vuln.get("CVSS", {})
-                for source in ["nvd", "redhat", "ghsa"]:
-                    if source in cvss_data:
-                        cvss_score = cvss_data[source].get("V3Score") or cvss_data[source].get("V2Score")
-                        if cvss_score:
-                            break
-                
-                cwe_ids = vuln.get("CweIDs", [])
-                cwe_id = None
-                if cwe_ids:
-                    try:
-                        cwe_id = int(cwe_ids[0].replace("CWE-", ""))
-                    except:
-                        pass
-                
-                pkg_name = vuln.get("PkgName", "")
-                installed = vuln.get("InstalledVersion", "")
-                fixed = vuln.get("FixedVersion", "")
-                
-                title = f"{cve_id or vuln.get('Title', 'Vulnerability')}: {pkg_name}"
-                
-                finding = ParsedFinding(
-                    title=title,
-                    severity=Severity.normalize(vuln.get("Severity", "UNKNOWN")),
-                    tool="trivy",
-                    description=vuln.get("Description", ""),
-                    asset=target,
-                    cve_id=cve_id,
-                    cwe_id=cwe_id,
-                    cvss_score=cvss_score,
-                    recommendation=f"Upgrade {pkg_name} from {installed} to {fixed}" if fixed else "",
-                    references=vuln.get("References", []),
-                    tags=[result_type, pkg_name] if result_type else [pkg_name],
-                    raw_data=vuln,
-                )
-                findings.append(finding)
-            
-            for misconfig in result.get("Misconfigurations", []):
-                finding = ParsedFinding(
-                    title=misconfig.get("Title", misconfig.get("ID", "Misconfiguration")),
-                    severity=Severity.normalize(misconfig.get("Severity", "MEDIUM")),
-                    tool="trivy",
-                    description=misconfig.get("Description", ""),
-                    asset=target,
-                    recommendation=misconfig.get("Resolution", ""),
-                    references=misconfig.get("References", []),
-                    tags=["misconfiguration", misconfig.get("Type", "")],
-                    raw_data=misconfig,
-                )
-                findings.append(finding)
-            
-            for secret in result.get("Secrets", []):
-                finding = ParsedFinding(
-                    title=f"Secret Detected: {secret.get('RuleID', secret.get('Category', 'Unknown'))}",
-                    severity=Severity.HIGH,
-                    tool="trivy",
-                    description=secret.get("Title", ""),
-                    asset=target,
-                    file_path=target,
-                    line_number=secret.get("StartLine"),
-                    tags=["secrets", secret.get("Category", "")],
-                    raw_data=secret,
-                )
-                findings.append(finding)
+        title = f"{cve_id or vuln.get('Title', 'Vulnerability')}: {pkg_name}"
         
-        return findings
+        return ParsedFinding(
+            title=title,
+            severity=Severity.normalize(vuln.get("Severity", "UNKNOWN")),
+            tool="trivy",
+            description=vuln.get("Description", ""),
+            asset=target,
+            cve_id=cve_id,
+            cwe_id=cwe_id,
+            cvss_score=cvss_score,
+            recommendation=f"Upgrade {pkg_name} from {installed} to {fixed}" if fixed else "",
+            references=vuln.get("References", []),
+            tags=[result_type, pkg_name] if result_type else [pkg_name],
+            raw_data=vuln,
+        )
+    
+    def _misconfiguration(self, misconfig: dict, target: str) -> ParsedFinding:
+        return ParsedFinding(
+            title=misconfig.get("Title", misconfig.get("ID", "Misconfiguration")),
+            severity=Severity.normalize(misconfig.get("Severity", "MEDIUM")),
+            tool="trivy",
+            description=misconfig.get("Description", ""),
+            asset=target,
+            recommendation=misconfig.get("Resolution", ""),
+            references=misconfig.get("References", []),
+            tags=["misconfiguration", misconfig.get("Type", "")],
+            raw_data=misconfig,
+        )
+    
+    def _secret(self, secret: dict, target: str) -> ParsedFinding:
+        return ParsedFinding(
+            title=f"Secret Detected: {secret.get('RuleID', secret.get('Category', 'Unknown'))}",
+            severity=Severity.HIGH,
+            tool="trivy",
+            description=secret.get("Title", ""),
+            asset=target,
+            file_path=target,
+            line_number=secret.get("StartLine"),
+            tags=["secrets", secret.get("Category", "")],
+            raw_data=secret,
+        )
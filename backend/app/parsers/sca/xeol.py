@@ -1,8 +1,8 @@
-import json
 from datetime import datetime, timedelta
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -13,24 +13,12 @@ class XeolParser(BaseParser):
     file_types = ["json"]
     description = "Xeol end-of-life package scanner"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, dict):
-                return False
-            if "matches" not in data:
-                return False
-            matches = data["matches"]
-            if not isinstance(matches, list) or len(matches) == 0:
-                return True  # empty matches is valid xeol
-            first = matches[0]
-            return "Cycle" in first or "artifact" in first
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("matches",), child="matches", child_keys=("Cycle",)),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         findings = []
 
         distro = data.get("distro", {})
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,24 +12,11 @@ class YarnAuditParser(BaseParser):
     file_types = ["json"]
     description = "Yarn package manager security audit scanner"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            stripped = content.strip()
-            # Old yarn: NDJSON lines with {"type": "auditAdvisory", ...}
-            if '"type"' in stripped and '"auditAdvisory"' in stripped:
-                return True
-            # Yarn 2+: NDJSON lines with {"value": ..., "children": {..., "ID": ...}}
-            if '"value"' in stripped and '"children"' in stripped and '"ID"' in stripped:
-                return True
-            # audit-ci format: JSON with "advisories" key
-            data = json.loads(stripped)
-            if isinstance(data, dict) and "advisories" in data:
-                # Distinguish from npm_audit by checking for yarn-specific keys or absence of npm metadata
-                return True
-            return False
-        except Exception:
-            return False
+    signatures = (
+        Signature(keys=("type",), contains=('"auditadvisory"',)),
+        Signature(keys=("value", "children")),
+        Signature(format="json", keys=("advisories",)),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         stripped = content.strip()
@@ -44,7 +31,7 @@ class YarnAuditParser(BaseParser):
 
         # audit-ci / JSON format
         try:
-            data = json.loads(stripped)
+            data = jsonlib.loads(stripped)
             if isinstance(data, dict) and "advisories" in data:
                 return self._parse_audit_ci(data)
         except Exception:
@@ -60,7 +47,7 @@ class YarnAuditParser(BaseParser):
             if not line or "{" not in line:
                 continue
             try:
-                element = json.loads(line)
+                element = jsonlib.loads(line)
             except Exception:
                 continue
             if element.get("type") != "auditAdvisory":
@@ -122,7 +109,7 @@ class YarnAuditParser(BaseParser):
             if not line or "{" not in line:
                 continue
             try:
-                element = json.loads(line)
+                element = jsonlib.loads(line)
             except Exception:
                 continue
             value = element.get("value")
@@ -1,12 +1,7 @@
-from .ggshield import GgshieldParser
-from .github_secrets import GithubSecretsParser
-from .gitlab_secrets import GitLabSecretsParser
-from .n0s1 import N0s1Parser
-from .rusty_hog import RustyHogParser
-from .talisman import TalismanParser
-from .trufflehog import TruffleHogParser
-from .trufflehog3 import TruffleHog3Parser
-from .whispers import WhispersParser
+# Parser classes are imported on first access; see ..manifest
+from ..manifest import package_getattr
+
+__getattr__ = package_getattr(__name__)
 
 __all__ = [
     "GgshieldParser",
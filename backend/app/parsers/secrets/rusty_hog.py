@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,17 +12,9 @@ class RustyHogParser(BaseParser):
     file_types = ["json"]
     description = "RustyHog secrets scanner (Choctaw, Duroc, Gottingen, Essex variants)"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, list) or not data:
-                return False
-            first = data[0]
-            # All RustyHog variants have 'reason' and 'stringsFound'
-            return "reason" in first and "stringsFound" in first
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", item_keys=("reason", "stringsFound")),
+    )
 
     def _detect_scanner(self, items: list) -> str:
         for item in items:
@@ -38,7 +30,7 @@ class RustyHogParser(BaseParser):
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         scanner = self._detect_scanner(data)
 
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,25 +12,13 @@ class TalismanParser(BaseParser):
     file_types = ["json"]
     description = "Talisman git hook secrets scanner"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, dict):
-                return False
-            results = data.get("results")
-            if not isinstance(results, list):
-                return False
-            if not results:
-                return True
-            first = results[0]
-            return "filename" in first and "failure_list" in first
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", keys=("results",), child="results", child_keys=("filename", "failure_list")),
+    )
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         results = data.get("results", [])
 
         seen = set()
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,19 +12,10 @@ class TruffleHogParser(BaseParser):
     file_types = ["json"]
     description = "TruffleHog secrets scanner (supports v2 and v3 JSON output)"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            lines = content.strip().splitlines()
-            if not lines:
-                return False
-            first_line = lines[0].strip()
-            first_obj = json.loads(first_line)
-            # v2: has 'path' and 'reason'
-            # v3: has 'SourceMetadata' and 'DetectorName'
-            return "SourceMetadata" in first_obj or ("path" in first_obj and "reason" in first_obj)
-        except Exception:
-            return False
+    signatures = (
+        Signature(keys=("SourceMetadata",)),
+        Signature(keys=("path", "reason")),
+    )
 
     def _detect_version(self, first_obj: dict) -> str:
         if "SourceMetadata" in first_obj:
@@ -58,8 +49,8 @@ class TruffleHogParser(BaseParser):
             return findings
 
         try:
-            first_obj = json.loads(lines[0])
-        except (json.JSONDecodeError, IndexError):
+            first_obj = jsonlib.loads(lines[0])
+        except (jsonlib.JSONDecodeError, IndexError):
             return findings
 
         version = self._detect_version(first_obj)
@@ -74,8 +65,8 @@ class TruffleHogParser(BaseParser):
 
         for line in lines:
             try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
+                obj = jsonlib.loads(line)
+            except jsonlib.JSONDecodeError:
                 continue
 
             file_path = obj.get("path")
@@ -124,8 +115,8 @@ class TruffleHogParser(BaseParser):
 
         for line in lines:
             try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
+                obj = jsonlib.loads(line)
+            except jsonlib.JSONDecodeError:
                 continue
 
             metadata = obj.get("SourceMetadata", {}).get("Data", {})
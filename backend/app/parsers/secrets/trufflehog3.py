@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -12,17 +12,10 @@ class TruffleHog3Parser(BaseParser):
     file_types = ["json"]
     description = "TruffleHog v3 fork (truffleHog3) secrets scanner"
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, list) or not data:
-                return False
-            first = data[0]
-            # trufflehog3 has either 'reason' (legacy) or 'rule' (current format)
-            return "reason" in first or "rule" in first
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", item_keys=("reason",)),
+        Signature(format="json", item_keys=("rule", "secret")),
+    )
 
     def _severity_legacy(self, reason: str) -> Severity:
         if reason == "High Entropy":
@@ -35,7 +28,7 @@ class TruffleHog3Parser(BaseParser):
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
         seen = set()
 
         for obj in data:
@@ -1,7 +1,7 @@
-import json
 from typing import List, Optional
 
-from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry
+from ..base import BaseParser, ParsedFinding, Severity, ScannerCategory, ParserRegistry, Signature
+from ... import jsonlib
 
 
 @ParserRegistry.register
@@ -27,23 +27,9 @@ class WhispersParser(BaseParser):
         "Info": "info",
     }
 
-    @classmethod
-    def can_parse(cls, content: str, filename: Optional[str] = None) -> bool:
-        try:
-            data = json.loads(content)
-            if not isinstance(data, list) or not data:
-                return False
-            first = data[0]
-            return (
-                "message" in first
-                and "key" in first
-                and "value" in first
-                and "file" in first
-                and "line" in first
-                and "severity" in first
-            )
-        except Exception:
-            return False
+    signatures = (
+        Signature(format="json", item_keys=("message", "key", "value", "file", "line", "severity")),
+    )
 
     @staticmethod
     def _mask(text: str, n_plain: int = 4) -> str:
@@ -54,7 +40,7 @@ class WhispersParser(BaseParser):
 
     def parse(self, content: str, filename: Optional[str] = None) -> List[ParsedFinding]:
         findings = []
-        data = json.loads(content)
+        data = jsonlib.loads(content)
 
         for vuln in data:
             message = vuln.get("message", "Unknown")
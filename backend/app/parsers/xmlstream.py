@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from typing import IO, Collection, Dict, Iterator, List, Optional, Tuple, Union
+import xml.etree.ElementTree as ET
+from xml.parsers import expat
+
+# Bytes (or characters, for text streams) fed to expat per read.
+READ_SIZE = 64 * 1024
+
+Source = Union[str, bytes, IO]
+
+
+class XmlSecurityError(ValueError):
+    """Raised for documents that declare entities or reference external ones."""
+
+
+def _reject_entity(*args) -> None:
+    raise XmlSecurityError("XML entity declarations are not allowed")
+
+
+def _reject_external(*args) -> int:
+    raise XmlSecurityError("External XML entities are not allowed")
+
+
+def _hardened_parser() -> "expat.XMLParserType":
+    # Entity expansion (billion laughs, quadratic blowup) needs a declaration
+    # and XXE needs an external reference, so both are refused outright.
+    parser = expat.ParserCreate(namespace_separator="}")
+    parser.SetParamEntityParsing(expat.XML_PARAM_ENTITY_PARSING_NEVER)
+    parser.EntityDeclHandler = _reject_entity
+    parser.UnparsedEntityDeclHandler = _reject_entity
+    parser.ExternalEntityRefHandler = _reject_external
+    parser.buffer_text = True
+    return parser
+
+
+def split_tag(tag: str) -> Tuple[Optional[str], str]:
+    """``"{uri}local"`` -> ``("uri", "local")``; un-namespaced tags get ``None``."""
+    if tag[:1] == "{":
+        namespace, _, local = tag[1:].partition("}")
+        return namespace, local
+    return None, tag
+
+
+def _clark(name: str) -> str:
+    # expat joins namespace and local name with the separator; ElementTree
+    # spells the same thing "{uri}local".
+    return "{" + name if "}" in name else name
+
+
+def _local(name: str) -> str:
+    return name.rpartition("}")[2]
+
+
+def _chunks(source: Source) -> Iterator[Union[str, bytes]]:
+    if isinstance(source, (str, bytes)):
+        yield source
+        return
+    while True:
+        chunk = source.read(READ_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_events(source: Source, strip_namespaces: bool = True) -> Iterator[Tuple[str, ET.Element]]:
+    """Incrementally parse ``source``, yielding ``("start"|"end", element)``.
+
+    Elements are built by ElementTree's TreeBuilder, so an element is
+    complete at its "end" event. With ``strip_namespaces`` tags and attribute
+    names are reduced to their local part, so callers can ignore which schema
+    version (or whether any) namespace a tool wrote.
+    """
+    convert = _local if strip_namespaces else _clark
+    names: Dict[str, str] = {}
+    builder = ET.TreeBuilder()
+    events: List[Tuple[str, ET.Element]] = []
+
+    def fix(name):
+        # Reports repeat a handful of names many times over
+        fixed = names.get(name)
+        if fixed is None:
+            fixed = names[name] = convert(name)
+        return fixed
+
+    def start(tag, attrs):
+        if attrs:
+            attrs = {fix(k): v for k, v in attrs.items()}
+        events.append(("start", builder.start(fix(tag), attrs)))
+
+    def end(tag):
+        events.append(("end", builder.end(fix(tag))))
+
+    parser = _hardened_parser()
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = builder.data
+
+    chunks = _chunks(source)
+    final = False
+    while not final:
+        chunk = next(chunks, None)
+        final = chunk is None
+        try:
+            parser.Parse(b"" if final else chunk, final)
+        except expat.ExpatError as e:
+            err = ET.ParseError(f"{expat.ErrorString(e.code)}: line {e.lineno}, column {e.offset}")
+            err.code = e.code
+            err.position = (e.lineno, e.offset)
+            raise err from None
+        yield from events
+        events.clear()
+
+
+def iter_elements(
+    source: Source,
+    tags: Collection[str],
+    strip_namespaces: bool = True,
+) -> Iterator[Tuple[ET.Element, List[ET.Element]]]:
+    """Yield each complete element named in ``tags`` with its open ancestors.
+
+    Ancestors run from the document root to the element's parent and only
+    hold the children that have ended so far. Once the caller moves on, the
+    element is detached and cleared, so memory stays at one element's
+    subtree however many the document has. Tags should not nest.
+    """
+    stack: List[ET.Element] = []
+    for event, elem in iter_events(source, strip_namespaces):
+        if event == "start":
+            stack.append(elem)
+            continue
+        stack.pop()
+        if elem.tag in tags:
+            yield elem, stack
+            if stack:
+                stack[-1].remove(elem)
+            elem.clear()
+
+
+def iter_first_of(
+    source: Source,
+    tags: Collection[str],
+    strip_namespaces: bool = True,
+) -> Iterator[Tuple[ET.Element, List[ET.Element]]]:
+    """Like iter_elements, but only for whichever of ``tags`` occurs first.
+
+    The streaming counterpart of ``root.findall(a) or root.findall(b)`` for
+    formats whose item element is spelled differently between versions.
+    """
+    kind = None
+    for elem, ancestors in iter_elements(source, tags, strip_namespaces):
+        if kind is None:
+            kind = elem.tag
+        if elem.tag == kind:
+            yield elem, ancestors
+
+
+def parse(source: Source, strip_namespaces: bool = True) -> ET.Element:
+    """Parse a whole document with the hardened parser and return its root."""
+    root = None
+    for event, elem in iter_events(source, strip_namespaces):
+        if root is None:
+            root = elem
+    if root is None:
+        raise ET.ParseError("no element found")
+    return root
+
+
+def root_tag(source: Source) -> Optional[str]:
+    """The root element's tag in ``{uri}local`` form, reading only up to it."""
+    try:
+        for event, elem in iter_events(source, strip_namespaces=False):
+            return elem.tag
+    except (ET.ParseError, XmlSecurityError):
+        pass
+    return None
+
+
+def peek_text(stream: IO, size: int = 256) -> str:
+    """The first ``size`` bytes of a seekable stream as text, leading whitespace removed."""
+    position = stream.tell()
+    head = stream.read(size)
+    stream.seek(position)
+    if isinstance(head, bytes):
+        head = head.decode("utf-8", errors="replace")
+    return head.lstrip("﻿ \t\r\n")
+
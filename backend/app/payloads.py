@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Iterable
+import hashlib
+import zlib
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from . import jsonlib
+from .models import SignalPayload
+from .upserts import dialect_insert
+
+try:
+    import zstandard
+except ImportError:  # optional: fall back to zlib
+    zstandard = None
+
+PAYLOAD_CODEC = "zstd" if zstandard is not None else "zlib"
+
+
+def _compress(data: bytes) -> bytes:
+    if PAYLOAD_CODEC == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd-compressed payloads")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == "zlib":
+        return zlib.decompress(data)
+    raise ValueError(f"Unknown payload codec: {codec}")
+
+
+def canonical_json(payload: Any) -> bytes:
+    return jsonlib.canonical(payload)
+
+
+def encode_payload(payload: Any, now: datetime | None = None) -> dict:
+    """Build a signal_payloads row keyed by the SHA-256 of the canonical JSON."""
+    return encode_payload_json(canonical_json(payload), now)
+
+
+def encode_payload_json(raw: bytes, now: datetime | None = None) -> dict:
+    """Like encode_payload(), for a payload that is already canonical JSON."""
+    return {
+        "hash": hashlib.sha256(raw).hexdigest(),
+        "codec": PAYLOAD_CODEC,
+        "size": len(raw),
+        "data": _compress(raw),
+        "created_at": now or datetime.utcnow(),
+    }
+
+
+def store_payloads(db: Session, rows: Iterable[dict]) -> None:
+    """Insert payload blobs, skipping hashes that are already stored."""
+    unique = list({r["hash"]: r for r in rows}.values())
+    if unique:
+        stmt = dialect_insert(db, SignalPayload).on_conflict_do_nothing(index_elements=[SignalPayload.hash])
+        db.execute(stmt, unique)
+
+
+def store_payload(db: Session, payload: Any, now: datetime | None = None) -> str:
+    row = encode_payload(payload, now)
+    store_payloads(db, [row])
+    return row["hash"]
+
+
+def load_payload(db: Session, payload_hash: str) -> Any:
+    row = db.execute(
+        select(SignalPayload.codec, SignalPayload.data).where(SignalPayload.hash == payload_hash)
+    ).one_or_none()
+    if row is None:
+        return None
+    return jsonlib.loads(_decompress(row.codec, row.data))
@@ -0,0 +1,114 @@
+"""How much of each finding's raw scanner record is stored with its signal.
+
+A policy is one of::
+
+    full             keep raw_data as parsed (the default)
+    drop             store an empty object
+    fields:a,b,c     keep only these top-level keys
+    truncate:4096    keep raw_data up to 4096 bytes of JSON; larger records
+                     become {"truncated": <size>, "head": "<first bytes>"}
+
+``RAW_DATA_RETENTION`` sets the policy for every parser and
+``RAW_DATA_RETENTION_<PARSER>`` overrides it for one, with the parser name
+upper-cased and dashes as underscores (``RAW_DATA_RETENTION_BURP=drop``,
+``RAW_DATA_RETENTION_GENERIC_JSON=truncate:2048``). Policies are read at
+startup, so a malformed one fails fast.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Mapping, Optional
+import os
+
+from . import jsonlib
+from .parsers.base import ParsedFinding
+
+ENV_PREFIX = "RAW_DATA_RETENTION"
+
+_EMPTY_JSON = b"{}"
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    mode: str = "full"
+    fields: frozenset[str] = frozenset()
+    max_bytes: int = 0
+
+    @classmethod
+    def parse(cls, spec: str) -> "RetentionPolicy":
+        mode, _, arg = spec.strip().partition(":")
+        mode = mode.strip().lower()
+        if mode in ("full", "drop") and not arg:
+            return cls(mode)
+        if mode == "fields" and arg.strip():
+            return cls(mode, fields=frozenset(f.strip() for f in arg.split(",") if f.strip()))
+        if mode == "truncate" and arg.strip().isdigit():
+            return cls(mode, max_bytes=int(arg))
+        raise ValueError(f"Invalid raw_data retention policy {spec!r}; use full, drop, fields:a,b or truncate:N")
+
+    def apply(self, raw_json: bytes) -> bytes:
+        """``raw_json`` (canonical JSON) as this policy stores it."""
+        if self.mode == "full" or raw_json == _EMPTY_JSON:
+            return raw_json
+        if self.mode == "drop":
+            return _EMPTY_JSON
+        if self.mode == "truncate":
+            if len(raw_json) <= self.max_bytes:
+                return raw_json
+            head = raw_json[:self.max_bytes].decode("utf-8", errors="ignore")
+            return jsonlib.canonical({"truncated": len(raw_json), "head": head})
+        raw = jsonlib.loads(raw_json)
+        if not isinstance(raw, dict):
+            return raw_json
+        return jsonlib.canonical({k: v for k, v in raw.items() if k in self.fields})
+
+
+def _env_key(parser_name: str) -> str:
+    return parser_name.upper().replace("-", "_")
+
+
+def load_policies(environ: Mapping[str, str] = os.environ) -> tuple[RetentionPolicy, dict[str, RetentionPolicy]]:
+    """The default policy and per-parser overrides (keyed by env suffix) from ``environ``."""
+    default = RetentionPolicy.parse(environ.get(ENV_PREFIX) or "full")
+    overrides = {
+        key[len(ENV_PREFIX) + 1:]: RetentionPolicy.parse(value)
+        for key, value in environ.items()
+        if key.startswith(ENV_PREFIX + "_") and value
+    }
+    return default, overrides
+
+
+DEFAULT_POLICY, PARSER_POLICIES = load_policies()
+
+
+def policy_for(parser_name: Optional[str]) -> RetentionPolicy:
+    if parser_name:
+        return PARSER_POLICIES.get(_env_key(parser_name), DEFAULT_POLICY)
+    return DEFAULT_POLICY
+
+
+@dataclass
+class RetentionStats:
+    raw_bytes: int = 0
+    stored_bytes: int = 0
+
+    @property
+    def saved(self) -> int:
+        return self.raw_bytes - self.stored_bytes
+
+
+def retain(
+    findings: Iterable[ParsedFinding],
+    parser_name: Optional[str],
+    stats: Optional[RetentionStats] = None,
+) -> Iterator[ParsedFinding]:
+    """Apply ``parser_name``'s policy to each finding's raw_data as it passes through."""
+    policy = policy_for(parser_name)
+    for pf in findings:
+        raw_json = pf.raw_json
+        if policy.mode != "full":
+            pf.raw_json = policy.apply(raw_json)
+        if stats is not None:
+            stats.raw_bytes += len(raw_json)
+            stats.stored_bytes += len(pf.raw_json)
+        yield pf
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+import sys
+
+from sqlalchemy import case, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from .models import AssetRiskRollup, Finding
+from .upserts import dialect_insert, greatest
+
+SEVERITY_COLUMNS = {
+    "critical": "critical_count",
+    "high": "high_count",
+    "medium": "medium_count",
+    "low": "low_count",
+    "info": "info_count",
+}
+
+_COUNTER_COLUMNS = ["open_findings", "risk_sum", *SEVERITY_COLUMNS.values()]
+
+
+@dataclass
+class _Delta:
+    asset_id: Optional[str] = None
+    counters: dict[str, int] = field(default_factory=lambda: dict.fromkeys(_COUNTER_COLUMNS, 0))
+    max_risk: int = 0
+    recompute_max: bool = False
+
+
+class RollupDeltas:
+    """Accumulates per-asset rollup changes and applies them in one upsert.
+
+    Additions and risk increases are pure deltas. When an open finding leaves
+    the open set its asset's max_risk may drop, so those assets get their max
+    recomputed from their own open findings.
+    """
+
+    def __init__(self):
+        self._deltas: dict[str, _Delta] = {}
+
+    def _get(self, asset: str, asset_id: Optional[str]) -> _Delta:
+        delta = self._deltas.setdefault(asset, _Delta())
+        if asset_id:
+            delta.asset_id = asset_id
+        return delta
+
+    def opened(self, asset: str, asset_id: Optional[str], severity: str, risk_score: int) -> None:
+        delta = self._get(asset, asset_id)
+        delta.counters["open_findings"] += 1
+        delta.counters["risk_sum"] += risk_score
+        delta.max_risk = max(delta.max_risk, risk_score)
+        column = SEVERITY_COLUMNS.get((severity or "").lower())
+        if column:
+            delta.counters[column] += 1
+
+    def closed(self, asset: str, asset_id: Optional[str], severity: str, risk_score: int) -> None:
+        delta = self._get(asset, asset_id)
+        delta.counters["open_findings"] -= 1
+        delta.counters["risk_sum"] -= risk_score
+        delta.recompute_max = True
+        column = SEVERITY_COLUMNS.get((severity or "").lower())
+        if column:
+            delta.counters[column] -= 1
+
+    def risk_raised(self, asset: str, asset_id: Optional[str], old_risk: int, new_risk: int) -> None:
+        if new_risk == old_risk:
+            return
+        delta = self._get(asset, asset_id)
+        delta.counters["risk_sum"] += new_risk - old_risk
+        delta.max_risk = max(delta.max_risk, new_risk)
+
+    def apply(self, db: Session, now: Optional[datetime] = None) -> None:
+        if not self._deltas:
+            return
+        now = now or datetime.utcnow()
+
+        rows = [
+            {"asset": asset, "asset_id": d.asset_id, "max_risk": d.max_risk, "updated_at": now, **d.counters}
+            for asset, d in self._deltas.items()
+        ]
+        stmt = dialect_insert(db, AssetRiskRollup)
+        excluded = stmt.excluded
+        set_ = {col: getattr(AssetRiskRollup, col) + getattr(excluded, col) for col in _COUNTER_COLUMNS}
+        set_["max_risk"] = greatest(db, AssetRiskRollup.max_risk, excluded.max_risk)
+        set_["asset_id"] = func.coalesce(excluded.asset_id, AssetRiskRollup.asset_id)
+        set_["updated_at"] = excluded.updated_at
+        db.execute(stmt.on_conflict_do_update(index_elements=[AssetRiskRollup.asset], set_=set_), rows)
+
+        recompute = [asset for asset, d in self._deltas.items() if d.recompute_max]
+        if recompute:
+            open_max = (
+                select(func.max(Finding.risk_score))
+                .where(Finding.asset == AssetRiskRollup.asset, Finding.status == "open")
+                .scalar_subquery()
+            )
+            db.execute(
+                update(AssetRiskRollup)
+                .where(AssetRiskRollup.asset.in_(recompute))
+                .values(max_risk=func.coalesce(open_max, 0))
+                .execution_options(synchronize_session=False)
+            )
+
+        self._deltas.clear()
+
+
+def rebuild_rollups(db: Session) -> int:
+    """Recompute every rollup row from the findings table. Returns the row count."""
+    severity = func.lower(Finding.severity)
+    source = (
+        select(
+            Finding.asset,
+            func.max(Finding.asset_id),
+            func.count(),
+            func.max(Finding.risk_score),
+            func.sum(Finding.risk_score),
+            *[func.sum(case((severity == sev, 1), else_=0)) for sev in SEVERITY_COLUMNS],
+            func.max(Finding.last_seen),
+        )
+        .where(Finding.status == "open")
+        .group_by(Finding.asset)
+    )
+    db.execute(delete(AssetRiskRollup))
+    db.execute(
+        insert(AssetRiskRollup).from_select(
+            ["asset", "asset_id", "open_findings", "max_risk", "risk_sum", *SEVERITY_COLUMNS.values(), "updated_at"],
+            source,
+        )
+    )
+    return db.execute(select(func.count()).select_from(AssetRiskRollup)).scalar_one()
+
+
+if __name__ == "__main__":
+    # Repair: python -m app.rollups rebuild
+    if sys.argv[1:] != ["rebuild"]:
+        sys.exit("usage: python -m app.rollups rebuild")
+
+    from .db import SessionLocal
+
+    db = SessionLocal()
+    try:
+        count = rebuild_rollups(db)
+        db.commit()
+        print(f"Rebuilt {count} asset risk rollups")
+    finally:
+        db.close()
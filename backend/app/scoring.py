@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import hashlib
+
+SEVERITY_WEIGHT = {
+    "info": 1,
+    "low": 3,
+    "medium": 6,
+    "high": 10,
+    "critical": 15,
+}
+
+EXPOSURE_WEIGHT = {
+    "internal": 1.0,
+    "internet": 1.5,
+}
+
+CRITICALITY_WEIGHT = {
+    "low": 0.8,
+    "medium": 1.0,
+    "high": 1.3,
+}
+
+
+def compute_risk_score(severity: str, exposure: str, criticality: str) -> int:
+    s = SEVERITY_WEIGHT.get((severity or "").lower(), 1)
+    e = EXPOSURE_WEIGHT.get((exposure or "").lower(), 1.0)
+    c = CRITICALITY_WEIGHT.get((criticality or "").lower(), 1.0)
+    return max(1, min(int(round(s * e * c * 10)), 200))
+
+
+def make_fingerprint(tool: str, title: str, asset_key: str) -> str:
+    raw = f"{(tool or '').strip().lower()}|{(title or '').strip().lower()}|{(asset_key or '').strip().lower()}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from itertools import groupby
+from typing import Optional
+import re
+import sys
+
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.orm import Session
+
+from .models import Comment, DailyFindingStat, Finding
+from .upserts import dialect_insert
+
+_COUNTER_COLUMNS = ["opened", "reopened", "closed", "resolved", "risk_delta"]
+
+# Statuses counted as resolved; anything but "open" counts as closed, as in the rollups
+RESOLVED_STATUSES = {"resolved", "closed"}
+
+_STATUS_CHANGE = re.compile(r"Status changed from '([^']*)' to '([^']*)'")
+
+
+class TrendDeltas:
+    """Accumulates daily_finding_stats changes and applies them in one upsert.
+
+    Mirrors RollupDeltas: call it wherever a finding enters or leaves the open
+    set or its open risk changes, then ``apply`` in the same transaction.
+    """
+
+    def __init__(self):
+        self._deltas: dict[tuple[date, str, str, str], dict[str, int]] = {}
+
+    def _get(self, at: datetime, severity: str, tool: str, asset: str) -> dict[str, int]:
+        key = (at.date(), (severity or "").lower(), tool or "", asset or "")
+        return self._deltas.setdefault(key, dict.fromkeys(_COUNTER_COLUMNS, 0))
+
+    def opened(self, at: datetime, severity: str, tool: str, asset: str, risk_score: int) -> None:
+        delta = self._get(at, severity, tool, asset)
+        delta["opened"] += 1
+        delta["risk_delta"] += risk_score
+
+    def status_changed(
+        self,
+        at: datetime,
+        severity: str,
+        tool: str,
+        asset: str,
+        risk_score: int,
+        old_status: str,
+        new_status: str,
+    ) -> None:
+        if new_status == old_status:
+            return
+        delta = self._get(at, severity, tool, asset)
+        if old_status == "open":
+            delta["closed"] += 1
+            delta["risk_delta"] -= risk_score
+        elif new_status == "open":
+            delta["reopened"] += 1
+            delta["risk_delta"] += risk_score
+        if new_status in RESOLVED_STATUSES and old_status not in RESOLVED_STATUSES:
+            delta["resolved"] += 1
+
+    def risk_raised(self, at: datetime, severity: str, tool: str, asset: str, old_risk: int, new_risk: int) -> None:
+        if new_risk == old_risk:
+            return
+        self._get(at, severity, tool, asset)["risk_delta"] += new_risk - old_risk
+
+    def apply(self, db: Session, now: Optional[datetime] = None) -> None:
+        if not self._deltas:
+            return
+        now = now or datetime.utcnow()
+
+        rows = [
+            {"day": day, "severity": severity, "tool": tool, "asset": asset, "updated_at": now, **counters}
+            for (day, severity, tool, asset), counters in self._deltas.items()
+        ]
+        stmt = dialect_insert(db, DailyFindingStat)
+        excluded = stmt.excluded
+        set_ = {col: getattr(DailyFindingStat, col) + getattr(excluded, col) for col in _COUNTER_COLUMNS}
+        set_["updated_at"] = excluded.updated_at
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    DailyFindingStat.day, DailyFindingStat.severity, DailyFindingStat.tool, DailyFindingStat.asset,
+                ],
+                set_=set_,
+            ),
+            rows,
+        )
+        self._deltas.clear()
+
+
+def backfill_trends(db: Session, batch_size: int = 10000) -> int:
+    """Rebuild daily_finding_stats from findings and their status-change comments.
+
+    Each finding opens on its ``first_seen`` day and then follows its
+    "Status changed from 'x' to 'y'" comments. Past risk increases aren't
+    recorded anywhere, so a finding's current risk score is used throughout;
+    the open-risk total still ends at today's value. Returns the row count.
+    """
+    status_comments = and_(
+        Comment.finding_id == Finding.id,
+        Comment.action_type == "update",
+        Comment.content.like("Status changed from %"),
+    )
+    rows = db.execute(
+        select(
+            Finding.id,
+            Finding.severity,
+            Finding.tool,
+            Finding.asset,
+            Finding.risk_score,
+            Finding.status,
+            Finding.first_seen,
+            Comment.content,
+            Comment.created_at,
+        )
+        .outerjoin(Comment, status_comments)
+        .order_by(Finding.id, Comment.created_at)
+        .execution_options(yield_per=batch_size)
+    )
+
+    trends = TrendDeltas()
+    for _, events in groupby(rows, key=lambda r: r.id):
+        events = list(events)
+        f = events[0]
+        risk = f.risk_score or 0
+        trends.opened(f.first_seen, f.severity, f.tool, f.asset, risk)
+        status, at = "open", f.first_seen
+        for e in events:
+            match = _STATUS_CHANGE.match(e.content or "")
+            if match is None:
+                continue
+            at = max(e.created_at, f.first_seen)
+            trends.status_changed(at, f.severity, f.tool, f.asset, risk, status, match.group(2))
+            status = match.group(2)
+        # A status changed without a comment (e.g. by hand in SQL) lands on the last known day
+        trends.status_changed(at, f.severity, f.tool, f.asset, risk, status, f.status)
+
+    db.execute(delete(DailyFindingStat))
+    trends.apply(db)
+    return db.execute(select(func.count()).select_from(DailyFindingStat)).scalar_one()
+
+
+if __name__ == "__main__":
+    # History: python -m app.trends backfill
+    if sys.argv[1:] != ["backfill"]:
+        sys.exit("usage: python -m app.trends backfill")
+
+    from .db import SessionLocal
+
+    db = SessionLocal()
+    try:
+        count = backfill_trends(db)
+        db.commit()
+        print(f"Rebuilt {count} daily finding stats rows")
+    finally:
+        db.close()
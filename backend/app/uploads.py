@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import AsyncIterator, BinaryIO, Iterator, Optional
+import gzip
+import os
+import tempfile
+import zlib
+
+UPLOAD_CHUNK_SIZE = int(os.environ.get("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+UPLOAD_MAX_BYTES = int(os.environ.get("UPLOAD_MAX_BYTES", "0"))  # 0 = unlimited
+UPLOAD_SPOOL_DIR = os.environ.get("UPLOAD_SPOOL_DIR") or None
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+async def spool_to_file(chunks: AsyncIterator[bytes]) -> str:
+    """Write an async byte stream to a temp file and return its path.
+
+    Only one chunk is held in memory at a time. The caller removes the file.
+    """
+    fd, path = tempfile.mkstemp(prefix="secops-upload-", dir=UPLOAD_SPOOL_DIR)
+    written = 0
+    try:
+        with os.fdopen(fd, "wb") as out:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                written += len(chunk)
+                if UPLOAD_MAX_BYTES and written > UPLOAD_MAX_BYTES:
+                    raise UploadTooLarge(f"Upload exceeds {UPLOAD_MAX_BYTES} bytes")
+                out.write(chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+
+async def iter_upload_file(upload) -> AsyncIterator[bytes]:
+    """Yield an UploadFile's content in UPLOAD_CHUNK_SIZE pieces."""
+    while True:
+        chunk = await upload.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
+
+def strip_gzip_suffix(filename: Optional[str]) -> Optional[str]:
+    if filename and filename.lower().endswith(".gz"):
+        return filename[:-3]
+    return filename
+
+
+@contextmanager
+def open_spooled(path: str) -> Iterator[BinaryIO]:
+    """Open a spooled upload for reading, transparently gunzipping it."""
+    with open(path, "rb") as raw:
+        magic = raw.read(2)
+        raw.seek(0)
+        if magic == _GZIP_MAGIC:
+            with gzip.GzipFile(fileobj=raw, mode="rb") as fh:
+                yield fh
+        else:
+            yield raw
+
+
+def iter_gzipped(fh: BinaryIO) -> Iterator[bytes]:
+    """Yield a report as gzip bytes in pieces of about UPLOAD_CHUNK_SIZE, compressing it if it isn't already."""
+    magic = fh.read(2)
+    if magic == _GZIP_MAGIC:
+        chunk = magic + fh.read(UPLOAD_CHUNK_SIZE - len(magic))
+        while chunk:
+            yield chunk
+            chunk = fh.read(UPLOAD_CHUNK_SIZE)
+        return
+
+    compressor = zlib.compressobj(wbits=31)
+    pending = bytearray(compressor.compress(magic))
+    while True:
+        chunk = fh.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        pending += compressor.compress(chunk)
+        if len(pending) >= UPLOAD_CHUNK_SIZE:
+            yield bytes(pending)
+            pending.clear()
+    pending += compressor.flush()
+    yield bytes(pending)
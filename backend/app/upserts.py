@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from .models import Asset, Finding, _uuid
+
+
+def dialect_insert(db: Session, model):
+    name = db.get_bind().dialect.name
+    if name == "postgresql":
+        return postgresql.insert(model)
+    if name == "sqlite":
+        return sqlite.insert(model)
+    raise NotImplementedError(f"ON CONFLICT upserts are not supported on {name}")
+
+
+def greatest(db: Session, a, b):
+    # SQLite's multi-argument max() is the scalar GREATEST
+    if db.get_bind().dialect.name == "sqlite":
+        return func.max(a, b)
+    return func.greatest(a, b)
+
+
+def finding_upsert(db: Session):
+    """INSERT ... ON CONFLICT (fingerprint) DO UPDATE for findings.
+
+    A conflicting row gets its occurrences bumped by the incoming count, its
+    risk_score raised to the max of both, and last_seen/signal_id/asset moved
+    to the new sighting. Works for a single row or a list of rows.
+    """
+    stmt = dialect_insert(db, Finding)
+    excluded = stmt.excluded
+    return stmt.on_conflict_do_update(
+        index_elements=[Finding.fingerprint],
+        set_={
+            "occurrences": Finding.occurrences + excluded.occurrences,
+            "risk_score": greatest(db, Finding.risk_score, excluded.risk_score),
+            "last_seen": excluded.last_seen,
+            "signal_id": excluded.signal_id,
+            "asset": excluded.asset,
+            "asset_id": excluded.asset_id,
+        },
+    )
+
+
+def upsert_finding(db: Session, values: dict):
+    """Insert or bump one finding and return (id, fingerprint, occurrences, risk_score).
+
+    ``occurrences == 1`` in the returned row means the finding is new.
+    """
+    stmt = finding_upsert(db).values(**values).returning(
+        Finding.id, Finding.fingerprint, Finding.occurrences, Finding.risk_score
+    )
+    return db.execute(stmt).one()
+
+
+def ensure_asset(
+    db: Session,
+    key: str,
+    criticality: str = "medium",
+    exposure: str = "internal",
+    now: datetime | None = None,
+):
+    """Get-or-create an asset by key in one statement; returns (id, exposure, criticality).
+
+    The no-op DO UPDATE makes RETURNING yield the existing row on conflict.
+    """
+    now = now or datetime.utcnow()
+    stmt = dialect_insert(db, Asset).values(
+        id=_uuid(),
+        key=key,
+        name=key,
+        environment="unknown",
+        owner="",
+        criticality=criticality,
+        exposure=exposure,
+        created_at=now,
+        updated_at=now,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Asset.key],
+        set_={"key": stmt.excluded.key},
+    ).returning(Asset.id, Asset.exposure, Asset.criticality)
+    return db.execute(stmt).one()
+
+
+def insert_assets_ignoring_conflicts(db: Session, rows: list[dict]) -> None:
+    if rows:
+        stmt = dialect_insert(db, Asset).on_conflict_do_nothing(index_elements=[Asset.key])
+        db.execute(stmt, rows)
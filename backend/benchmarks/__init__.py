@@ -0,0 +1 @@
+"""Parser benchmarks with synthetic report generators; see __main__."""
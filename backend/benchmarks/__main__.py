@@ -0,0 +1,95 @@
+"""Parser benchmarks: ``python -m benchmarks`` from the backend directory.
+
+    python -m benchmarks                      # all cases, compared with baseline.json
+    python -m benchmarks --only trivy,nessus  # a subset
+    python -m benchmarks --update-baseline    # record this machine's numbers
+
+Exits 1 when a case is slower, larger or detected differently than the
+baseline allows. Baselines are machine-specific; record one on the machine
+(or CI runner class) that checks against it.
+"""
+from typing import List
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+from .generators import CASES, generate
+from .harness import Thresholds, compare, measure
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+COLUMNS = (
+    ("case", "{:<13}"), ("findings", "{:>9}"), ("size_mb", "{:>8}"), ("findings_per_sec", "{:>11}"),
+    ("mb_per_sec", "{:>7}"), ("peak_rss_mb", "{:>8}"), ("rss_growth_mb", "{:>7}"), ("detect_ms", "{:>9}"),
+    ("detected", "{:<13}"),
+)
+HEADERS = ("case", "findings", "MB", "findings/s", "MB/s", "peak MB", "+RSS", "detect ms", "detected")
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Parser throughput benchmarks")
+    parser.add_argument("--only", help="comma-separated cases (default: all)")
+    parser.add_argument("--count", type=int, default=20000, help="findings per report (default: 20000)")
+    parser.add_argument("--repeat", type=int, default=3, help="detection and parse runs per case; the fastest counts")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--throughput-threshold", type=float, default=Thresholds.throughput)
+    parser.add_argument("--rss-threshold", type=float, default=Thresholds.rss)
+    parser.add_argument("--detect-threshold", type=float, default=Thresholds.detect)
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args(argv)
+
+    cases = args.only.split(",") if args.only else list(CASES)
+    unknown = [c for c in cases if c not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}; choose from {', '.join(CASES)}")
+    limits = Thresholds(
+        throughput=args.throughput_threshold, rss=args.rss_threshold, detect=args.detect_threshold
+    )
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+    if baseline and not args.update_baseline and baseline.get("count") != args.count:
+        print(f"Baseline was recorded with --count {baseline.get('count')}; comparing anyway", file=sys.stderr)
+
+    print("  ".join(fmt.format(h) for h, (_, fmt) in zip(HEADERS, COLUMNS)).rstrip())
+    results = {}
+    failures = 0
+    with tempfile.TemporaryDirectory(prefix="parser-bench-") as tmp:
+        for case in cases:
+            path = os.path.join(tmp, CASES[case][1])
+            with open(path, "wb") as fh:
+                generate(case, fh, args.count, args.seed)
+            result = measure(case, path, os.path.getsize(path), args.repeat)
+            os.remove(path)
+            results[case] = result.to_dict()
+
+            row = {key: "-" if value is None else value for key, value in result.to_dict().items()}
+            print("  ".join(fmt.format(row[key]) for key, fmt in COLUMNS).rstrip())
+            expected = baseline.get("cases", {}).get(case)
+            if expected and not args.update_baseline:
+                for problem in compare(result, expected, limits):
+                    print(f"  REGRESSION {case}: {problem}")
+                    failures += 1
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=1)
+    if args.update_baseline:
+        cases_out = dict(baseline.get("cases", {}))
+        cases_out.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as fh:
+            json.dump({"count": args.count, "cases": cases_out}, fh, indent=1)
+            fh.write("\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
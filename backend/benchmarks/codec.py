@@ -0,0 +1,72 @@
+"""JSON codec benchmark: ``python -m benchmarks.codec`` from the backend directory.
+
+Compares the stdlib json module with ``app.jsonlib`` (orjson when installed)
+on generated Trivy and SARIF reports: decoding the whole report, and
+encoding every finding's signal payload the way an import stores it.
+"""
+from typing import Callable, List
+import argparse
+import io
+import json
+import sys
+import time
+
+from app import jsonlib
+from app.parsers import get_parser
+
+from .generators import CASES, generate
+
+
+def _best(fn: Callable[[], object], repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _stdlib_canonical(payload: object) -> bytes:
+    # What payloads.canonical_json did before jsonlib
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.codec", description="JSON codec benchmark")
+    parser.add_argument("--only", default="trivy,sarif", help="comma-separated cases (default: trivy,sarif)")
+    parser.add_argument("--count", type=int, default=20000, help="findings per report (default: 20000)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement; the fastest counts")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    cases = args.only.split(",")
+    unknown = [c for c in cases if c not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}; choose from {', '.join(CASES)}")
+
+    print(f"jsonlib backend: {jsonlib.BACKEND}")
+    print(f"{'case':<8}  {'operation':<16}  {'MB':>6}  {'json s':>8}  {'jsonlib s':>9}  {'speedup':>7}")
+    for case in cases:
+        parser_name, filename, _ = CASES[case]
+        buf = io.BytesIO()
+        generate(case, buf, args.count, args.seed)
+        raw = buf.getvalue()
+        text = raw.decode("utf-8")
+        payloads = [f.to_signal_payload() for f in get_parser(parser_name).iter_parse(io.BytesIO(raw), filename)]
+        payload_mb = sum(len(jsonlib.canonical(p)) for p in payloads) / (1024 * 1024)
+
+        rows = (
+            ("loads report", len(raw) / (1024 * 1024),
+             lambda: json.loads(text), lambda: jsonlib.loads(raw)),
+            (f"canonical x{len(payloads)}", payload_mb,
+             lambda: [_stdlib_canonical(p) for p in payloads], lambda: [jsonlib.canonical(p) for p in payloads]),
+        )
+        for operation, size_mb, stdlib_fn, jsonlib_fn in rows:
+            before = _best(stdlib_fn, args.repeat)
+            after = _best(jsonlib_fn, args.repeat)
+            print(f"{case:<8}  {operation:<16}  {size_mb:>6.1f}  {before:>8.3f}  {after:>9.3f}  {before / after:>6.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""Finding memory benchmark: ``python -m benchmarks.findings`` from the backend directory.
+
+Parses generated reports and reports the memory retained by the resulting
+ParsedFinding objects (traced with tracemalloc), per report and per 100k
+findings. Each case runs in a fresh process.
+"""
+from typing import List
+import argparse
+import io
+import multiprocessing
+import sys
+
+from .generators import CASES, generate
+
+
+def _retained(case: str, count: int, seed: int) -> tuple:
+    import gc
+    import tracemalloc
+
+    from app.parsers import get_parser
+
+    parser_name, filename, _ = CASES[case]
+    buf = io.BytesIO()
+    generate(case, buf, count, seed)
+    buf.seek(0)
+    parser = get_parser(parser_name)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    findings = list(parser.iter_parse(buf, filename))
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return len(findings), retained
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.findings", description="ParsedFinding memory benchmark")
+    parser.add_argument("--only", default="trivy,sarif,zap,burp", help="comma-separated cases (default: trivy,sarif,zap,burp)")
+    parser.add_argument("--count", type=int, default=100000, help="findings per report (default: 100000)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    cases = args.only.split(",")
+    unknown = [c for c in cases if c not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}; choose from {', '.join(CASES)}")
+
+    print(f"{'case':<13}  {'findings':>9}  {'retained MB':>11}  {'bytes/finding':>13}  {'MB/100k':>8}")
+    ctx = multiprocessing.get_context("spawn")
+    for case in cases:
+        with ctx.Pool(1) as pool:
+            findings, retained = pool.apply(_retained, (case, args.count, args.seed))
+        per = retained / max(findings, 1)
+        print(f"{case:<13}  {findings:>9}  {retained / 2**20:>11.1f}  {per:>13.0f}  {per * 100000 / 2**20:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
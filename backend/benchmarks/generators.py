@@ -0,0 +1,247 @@
+"""Deterministic synthetic scanner reports.
+
+Each generator writes a valid report with ``count`` findings to a binary
+file handle. Output depends only on ``count`` and the seed, so a baseline
+recorded on one run is comparable with the next.
+"""
+from __future__ import annotations
+
+from typing import BinaryIO, Callable, Dict, Iterator
+from xml.sax.saxutils import escape, quoteattr
+import json
+import random
+
+SEVERITIES = ("CRITICAL", "HIGH", "MEDIUM", "LOW", "UNKNOWN")
+WORDS = (
+    "buffer", "overflow", "injection", "request", "handler", "parser", "token", "session",
+    "cookie", "header", "upload", "path", "traversal", "deserialization", "template", "query",
+)
+PACKAGES = ("openssl", "libxml2", "lodash", "requests", "log4j-core", "jackson-databind", "glibc", "zlib")
+
+Generator = Callable[[BinaryIO, int, random.Random], None]
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _cve(rng: random.Random, i: int) -> str:
+    return f"CVE-{rng.randint(2015, 2024)}-{10000 + i}"
+
+
+def _path(rng: random.Random, i: int) -> str:
+    return f"src/{rng.choice(WORDS)}/{rng.choice(WORDS)}_{i}.py"
+
+
+def _json_array(fh: BinaryIO, items: Iterator[dict]) -> None:
+    # Written element by element so large reports never sit in memory
+    fh.write(b"[")
+    for n, item in enumerate(items):
+        if n:
+            fh.write(b",")
+        fh.write(json.dumps(item).encode())
+    fh.write(b"]")
+
+
+def trivy(fh: BinaryIO, count: int, rng: random.Random) -> None:
+    per_target = 500
+
+    def vulnerabilities(start: int, stop: int) -> Iterator[dict]:
+        for i in range(start, stop):
+            yield {
+                "VulnerabilityID": _cve(rng, i),
+                "PkgName": rng.choice(PACKAGES),
+                "InstalledVersion": f"1.{rng.randint(0, 9)}.{rng.randint(0, 20)}",
+                "FixedVersion": f"1.{rng.randint(10, 19)}.0",
+                "Title": _sentence(rng, 6),
+                "Description": _sentence(rng, 40),
+                "Severity": rng.choice(SEVERITIES),
+                "CweIDs": [f"CWE-{rng.randint(20, 900)}"],
+                "CVSS": {"nvd": {"V3Score": round(rng.uniform(1, 10), 1)}},
+                "References": [f"https://avd.aquasec.com/nvd/cve-{i}"],
+            }
+
+    fh.write(b'{"SchemaVersion": 2, "ArtifactName": "registry.local/app:1.0", "ArtifactType": "container_image", "Results": [')
+    for n, start in enumerate(range(0, count, per_target)):
+        if n:
+            fh.write(b",")
+        fh.write(f'{{"Target": "layer-{n}", "Class": "os-pkgs", "Type": "debian", "Vulnerabilities": '.encode())
+        _json_array(fh, vulnerabilities(start, min(start + per_target, count)))
+        fh.write(b"}")
+    fh.write(b"]}")
+
+
+def cyclonedx(fh: BinaryIO, count: int, rng: random.Random) -> None:
+    def vulnerabilities() -> Iterator[dict]:
+        for i in range(count):
+            yield {
+                "id": _cve(rng, i),
+                "description": _sentence(rng, 30),
+                "recommendation": "Upgrade to the latest version.",
+                "cwes": [rng.randint(20, 900)],
+                "ratings": [{"severity": rng.choice(SEVERITIES).lower(), "score": round(rng.uniform(1, 10), 1)}],
+                "affects": [{"ref": f"pkg:npm/{rng.choice(PACKAGES)}@{i % 50}.0.0"}],
+                "source": {"references": [{"url": f"https://nvd.nist.gov/vuln/detail/{i}"}]},
+            }
+
+    fh.write(b'{"bomFormat": "CycloneDX", "specVersion": "1.4", "version": 1, "components": [], "vulnerabilities": ')
+    _json_array(fh, vulnerabilities())
+    fh.write(b"}")
+
+
+def sarif(fh: BinaryIO, count: int, rng: random.Random) -> None:
+    rules = [
+        {
+            "id": f"RULE{r}",
+            "shortDescription": {"text": _sentence(rng, 5)},
+            "help": {"text": _sentence(rng, 15)},
+            "helpUri": f"https://example.com/rules/{r}",
+            "properties": {"tags": ["security", f"external/cwe/cwe-{rng.randint(20, 900)}"]},
+        }
+        for r in range(50)
+    ]
+
+    def results() -> Iterator[dict]:
+        for i in range(count):
+            yield {
+                "ruleId": f"RULE{rng.randrange(50)}",
+                "level": rng.choice(("error", "warning", "note")),
+                "message": {"text": _sentence(rng, 20)},
+                "locations": [{"physicalLocation": {
+                    "artifactLocation": {"uri": _path(rng, i)},
+                    "region": {"startLine": rng.randint(1, 2000)},
+                }}],
+            }
+
+    header = {"$schema": "https://json.schemastore.org/sarif-2.1.0.json", "version": "2.1.0"}
+    fh.write(json.dumps(header)[:-1].encode())
+    fh.write(b', "runs": [{"tool": ')
+    fh.write(json.dumps({"driver": {"name": "Semgrep", "rules": rules}}).encode())
+    fh.write(b', "results": ')
+    _json_array(fh, results())
+    fh.write(b"}]}")
+
+
+def generic_json(fh: BinaryIO, count: int, rng: random.Random) -> None:
+    def findings() -> Iterator[dict]:
+        for i in range(count):
+            yield {
+                "title": _sentence(rng, 5),
+                "severity": rng.choice(SEVERITIES).lower(),
+                "description": _sentence(rng, 25),
+                "asset": f"host-{i % 200}.internal",
+                "file": _path(rng, i),
+                "line": rng.randint(1, 2000),
+                "cve": _cve(rng, i),
+                "cwe": f"CWE-{rng.randint(20, 900)}",
+                "cvss": round(rng.uniform(1, 10), 1),
+                "remediation": _sentence(rng, 8),
+            }
+
+    fh.write(b'{"findings": ')
+    _json_array(fh, findings())
+    fh.write(b"}")
+
+
+def generic_csv(fh: BinaryIO, count: int, rng: random.Random) -> None:
+    fh.write(b"title,severity,description,asset,file,line,cve,cwe,cvss,remediation\n")
+    for i in range(count):
+        row = (
+            _sentence(rng, 5), rng.choice(SEVERITIES).lower(), _sentence(rng, 25),
+            f"host-{i % 200}.internal", _path(rng, i), str(rng.randint(1, 2000)), _cve(rng, i),
+            f"CWE-{rng.randint(20, 900)}", str(round(rng.uniform(1, 10), 1)), _sentence(rng, 8),
+        )
+        fh.write((",".join(f'"{value}"' for value in row) + "\n").encode())
+
+
+def trufflehog(fh: BinaryIO, count: int, rng: random.Random) -> None:
+    for i in range(count):
+        record = {
+            "SourceMetadata": {"Data": {"Git": {
+                "commit": f"{rng.getrandbits(160):040x}",
+                "file": _path(rng, i),
+                "email": f"dev{i % 40}@example.com",
+                "repository": "https://github.com/example/app",
+                "timestamp": "2024-01-01 00:00:00 +0000",
+                "line": rng.randint(1, 500),
+                "link": f"https://github.com/example/app/blob/main/{i}",
+            }}},
+            "DetectorName": rng.choice(("AWS", "PrivateKey", "Github", "Slack")),
+            "Verified": rng.random() < 0.2,
+            "Raw": f"secret-{i}-{rng.getrandbits(64):016x}",
+            "Redacted": "****",
+        }
+        fh.write(json.dumps(record).encode() + b"\n")
+
+
+def nessus(fh: BinaryIO, count: int, rng: random.Random) -> None:
+    per_host = 50
+    fh.write(b'<?xml version="1.0" ?>\n<NessusClientData_v2><Report name="benchmark">')
+    for h, start in enumerate(range(0, count, per_host)):
+        fh.write(f'<ReportHost name="10.{h // 65536 % 256}.{h // 256 % 256}.{h % 256}"><HostProperties>'
+                 f'<tag name="operating-system">Linux</tag></HostProperties>'.encode())
+        for i in range(start, min(start + per_host, count)):
+            fh.write(
+                f'<ReportItem port="{rng.choice((22, 80, 443, 3306))}" svc_name="www" protocol="tcp" '
+                f'severity="{rng.randint(1, 4)}" pluginID="{10000 + i % 5000}" pluginName={quoteattr(_sentence(rng, 5))}>'
+                f"<description>{escape(_sentence(rng, 40))}</description>"
+                f"<synopsis>{escape(_sentence(rng, 8))}</synopsis>"
+                f"<solution>{escape(_sentence(rng, 8))}</solution>"
+                f"<cve>{_cve(rng, i)}</cve>"
+                f"<cvss3_base_score>{round(rng.uniform(1, 10), 1)}</cvss3_base_score>"
+                f"</ReportItem>".encode()
+            )
+        fh.write(b"</ReportHost>")
+    fh.write(b"</Report></NessusClientData_v2>")
+
+
+def zap(fh: BinaryIO, count: int, rng: random.Random) -> None:
+    per_alert = 10
+    fh.write(b'<?xml version="1.0"?><OWASPZAPReport version="2.14.0" generated="Mon, 1 Jan 2024">'
+             b'<site name="https://app.example.com" host="app.example.com" port="443" ssl="true"><alerts>')
+    for a, start in enumerate(range(0, count, per_alert)):
+        fh.write(
+            f"<alertitem><pluginid>{10000 + a % 300}</pluginid><name>{escape(_sentence(rng, 4))}</name>"
+            f"<riskcode>{rng.randint(0, 3)}</riskcode><confidence>2</confidence>"
+            f"<desc>{escape(_sentence(rng, 30))}</desc><solution>{escape(_sentence(rng, 10))}</solution>"
+            f"<cweid>{rng.randint(20, 900)}</cweid><instances>".encode()
+        )
+        for i in range(start, min(start + per_alert, count)):
+            fh.write(f"<instance><uri>https://app.example.com/{rng.choice(WORDS)}/{i}</uri>"
+                     f"<method>GET</method><param>q</param></instance>".encode())
+        fh.write(b"</instances></alertitem>")
+    fh.write(b"</alerts></site></OWASPZAPReport>")
+
+
+def burp(fh: BinaryIO, count: int, rng: random.Random) -> None:
+    fh.write(b'<?xml version="1.0"?><issues burpVersion="2023.10" exportTime="Mon Jan 01 00:00:00 UTC 2024">')
+    for i in range(count):
+        fh.write(
+            f"<issue><serialNumber>{i}</serialNumber><type>{1049088 + i % 40}</type>"
+            f"<name>{escape(_sentence(rng, 4))}</name><host ip=\"10.0.0.{i % 250}\">https://app.example.com</host>"
+            f"<path>/{rng.choice(WORDS)}/{i}</path><severity>{rng.choice(('High', 'Medium', 'Low', 'Information'))}</severity>"
+            f"<confidence>Certain</confidence><issueBackground>{escape(_sentence(rng, 40))}</issueBackground>"
+            f"<remediationBackground>{escape(_sentence(rng, 15))}</remediationBackground>"
+            f"<issueDetail>{escape(_sentence(rng, 20))}</issueDetail>"
+            f'<requestresponse><request method="GET" base64="true">{"R0VUIC8gSFRUUC8xLjENCg==" * 20}</request>'
+            f"</requestresponse></issue>".encode()
+        )
+    fh.write(b"</issues>")
+
+
+# case name -> (parser name, report filename, generator)
+CASES: Dict[str, tuple] = {
+    "sarif": ("sarif", "semgrep.sarif", sarif),
+    "cyclonedx": ("cyclonedx", "bom.json", cyclonedx),
+    "trivy": ("trivy", "trivy.json", trivy),
+    "nessus": ("nessus", "scan.nessus", nessus),
+    "zap": ("zap", "zap.xml", zap),
+    "burp": ("burp", "burp.xml", burp),
+    "generic-csv": ("generic-csv", "findings.csv", generic_csv),
+    "generic-json": ("generic-json", "findings.json", generic_json),
+    "trufflehog": ("trufflehog", "trufflehog.json", trufflehog),
+}
+
+
+def generate(case: str, fh: BinaryIO, count: int, seed: int = 0) -> None:
+    CASES[case][2](fh, count, random.Random(f"{case}:{seed}"))
@@ -0,0 +1,125 @@
+"""Measure parsers on generated reports and compare with a stored baseline."""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+import multiprocessing
+import resource
+import sys
+import time
+
+from .generators import CASES
+
+
+@dataclass
+class Result:
+    case: str
+    parser: str
+    findings: int
+    size_mb: float
+    seconds: float
+    findings_per_sec: float
+    mb_per_sec: float
+    peak_rss_mb: float
+    rss_growth_mb: float
+    detect_ms: float
+    detected: Optional[str]
+
+    def to_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+
+@dataclass
+class Thresholds:
+    """Allowed regression relative to the baseline, as fractions."""
+
+    throughput: float = 0.30
+    rss: float = 0.25
+    detect: float = 0.50
+    # Absolute slack so tiny baselines don't fail on timer noise
+    detect_ms: float = 5.0
+    rss_mb: float = 4.0
+
+
+def _rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _measure(case: str, path: str, repeat: int) -> Dict[str, object]:
+    # Runs in a fresh process, so peak RSS belongs to this case alone
+    from app.parsers import get_parser
+    from app.parsers.base import ParserRegistry
+    from app.parsers.detection import Probe
+
+    parser_name, filename, _ = CASES[case]
+    parser = get_parser(parser_name)
+    ParserRegistry.detection_index()
+    rss_before = _rss_mb()
+
+    detect_ms = None
+    for _ in range(repeat):
+        with open(path, "rb") as fh:
+            start = time.perf_counter()
+            detected = ParserRegistry.detect(Probe.sniff_file(fh, filename))
+            elapsed = (time.perf_counter() - start) * 1000
+        detect_ms = elapsed if detect_ms is None else min(detect_ms, elapsed)
+
+    best = None
+    findings = 0
+    for _ in range(repeat):
+        with open(path, "rb") as fh:
+            start = time.perf_counter()
+            findings = sum(1 for _ in parser.iter_parse(fh, filename))
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return {
+        "findings": findings,
+        "seconds": best,
+        "peak_rss_mb": _rss_mb(),
+        "rss_growth_mb": _rss_mb() - rss_before,
+        "detect_ms": detect_ms,
+        "detected": detected.name if detected else None,
+    }
+
+
+def measure(case: str, path: str, size_bytes: int, repeat: int = 3) -> Result:
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(1) as pool:
+        m = pool.apply(_measure, (case, path, repeat))
+    seconds = max(m["seconds"], 1e-9)
+    size_mb = size_bytes / (1024 * 1024)
+    return Result(
+        case=case,
+        parser=CASES[case][0],
+        findings=m["findings"],
+        size_mb=round(size_mb, 2),
+        seconds=round(seconds, 4),
+        findings_per_sec=round(m["findings"] / seconds, 1),
+        mb_per_sec=round(size_mb / seconds, 2),
+        peak_rss_mb=round(m["peak_rss_mb"], 1),
+        rss_growth_mb=round(m["rss_growth_mb"], 1),
+        detect_ms=round(m["detect_ms"], 2),
+        detected=m["detected"],
+    )
+
+
+def compare(result: Result, baseline: Dict[str, object], limits: Thresholds) -> List[str]:
+    """Regressions of ``result`` against its baseline entry, as messages."""
+    problems = []
+    if result.findings != baseline["findings"]:
+        problems.append(f"found {result.findings} findings, baseline {baseline['findings']}")
+    if result.detected != baseline["detected"]:
+        problems.append(f"detected as {result.detected}, baseline {baseline['detected']}")
+    floor = baseline["findings_per_sec"] * (1 - limits.throughput)
+    if result.findings_per_sec < floor:
+        problems.append(f"{result.findings_per_sec:.0f} findings/s, below {floor:.0f}")
+    ceiling = max(baseline["peak_rss_mb"] * (1 + limits.rss), baseline["peak_rss_mb"] + limits.rss_mb)
+    if result.peak_rss_mb > ceiling:
+        problems.append(f"peak RSS {result.peak_rss_mb} MB, above {ceiling:.1f} MB")
+    ceiling = max(baseline["detect_ms"] * (1 + limits.detect), baseline["detect_ms"] + limits.detect_ms)
+    if result.detect_ms > ceiling:
+        problems.append(f"detection {result.detect_ms} ms, above {ceiling:.1f} ms")
+    return problems
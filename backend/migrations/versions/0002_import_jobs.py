@@ -0,0 +1,45 @@
+"""Import jobs
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "import_jobs",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False, server_default="queued"),
+        sa.Column("parser", sa.String(), nullable=True),
+        sa.Column("filename", sa.String(), nullable=True),
+        sa.Column("default_asset", sa.String(), nullable=True),
+        sa.Column("default_exposure", sa.String(), nullable=False, server_default="internal"),
+        sa.Column("default_criticality", sa.String(), nullable=False, server_default="medium"),
+        sa.Column("content", sa.LargeBinary(), nullable=True),
+        sa.Column("parsed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("imported", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("new_findings", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("deduplicated", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("worker_id", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_import_jobs_status", "import_jobs", ["status"])
+    op.create_index("ix_import_jobs_created_at", "import_jobs", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_table("import_jobs")
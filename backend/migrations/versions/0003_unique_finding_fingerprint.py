@@ -0,0 +1,65 @@
+"""Unique finding fingerprint
+
+Merges findings that share a fingerprint into the oldest row (summing
+occurrences, keeping the highest risk score and the latest sighting) and
+replaces the plain fingerprint index with a unique one.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    duplicates = conn.execute(sa.text(
+        "SELECT fingerprint FROM findings GROUP BY fingerprint HAVING COUNT(*) > 1"
+    )).scalars().all()
+
+    for fp in duplicates:
+        rows = conn.execute(sa.text(
+            "SELECT id, occurrences, risk_score, first_seen, last_seen, signal_id "
+            "FROM findings WHERE fingerprint = :fp ORDER BY first_seen, id"
+        ), {"fp": fp}).all()
+        keep, others = rows[0], rows[1:]
+        latest = max(rows, key=lambda r: r.last_seen)
+        other_ids = [r.id for r in others]
+
+        conn.execute(sa.text(
+            "UPDATE findings SET occurrences = :occurrences, risk_score = :risk_score, "
+            "last_seen = :last_seen, signal_id = :signal_id WHERE id = :id"
+        ), {
+            "id": keep.id,
+            "occurrences": sum(r.occurrences or 1 for r in rows),
+            "risk_score": max(r.risk_score or 0 for r in rows),
+            "last_seen": latest.last_seen,
+            "signal_id": latest.signal_id,
+        })
+        conn.execute(
+            sa.text("UPDATE comments SET finding_id = :keep WHERE finding_id IN :ids")
+            .bindparams(sa.bindparam("ids", expanding=True)),
+            {"keep": keep.id, "ids": other_ids},
+        )
+        conn.execute(
+            sa.text("DELETE FROM findings WHERE id IN :ids")
+            .bindparams(sa.bindparam("ids", expanding=True)),
+            {"ids": other_ids},
+        )
+
+    op.drop_index("ix_findings_fingerprint", table_name="findings")
+    op.create_index("ix_findings_fingerprint", "findings", ["fingerprint"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_findings_fingerprint", table_name="findings")
+    op.create_index("ix_findings_fingerprint", "findings", ["fingerprint"])
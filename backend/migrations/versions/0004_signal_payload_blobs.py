@@ -0,0 +1,102 @@
+"""Content-addressed signal payloads
+
+Moves signals.payload into signal_payloads, one zlib-compressed row per
+distinct canonical JSON document, and leaves signals with a payload_hash.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from datetime import datetime
+from typing import Sequence, Union
+import hashlib
+import json
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+def _canonical(text: str) -> bytes:
+    try:
+        payload = json.loads(text)
+    except (TypeError, ValueError):
+        payload = text
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "signal_payloads",
+        sa.Column("hash", sa.String(64), nullable=False),
+        sa.Column("codec", sa.String(), nullable=False, server_default="zlib"),
+        sa.Column("size", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("hash"),
+    )
+    op.add_column("signals", sa.Column("payload_hash", sa.String(64), nullable=True))
+
+    conn = op.get_bind()
+    seen: set[str] = set()
+    last_id = ""
+    while True:
+        rows = conn.execute(sa.text(
+            "SELECT id, payload FROM signals WHERE id > :last_id ORDER BY id LIMIT :limit"
+        ), {"last_id": last_id, "limit": BATCH_SIZE}).all()
+        if not rows:
+            break
+        now = datetime.utcnow()
+        blobs = []
+        updates = []
+        for r in rows:
+            raw = _canonical(r.payload)
+            digest = hashlib.sha256(raw).hexdigest()
+            if digest not in seen:
+                seen.add(digest)
+                blobs.append({"hash": digest, "codec": "zlib", "size": len(raw), "data": zlib.compress(raw, 6), "created_at": now})
+            updates.append({"id": r.id, "payload_hash": digest})
+        if blobs:
+            conn.execute(sa.text(
+                "INSERT INTO signal_payloads (hash, codec, size, data, created_at) "
+                "VALUES (:hash, :codec, :size, :data, :created_at)"
+            ), blobs)
+        conn.execute(sa.text("UPDATE signals SET payload_hash = :payload_hash WHERE id = :id"), updates)
+        last_id = rows[-1].id
+
+    with op.batch_alter_table("signals") as batch:
+        batch.drop_column("payload")
+        batch.alter_column("payload_hash", existing_type=sa.String(64), nullable=False)
+        batch.create_foreign_key("fk_signals_payload_hash", "signal_payloads", ["payload_hash"], ["hash"])
+    op.create_index("ix_signals_payload_hash", "signals", ["payload_hash"])
+
+
+def downgrade() -> None:
+    op.add_column("signals", sa.Column("payload", sa.Text(), nullable=True))
+
+    conn = op.get_bind()
+    blobs = conn.execute(sa.text("SELECT hash, codec, data FROM signal_payloads")).all()
+    for b in blobs:
+        if b.codec == "zstd":
+            import zstandard
+            raw = zstandard.ZstdDecompressor().decompress(b.data)
+        else:
+            raw = zlib.decompress(b.data)
+        conn.execute(
+            sa.text("UPDATE signals SET payload = :payload WHERE payload_hash = :hash"),
+            {"payload": raw.decode("utf-8"), "hash": b.hash},
+        )
+
+    op.drop_index("ix_signals_payload_hash", table_name="signals")
+    with op.batch_alter_table("signals") as batch:
+        batch.drop_constraint("fk_signals_payload_hash", type_="foreignkey")
+        batch.drop_column("payload_hash")
+        batch.alter_column("payload", existing_type=sa.Text(), nullable=False)
+    op.drop_table("signal_payloads")
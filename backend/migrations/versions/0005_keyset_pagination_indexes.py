@@ -0,0 +1,24 @@
+"""Keyset pagination indexes
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_findings_last_seen_id", "findings", ["last_seen", "id"])
+    op.create_index("ix_assets_updated_at_id", "assets", ["updated_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_assets_updated_at_id", table_name="assets")
+    op.drop_index("ix_findings_last_seen_id", table_name="findings")
@@ -0,0 +1,49 @@
+"""Finding filter and sort indexes
+
+Adds composite indexes for the /findings access paths and drops the
+single-column indexes they make redundant.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COMPOSITE_INDEXES = {
+    "ix_findings_risk_score_id": ["risk_score", "id"],
+    "ix_findings_status_last_seen_id": ["status", "last_seen", "id"],
+    "ix_findings_status_risk_score_id": ["status", "risk_score", "id"],
+    "ix_findings_severity_status": ["severity", "status"],
+    "ix_findings_asset_id_status": ["asset_id", "status"],
+    "ix_findings_tool_status": ["tool", "status"],
+    "ix_findings_assignee_status": ["assignee", "status"],
+    "ix_findings_cwe_id": ["cwe_id"],
+}
+
+REDUNDANT_INDEXES = {
+    "ix_findings_status": ["status"],
+    "ix_findings_tool": ["tool"],
+    "ix_findings_assignee": ["assignee"],
+    "ix_findings_asset_id": ["asset_id"],
+}
+
+
+def upgrade() -> None:
+    for name, columns in COMPOSITE_INDEXES.items():
+        op.create_index(name, "findings", columns)
+    for name in REDUNDANT_INDEXES:
+        op.drop_index(name, table_name="findings")
+
+
+def downgrade() -> None:
+    for name, columns in REDUNDANT_INDEXES.items():
+        op.create_index(name, "findings", columns)
+    for name in COMPOSITE_INDEXES:
+        op.drop_index(name, table_name="findings")
@@ -0,0 +1,56 @@
+"""Asset risk rollups
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "asset_risk_rollups",
+        sa.Column("asset", sa.String(), nullable=False),
+        sa.Column("asset_id", sa.String(), nullable=True),
+        sa.Column("open_findings", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_risk", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("risk_sum", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("critical_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("high_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("medium_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("low_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("info_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("asset"),
+    )
+    op.create_index("ix_asset_risk_rollups_max_risk", "asset_risk_rollups", ["max_risk"])
+
+    op.execute("""
+        INSERT INTO asset_risk_rollups (
+            asset, asset_id, open_findings, max_risk, risk_sum,
+            critical_count, high_count, medium_count, low_count, info_count, updated_at
+        )
+        SELECT
+            asset, MAX(asset_id), COUNT(*), MAX(risk_score), SUM(risk_score),
+            SUM(CASE WHEN LOWER(severity) = 'critical' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN LOWER(severity) = 'high' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN LOWER(severity) = 'medium' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN LOWER(severity) = 'low' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN LOWER(severity) = 'info' THEN 1 ELSE 0 END),
+            MAX(last_seen)
+        FROM findings
+        WHERE status = 'open'
+        GROUP BY asset
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("asset_risk_rollups")
@@ -0,0 +1,34 @@
+"""Jira issue keys on findings and integration sync cursors
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("findings", sa.Column("jira_issue_key", sa.String(), nullable=True))
+    op.create_index("ix_findings_jira_issue_key", "findings", ["jira_issue_key"])
+    op.create_table(
+        "integration_cursors",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("value", sa.String(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("integration_cursors")
+    op.drop_index("ix_findings_jira_issue_key", table_name="findings")
+    with op.batch_alter_table("findings") as batch:
+        batch.drop_column("jira_issue_key")
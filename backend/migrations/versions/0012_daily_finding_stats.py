@@ -0,0 +1,38 @@
+"""Daily finding stats
+
+History is filled in afterwards with ``python -m app.trends backfill``.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_finding_stats",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("severity", sa.String(), nullable=False),
+        sa.Column("tool", sa.String(), nullable=False),
+        sa.Column("asset", sa.String(), nullable=False),
+        sa.Column("opened", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("reopened", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("closed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("resolved", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("risk_delta", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("day", "severity", "tool", "asset"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("daily_finding_stats")
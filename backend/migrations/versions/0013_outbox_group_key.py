@@ -0,0 +1,26 @@
+"""Outbox group key for per-chunk import digests
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0013"
+down_revision: Union[str, None] = "0012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("notification_outbox", sa.Column("group_key", sa.String(), nullable=True))
+    op.create_index("ix_notification_outbox_group_key", "notification_outbox", ["group_key"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notification_outbox_group_key", table_name="notification_outbox")
+    with op.batch_alter_table("notification_outbox") as batch:
+        batch.drop_column("group_key")
@@ -0,0 +1,39 @@
+"""Store queued import reports in chunks
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0014"
+down_revision: Union[str, None] = "0013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "import_job_chunks",
+        sa.Column("job_id", sa.String(), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["import_jobs.id"]),
+        sa.PrimaryKeyConstraint("job_id", "seq"),
+    )
+    # Jobs still queued keep their report as a single chunk
+    op.execute("""
+        INSERT INTO import_job_chunks (job_id, seq, data)
+        SELECT id, 0, content FROM import_jobs WHERE content IS NOT NULL
+    """)
+    with op.batch_alter_table("import_jobs") as batch:
+        batch.drop_column("content")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("import_jobs") as batch:
+        batch.add_column(sa.Column("content", sa.LargeBinary(), nullable=True))
+    op.drop_table("import_job_chunks")
@@ -0,0 +1,28 @@
+"""Import job lease heartbeats
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0015"
+down_revision: Union[str, None] = "0014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("import_jobs", sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("import_jobs", sa.Column("heartbeat_at", sa.DateTime(), nullable=True))
+    # Jobs already stuck in running are reclaimed by the first worker to look
+    op.execute("UPDATE import_jobs SET attempts = 1 WHERE status = 'running'")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("import_jobs") as batch:
+        batch.drop_column("heartbeat_at")
+        batch.drop_column("attempts")
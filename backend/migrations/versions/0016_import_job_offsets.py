@@ -0,0 +1,26 @@
+"""Import job committed offset
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0016"
+down_revision: Union[str, None] = "0015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("import_jobs", sa.Column("committed", sa.Integer(), nullable=False, server_default="0"))
+    # Running jobs committed everything they imported so far
+    op.execute("UPDATE import_jobs SET committed = parsed WHERE status = 'running'")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("import_jobs") as batch:
+        batch.drop_column("committed")
@@ -0,0 +1 @@
+"""Local stand-ins for external services, for trying integrations without real accounts."""
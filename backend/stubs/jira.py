@@ -0,0 +1,214 @@
+"""In-memory Jira Cloud stub: ``python -m stubs.jira`` from the backend directory.
+
+    python -m stubs.jira --port 8090 --project SEC
+    JIRA_BASE_URL=http://127.0.0.1:8090 JIRA_EMAIL=stub JIRA_API_TOKEN=stub JIRA_PROJECT_KEY=SEC ...
+
+Covers what the dashboard uses: single and bulk issue creation, the
+``/search/jql`` endpoint with the JQL the dashboard sends (``project =``,
+``labels =``, ``labels in (...)``, ``updated >= "-Nm"``, ``ORDER BY``) and
+token paging, and transitions so issue status can be changed by hand:
+
+    curl -u stub:stub -X POST localhost:8090/rest/api/3/issue/SEC-1/transitions \\
+        -H 'Content-Type: application/json' -d '{"transition": {"id": "31"}}'
+
+Any Basic credentials are accepted. ``--rate-limit N`` answers 429 with
+Retry-After once more than N requests arrive in a second.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+import argparse
+import re
+import time
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse
+
+STATUSES = {
+    "11": ("To Do", "new"),
+    "21": ("In Progress", "indeterminate"),
+    "31": ("Done", "done"),
+}
+
+_CLAUSE = re.compile(
+    r'\s*(?:'
+    r'(?P<field>project|labels)\s*=\s*"(?P<value>(?:[^"\\]|\\.)*)"'
+    r'|labels\s+in\s*\((?P<values>[^)]*)\)'
+    r'|updated\s*>=\s*"-(?P<minutes>\d+)m"'
+    r')\s*',
+    re.IGNORECASE,
+)
+_STRING = re.compile(r'"((?:[^"\\]|\\.)*)"')
+
+
+def _unquote(value: str) -> str:
+    return re.sub(r"\\(.)", r"\1", value)
+
+
+def _jira_time(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}+0000"
+
+
+def parse_jql(jql: str) -> tuple[list, Optional[tuple[str, bool]]]:
+    """(predicates, (order field, descending)) for the supported JQL subset."""
+    where, order = (re.split(r"\s+ORDER\s+BY\s+", jql, maxsplit=1, flags=re.IGNORECASE) + [""])[:2]
+    predicates = []
+    for clause in re.split(r"\s+AND\s+", where.strip(), flags=re.IGNORECASE) if where.strip() else []:
+        m = _CLAUSE.fullmatch(clause)
+        if m is None:
+            raise ValueError(f"Unsupported JQL clause: {clause!r}")
+        if m["field"] and m["field"].lower() == "project":
+            key = _unquote(m["value"])
+            predicates.append(lambda issue, key=key: issue["project"] == key)
+        elif m["field"]:
+            label = _unquote(m["value"])
+            predicates.append(lambda issue, label=label: label in issue["labels"])
+        elif m["values"] is not None:
+            labels = {_unquote(v) for v in _STRING.findall(m["values"])}
+            predicates.append(lambda issue, labels=labels: bool(labels & set(issue["labels"])))
+        else:
+            cutoff = datetime.now(timezone.utc) - timedelta(minutes=int(m["minutes"]))
+            predicates.append(lambda issue, cutoff=cutoff: issue["updated"] >= cutoff)
+    sort = None
+    if order.strip():
+        field, _, direction = order.strip().partition(" ")
+        sort = (field.lower(), direction.strip().upper() == "DESC")
+    return predicates, sort
+
+
+class JiraStub:
+    def __init__(self, project: str, rate_limit: int = 0):
+        self.project = project
+        self.rate_limit = rate_limit
+        self.issues: dict[str, dict] = {}
+        self._next_id = 10000
+        self._window = (0, 0)
+
+    def throttled(self) -> bool:
+        if not self.rate_limit:
+            return False
+        second, count = self._window
+        now = int(time.time())
+        self._window = (now, count + 1) if now == second else (now, 1)
+        return self._window[1] > self.rate_limit
+
+    def create(self, body: dict) -> tuple[Optional[dict], Optional[dict]]:
+        fields = body.get("fields") or {}
+        errors = {}
+        if (fields.get("project") or {}).get("key") != self.project:
+            errors["project"] = "valid project is required"
+        if not (fields.get("summary") or "").strip():
+            errors["summary"] = "You must specify a summary of the issue."
+        if errors:
+            return None, {"errorMessages": [], "errors": errors}
+        self._next_id += 1
+        key = f"{self.project}-{self._next_id - 10000}"
+        now = datetime.now(timezone.utc)
+        self.issues[key] = {
+            "id": str(self._next_id),
+            "key": key,
+            "project": self.project,
+            "summary": fields["summary"],
+            "labels": list(fields.get("labels") or []),
+            "status": "11",
+            "created": now,
+            "updated": now,
+        }
+        return {"id": str(self._next_id), "key": key, "self": f"/rest/api/3/issue/{self._next_id}"}, None
+
+    def view(self, issue: dict, fields: list[str]) -> dict:
+        name, category = STATUSES[issue["status"]]
+        values = {
+            "summary": issue["summary"],
+            "labels": issue["labels"],
+            "status": {"id": issue["status"], "name": name, "statusCategory": {"key": category}},
+            "created": _jira_time(issue["created"]),
+            "updated": _jira_time(issue["updated"]),
+        }
+        return {"id": issue["id"], "key": issue["key"], "fields": {f: values[f] for f in fields if f in values}}
+
+
+def create_app(project: str = "SEC", rate_limit: int = 0) -> FastAPI:
+    app = FastAPI(title="Jira stub")
+    stub = app.state.stub = JiraStub(project, rate_limit)
+
+    @app.middleware("http")
+    async def auth_and_rate_limit(request: Request, call_next):
+        if not request.headers.get("Authorization", "").startswith("Basic "):
+            return JSONResponse({"errorMessages": ["Unauthorized"]}, status_code=401)
+        if stub.throttled():
+            return JSONResponse({"errorMessages": ["Rate limit exceeded"]}, status_code=429, headers={"Retry-After": "1"})
+        return await call_next(request)
+
+    @app.post("/rest/api/3/issue", status_code=201)
+    async def create_issue(body: dict):
+        created, error = stub.create(body)
+        if error:
+            return JSONResponse(error, status_code=400)
+        return created
+
+    @app.post("/rest/api/3/issue/bulk", status_code=201)
+    async def create_issues(body: dict):
+        updates = body.get("issueUpdates") or []
+        if len(updates) > 50:
+            return JSONResponse({"errorMessages": ["Too many issues (max 50)"]}, status_code=400)
+        issues, errors = [], []
+        for i, update in enumerate(updates):
+            created, error = stub.create(update)
+            if error:
+                errors.append({"status": 400, "elementErrors": error, "failedElementNumber": i})
+            else:
+                issues.append(created)
+        return JSONResponse({"issues": issues, "errors": errors}, status_code=400 if not issues else 201)
+
+    @app.post("/rest/api/3/search/jql")
+    async def search(body: dict):
+        try:
+            predicates, sort = parse_jql(body.get("jql") or "")
+        except ValueError as e:
+            return JSONResponse({"errorMessages": [str(e)]}, status_code=400)
+        matches = [i for i in stub.issues.values() if all(p(i) for p in predicates)]
+        if sort:
+            field, descending = sort
+            matches.sort(key=lambda i: i.get(field) or i["id"], reverse=descending)
+        start = int(body.get("nextPageToken") or 0)
+        size = min(int(body.get("maxResults") or 50), 100)
+        page = matches[start:start + size]
+        fields = body.get("fields") or ["summary", "status"]
+        result = {"issues": [stub.view(i, fields) for i in page], "isLast": start + size >= len(matches)}
+        if not result["isLast"]:
+            result["nextPageToken"] = str(start + size)
+        return result
+
+    @app.get("/rest/api/3/issue/{key}/transitions")
+    async def transitions(key: str):
+        if key not in stub.issues:
+            raise HTTPException(status_code=404, detail="Issue does not exist")
+        return {"transitions": [
+            {"id": tid, "name": name, "to": {"name": name, "statusCategory": {"key": category}}}
+            for tid, (name, category) in STATUSES.items()
+        ]}
+
+    @app.post("/rest/api/3/issue/{key}/transitions", status_code=204)
+    async def transition(key: str, body: dict):
+        issue = stub.issues.get(key)
+        if issue is None:
+            raise HTTPException(status_code=404, detail="Issue does not exist")
+        tid = str((body.get("transition") or {}).get("id"))
+        if tid not in STATUSES:
+            return JSONResponse({"errorMessages": [f"Transition {tid} is not valid"]}, status_code=400)
+        issue["status"] = tid
+        issue["updated"] = datetime.now(timezone.utc)
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(prog="python -m stubs.jira", description="In-memory Jira Cloud stub")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--project", default="SEC")
+    parser.add_argument("--rate-limit", type=int, default=0, help="requests per second before 429 (default: off)")
+    args = parser.parse_args()
+    uvicorn.run(create_app(args.project, args.rate_limit), host=args.host, port=args.port, log_level="warning")
@@ -0,0 +1,31 @@
+"""Tests run against a throwaway SQLite database; run ``pytest`` from the backend directory."""
+import os
+import tempfile
+
+_DB_DIR = tempfile.mkdtemp(prefix="secops-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/test.db"
+os.environ["IMPORT_WORKERS"] = "0"
+os.environ["OUTBOX_DISPATCHER"] = "0"
+os.environ["JIRA_RECONCILE_INTERVAL"] = "0"
+for _name in ("SLACK_WEBHOOK_URL", "JIRA_BASE_URL", "JIRA_EMAIL", "JIRA_API_TOKEN", "JIRA_PROJECT_KEY"):
+    os.environ.pop(_name, None)
+
+import pytest
+
+from app.db import Base, SessionLocal, engine
+
+
+@pytest.fixture(autouse=True)
+def _schema():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
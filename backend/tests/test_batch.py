@@ -0,0 +1,61 @@
+import json
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlalchemy import func, select
+
+from app import batch
+from app.models import Finding
+
+
+def _trivy(tmp_path, name: str, count: int) -> batch.ReportFile:
+    vulns = [
+        {"VulnerabilityID": f"CVE-2024-{i}", "PkgName": "openssl", "InstalledVersion": "1", "Severity": "HIGH", "Title": f"t{i}"}
+        for i in range(count)
+    ]
+    report = {"SchemaVersion": 2, "ArtifactName": name, "Results": [{"Target": name, "Vulnerabilities": vulns}]}
+    path = tmp_path / f"{name}.json"
+    path.write_text(json.dumps(report))
+    return batch.ReportFile(f"{name}.json", str(path))
+
+
+def test_findings_are_handed_back_in_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch, "INGEST_CHUNK_SIZE", 2)
+    report = _trivy(tmp_path, "img", 5)
+
+    name, path, parsed, _, _, error = batch._parse_report(report.path, report.filename, None, str(tmp_path))
+
+    assert (name, parsed, error) == ("trivy", 5, None)
+    sizes = []
+    with open(path, "rb") as fh:
+        while True:
+            try:
+                sizes.append(len(pickle.load(fh)))
+            except EOFError:
+                break
+    assert sizes == [2, 2, 1]
+    assert [f.cve_id for f in batch._read_findings(path)] == [f"CVE-2024-{i}" for i in range(5)]
+
+
+def test_batch_is_parsed_in_the_pool_and_ingested(db, tmp_path, monkeypatch):
+    spool = tmp_path / "spool"
+    spool.mkdir()
+    monkeypatch.setattr(batch, "UPLOAD_SPOOL_DIR", str(spool))
+    reports = [_trivy(tmp_path, "a", 3), _trivy(tmp_path, "b", 4)]
+    broken = tmp_path / "broken.json"
+    broken.write_text("{")
+    reports.append(batch.ReportFile("broken.json", str(broken)))
+
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        result = batch.import_reports(db, reports, parser="trivy", pool=pool)
+
+    assert [(f.filename, f.status, f.parsed, f.new_findings) for f in result.files] == [
+        ("a.json", "completed", 3, 3),
+        ("b.json", "completed", 4, 4),
+        ("broken.json", "failed", 0, 0),
+    ]
+    assert result.imported == 7
+    assert db.execute(select(func.count()).select_from(Finding)).scalar_one() == 7
+    # The findings files are removed once ingested
+    assert list(spool.iterdir()) == []
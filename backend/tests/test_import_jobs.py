@@ -0,0 +1,270 @@
+import functools
+import gzip
+import hashlib
+import io
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+
+from app import jobs, uploads
+from app.ingest import BulkIngestor
+from app.models import AssetRiskRollup, DailyFindingStat, Finding, ImportJob, ImportJobChunk, NotificationOutbox
+
+
+def _trivy(count: int) -> bytes:
+    vulns = [
+        {
+            "VulnerabilityID": f"CVE-2024-{i}",
+            "PkgName": "openssl",
+            "InstalledVersion": "1",
+            "Severity": "CRITICAL",
+            "Title": f"t{i}",
+            "Description": hashlib.sha256(str(i).encode()).hexdigest(),
+        }
+        for i in range(count)
+    ]
+    report = {"SchemaVersion": 2, "ArtifactName": "img:1", "Results": [{"Target": "img:1 (debian)", "Vulnerabilities": vulns}]}
+    return json.dumps(report).encode()
+
+
+def _enqueue(db, content: bytes) -> str:
+    return jobs.enqueue_import(db, io.BytesIO(content), parser="trivy", filename="trivy.json").id
+
+
+@pytest.fixture
+def slack(monkeypatch):
+    monkeypatch.setenv("SLACK_WEBHOOK_URL", "http://127.0.0.1:9/hook")
+    monkeypatch.setattr(jobs, "BulkIngestor", functools.partial(BulkIngestor, chunk_size=2))
+
+
+def _fail_after(n: int):
+    real_retain = jobs.retain
+
+    def retain(findings, parser_name, stats):
+        for i, pf in enumerate(real_retain(findings, parser_name, stats)):
+            if i == n:
+                raise RuntimeError("parser blew up")
+            yield pf
+
+    return retain
+
+
+def test_failed_job_keeps_notifications_for_committed_chunks(db, slack, monkeypatch):
+    monkeypatch.setattr(jobs, "retain", _fail_after(3))
+    job_id = _enqueue(db, _trivy(5))
+    jobs.run_import_job(job_id)
+
+    db.expire_all()
+    assert db.get(ImportJob, job_id).status == "failed"
+    # The first chunk of two committed; the third finding was rolled back
+    notified = db.execute(select(Finding).where(Finding.last_notified_at.is_not(None))).scalars().all()
+    assert len(notified) == 2
+    rows = db.execute(select(NotificationOutbox)).scalars().all()
+    assert len(rows) == 1
+    assert rows[0].group_key is None
+    assert len(json.loads(rows[0].payload)["notifications"]) == 2
+
+
+def test_completed_job_sends_one_digest(db, slack):
+    job_id = _enqueue(db, _trivy(5))
+    jobs.run_import_job(job_id)
+
+    db.expire_all()
+    assert db.get(ImportJob, job_id).status == "completed"
+    rows = db.execute(select(NotificationOutbox)).scalars().all()
+    assert [r.kind for r in rows] == ["digest"]
+    assert len(json.loads(rows[0].payload)["notifications"]) == 5
+
+
+def test_reimport_after_failure_notifies_only_rolled_back_findings(db, slack, monkeypatch):
+    monkeypatch.setattr(jobs, "retain", _fail_after(3))
+    jobs.run_import_job(_enqueue(db, _trivy(5)))
+    monkeypatch.undo()
+    monkeypatch.setenv("SLACK_WEBHOOK_URL", "http://127.0.0.1:9/hook")
+    monkeypatch.setattr(jobs, "BulkIngestor", functools.partial(BulkIngestor, chunk_size=2))
+
+    jobs.run_import_job(_enqueue(db, _trivy(5)))
+
+    db.expire_all()
+    payloads = [json.loads(r.payload) for r in db.execute(select(NotificationOutbox)).scalars()]
+    # Two findings were notified by the failed job; the cooldown suppresses them on the second import
+    assert sorted(len(p["notifications"]) for p in payloads) == [2, 3]
+    assert len({n["finding_id"] for p in payloads for n in p["notifications"]}) == 5
+    assert db.execute(select(func.count()).select_from(Finding)).scalar_one() == 5
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_report_is_stored_and_read_back_in_chunks(db, monkeypatch, compress):
+    monkeypatch.setattr(uploads, "UPLOAD_CHUNK_SIZE", 256)
+    report = _trivy(500)
+    job_id = _enqueue(db, gzip.compress(report) if compress else report)
+
+    chunks = db.execute(select(ImportJobChunk.data).where(ImportJobChunk.job_id == job_id)).scalars().all()
+    assert len(chunks) > 1
+    assert gzip.decompress(b"".join(chunks)) == report
+
+    jobs.run_import_job(job_id)
+    db.expire_all()
+    assert db.get(ImportJob, job_id).new_findings == 500
+    assert db.execute(select(func.count()).select_from(ImportJobChunk)).scalar_one() == 0
+
+
+def test_failed_job_error_reports_kept_findings(db, slack, monkeypatch):
+    monkeypatch.setattr(jobs, "retain", _fail_after(3))
+    job_id = _enqueue(db, _trivy(5))
+    jobs.run_import_job(job_id)
+
+    db.expire_all()
+    error = db.get(ImportJob, job_id).error
+    assert error.startswith("parser blew up")
+    assert "2 findings from earlier chunks were kept" in error
+
+
+def _age_lease(db, job_id: str, seconds: float) -> None:
+    db.execute(
+        update(ImportJob)
+        .where(ImportJob.id == job_id)
+        .values(heartbeat_at=datetime.utcnow() - timedelta(seconds=seconds))
+    )
+    db.commit()
+
+
+def test_expired_lease_is_reclaimed(db):
+    job_id = _enqueue(db, _trivy(1))
+    assert jobs.lease_next_job(db, "worker-a") == job_id
+    # Still fresh: nobody else may take it
+    assert jobs.lease_next_job(db, "worker-b") is None
+
+    _age_lease(db, job_id, jobs.IMPORT_LEASE_SECONDS + 1)
+    assert jobs.lease_next_job(db, "worker-b") == job_id
+    db.expire_all()
+    job = db.get(ImportJob, job_id)
+    assert (job.status, job.worker_id, job.attempts) == ("running", "worker-b", 2)
+
+
+def test_job_is_failed_after_max_attempts(db, monkeypatch):
+    monkeypatch.setattr(jobs, "IMPORT_MAX_ATTEMPTS", 2)
+    job_id = _enqueue(db, _trivy(1))
+    for worker in ("worker-a", "worker-b"):
+        assert jobs.lease_next_job(db, worker) == job_id
+        _age_lease(db, job_id, jobs.IMPORT_LEASE_SECONDS + 1)
+
+    assert jobs.lease_next_job(db, "worker-c") is None
+    db.expire_all()
+    job = db.get(ImportJob, job_id)
+    assert job.status == "failed"
+    assert "lost 2 times" in job.error
+    assert db.execute(select(func.count()).select_from(ImportJobChunk)).scalar_one() == 0
+
+
+def test_heartbeat_renews_lease_and_notices_reclaim(db):
+    job_id = _enqueue(db, _trivy(1))
+    jobs.lease_next_job(db, "worker-a")
+    _age_lease(db, job_id, 60)
+
+    with jobs._Heartbeat(job_id, "worker-a", interval=0.01) as heartbeat:
+        time.sleep(0.1)
+        heartbeat.check()
+    db.expire_all()
+    assert datetime.utcnow() - db.get(ImportJob, job_id).heartbeat_at < timedelta(seconds=5)
+
+    db.execute(update(ImportJob).where(ImportJob.id == job_id).values(worker_id="worker-b"))
+    db.commit()
+    with jobs._Heartbeat(job_id, "worker-a", interval=0.01) as heartbeat:
+        time.sleep(0.1)
+        with pytest.raises(jobs.LeaseLost):
+            heartbeat.check()
+
+
+def test_reclaimed_job_is_not_marked_failed_by_the_old_worker(db, monkeypatch):
+    job_id = _enqueue(db, _trivy(3))
+    jobs.lease_next_job(db, "worker-a")
+    db.execute(update(ImportJob).where(ImportJob.id == job_id).values(worker_id="worker-b"))
+    db.commit()
+    monkeypatch.setattr(jobs, "_Heartbeat", functools.partial(jobs._Heartbeat, interval=0.01))
+    monkeypatch.setattr(jobs, "retain", _slow(0.05))
+
+    jobs.run_import_job(job_id, "worker-a")
+    db.expire_all()
+    job = db.get(ImportJob, job_id)
+    assert (job.status, job.worker_id, job.error) == ("running", "worker-b", None)
+
+
+def _slow(delay: float):
+    real_retain = jobs.retain
+
+    def retain(findings, parser_name, stats):
+        for pf in real_retain(findings, parser_name, stats):
+            time.sleep(delay)
+            yield pf
+
+    return retain
+
+
+class _Killed(BaseException):
+    """Stands in for the worker process dying: nothing in run_import_job handles it."""
+
+
+def _killed_after(n: int):
+    real_retain = jobs.retain
+
+    def retain(findings, parser_name, stats):
+        for i, pf in enumerate(real_retain(findings, parser_name, stats)):
+            if i == n:
+                raise _Killed()
+            yield pf
+
+    return retain
+
+
+def test_reclaimed_job_resumes_after_committed_chunks(db, slack, monkeypatch):
+    job_id = _enqueue(db, _trivy(5))
+    assert jobs.lease_next_job(db, "worker-a") == job_id
+    with monkeypatch.context() as m:
+        m.setattr(jobs, "retain", _killed_after(3))
+        with pytest.raises(_Killed):
+            jobs.run_import_job(job_id, "worker-a")
+
+    db.expire_all()
+    job = db.get(ImportJob, job_id)
+    assert (job.status, job.committed, job.imported) == ("running", 2, 2)
+
+    _age_lease(db, job_id, jobs.IMPORT_LEASE_SECONDS + 1)
+    assert jobs.lease_next_job(db, "worker-b") == job_id
+    jobs.run_import_job(job_id, "worker-b")
+
+    db.expire_all()
+    job = db.get(ImportJob, job_id)
+    assert (job.status, job.committed) == ("completed", 5)
+    assert (job.imported, job.new_findings, job.deduplicated) == (5, 5, 0)
+    assert db.execute(select(Finding.occurrences)).scalars().all() == [1] * 5
+    assert db.execute(select(AssetRiskRollup.open_findings)).scalar_one() == 5
+    assert db.execute(select(func.sum(DailyFindingStat.opened))).scalar_one() == 5
+    rows = db.execute(select(NotificationOutbox)).scalars().all()
+    assert [r.kind for r in rows] == ["digest"]
+    notified = [n["finding_id"] for n in json.loads(rows[0].payload)["notifications"]]
+    assert len(notified) == len(set(notified)) == 5
+
+
+def test_chunk_of_a_worker_whose_lease_was_taken_is_rolled_back(db, monkeypatch):
+    job_id = _enqueue(db, _trivy(3))
+    jobs.lease_next_job(db, "worker-a")
+    real_claim = jobs._claim_progress
+
+    def reclaimed_meanwhile(session, *args, **kwargs):
+        # Another worker takes the job before this one's heartbeat notices
+        # (through the worker's own session: SQLite allows one writer)
+        session.execute(update(ImportJob).where(ImportJob.id == job_id).values(worker_id="worker-b"))
+        return real_claim(session, *args, **kwargs)
+
+    monkeypatch.setattr(jobs, "_claim_progress", reclaimed_meanwhile)
+    jobs.run_import_job(job_id, "worker-a")
+
+    db.expire_all()
+    assert db.execute(select(func.count()).select_from(Finding)).scalar_one() == 0
+    job = db.get(ImportJob, job_id)
+    # Rolled back as a lost lease, not failed
+    assert (job.status, job.committed, job.error) == ("running", 0, None)
@@ -0,0 +1,83 @@
+from datetime import datetime
+
+from sqlalchemy import func, select
+
+from app.ingest import BulkIngestor
+from app.main import SignalIn, _write_signal
+from app.models import AssetRiskRollup, DailyFindingStat, Finding
+from app.parsers.base import ParsedFinding, Severity
+from app.scoring import compute_risk_score
+
+
+def _finding(severity: Severity = Severity.HIGH) -> ParsedFinding:
+    return ParsedFinding(title="Open redirect", severity=severity, tool="nuclei", asset="api.example.com")
+
+
+def _signal(db, severity: str = "high") -> None:
+    payload = SignalIn(tool="nuclei", severity=severity, title="Open redirect", asset="api.example.com")
+    _write_signal(db, payload, "api.example.com", datetime.utcnow())
+
+
+def test_repeats_add_to_sightings_recorded_meanwhile(db):
+    def signals_between_chunks(result):
+        db.commit()
+        if result.imported == 1:
+            for _ in range(3):
+                _signal(db, "critical")
+            db.commit()
+
+    ingestor = BulkIngestor(db, chunk_size=1, on_flush=signals_between_chunks)
+    result = ingestor.add_all([_finding(), _finding()])
+
+    finding = db.execute(select(Finding)).scalar_one()
+    assert finding.occurrences == 5
+    # The critical signals raised the score; the later high sighting doesn't lower it
+    assert finding.risk_score == compute_risk_score("critical", "internal", "medium")
+    assert result.new_findings == 1
+    assert result.deduplicated == 1
+
+
+def test_row_inserted_concurrently_is_adopted_not_opened_twice(db, monkeypatch):
+    ingestor = BulkIngestor(db)
+    resolve = ingestor._resolve_findings
+
+    def racing_signal(fingerprints):
+        resolve(fingerprints)
+        # /ingest/signal creates the finding between the lookup and the insert
+        _signal(db)
+
+    monkeypatch.setattr(ingestor, "_resolve_findings", racing_signal)
+    result = ingestor.add_all([_finding(), _finding()])
+    db.commit()
+
+    finding = db.execute(select(Finding)).scalar_one()
+    assert finding.occurrences == 3
+    assert ingestor._findings[finding.fingerprint].id == finding.id
+    assert result.new_findings == 0
+    assert result.deduplicated == 2
+
+    rollup = db.execute(select(AssetRiskRollup)).scalar_one()
+    assert rollup.open_findings == 1
+    assert rollup.risk_sum == finding.risk_score
+    assert db.execute(select(func.sum(DailyFindingStat.opened))).scalar_one() == 1
+    assert db.execute(select(func.sum(DailyFindingStat.risk_delta))).scalar_one() == finding.risk_score
+
+
+def test_adopted_row_takes_the_higher_risk(db, monkeypatch):
+    ingestor = BulkIngestor(db)
+    resolve = ingestor._resolve_findings
+
+    def racing_signal(fingerprints):
+        resolve(fingerprints)
+        _signal(db, "low")
+
+    monkeypatch.setattr(ingestor, "_resolve_findings", racing_signal)
+    ingestor.add_all([_finding(Severity.CRITICAL)])
+    db.commit()
+
+    finding = db.execute(select(Finding)).scalar_one()
+    rollup = db.execute(select(AssetRiskRollup)).scalar_one()
+    assert finding.severity == "low"
+    assert rollup.open_findings == 1
+    assert rollup.risk_sum == finding.risk_score
+    assert db.execute(select(func.sum(DailyFindingStat.risk_delta))).scalar_one() == finding.risk_score
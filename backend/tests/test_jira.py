@@ -0,0 +1,173 @@
+import asyncio
+import socket
+import threading
+import time
+from datetime import datetime
+
+import httpx
+import pytest
+import uvicorn
+from sqlalchemy import insert, select
+
+from app.db import async_engine
+from app.main import SignalIn, _write_signal
+from app.models import AssetRiskRollup, Comment, Finding, NotificationOutbox
+from app.notifications import outbox
+from app.notifications.clients import close_clients, jira_client
+from app.notifications.jira import fingerprint_label
+from app.notifications.reconcile import reconcile_jira
+from app.scoring import make_fingerprint
+from stubs.jira import create_app
+
+AUTH = ("stub", "stub")
+
+
+@pytest.fixture
+def jira(monkeypatch):
+    """The Jira stub served over HTTP on a free port, with the JIRA_* settings pointing at it."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    app = create_app("SEC")
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+
+    base = f"http://127.0.0.1:{port}"
+    monkeypatch.setenv("JIRA_BASE_URL", base)
+    monkeypatch.setenv("JIRA_EMAIL", AUTH[0])
+    monkeypatch.setenv("JIRA_API_TOKEN", AUTH[1])
+    monkeypatch.setenv("JIRA_PROJECT_KEY", "SEC")
+    app.state.base_url = base
+    yield app.state
+    server.should_exit = True
+    thread.join()
+
+
+def _run(coro):
+    async def main():
+        try:
+            return await coro
+        finally:
+            await close_clients()
+            await async_engine.dispose()
+
+    return asyncio.run(main())
+
+
+def _signal(db, title: str) -> Finding:
+    payload = SignalIn(tool="nuclei", severity="critical", title=title, asset="api.example.com")
+    _, finding, _, _ = _write_signal(db, payload, "api.example.com", datetime.utcnow())
+    db.commit()
+    return finding
+
+
+def _transition(jira, key: str, transition_id: str) -> None:
+    response = httpx.post(
+        f"{jira.base_url}/rest/api/3/issue/{key}/transitions",
+        auth=AUTH,
+        json={"transition": {"id": transition_id}},
+    )
+    assert response.status_code == 204
+
+
+def test_issues_are_created_in_one_bulk_call(db, jira, monkeypatch):
+    calls = []
+    create = outbox.create_jira_issues
+
+    async def counting(issues):
+        calls.append(len(issues))
+        return await create(issues)
+
+    monkeypatch.setattr(outbox, "create_jira_issues", counting)
+    findings = [_signal(db, f"Open redirect {i}") for i in range(3)]
+
+    assert _run(outbox.OutboxDispatcher().drain("jira")) == 3
+
+    assert calls == [3]
+    assert len(jira.stub.issues) == 3
+    for finding in findings:
+        key = db.execute(select(Finding.jira_issue_key).where(Finding.id == finding.id)).scalar_one()
+        assert fingerprint_label(finding.fingerprint) in jira.stub.issues[key]["labels"]
+    assert db.execute(select(NotificationOutbox)).first() is None
+
+
+def test_issue_with_the_fingerprint_label_is_adopted(db, jira):
+    fingerprint = make_fingerprint("nuclei", "Open redirect", "api.example.com")
+    existing, _ = jira.stub.create({"fields": {
+        "project": {"key": "SEC"},
+        "summary": "[CRITICAL] Open redirect - api.example.com",
+        "labels": ["security", "secops-dashboard", fingerprint_label(fingerprint)],
+    }})
+    finding = _signal(db, "Open redirect")
+
+    _run(outbox.OutboxDispatcher().drain("jira"))
+
+    assert list(jira.stub.issues) == [existing["key"]]
+    assert db.execute(select(Finding.jira_issue_key).where(Finding.id == finding.id)).scalar_one() == existing["key"]
+    assert db.execute(select(NotificationOutbox)).first() is None
+
+
+def test_reconcile_moves_findings_to_their_issue_status(db, jira):
+    findings = [_signal(db, f"Open redirect {i}") for i in range(2)]
+    _run(outbox.OutboxDispatcher().drain("jira"))
+    keys = dict(db.execute(select(Finding.id, Finding.jira_issue_key)).all())
+
+    _transition(jira, keys[findings[0].id], "31")
+    _transition(jira, keys[findings[1].id], "21")
+    result = _run(reconcile_jira())
+
+    assert result.issues == 2
+    assert result.findings_updated == 2
+    statuses = dict(db.execute(select(Finding.id, Finding.status)).all())
+    assert statuses == {findings[0].id: "resolved", findings[1].id: "investigating"}
+    comments = db.execute(select(Comment).where(Comment.finding_id == findings[0].id)).scalars().all()
+    assert [(c.author, c.content) for c in comments] == [
+        ("jira", f"Status changed from 'open' to 'resolved' ({keys[findings[0].id]} is Done)"),
+    ]
+    rollup = db.execute(select(AssetRiskRollup)).scalar_one()
+    assert rollup.open_findings == 0
+    assert rollup.risk_sum == 0
+
+    # Applying the same issue states again changes nothing
+    assert _run(reconcile_jira()).findings_updated == 0
+
+    _transition(jira, keys[findings[0].id], "11")
+    assert _run(reconcile_jira()).findings_updated == 1
+    db.expire_all()
+    rollup = db.execute(select(AssetRiskRollup)).scalar_one()
+    assert rollup.open_findings == 1
+    assert rollup.risk_sum == findings[0].risk_score
+
+
+def test_jira_calls_take_one_token_each(db, jira, monkeypatch):
+    events = []
+    dispatcher = outbox.OutboxDispatcher()
+    bucket = dispatcher.buckets["jira"]
+    acquire, post = bucket.acquire, jira_client.post
+
+    async def counting_acquire():
+        events.append("token")
+        await acquire()
+
+    async def counting_post(url, **kwargs):
+        events.append(url.rsplit("/rest/api/3", 1)[1])
+        return await post(url, **kwargs)
+
+    monkeypatch.setattr(bucket, "acquire", counting_acquire)
+    monkeypatch.setattr(jira_client, "post", counting_post)
+    finding = _signal(db, "Open redirect")
+
+    _run(dispatcher.drain("jira"))
+    assert events == ["token", "/search/jql", "token", "/issue/bulk"]
+
+    # A finding that already has its issue costs no call and no token
+    events.clear()
+    payload = {"title": "Open redirect", "severity": "critical", "asset": "api.example.com",
+               "risk_score": finding.risk_score, "finding_id": finding.id, "tool": "nuclei", "is_new": True}
+    db.execute(insert(NotificationOutbox), [outbox._row("jira", "issue", payload, datetime.utcnow())])
+    db.commit()
+    assert _run(dispatcher.drain("jira")) == 1
+    assert events == []
@@ -0,0 +1,105 @@
+import io
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from app.parsers import get_parser
+from app.parsers.xmlstream import XmlSecurityError
+
+XML_PARSERS = [
+    ("nessus", "NessusClientData_v2"),
+    ("tenable", "NessusClientData_v2"),
+    ("qualys", "SCAN"),
+    ("openvas", "report"),
+    ("nmap", "nmaprun"),
+    ("fortify", "FVDL"),
+    ("spotbugs", "BugCollection"),
+    ("vcg", "CodeIssueCollection"),
+    ("xanitizer", "XanitizerFindingsList"),
+    ("zap", "OWASPZAPReport"),
+    ("appspider", "VulnSummary"),
+    ("crashtest", "report"),
+    ("hcl_appscan", "xml-report"),
+    ("ibm_appscan", "xml-report"),
+    ("immuniweb", "report"),
+    ("webinspect", "Issues"),
+    ("outpost24", "report"),
+    ("pingcastle", "HealthcheckData"),
+]
+
+
+def _parse(name: str, document: str) -> list:
+    return get_parser(name).parse_file(io.BytesIO(document.encode()), f"{name}.xml")
+
+
+@pytest.mark.parametrize("name,root", XML_PARSERS)
+def test_entity_expansion_is_rejected(name, root):
+    document = (
+        '<?xml version="1.0"?>\n'
+        f'<!DOCTYPE {root} [<!ENTITY a "aaaaaaaaaa"><!ENTITY b "&a;&a;&a;&a;&a;&a;&a;&a;&a;&a;">]>\n'
+        f"<{root}>&b;</{root}>"
+    )
+    with pytest.raises(XmlSecurityError):
+        _parse(name, document)
+
+
+@pytest.mark.parametrize("name,root", XML_PARSERS)
+def test_malformed_xml_raises(name, root):
+    with pytest.raises(ET.ParseError):
+        _parse(name, f'<?xml version="1.0"?>\n<{root}><unclosed></{root}>')
+
+
+def test_findings_before_a_malformed_tail_are_yielded():
+    document = (
+        '<?xml version="1.0"?>\n<NessusClientData_v2><Report name="scan">'
+        '<ReportHost name="10.0.0.1"><ReportItem port="443" severity="3" pluginID="1" pluginName="Weak TLS">'
+        "<description>d</description></ReportItem></ReportHost>"
+        '<ReportHost name="10.0.0.2"><ReportItem'
+    )
+    findings = get_parser("nessus").iter_parse(io.BytesIO(document.encode()), "scan.nessus")
+    assert next(findings).title == "Weak TLS"
+    with pytest.raises(ET.ParseError):
+        next(findings)
+
+
+def test_item_with_a_non_numeric_severity_is_skipped():
+    document = (
+        '<?xml version="1.0"?>\n<NessusClientData_v2><Report name="scan"><ReportHost name="10.0.0.1">'
+        '<ReportItem port="80" severity="" pluginID="1" pluginName="Banner"/>'
+        '<ReportItem port="443" severity="high" pluginID="2" pluginName="Unknown level"/>'
+        '<ReportItem port="443" severity="3" pluginID="3" pluginName="Weak TLS"/>'
+        "</ReportHost></Report></NessusClientData_v2>"
+    )
+    assert [f.title for f in _parse("nessus", document)] == ["Weak TLS"]
+
+
+class _Unseekable(io.BytesIO):
+    def seekable(self):
+        return False
+
+
+@pytest.mark.parametrize("stream", [io.BytesIO, _Unseekable])
+def test_trivy_artifact_name_after_results(stream):
+    document = {
+        "SchemaVersion": 2,
+        "Results": [
+            {
+                "Class": "secret",
+                "Secrets": [{"RuleID": "aws-access-key-id", "Category": "AWS", "StartLine": 3}],
+                "Misconfigurations": [{"ID": "DS002", "Title": "Image user should not be 'root'"}],
+                "Type": "debian",
+                "Vulnerabilities": [{"VulnerabilityID": "CVE-2024-1", "PkgName": "openssl"}],
+            },
+            {"Target": "app/package-lock.json", "Type": "npm", "Vulnerabilities": [{"VulnerabilityID": "CVE-2024-2", "PkgName": "lodash"}]},
+        ],
+        "ArtifactName": "registry.example.com/api:1.4",
+    }
+    findings = list(get_parser("trivy").iter_parse(stream(json.dumps(document).encode()), "trivy.json"))
+    assert [(f.title, f.asset) for f in findings] == [
+        ("CVE-2024-1: openssl", "registry.example.com/api:1.4"),
+        ("Image user should not be 'root'", "registry.example.com/api:1.4"),
+        ("Secret Detected: aws-access-key-id", "registry.example.com/api:1.4"),
+        ("CVE-2024-2: lodash", "app/package-lock.json"),
+    ]
+    assert findings[0].tags == ["debian", "openssl"]
@@ -0,0 +1,64 @@
+import pytest
+from fastapi.testclient import TestClient
+from starlette.datastructures import FormData
+
+from app import main
+
+
+@pytest.fixture
+def client():
+    with TestClient(main.app) as client:
+        yield client
+
+
+@pytest.fixture
+def spooled(monkeypatch):
+    calls = []
+    spool = main.spool_to_file
+
+    async def recording(chunks):
+        calls.append(chunks)
+        return await spool(chunks)
+
+    monkeypatch.setattr(main, "spool_to_file", recording)
+    return calls
+
+
+@pytest.fixture
+def closed(monkeypatch):
+    forms = []
+    close = FormData.close
+
+    async def recording(self):
+        forms.append(self)
+        await close(self)
+
+    monkeypatch.setattr(FormData, "close", recording)
+    return forms
+
+
+def test_unknown_parser_is_rejected_before_the_body_is_spooled(client, spooled):
+    response = client.post("/import/scan/upload?parser=nope", content=b"{}")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown parser: nope"
+    assert spooled == []
+
+
+def test_unknown_form_parser_is_rejected_before_the_file_is_spooled(client, spooled, closed):
+    response = client.post("/import/scan/upload", data={"parser": "nope"}, files={"file": ("scan.json", b"{}")})
+    assert response.status_code == 400
+    assert spooled == []
+    assert len(closed) == 1
+
+
+def test_form_without_a_file_is_closed(client, closed):
+    response = client.post("/import/scan/upload", data={"parser": "trivy"}, files={"other": ("scan.json", b"{}")})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "multipart upload requires a 'file' field"
+    assert len(closed) == 1
+
+
+def test_batch_form_is_closed_when_rejected(client, closed):
+    response = client.post("/import/batch", data={"parser": "nope"}, files={"files": ("scan.json", b"{}")})
+    assert response.status_code == 400
+    assert len(closed) == 1
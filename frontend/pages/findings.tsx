@@ -31,15 +31,70 @@ const STATUS_COLORS: Record<string, string> = {
   closed: "bg-gray-100 text-gray-800 dark:bg-gray-700 dark:text-gray-200",
 };
 
+type FindingsResponse = { count: number; next_cursor: string | null; results: Finding[] };
+
+type Filters = {
+  status: string;
+  severity: string;
+  tool: string;
+  asset: string;
+  min_risk: string;
+  sort: string;
+};
+
+const DEFAULT_FILTERS: Filters = { status: "", severity: "", tool: "", asset: "", min_risk: "", sort: "-last_seen" };
+
+const SORT_OPTIONS: Record<string, string> = {
+  "-last_seen": "Last seen (newest)",
+  "-risk_score": "Risk (highest)",
+  "-first_seen": "First seen (newest)",
+  "-occurrences": "Occurrences (most)",
+};
+
+function buildQuery(filters: Filters, cursor?: string | null): string {
+  const params = new URLSearchParams();
+  Object.entries(filters).forEach(([key, value]) => {
+    if (value) params.set(key, value);
+  });
+  params.set("limit", "100");
+  if (cursor) params.set("cursor", cursor);
+  return params.toString();
+}
+
 export default function FindingsPage() {
   const [data, setData] = useState<{ count: number; results: Finding[] } | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [filters, setFilters] = useState<Filters>(DEFAULT_FILTERS);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [err, setErr] = useState<string>("");
 
   useEffect(() => {
-    apiGet<{ count: number; results: Finding[] }>("/findings")
-      .then(setData)
+    setErr("");
+    apiGet<FindingsResponse>(`/findings?${buildQuery(filters)}`)
+      .then((res) => {
+        setData(res);
+        setNextCursor(res.next_cursor);
+      })
       .catch((e) => setErr(String(e?.message || e)));
-  }, []);
+  }, [filters]);
+
+  const loadMore = async () => {
+    if (!nextCursor || !data) return;
+    setLoadingMore(true);
+    try {
+      const res = await apiGet<FindingsResponse>(`/findings?${buildQuery(filters, nextCursor)}`);
+      setData({ count: data.count + res.count, results: [...data.results, ...res.results] });
+      setNextCursor(res.next_cursor);
+    } catch (e: any) {
+      setErr(String(e?.message || e));
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  const setFilter = (key: keyof Filters, value: string) => setFilters((f) => ({ ...f, [key]: value }));
+
+  const inputClass = "px-3 py-2 rounded-lg border dark:border-gray-600 bg-white dark:bg-gray-700 text-gray-900 dark:text-white text-sm";
 
   return (
     <div className="space-y-4">
@@ -47,6 +102,29 @@ export default function FindingsPage() {
 
       {err && <div className="mb-4 p-3 rounded bg-red-50 dark:bg-red-900/40 border border-red-300 dark:border-red-700 text-gray-900 dark:text-white">Error: {err}</div>}
 
+      <div className="flex flex-wrap gap-2">
+        <select value={filters.status} onChange={(e) => setFilter("status", e.target.value)} className={inputClass}>
+          <option value="">All statuses</option>
+          {Object.keys(STATUS_COLORS).map((s) => (
+            <option key={s} value={s}>{s}</option>
+          ))}
+        </select>
+        <select value={filters.severity} onChange={(e) => setFilter("severity", e.target.value)} className={inputClass}>
+          <option value="">All severities</option>
+          {Object.keys(SEVERITY_COLORS).map((s) => (
+            <option key={s} value={s}>{s}</option>
+          ))}
+        </select>
+        <input value={filters.tool} onChange={(e) => setFilter("tool", e.target.value)} placeholder="Tool" className={inputClass} />
+        <input value={filters.asset} onChange={(e) => setFilter("asset", e.target.value)} placeholder="Asset" className={inputClass} />
+        <input value={filters.min_risk} onChange={(e) => setFilter("min_risk", e.target.value)} placeholder="Min risk" type="number" className={`${inputClass} w-28`} />
+        <select value={filters.sort} onChange={(e) => setFilter("sort", e.target.value)} className={inputClass}>
+          {Object.entries(SORT_OPTIONS).map(([value, label]) => (
+            <option key={value} value={value}>{label}</option>
+          ))}
+        </select>
+      </div>
+
       {!data ? (
         <div className="text-gray-600 dark:text-gray-300">Loading...</div>
       ) : (
@@ -93,6 +171,16 @@ export default function FindingsPage() {
           </table>
         </div>
       )}
+
+      {nextCursor && (
+        <button
+          onClick={loadMore}
+          disabled={loadingMore}
+          className="px-4 py-2 bg-indigo-600 text-white rounded-lg hover:bg-indigo-700 disabled:opacity-50 text-sm font-medium"
+        >
+          {loadingMore ? "Loading..." : "Load more"}
+        </button>
+      )}
     </div>
   );
 }
@@ -30,6 +30,8 @@ type ParsersResponse = {
 
 type ImportResult = {
   ok: boolean;
+  job_id?: string;
+  status?: string;
   imported: number;
   new_findings: number;
   deduplicated: number;
@@ -112,12 +114,17 @@ export default function Integrations() {
     setImporting(true);
     setImportResult(null);
     try {
-      const result = await apiPost<ImportResult>("/import/scan", {
+      let result = await apiPost<ImportResult>("/import/scan", {
         content: scanContent,
         parser: selectedParser || undefined,
         default_asset: defaultAsset || undefined,
       });
       setImportResult(result);
+      while (result.status === "queued" || result.status === "running") {
+        await new Promise((resolve) => setTimeout(resolve, 1000));
+        result = await apiGet<ImportResult>(`/import/jobs/${result.job_id}`);
+        setImportResult(result);
+      }
       if (result.ok && result.imported > 0) {
         setScanContent("");
       }